@@ -5,6 +5,7 @@ from backend.api.routes.scenarios import router as scenarios_router
 from backend.api.routes.draft import router as draft_router
 from backend.api.routes.performance import router as performance_router
 from backend.api.routes.batch import router as batch_router
+from backend.api.routes.jobs import router as jobs_router
 
 __all__ = [
     "players_router",
@@ -14,4 +15,5 @@ __all__ = [
     "draft_router",
     "performance_router",
     "batch_router",
+    "jobs_router",
 ]
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Dict, List, Optional, Any
 
 from backend.database.database import get_db
 from backend.services.batch_service import BatchService
+from backend.services.projection_service import ProjectionService
 from backend.services.cache_service import get_cache
 from backend.services.nfl_data_import_service import NFLDataImportService
+from backend.services.job_service import JobContext, JobRunner, get_job_runner
+from backend.api.routes.jobs import job_accepted
 from backend.api.schemas import (
     BatchProjectionCreateRequest,
     BatchProjectionAdjustRequest,
@@ -20,14 +23,32 @@ router = APIRouter(tags=["batch operations"])
 
 @router.post("/projections/create", response_model=BatchResponse)
 async def batch_create_projections(
-    request: BatchProjectionCreateRequest, db: Session = Depends(get_db)
+    request: BatchProjectionCreateRequest,
+    background: bool = False,
+    db: Session = Depends(get_db),
+    runner: JobRunner = Depends(get_job_runner),
 ):
     """
     Create projections for multiple players in a single operation.
 
     Efficient batch operation for creating baseline projections
-    for multiple players at once.
+    for multiple players at once. With background=true the batch runs as a
+    job and the response points at /api/jobs/{job_id}.
     """
+    if background:
+
+        async def create_projections(job_db: Session, job: JobContext):
+            return await BatchService(job_db).batch_create_projections(
+                player_ids=request.player_ids,
+                season=request.season,
+                scenario_id=request.scenario_id,
+            )
+
+        job_id = runner.submit(
+            "batch_create_projections", create_projections, request.model_dump()
+        )
+        return job_accepted(job_id)
+
     service = BatchService(db)
     result = await service.batch_create_projections(
         player_ids=request.player_ids, season=request.season, scenario_id=request.scenario_id
@@ -41,6 +62,26 @@ async def batch_create_projections(
     return result
 
 
+@router.post("/projections/build/{season}")
+async def build_season_projections(
+    season: int, scenario_id: Optional[str] = None, db: Session = Depends(get_db)
+):
+    """
+    Build base projections for every fantasy-relevant player in a season.
+
+    Set-based rebuild: historical totals and team stats are loaded once and all
+    projections are inserted in a single transaction. Players that already have
+    a projection for the season and scenario are skipped.
+    """
+    service = ProjectionService(db)
+    result = await service.build_season_projections(season=season, scenario_id=scenario_id)
+
+    if not result["success"]:
+        raise HTTPException(status_code=400, detail=result["message"])
+
+    return result
+
+
 @router.post("/projections/adjust", response_model=BatchResponse)
 async def batch_adjust_projections(
     request: BatchProjectionAdjustRequest, db: Session = Depends(get_db)
@@ -88,14 +129,32 @@ async def export_projections(
     request: ExportFiltersRequest,
     format: str = Query("csv", pattern="^(csv|json)$"),
     include_metadata: bool = False,
+    background: bool = False,
     db: Session = Depends(get_db),
+    runner: JobRunner = Depends(get_job_runner),
 ):
     """
     Export projections in CSV or JSON format.
 
     Advanced export functionality with filtering capabilities.
-    Supports CSV and JSON formats with optional metadata.
+    Supports CSV and JSON formats with optional metadata. With background=true
+    the export runs as a job; download the file from /api/jobs/{job_id}/download.
     """
+    if background:
+
+        async def export(job_db: Session, job: JobContext):
+            filename, content = await BatchService(job_db).export_projections(
+                format=format, filters=request.filters, include_metadata=include_metadata
+            )
+            return {
+                "filename": filename,
+                "media_type": "text/csv" if format.lower() == "csv" else "application/json",
+                "content": content,
+            }
+
+        params = {"format": format, "include_metadata": include_metadata, **request.model_dump()}
+        return job_accepted(runner.submit("export_projections", export, params))
+
     service = BatchService(db)
 
     try:
@@ -129,16 +188,25 @@ async def get_cache_stats(db: Session = Depends(get_db)):
 
 
 @router.post("/cache/clear")
-async def clear_cache(pattern: Optional[str] = None, db: Session = Depends(get_db)):
+async def clear_cache(
+    pattern: Optional[str] = None,
+    tag: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db),
+):
     """
     Clear all or part of the cache (admin only).
 
-    Clears the application cache, optionally only entries
-    matching the specified pattern.
+    Clears the application cache, optionally only entries carrying
+    one of the given tags (e.g. player:<id>, team:KC:2024, scenario:<id>)
+    or matching the specified pattern. With a shared cache tier (CACHE_L2_PATH)
+    the clear reaches every worker; cleared_entries counts this worker's entries.
     """
     cache = get_cache()
 
-    if pattern:
+    if tag:
+        count = cache.invalidate_tags(tag)
+        return {"status": "success", "cleared_entries": count}
+    elif pattern:
         count = cache.clear_pattern(pattern)
         return {"status": "success", "cleared_entries": count}
     else:
@@ -151,27 +219,32 @@ async def clear_cache(pattern: Optional[str] = None, db: Session = Depends(get_d
 
 @router.post("/import/nfl-data/{season}")
 async def import_nfl_data(
-    season: int, db: Session = Depends(get_db), background_tasks: BackgroundTasks = None
+    season: int,
+    incremental: bool = False,
+    runner: JobRunner = Depends(get_job_runner),
 ):
     """
     Import NFL data for the specified season using the new NFL data sources.
 
     Handles complete data import from nfl-data-py and NFL API sources,
-    processes the data, and stores it in the database.
+    processes the data, and stores it in the database. The import runs as a
+    background job; poll /api/jobs/{job_id} for progress and results.
 
     Args:
         season: NFL season year (e.g., 2023)
+        incremental: Only import weeks newer than the last import and update
+            season totals for the players in them
     """
-    service = NFLDataImportService(db)
 
-    if background_tasks:
-        # Run in background for long operations
-        background_tasks.add_task(service.import_season, season)
-        return {"status": "Import started in background"}
-    else:
-        # Run immediately for smaller imports or testing
-        results = await service.import_season(season)
-        return results
+    async def import_season(job_db: Session, job: JobContext):
+        service = NFLDataImportService(job_db)
+        service.progress = job.report
+        return await service.import_season(season, incremental=incremental)
+
+    job_id = runner.submit(
+        "nfl_import", import_season, {"season": season, "incremental": incremental}
+    )
+    return job_accepted(job_id)
 
 
 @router.post("/import/nfl-data/players/{season}")
@@ -188,15 +261,16 @@ async def import_nfl_players(season: int, db: Session = Depends(get_db)):
 
 
 @router.post("/import/nfl-data/weekly/{season}")
-async def import_nfl_weekly(season: int, db: Session = Depends(get_db)):
+async def import_nfl_weekly(season: int, replace: bool = False, db: Session = Depends(get_db)):
     """
     Import only weekly statistics for the specified season.
 
     Args:
         season: NFL season year (e.g., 2023)
+        replace: Re-import weeks that already exist instead of skipping them
     """
     service = NFLDataImportService(db)
-    results = await service.import_weekly_stats(season)
+    results = await service.import_weekly_stats(season, replace=replace)
     return results
 
 
@@ -2,11 +2,18 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Body, Path
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
+import pandas as pd
 
 from backend.database.database import get_db
 from backend.database.models import DraftStatus
 from backend.services.draft_service import DraftService
+from backend.services.mock_draft_service import (
+    DEFAULT_SIMULATIONS,
+    MAX_SIMULATIONS,
+    MockDraftService,
+)
 from backend.services.rookie_projection_service import RookieProjectionService
+from backend.services.scoring_service import ScoringService
 
 router = APIRouter()
 
@@ -45,6 +52,18 @@ class DraftBoardCreate(BaseModel):
     roster_spots: int = 15
 
 
+class MockDraftRequest(BaseModel):
+    """Schema for a mock-draft simulation"""
+
+    draft_board_id: str
+    simulations: int = Field(DEFAULT_SIMULATIONS, ge=1, le=MAX_SIMULATIONS)
+    seed: Optional[int] = None
+    draft_slot: Optional[int] = Field(None, ge=1)
+    rounds: Optional[int] = Field(None, ge=1, le=30)
+    adp: Optional[Dict[str, float]] = None
+    limit: int = Field(200, ge=1, le=1000)
+
+
 @router.get("/draft-board")
 async def get_draft_board(
     status: Optional[str] = Query(None, pattern="^(available|drafted|watched)$"),
@@ -209,7 +228,12 @@ async def create_draft_board(board: DraftBoardCreate, db: Session = Depends(get_
     """
     draft_service = DraftService(db)
     result = await draft_service.create_draft_board(
-        name=board.name, description=board.description, season=board.season, settings=board.settings
+        name=board.name,
+        description=board.description,
+        season=board.season,
+        settings=board.settings,
+        number_of_teams=board.number_of_teams,
+        roster_spots=board.roster_spots,
     )
 
     if not result:
@@ -241,6 +265,166 @@ async def get_draft_boards(active_only: bool = Query(True), db: Session = Depend
     return {"draft_boards": result}
 
 
+@router.get("/draft-boards/{draft_board_id}/scores")
+async def get_draft_board_scores(
+    draft_board_id: str,
+    season: Optional[int] = None,
+    scenario_id: Optional[str] = None,
+    position: Optional[str] = Query(None, pattern="^(QB|RB|WR|TE)$"),
+    formats: List[str] = Query([]),
+    limit: int = Query(200, ge=1, le=5000),
+    db: Session = Depends(get_db),
+):
+    """
+    Rank projections under a draft board's scoring rules.
+
+    The rules live in the board's settings under "scoring", e.g.
+    {"preset": "ppr", "points": {"pass_td": 6}, "position_points": {"TE": {"receptions": 0.5}}}
+
+    Parameters:
+    - draft_board_id: Draft board whose scoring rules are applied
+    - season: Projection season (defaults to the board's season)
+    - scenario_id: Optional scenario to score instead of the base projections
+    - position: Optional position filter
+    - formats: Built-in formats (standard, half, ppr) to include as extra columns
+    - limit: Maximum number of players to return
+
+    Returns:
+    - Players ordered by points under the board's rules
+    """
+    scoring_service = ScoringService(db)
+    try:
+        result = await scoring_service.score_draft_board(
+            draft_board_id,
+            season=season,
+            scenario_id=scenario_id,
+            position=position,
+            formats=formats,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="Draft board not found")
+
+    return {
+        "draft_board_id": draft_board_id,
+        "total": len(result),
+        "players": result.head(limit).to_dict("records"),
+    }
+
+
+@router.get("/draft-boards/{draft_board_id}/values")
+async def get_draft_board_values(
+    draft_board_id: str,
+    position: Optional[str] = Query(None, pattern="^(QB|RB|WR|TE)$"),
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Rank available players by value over replacement (VORP) for a draft board.
+
+    Points come from the board's scoring rules. Replacement levels depend on the
+    board's number_of_teams and roster_spots (split by settings["starters"]) and
+    move with every recorded pick.
+
+    Parameters:
+    - draft_board_id: Draft board whose settings are used
+    - position: Optional position filter
+    - limit: Maximum number of players to return
+    - offset: Number of players to skip
+
+    Returns:
+    - Replacement levels per position and available players ordered by VORP
+    """
+    draft_service = DraftService(db)
+    result = await draft_service.get_value_board(
+        draft_board_id, position=position, limit=limit, offset=offset
+    )
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="Draft board not found")
+
+    return result
+
+
+@router.post("/simulate")
+async def simulate_mock_drafts(request: MockDraftRequest, db: Session = Depends(get_db)):
+    """
+    Simulate mock drafts and estimate each player's availability at each pick.
+
+    Drafts are snake drafts with the board's number_of_teams and roster_spots rounds.
+    Teams pick by noisy ADP (from "adp", or value over replacement for players without
+    one) within the board's settings["position_limits"].
+
+    Parameters:
+    - draft_board_id: Draft board whose league settings are used
+    - simulations: Number of drafts to simulate
+    - seed: RNG seed; the response's seed reproduces the run
+    - draft_slot: Only report availability at this slot's picks (default: every pick)
+    - rounds: Picks per team (defaults to the board's roster spots)
+    - adp: Optional player_id -> ADP
+    - limit: Maximum number of players to return, in ADP order
+
+    Returns:
+    - Pick numbers and, per player, the probability of being available at each of them
+    """
+    service = MockDraftService(db)
+    try:
+        result = await service.simulate(
+            request.draft_board_id,
+            simulations=request.simulations,
+            seed=request.seed,
+            rounds=request.rounds,
+            adp=request.adp,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="Draft board not found")
+    if request.draft_slot and request.draft_slot > result.teams:
+        raise HTTPException(
+            status_code=400, detail=f"draft_slot must be between 1 and {result.teams}"
+        )
+
+    picks = (
+        result.slot_picks(request.draft_slot)
+        if request.draft_slot
+        else list(range(1, result.total_picks + 1))
+    )
+    summary = result.summary().head(request.limit)
+    availability = result.availability(picks)
+
+    players = []
+    for i, row in enumerate(summary.itertuples(index=False)):
+        players.append(
+            {
+                "player_id": row.player_id,
+                "name": row.name,
+                "team": row.team,
+                "position": row.position,
+                "points": row.points,
+                "vorp": row.vorp,
+                "adp": row.adp,
+                "drafted_probability": row.drafted_probability,
+                "mean_pick": None if pd.isna(row.mean_pick) else row.mean_pick,
+                "availability": availability[i].round(4).tolist(),
+            }
+        )
+
+    return {
+        "draft_board_id": request.draft_board_id,
+        "seed": result.seed,
+        "simulations": result.simulations,
+        "teams": result.teams,
+        "rounds": result.rounds,
+        "picks": picks,
+        "players": players,
+    }
+
+
 @router.get("/rookie-projection-template/{position}")
 async def get_rookie_projection_template(
     position: str = Path(..., pattern="^(QB|RB|WR|TE)$"),
@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, defer
+from typing import List, Optional
+
+from backend.database.database import get_db
+from backend.database.models import Job, JobStatus
+from backend.services.job_service import JobRunner, get_job_runner
+from backend.api.schemas import JobResponse, JobSubmittedResponse, JobSummaryResponse
+
+router = APIRouter(tags=["jobs"])
+
+
+def job_accepted(job_id: str) -> JSONResponse:
+    """202 response pointing the client at a queued job."""
+    body = JobSubmittedResponse(
+        job_id=job_id, status=JobStatus.QUEUED.value, status_url=f"/api/jobs/{job_id}"
+    )
+    return JSONResponse(status_code=202, content=body.model_dump())
+
+
+@router.get("/", response_model=List[JobSummaryResponse])
+async def list_jobs(
+    status: Optional[JobStatus] = None,
+    operation: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    List recent jobs, newest first.
+
+    Results (which hold whole export files) are left out; fetch a job by id for its
+    result.
+
+    Args:
+        status: Only jobs with this status
+        operation: Only jobs of this type (e.g., nfl_import)
+        limit: Maximum number of jobs
+    """
+    query = db.query(Job).options(defer(Job.result))
+    if status:
+        query = query.filter(Job.status == status)
+    if operation:
+        query = query.filter(Job.operation == operation)
+    return query.order_by(Job.created_at.desc()).limit(limit).all()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, db: Session = Depends(get_db)):
+    """Status, progress and, once finished, the result or error of a job."""
+    job = db.get(Job, job_id, populate_existing=True)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(
+    job_id: str, db: Session = Depends(get_db), runner: JobRunner = Depends(get_job_runner)
+):
+    """
+    Cancel a queued or running job.
+
+    A queued job is dropped; a running job stops at its next checkpoint.
+    """
+    job = db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not runner.cancel(job_id):
+        raise HTTPException(status_code=409, detail="Job already finished")
+    return db.get(Job, job_id, populate_existing=True)
+
+
+@router.get("/{job_id}/download")
+async def download_job_result(job_id: str, db: Session = Depends(get_db)):
+    """Download the file produced by a finished export job."""
+    job = db.get(Job, job_id, populate_existing=True)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != JobStatus.SUCCEEDED or not job.result or "content" not in job.result:
+        raise HTTPException(status_code=409, detail="Job has no file to download")
+
+    return Response(
+        content=job.result["content"],
+        media_type=job.result.get("media_type", "application/octet-stream"),
+        headers={"Content-Disposition": f"attachment; filename={job.result['filename']}"},
+    )
@@ -1,20 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 from typing import Dict, List, Optional, Any
 import logging
-import uuid
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 from backend.database.database import get_db
-from backend.database.models import Projection
 from backend.services.projection_service import ProjectionService
 from backend.services.rookie_projection_service import RookieProjectionService
 from backend.services.projection_variance_service import ProjectionVarianceService
+from backend.services.projection_simulation_service import (
+    DEFAULT_DRAWS,
+    MAX_DRAWS,
+    ProjectionSimulationService,
+)
 from backend.services.team_stat_service import TeamStatService
-from backend.services.scenario_service import ScenarioService
 from backend.services.data_validation import DataValidationService, ValidationResultDict
+from backend.services.job_service import JobContext, JobRunner, get_job_runner
+from backend.api.routes.jobs import job_accepted
 from backend.api.schemas import (
     ProjectionResponse,
     ProjectionCreateRequest,
@@ -132,6 +137,70 @@ async def get_projection_variance(
     return variance_data
 
 
+@router.get("/simulation/{season}", response_model=Dict[str, Any])
+async def simulate_projections(
+    season: int,
+    scenario_id: Optional[str] = None,
+    position: Optional[str] = None,
+    draws: int = Query(DEFAULT_DRAWS, ge=100, le=MAX_DRAWS),
+    seed: Optional[int] = None,
+    include_distributions: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Monte Carlo outcome distributions for every projection in a season or scenario.
+
+    - draws: Simulated seasons per projection
+    - seed: RNG seed; the same seed returns the same results
+    - include_distributions: Also return every simulated half-PPR total per player
+    """
+    service = ProjectionSimulationService(db)
+    result = await service.simulate_season(
+        season=season, scenario_id=scenario_id, draws=draws, seed=seed, position=position
+    )
+
+    players = result.summary.round(3).to_dict(orient="records")
+    if include_distributions:
+        for player, points in zip(players, np.round(result.points, 1)):
+            player["distribution"] = points.tolist()
+
+    return {
+        "season": season,
+        "scenario_id": scenario_id,
+        "draws": draws,
+        "seed": seed,
+        "players": players,
+    }
+
+
+@router.get("/variance/{season}", response_model=Dict[str, Any])
+async def get_season_variance(
+    season: int,
+    scenario_id: Optional[str] = None,
+    position: Optional[str] = None,
+    confidence: float = Query(0.80, ge=0.5, le=0.99),
+    use_historical: bool = True,
+    db: Session = Depends(get_db),
+):
+    """
+    Variance and floor/ceiling ranges for every projection in a season or scenario.
+
+    Batch form of /{projection_id}/variance and /{projection_id}/range, returned
+    column by column: lists under "players", "half_ppr" and each stat share one order.
+
+    - confidence: Confidence level of the lower/upper bounds (0.5-0.99)
+    - use_historical: If true, use historical game-to-game variance
+    """
+    service = ProjectionVarianceService(db)
+    return await service.calculate_variance_batch(
+        season=season,
+        scenario_id=scenario_id,
+        position=position,
+        confidence=confidence,
+        use_historical=use_historical,
+    )
+
+
 @router.post("/rookies/create", response_model=Dict)
 async def create_rookie_projections(
     season: int = Query(..., ge=2023),
@@ -219,77 +288,8 @@ async def adjust_team_projections(
         logger.info(f"Adjustments: {adjustments}")
         logger.info(f"Player shares: {player_shares}")
 
-        # Clone projections from base scenario to new scenario if needed
-        if scenario_id:
-            # Check if we have projections for this scenario_id
-            projections_exist = (
-                db.query(Projection)
-                .filter(and_(Projection.scenario_id == scenario_id, Projection.season == season))
-                .count()
-                > 0
-            )
-
-            if not projections_exist:
-                # We need to clone some projections from the base scenario
-                scenario_service = ScenarioService(db)
-                base_scenario = await scenario_service.get_scenario(scenario_id)
-
-                if base_scenario and base_scenario.base_scenario_id:
-                    # Clone projections from base scenario
-                    source_projections = (
-                        db.query(Projection)
-                        .filter(
-                            and_(
-                                Projection.scenario_id == base_scenario.base_scenario_id,
-                                Projection.season == season,
-                            )
-                        )
-                        .all()
-                    )
-
-                    # Clone each projection
-                    for source_proj in source_projections:
-                        if (
-                            not db.query(Projection)
-                            .filter(
-                                and_(
-                                    Projection.player_id == source_proj.player_id,
-                                    Projection.scenario_id == scenario_id,
-                                    Projection.season == season,
-                                )
-                            )
-                            .first()
-                        ):
-                            # Create a new projection based on the source
-                            new_proj = Projection(
-                                projection_id=str(uuid.uuid4()),
-                                player_id=source_proj.player_id,
-                                scenario_id=scenario_id,
-                                season=season,
-                                games=source_proj.games,
-                                half_ppr=source_proj.half_ppr,
-                                # Copy all stats
-                                pass_attempts=source_proj.pass_attempts,
-                                completions=source_proj.completions,
-                                pass_yards=source_proj.pass_yards,
-                                pass_td=source_proj.pass_td,
-                                interceptions=source_proj.interceptions,
-                                rush_attempts=source_proj.rush_attempts,
-                                rush_yards=source_proj.rush_yards,
-                                rush_td=source_proj.rush_td,
-                                targets=source_proj.targets,
-                                receptions=source_proj.receptions,
-                                rec_yards=source_proj.rec_yards,
-                                rec_td=source_proj.rec_td,
-                                # Usage metrics
-                                snap_share=source_proj.snap_share,
-                                target_share=source_proj.target_share,
-                                rush_share=source_proj.rush_share,
-                            )
-                            db.add(new_proj)
-
-                    db.commit()
-
+        # Scenario projections resolve through the base scenario chain, so a cloned
+        # scenario needs no copies before it is adjusted
         updated_projections = await service.apply_team_adjustments(
             team=team,
             season=season,
@@ -459,17 +459,32 @@ async def validate_team_stats(
 @router.get("/validate/all-teams", response_model=Dict[str, Any])
 async def validate_all_teams(
     season: int = Query(..., ge=2023),
+    background: bool = False,
     db: Session = Depends(get_db),
+    runner: JobRunner = Depends(get_job_runner),
 ):
     """
     Validate the consistency of all team statistics.
     
     Args:
         season: The season to validate
+        background: Run as a job and return its ID instead of waiting
     """
+    if background:
+
+        async def validate(job_db: Session, job: JobContext):
+            results = await DataValidationService(job_db).validate_all_teams(season=season)
+            return _team_validation_summary(season, results)
+
+        return job_accepted(runner.submit("validate_all_teams", validate, {"season": season}))
+
     validation_service = DataValidationService(db)
     results = await validation_service.validate_all_teams(season=season)
-    
+    return _team_validation_summary(season, results)
+
+
+def _team_validation_summary(season: int, results: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap per-team validation results with summary counts."""
     # Calculate summary statistics
     valid_count = sum(1 for result in results.values() if result.get("valid", False))
     total_count = len(results)
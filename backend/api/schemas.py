@@ -504,3 +504,35 @@ class RookieProjectionTemplateRequest(BaseModel):
     rec_yards_per_catch: Optional[float] = None
     rec_td_per_catch: Optional[float] = None
     rush_td_per_att: Optional[float] = None
+
+
+class JobSummaryResponse(BaseModel):
+    """Status and progress of a background job, without its result."""
+
+    job_id: str
+    operation: str
+    status: str = Field(..., description="queued, running, succeeded, failed or cancelled")
+    message: Optional[str] = None
+    params: Optional[Dict[str, Any]] = None
+    progress: float = Field(..., description="Fraction complete, 0.0 to 1.0")
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class JobResponse(JobSummaryResponse):
+    """Status and progress of a background job, with its result once finished."""
+
+    result: Optional[Dict[str, Any]] = None
+
+
+class JobSubmittedResponse(BaseModel):
+    """Returned when an operation is queued as a background job."""
+
+    job_id: str
+    status: str
+    status_url: str = Field(..., description="Poll this URL for progress and the result")
@@ -3,6 +3,7 @@ Database package initialization.
 """
 
 from backend.database.database import Base, engine, get_db, SessionLocal
+from backend.database.executor import run_in_db_thread
 from backend.database.models import Player, BaseStat, Projection, TeamStat
 
 __all__ = [
@@ -10,6 +11,7 @@ __all__ = [
     "engine",
     "get_db",
     "SessionLocal",
+    "run_in_db_thread",
     "Player",
     "BaseStat",
     "Projection",
@@ -1,22 +1,167 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import StaticPool
 from pathlib import Path
+import os
 
 # Use the root data directory instead of the backend data directory
 ROOT_DIR = Path(__file__).parent.parent.parent
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{ROOT_DIR}/data/fantasy_football.db"
 
+# Connection profiles: PRAGMAs run on every new SQLite connection, plus pool settings.
+#
+# serving      API workers. WAL lets draft-day writes proceed without blocking readers;
+#              synchronous=NORMAL only fsyncs at checkpoints, which is still durable
+#              against application crashes.
+# bulk_import  Imports and maintenance scripts. Larger page cache and rarer WAL
+#              checkpoints, a long busy timeout, and few connections.
+# test         In-memory databases for the test suite; nothing is durable.
+DATABASE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "serving": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 5000,
+            "cache_size": -64000,  # KiB, i.e. 64 MB per connection
+            "mmap_size": 256 * 1024 * 1024,
+            "temp_store": "MEMORY",
+        },
+        "pool": {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30},
+    },
+    "bulk_import": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 30000,
+            "cache_size": -256000,
+            "mmap_size": 512 * 1024 * 1024,
+            "temp_store": "MEMORY",
+            "wal_autocheckpoint": 10000,
+        },
+        "pool": {"pool_size": 2, "max_overflow": 0, "pool_timeout": 60},
+    },
+    "test": {
+        "pragmas": {
+            "journal_mode": "MEMORY",
+            "synchronous": "OFF",
+            "temp_store": "MEMORY",
+        },
+        "pool": {"poolclass": StaticPool},
+    },
+}
+
+# Profile used by the application engine; override with DATABASE_PROFILE
+DEFAULT_PROFILE = os.environ.get("DATABASE_PROFILE", "serving")
+
+
+def apply_pragmas(dbapi_connection: Any, pragmas: Dict[str, Any]) -> None:
+    """Run PRAGMA statements on a raw SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def create_database_engine(
+    url: str = SQLALCHEMY_DATABASE_URL, profile: str = DEFAULT_PROFILE, **kwargs: Any
+) -> Engine:
+    """
+    Create an engine configured with a connection profile.
+
+    Args:
+        url: Database URL
+        profile: Name of a DATABASE_PROFILES entry
+        **kwargs: Extra create_engine arguments (override the profile's pool settings)
+
+    Returns:
+        SQLAlchemy engine
+    """
+    if profile not in DATABASE_PROFILES:
+        raise ValueError(f"Unknown database profile: {profile}")
+    settings = DATABASE_PROFILES[profile]
+
+    options: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    options.update(settings["pool"])
+    options.update(kwargs)
+    engine = create_engine(url, **options)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        apply_pragmas(dbapi_connection, settings["pragmas"])
+
+    return engine
+
+
 # Create SQLAlchemy engine
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_database_engine(SQLALCHEMY_DATABASE_URL, DEFAULT_PROFILE)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Engines for other profiles on the application database, created on first use
+_profile_engines: Dict[str, Engine] = {DEFAULT_PROFILE: engine}
+
 # Create Base class
 Base = declarative_base()
 
 
+def get_engine(profile: Optional[str] = None) -> Engine:
+    """Engine for the application database under a connection profile."""
+    profile = profile or DEFAULT_PROFILE
+    if profile not in _profile_engines:
+        _profile_engines[profile] = create_database_engine(SQLALCHEMY_DATABASE_URL, profile)
+    return _profile_engines[profile]
+
+
+def get_session(profile: Optional[str] = None) -> Session:
+    """New session on the application database, e.g. get_session("bulk_import") for imports."""
+    return Session(bind=get_engine(profile), autoflush=False)
+
+
+def upgrade_schema(bind: Engine) -> None:
+    """
+    Create missing tables, then bring existing ones up to date where SQLite allows it.
+
+    create_all skips tables that already exist. Nullable columns without a default,
+    virtual generated columns and indexes can be added to an existing table, so those
+    are added here; other column changes still need a migration script.
+
+    Args:
+        bind: Engine to upgrade
+    """
+    Base.metadata.create_all(bind=bind)
+
+    inspector = inspect(bind)
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not _can_add_column(column):
+                    continue
+                ddl = CreateColumn(column).compile(dialect=bind.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
+def _can_add_column(column: Any) -> bool:
+    """Whether SQLite can ALTER TABLE ADD COLUMN this column onto an existing table."""
+    if column.computed is not None:
+        return not column.computed.persisted
+    return (
+        column.nullable
+        and not column.primary_key
+        and column.default is None
+        and column.server_default is None
+    )
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -0,0 +1,90 @@
+"""
+Runs synchronous Session work off the event loop.
+
+Services are async but use a synchronous SQLAlchemy Session, so a slow query would
+block every other request on the uvicorn loop. run_in_db_thread executes the blocking
+part on a dedicated thread pool and awaits the result. Calls sharing a Session are
+serialized, since a Session must not be used from two threads at once.
+
+Work that can outlive the request, such as a background cache refresh, runs with
+run_in_own_session instead: by then get_db may have closed the request's Session.
+"""
+
+from typing import Any, Callable, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.orm import Session
+import asyncio
+import contextvars
+import copy
+import functools
+import threading
+
+T = TypeVar("T")
+
+# Stays below the serving profile's pool size so offloaded reads never wait on the pool
+DB_THREAD_WORKERS = 8
+
+# Session.info key holding the lock that serializes offloaded calls on a Session
+SESSION_LOCK_KEY = "db_thread_lock"
+
+_executor = ThreadPoolExecutor(max_workers=DB_THREAD_WORKERS, thread_name_prefix="db")
+
+
+def session_lock(db: Session) -> threading.RLock:
+    """Lock serializing offloaded calls that use the same Session."""
+    return db.info.setdefault(SESSION_LOCK_KEY, threading.RLock())
+
+
+async def run_in_db_thread(db: Session, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run blocking Session work on the database thread pool.
+
+    Args:
+        db: Session the work uses
+        fn: Synchronous callable doing the work
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        fn's return value
+    """
+    lock = session_lock(db)
+    context = contextvars.copy_context()
+
+    def call() -> T:
+        with lock:
+            return context.run(functools.partial(fn, *args, **kwargs))
+
+    return await asyncio.get_running_loop().run_in_executor(_executor, call)
+
+
+async def run_in_own_session(service: Any, method: str, *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a service's blocking method on a Session of its own, on the database thread pool.
+
+    The method runs on a shallow copy of the service whose db is a new Session on the
+    same bind as the service's, closed when the method returns. The service's own
+    Session is never touched, so it may already be closed.
+
+    Args:
+        service: Service whose db attribute is the (request's) Session
+        method: Name of the blocking method to call
+        *args: Positional arguments for the method
+        **kwargs: Keyword arguments for the method
+
+    Returns:
+        The method's return value
+    """
+    bind = service.db.get_bind()
+    context = contextvars.copy_context()
+
+    def call() -> Any:
+        db = Session(bind=bind, autoflush=False)
+        try:
+            own = copy.copy(service)
+            own.db = db
+            return context.run(functools.partial(getattr(own, method), *args, **kwargs))
+        finally:
+            db.close()
+
+    return await asyncio.get_running_loop().run_in_executor(_executor, call)
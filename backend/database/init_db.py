@@ -7,7 +7,7 @@ import os
 project_root = str(Path(__file__).parent.parent.parent)
 sys.path.insert(0, project_root)
 
-from backend.database.database import engine, Base, SessionLocal
+from backend.database.database import engine, SessionLocal, upgrade_schema
 from backend.database.models import (
     Player,
     BaseStat,
@@ -32,7 +32,7 @@ def init_db():
             json.dump(default_rookies, f, indent=2)
 
     # Create database tables
-    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
 
     # Initialize rookie templates
     print("Initializing rookie templates...")
@@ -1,5 +1,6 @@
 from sqlalchemy import (
     Column,
+    Computed,
     Integer,
     Float,
     String,
@@ -27,9 +28,42 @@ class DraftStatus(str, enum.Enum):
     WATCHED = "watched"
 
 
+class JobStatus(str, enum.Enum):
+    """Lifecycle of a background job"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
 # First ImportLog class removed to fix duplication error
 
 
+# Per-game stats also exposed as columns of GameStats, so they can be filtered,
+# indexed and aggregated in SQL instead of parsing the stats JSON in Python
+GAME_STAT_COLUMNS = [
+    "pass_attempts",
+    "completions",
+    "pass_yards",
+    "pass_td",
+    "interceptions",
+    "rush_attempts",
+    "rush_yards",
+    "rush_td",
+    "targets",
+    "receptions",
+    "rec_yards",
+    "rec_td",
+]
+
+
+def json_stat(name: str) -> Computed:
+    """Virtual generated column reading one numeric stat out of GameStats.stats."""
+    return Computed(f"CAST(json_extract(stats, '$.{name}') AS REAL)", persisted=False)
+
+
 class GameStats(Base):
     """Game-by-game player statistics"""
 
@@ -52,6 +86,21 @@ class GameStats(Base):
     # Store position-specific stats in JSON
     stats: Mapped[Dict] = mapped_column(JSON, nullable=False)
 
+    # Core stats from the JSON as virtual columns (GAME_STAT_COLUMNS); read-only,
+    # NULL when the stat is absent
+    pass_attempts: Mapped[Optional[float]] = mapped_column(Float, json_stat("pass_attempts"))
+    completions: Mapped[Optional[float]] = mapped_column(Float, json_stat("completions"))
+    pass_yards: Mapped[Optional[float]] = mapped_column(Float, json_stat("pass_yards"))
+    pass_td: Mapped[Optional[float]] = mapped_column(Float, json_stat("pass_td"))
+    interceptions: Mapped[Optional[float]] = mapped_column(Float, json_stat("interceptions"))
+    rush_attempts: Mapped[Optional[float]] = mapped_column(Float, json_stat("rush_attempts"))
+    rush_yards: Mapped[Optional[float]] = mapped_column(Float, json_stat("rush_yards"))
+    rush_td: Mapped[Optional[float]] = mapped_column(Float, json_stat("rush_td"))
+    targets: Mapped[Optional[float]] = mapped_column(Float, json_stat("targets"))
+    receptions: Mapped[Optional[float]] = mapped_column(Float, json_stat("receptions"))
+    rec_yards: Mapped[Optional[float]] = mapped_column(Float, json_stat("rec_yards"))
+    rec_td: Mapped[Optional[float]] = mapped_column(Float, json_stat("rec_td"))
+
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -61,6 +110,10 @@ class GameStats(Base):
     __table_args__ = (
         Index("ix_game_stats_player_season", "player_id", "season"),
         Index("ix_game_stats_season_week", "season", "week"),
+        # Weekly leaderboards by yardage
+        Index("ix_game_stats_season_week_pass_yards", "season", "week", "pass_yards"),
+        Index("ix_game_stats_season_week_rush_yards", "season", "week", "rush_yards"),
+        Index("ix_game_stats_season_week_rec_yards", "season", "week", "rec_yards"),
     )
 
     @classmethod
@@ -145,6 +198,7 @@ class Player(Base):
     # Relationships
     game_stats = relationship("GameStats", back_populates="player")
     base_stats = relationship("BaseStat", back_populates="player")
+    season_stats = relationship("PlayerSeasonStats", back_populates="player")
     projections = relationship("Projection", back_populates="player")
     stat_overrides = relationship("StatOverride", back_populates="player")
 
@@ -178,6 +232,114 @@ class BaseStat(Base):
     player = relationship("Player", back_populates="base_stats")
 
 
+class PlayerSeasonStats(Base):
+    """Season totals, one typed row per player and season"""
+
+    __tablename__ = "player_season_stats"
+
+    season_stats_id: Mapped[str] = mapped_column(
+        String, primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    player_id: Mapped[str] = mapped_column(ForeignKey("players.player_id"), nullable=False)
+    season: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    games: Mapped[Optional[float]] = mapped_column(Float)
+
+    # Passing
+    pass_attempts: Mapped[Optional[float]] = mapped_column(Float)
+    completions: Mapped[Optional[float]] = mapped_column(Float)
+    pass_yards: Mapped[Optional[float]] = mapped_column(Float)
+    pass_td: Mapped[Optional[float]] = mapped_column(Float)
+    interceptions: Mapped[Optional[float]] = mapped_column(Float)
+
+    # Rushing
+    rush_attempts: Mapped[Optional[float]] = mapped_column(Float)
+    rush_yards: Mapped[Optional[float]] = mapped_column(Float)
+    rush_td: Mapped[Optional[float]] = mapped_column(Float)
+
+    # Receiving
+    targets: Mapped[Optional[float]] = mapped_column(Float)
+    receptions: Mapped[Optional[float]] = mapped_column(Float)
+    rec_yards: Mapped[Optional[float]] = mapped_column(Float)
+    rec_td: Mapped[Optional[float]] = mapped_column(Float)
+
+    # Efficiency metrics, as written by calculate_season_totals (comp_pct and catch_rate
+    # are percentages)
+    comp_pct: Mapped[Optional[float]] = mapped_column(Float)
+    yards_per_att: Mapped[Optional[float]] = mapped_column(Float)
+    pass_td_rate: Mapped[Optional[float]] = mapped_column(Float)
+    int_rate: Mapped[Optional[float]] = mapped_column(Float)
+    yards_per_carry: Mapped[Optional[float]] = mapped_column(Float)
+    catch_rate: Mapped[Optional[float]] = mapped_column(Float)
+    yards_per_target: Mapped[Optional[float]] = mapped_column(Float)
+    yards_per_reception: Mapped[Optional[float]] = mapped_column(Float)
+
+    half_ppr: Mapped[Optional[float]] = mapped_column(Float)
+
+    # Stat types without a column of their own
+    extra: Mapped[Dict] = mapped_column(JSON, nullable=False, default=dict)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    # Relationships
+    player = relationship("Player", back_populates="season_stats")
+
+    __table_args__ = (
+        Index("ix_player_season_stats_player_season", "player_id", "season", unique=True),
+    )
+
+    def to_stat_dict(self) -> Dict[str, float]:
+        """Stats as {stat_type: value}, the shape BaseStat rows are read into."""
+        stats = {
+            name: float(getattr(self, name))
+            for name in SEASON_STAT_FIELDS
+            if getattr(self, name) is not None
+        }
+        for name, value in (self.extra or {}).items():
+            if value is not None:
+                stats.setdefault(name, float(value))
+        return stats
+
+
+# Typed stat columns of PlayerSeasonStats, in declaration order
+SEASON_STAT_FIELDS = [
+    column.name
+    for column in PlayerSeasonStats.__table__.columns
+    if column.name
+    not in ("season_stats_id", "player_id", "season", "extra", "created_at", "updated_at")
+]
+
+
+class StatVariance(Base):
+    """Week-to-week moments of one stat for a player and season, kept by the import pipeline"""
+
+    __tablename__ = "stat_variance"
+
+    stat_variance_id: Mapped[str] = mapped_column(
+        String, primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    player_id: Mapped[str] = mapped_column(ForeignKey("players.player_id"), nullable=False)
+    season: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    stat: Mapped[str] = mapped_column(String, nullable=False)  # a GAME_STAT_COLUMNS name
+
+    # Games with the stat, and the sum and sum of squares of its values; seasons
+    # combine by adding them
+    games: Mapped[int] = mapped_column(Integer, nullable=False)
+    total: Mapped[float] = mapped_column(Float, nullable=False)
+    total_sq: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # Version of the season's game logs when the season was refreshed in full (see
+    # StatVarianceService.season_versions); None for rows of a partial refresh
+    version: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_stat_variance_player_season_stat", "player_id", "season", "stat", unique=True),
+    )
+
+
 class TeamStat(Base):
     """Team-level offensive statistics and metrics"""
 
@@ -378,47 +540,18 @@ class Projection(Base):
 
     def calculate_fantasy_points(self, scoring_type: str = "half") -> float:
         """
-        Calculate fantasy points with enhanced accuracy
+        Calculate fantasy points under a built-in scoring format.
+
+        Net passing and rushing yards are used when available.
 
         Args:
             scoring_type: 'standard', 'half', or 'ppr'
         """
-        points = 0.0
-
-        # Passing points - use net passing yards if available
-        pass_yards = self.net_pass_yards if self.net_pass_yards is not None else self.pass_yards
-        if pass_yards:
-            points += pass_yards / 25.0  # 0.04 points per passing yard
-        if self.pass_td:
-            points += self.pass_td * 4.0
-        if self.interceptions:
-            points -= self.interceptions * 2.0
-
-        # Rushing points - use net rushing yards if available
-        rush_yards = self.net_rush_yards if self.net_rush_yards is not None else self.rush_yards
-        if rush_yards:
-            points += rush_yards / 10.0  # 0.1 points per rushing yard
-        if self.rush_td:
-            points += self.rush_td * 6.0
-
-        # Fumble penalty
-        if self.fumbles:
-            points -= self.fumbles * 2.0
-
-        # Receiving points
-        if self.receptions:
-            if scoring_type == "ppr":
-                points += self.receptions * 1.0  # Full PPR
-            elif scoring_type == "half":
-                points += self.receptions * 0.5  # Half PPR
-            # No points for receptions in standard scoring
-
-        if self.rec_yards:
-            points += self.rec_yards / 10.0  # 0.1 points per receiving yard
-        if self.rec_td:
-            points += self.rec_td * 6.0
-
-        return points
+        # Imported here: the scoring service imports these models
+        from backend.services.scoring_service import PRESET_RULES, SCORING_INPUT_COLUMNS
+
+        values = {stat: getattr(self, stat) for stat in SCORING_INPUT_COLUMNS}
+        return float(PRESET_RULES[scoring_type].score(values))
 
     @property
     def standard(self) -> float:
@@ -452,6 +585,44 @@ class Scenario(Base):
 
     # Relationships
     projections = relationship("Projection", back_populates="scenario")
+    projection_deltas = relationship("ProjectionDelta", back_populates="scenario")
+
+
+class ProjectionDelta(Base):
+    """
+    Copy-on-write change a scenario makes to a projection it inherits from its base
+    scenario. Only the changed fields are stored; everything else resolves through
+    the base_scenario_id chain.
+    """
+
+    __tablename__ = "projection_deltas"
+
+    delta_id: Mapped[str] = mapped_column(
+        String, primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    scenario_id: Mapped[str] = mapped_column(String, ForeignKey("scenarios.scenario_id"))
+    player_id: Mapped[str] = mapped_column(String, ForeignKey("players.player_id"))
+    season: Mapped[int] = mapped_column(Integer, nullable=False)
+    changes: Mapped[Dict] = mapped_column(JSON, nullable=False, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    # Relationships
+    scenario = relationship("Scenario", back_populates="projection_deltas")
+    player = relationship("Player")
+
+    __table_args__ = (
+        Index("ix_projection_deltas_scenario_season", "scenario_id", "season"),
+        Index(
+            "ix_projection_deltas_scenario_player_season",
+            "scenario_id",
+            "player_id",
+            "season",
+            unique=True,
+        ),
+    )
 
 
 class StatOverride(Base):
@@ -553,4 +724,37 @@ class ImportLog(Base):
     status: Mapped[str] = mapped_column(String, nullable=False)  # success, warning, error
     message: Mapped[str] = mapped_column(String, nullable=False)
     details: Mapped[Optional[Dict]] = mapped_column(JSON, nullable=True)
+
+    # High-water marks for incremental imports: the newest row per (dataset, season)
+    # holds the last imported position, e.g. the last imported week
+    dataset: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    season: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    watermark: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_import_logs_dataset_season", "dataset", "season", "created_at"),
+    )
+
+
+class Job(Base):
+    """Background job run by the in-process job runner"""
+
+    __tablename__ = "jobs"
+
+    job_id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    operation: Mapped[str] = mapped_column(String, nullable=False)  # e.g. nfl_import
+    status: Mapped[str] = mapped_column(Enum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    message: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    params: Mapped[Optional[Dict]] = mapped_column(JSON, nullable=True)
+    progress: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)  # 0.0 - 1.0
+    result: Mapped[Optional[Dict]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (Index("ix_jobs_status_created", "status", "created_at"),)
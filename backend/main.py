@@ -18,7 +18,9 @@ from backend.api.routes import (
 from backend.api.routes.batch import router as batch_router
 from backend.api.routes.draft import router as draft_router
 from backend.api.routes.performance import router as performance_router
-from backend.database import Base, engine
+from backend.api.routes.jobs import router as jobs_router
+from backend.database import engine
+from backend.database.database import upgrade_schema
 from backend.services import TeamStatService
 import logging
 from pathlib import Path
@@ -37,8 +39,8 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Fantasy Football Projections API")
     try:
-        # Verify database connection
-        Base.metadata.create_all(bind=engine)
+        # Verify database connection and bring the schema up to date
+        upgrade_schema(engine)
         logger.info("Database connection verified")
 
         # Ensure rookies.json exists
@@ -49,8 +51,19 @@ async def lifespan(app: FastAPI):
         # Initialize cache service
         from backend.services.cache_service import get_cache
 
-        cache = get_cache(ttl_seconds=300)  # 5 minute default TTL
-        logger.info(f"Cache service initialized")
+        # CACHE_L2_PATH shares the cache between workers through one SQLite file
+        l2_path = os.environ.get("CACHE_L2_PATH")
+        cache = get_cache(ttl_seconds=300, l2_path=l2_path)  # 5 minute default TTL
+        logger.info(
+            f"Cache service initialized" + (f" (shared tier: {l2_path})" if l2_path else "")
+        )
+
+        # Jobs a previous process left unfinished can no longer complete
+        from backend.services.job_service import get_job_runner
+
+        interrupted = get_job_runner().recover_interrupted()
+        if interrupted:
+            logger.warning(f"Marked {interrupted} interrupted background jobs as failed")
 
     except Exception as e:
         logger.error(f"Failed to initialize application: {str(e)}")
@@ -60,6 +73,11 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Fantasy Football Projections API")
+    get_job_runner().shutdown()
+
+    from backend.services.mock_draft_service import shutdown_mock_draft_pool
+
+    shutdown_mock_draft_pool()
 
 
 # Create the FastAPI app with lifespan manager
@@ -109,13 +127,14 @@ app.include_router(scenarios_router, prefix="/api/scenarios", tags=["scenarios"]
 app.include_router(batch_router, prefix="/api/batch", tags=["batch operations"])
 app.include_router(draft_router, prefix="/api/draft", tags=["draft tools"])
 app.include_router(performance_router, prefix="/api/performance", tags=["performance"])
+app.include_router(jobs_router, prefix="/api/jobs", tags=["jobs"])
 
 # Ensure data directory exists
 data_dir = Path("data")
 data_dir.mkdir(exist_ok=True)
 
 # Create database tables
-Base.metadata.create_all(bind=engine)
+upgrade_schema(engine)
 
 
 @app.get("/api/health")
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""
+Benchmark the SQLite connection profiles against an unconfigured engine.
+
+Each profile gets a fresh temporary database file and runs three workloads:
+
+- draft picks: single-row draft_status updates, one commit each
+- bulk import: player rows inserted in batches, one commit per batch
+- reads under write: reader latency while another thread keeps committing
+
+Usage:
+    python backend/scripts/benchmark_db_profiles.py [--picks 300] [--rows 20000]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.exc import OperationalError
+
+# Add the project root directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.database.database import Base, create_database_engine
+from backend.database.models import Player
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+POSITIONS = ["QB", "RB", "WR", "TE"]
+PLAYERS = Player.__table__
+
+
+def make_engine(profile: str, url: str) -> Any:
+    """Engine for a profile; "default" is a bare engine as the app used to create."""
+    if profile == "default":
+        return create_engine(url, connect_args={"check_same_thread": False})
+    return create_database_engine(url, profile)
+
+
+def player_rows(start: int, count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "player_id": f"p{i}",
+            "name": f"Player {i}",
+            "team": "KC",
+            "position": POSITIONS[i % len(POSITIONS)],
+            "status": "Active",
+            "depth_chart_position": "Backup",
+            "is_fill_player": False,
+            "is_rookie": False,
+            "draft_status": "available",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def bench_bulk_import(engine: Any, rows: int, batch: int = 1000) -> float:
+    """Seconds to insert `rows` players in committed batches."""
+    started = time.perf_counter()
+    for start in range(0, rows, batch):
+        with engine.begin() as conn:
+            conn.execute(PLAYERS.insert(), player_rows(start, min(batch, rows - start)))
+    return time.perf_counter() - started
+
+
+def bench_draft_picks(engine: Any, picks: int) -> float:
+    """Seconds for `picks` single-row updates, each in its own transaction."""
+    started = time.perf_counter()
+    for i in range(picks):
+        with engine.begin() as conn:
+            conn.execute(
+                update(PLAYERS)
+                .where(PLAYERS.c.player_id == f"p{i}")
+                .values(draft_status="drafted", draft_order=i + 1)
+            )
+    return time.perf_counter() - started
+
+
+def bench_reads_under_write(engine: Any, reads: int) -> Dict[str, Any]:
+    """Reader latency (ms) and lock errors while a writer thread commits continuously."""
+    stop = threading.Event()
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        update(PLAYERS)
+                        .where(PLAYERS.c.player_id == f"p{i % 1000}")
+                        .values(draft_status="watched" if i % 2 else "available")
+                    )
+            except OperationalError:
+                pass
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    latencies: List[float] = []
+    errors = 0
+    try:
+        query = (
+            select(PLAYERS.c.position, func.count())
+            .where(PLAYERS.c.draft_status == "available")
+            .group_by(PLAYERS.c.position)
+        )
+        for _ in range(reads):
+            started = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(query).all()
+            except OperationalError:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        stop.set()
+        thread.join()
+
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies) if latencies else float("nan"),
+        "p95": latencies[int(len(latencies) * 0.95) - 1] if latencies else float("nan"),
+        "errors": errors,
+    }
+
+
+def run(profiles: List[str], picks: int, rows: int, reads: int) -> List[Dict[str, Any]]:
+    results = []
+    for profile in profiles:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = make_engine(profile, f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            Base.metadata.create_all(bind=engine)
+
+            result: Dict[str, Any] = {"profile": profile}
+            result["bulk_s"] = bench_bulk_import(engine, rows)
+            result["picks_s"] = bench_draft_picks(engine, picks)
+            result.update(bench_reads_under_write(engine, reads))
+            engine.dispose()
+            results.append(result)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SQLite connection profiles")
+    parser.add_argument("--profiles", nargs="+", default=["default", "serving", "bulk_import"])
+    parser.add_argument("--picks", type=int, default=300)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--reads", type=int, default=300)
+    args = parser.parse_args()
+
+    results = run(args.profiles, args.picks, args.rows, args.reads)
+
+    logger.info(
+        f"{'profile':<12} {'bulk import':>12} {'draft picks':>12} "
+        f"{'read p50':>10} {'read p95':>10} {'lock errs':>10}"
+    )
+    for r in results:
+        logger.info(
+            f"{r['profile']:<12} {r['bulk_s']:>11.2f}s {r['picks_s']:>11.2f}s "
+            f"{r['p50']:>8.2f}ms {r['p95']:>8.2f}ms {r['errors']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
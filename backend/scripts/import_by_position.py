@@ -16,9 +16,14 @@ from typing import List, Optional
 # Add the project root directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from backend.database.database import get_db
+from backend.database.database import get_session
 from backend.database.models import Player
 from backend.services.nfl_data_import_service import NFLDataImportService
+from backend.services.adapters.nfl_data_cache import (
+    DEFAULT_CACHE_DIR,
+    REFRESH_POLICIES,
+    configure_nfl_data_cache,
+)
 
 # Configure logging
 import os
@@ -49,7 +54,7 @@ async def import_position(season: int, position: str) -> None:
     logger.info(f"Starting import for position {position} in season {season}")
 
     # Get database session
-    db = next(get_db())
+    db = get_session("bulk_import")
 
     try:
         # Initialize service
@@ -255,8 +260,8 @@ async def calculate_position_totals(
 
         logger.info(f"Found {len(players)} {position} players with game stats")
 
-        # Then use the service's existing method to calculate totals for each player
-        totals_created = 0
+        # Totals are collected for every player, then saved in one bulk write
+        totals_by_player = {}
 
         for player in players:
             # Get all game stats for this player and season
@@ -357,37 +362,15 @@ async def calculate_position_totals(
             # Calculate half-PPR fantasy points
             fantasy_points = service._calculate_fantasy_points(totals, position)
 
-            # Create or update BaseStat records using service's helper methods
-            existing_stats = service._get_player_base_stats(player.player_id, season)
-
-            # Update base stats in database
-            if existing_stats:
-                # Update existing base stats
-                for stat_name, value in totals.items():
-                    service._update_base_stat(existing_stats, stat_name, value)
-
-                # Update games and half_ppr
-                games_stat = next((s for s in existing_stats if s.stat_type == "games"), None)
-                if games_stat:
-                    games_stat.value = games_played
-                else:
-                    service._create_base_stat(player.player_id, season, "games", games_played)
-
-                half_ppr_stat = next((s for s in existing_stats if s.stat_type == "half_ppr"), None)
-                if half_ppr_stat:
-                    half_ppr_stat.value = fantasy_points
-                else:
-                    service._create_base_stat(player.player_id, season, "half_ppr", fantasy_points)
-            else:
-                # Create new base stats for all values
-                for stat_name, value in totals.items():
-                    service._create_base_stat(player.player_id, season, stat_name, value)
-
-                # Add games and half_ppr
-                service._create_base_stat(player.player_id, season, "games", games_played)
-                service._create_base_stat(player.player_id, season, "half_ppr", fantasy_points)
+            totals_by_player[player.player_id] = {
+                **totals,
+                "games": games_played,
+                "half_ppr": fantasy_points,
+            }
 
-                totals_created += 1
+        # Season totals live in PlayerSeasonStats (BaseStat rows are mirrored from it)
+        totals_created = service.season_stats.bulk_save_season_totals(season, totals_by_player)
+        service.stat_variance.refresh_season(season)
 
         # Commit changes
         db.commit()
@@ -534,6 +517,11 @@ async def validate_position_data(service: NFLDataImportService, season: int, pos
 
         # Commit fixes
         if issues_fixed > 0:
+            # Fixes were made on the BaseStat rows; carry them into the season rows
+            db.flush()
+            service.season_stats.sync_from_base_stats(
+                season, [player.player_id for player in players]
+            )
             db.commit()
 
         results = {
@@ -557,7 +545,7 @@ async def import_team_stats(season: int) -> None:
     logger.info(f"Starting team stats import for season {season}")
 
     # Get database session
-    db = next(get_db())
+    db = get_session("bulk_import")
 
     try:
         # Initialize service
@@ -588,8 +576,27 @@ async def main():
         required=True,
         help='Position to import or "team" for team stats or "all" for all positions',
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help="Directory caching downloaded nfl_data_py frames",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always download, cache nothing")
+    parser.add_argument(
+        "--refresh",
+        choices=REFRESH_POLICIES,
+        default="auto",
+        help="auto: re-download only the current season after 12 hours; "
+        "always: re-download everything; never: use any cached frame",
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="Only use cached frames, never download"
+    )
 
     args = parser.parse_args()
+    configure_nfl_data_cache(
+        None if args.no_cache else args.cache_dir, refresh=args.refresh, offline=args.offline
+    )
 
     try:
         if args.position == "all":
@@ -597,7 +604,7 @@ async def main():
             logger.info(f"Starting import for all positions in season {args.season}")
 
             # First import players
-            db = next(get_db())
+            db = get_session("bulk_import")
             service = NFLDataImportService(db)
             await service.import_players(args.season)
             db.close()
@@ -17,8 +17,13 @@ from typing import List, Optional
 # Add the project root directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from backend.database.database import get_db
+from backend.database.database import get_session
 from backend.services.nfl_data_import_service import NFLDataImportService
+from backend.services.adapters.nfl_data_cache import (
+    DEFAULT_CACHE_DIR,
+    REFRESH_POLICIES,
+    configure_nfl_data_cache,
+)
 
 # Configure logging
 import os
@@ -38,24 +43,25 @@ logging.basicConfig(
 logger = logging.getLogger("nfl_data_import")
 
 
-async def import_season(season: int) -> None:
+async def import_season(season: int, incremental: bool = False) -> None:
     """
     Import a full season of NFL data.
 
     Args:
         season: NFL season year (e.g., 2023)
+        incremental: Only import weeks newer than the last import
     """
     logger.info(f"Starting import for season {season}")
 
     # Get database session
-    db = next(get_db())
+    db = get_session("bulk_import")
 
     try:
         # Initialize service
         service = NFLDataImportService(db)
 
         # Import full season
-        results = await service.import_season(season)
+        results = await service.import_season(season, incremental=incremental)
 
         # Log results
         logger.info(f"Import complete for season {season}")
@@ -69,6 +75,33 @@ async def import_season(season: int) -> None:
         db.close()
 
 
+async def import_seasons(seasons: List[int]) -> None:
+    """
+    Import several full seasons, downloading them concurrently.
+
+    Args:
+        seasons: NFL season years (e.g., [2022, 2023])
+    """
+    logger.info(f"Starting import for seasons {seasons}")
+
+    # Get database session
+    db = get_session("bulk_import")
+
+    try:
+        service = NFLDataImportService(db)
+        results = await service.import_seasons(seasons)
+
+        logger.info(f"Import complete for seasons {seasons}")
+        logger.info(f"Results: {results}")
+
+    except Exception as e:
+        logger.error(f"Error importing seasons {seasons}: {str(e)}")
+        logger.debug(f"Stack trace: {traceback.format_exc()}")
+        raise
+    finally:
+        db.close()
+
+
 async def import_specific_data(
     seasons: List[int],
     data_type: str,
@@ -91,7 +124,7 @@ async def import_specific_data(
         logger.info(f"Player limit enabled with limit of {player_limit} players")
 
     # Get database session
-    db = next(get_db())
+    db = get_session("bulk_import")
 
     try:
         # Initialize service
@@ -153,7 +186,7 @@ async def main():
     )
     parser.add_argument(
         "--type",
-        choices=["full", "players", "weekly", "team", "totals", "validate"],
+        choices=["full", "incremental", "players", "weekly", "team", "totals", "validate"],
         default="full",
         help="Type of data to import",
     )
@@ -165,13 +198,38 @@ async def main():
     parser.add_argument(
         "--player_limit", type=int, help="Limit number of players for weekly stats import"
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help="Directory caching downloaded nfl_data_py frames",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always download, cache nothing")
+    parser.add_argument(
+        "--refresh",
+        choices=REFRESH_POLICIES,
+        default="auto",
+        help="auto: re-download only the current season after 12 hours; "
+        "always: re-download everything; never: use any cached frame",
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="Only use cached frames, never download"
+    )
 
     args = parser.parse_args()
+    configure_nfl_data_cache(
+        None if args.no_cache else args.cache_dir, refresh=args.refresh, offline=args.offline
+    )
 
     if args.type == "full":
-        # Import full seasons one by one
+        if len(args.seasons) == 1:
+            await import_season(args.seasons[0])
+        else:
+            # Downloads overlap; database writes still go one season at a time
+            await import_seasons(args.seasons)
+    elif args.type == "incremental":
+        # New weeks only, with season totals updated for the players in them
         for season in args.seasons:
-            await import_season(season)
+            await import_season(season, incremental=True)
     else:
         # Import specific data type for all seasons
         await import_specific_data(args.seasons, args.type, args.limit, args.player_limit)
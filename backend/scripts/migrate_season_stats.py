@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Migrate BaseStat season totals into the wide player_season_stats table.
+
+Creates the table if needed and writes one row per player-season from the BaseStat
+rows with no week. Safe to re-run: existing rows are overwritten with the BaseStat
+values. Until a season is migrated, reads fall back to BaseStat for it.
+
+Usage:
+    python backend/scripts/migrate_season_stats.py [--season 2024] [--dry-run]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add the project root directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.database.database import get_engine, get_session
+from backend.database.models import PlayerSeasonStats
+from backend.services.season_stats_service import SeasonStatsService
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate BaseStat season totals")
+    parser.add_argument("--season", type=int, help="Only migrate this season")
+    parser.add_argument("--dry-run", action="store_true", help="Roll back instead of committing")
+    args = parser.parse_args()
+
+    PlayerSeasonStats.__table__.create(bind=get_engine("bulk_import"), checkfirst=True)
+
+    db = get_session("bulk_import")
+    try:
+        count = SeasonStatsService(db).sync_from_base_stats(season=args.season)
+        if args.dry_run:
+            db.rollback()
+            logger.info(f"Dry run: {count} player-seasons would be migrated")
+        else:
+            db.commit()
+            logger.info(f"Migrated {count} player-seasons")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Migration failed: {str(e)}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
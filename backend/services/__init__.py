@@ -2,6 +2,8 @@
 Services package initialization.
 """
 
+# Registers the commit-time cache invalidation hooks on every session
+import backend.services.cache_invalidation  # noqa: F401
 from backend.services.data_service import DataService
 from backend.services.projection_service import ProjectionService
 from backend.services.team_stat_service import TeamStatService
@@ -0,0 +1,263 @@
+"""
+On-disk cache for nfl_data_py frames.
+
+Every import otherwise downloads the same weekly, seasonal, roster and schedule
+frames again. NFLDataCache keeps each frame on disk keyed by dataset and season:
+
+- objects/ holds the frames, content-addressed by the SHA-256 of their serialized
+  bytes, so a refresh that downloads identical data writes nothing new
+- refs/ holds one small JSON file per (dataset, season) naming its object and when
+  it was fetched; refs are replaced atomically, so readers never see a partial write
+
+Frames are stored as Parquet when pyarrow is installed and as pickles otherwise
+(or when a frame has columns Parquet cannot store), so the cache directory must only
+be writable by the application itself.
+
+Refresh policies:
+
+- "auto": completed seasons are never downloaded again; the current season and
+  season-less datasets (players, team descriptions) are refreshed after max_age
+- "always": download every time and update the cache
+- "never": use any cached frame regardless of age
+
+In offline mode the network is never used; a frame missing from the cache raises
+NFLDataCacheMiss. This lets tests and benchmarks replay real-size data locally.
+
+The cache is off unless configured, either with configure_nfl_data_cache (the import
+scripts do this) or the NFL_DATA_CACHE_DIR, NFL_DATA_CACHE_REFRESH and
+NFL_DATA_OFFLINE environment variables.
+"""
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+REFRESH_POLICIES = ("auto", "always", "never")
+
+# Default location used by the import scripts
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "nfl_data_cache"
+
+# How long frames that can still change (current season, season-less datasets) are kept
+DEFAULT_MAX_AGE = timedelta(hours=12)
+
+# The NFL season that starts in September ends with the Super Bowl in February
+SEASON_COMPLETE_MONTH = 3
+
+
+class NFLDataCacheMiss(LookupError):
+    """Raised in offline mode when a frame is not cached."""
+
+
+def season_is_complete(season: int, today: Optional[date] = None) -> bool:
+    """Whether a season's data can no longer change."""
+    today = today or date.today()
+    return today >= date(season + 1, SEASON_COMPLETE_MONTH, 1)
+
+
+class NFLDataCache:
+    """Content-addressed on-disk cache of nfl_data_py frames."""
+
+    def __init__(
+        self,
+        root: Any,
+        refresh: str = "auto",
+        offline: bool = False,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+    ):
+        """
+        Args:
+            root: Cache directory (created if missing)
+            refresh: One of REFRESH_POLICIES
+            offline: Never download; missing frames raise NFLDataCacheMiss
+            max_age: Refresh age for frames that can still change, under "auto"
+        """
+        if refresh not in REFRESH_POLICIES:
+            raise ValueError(f"Unknown refresh policy: {refresh}")
+        self.root = Path(root)
+        self.refresh = refresh
+        self.offline = offline
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        (self.root / "objects").mkdir(parents=True, exist_ok=True)
+        (self.root / "refs").mkdir(parents=True, exist_ok=True)
+
+    def fetch(
+        self, dataset: str, season: Optional[int], download: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Cached frame for a dataset and season, downloading it when needed.
+
+        Args:
+            dataset: Dataset name (e.g., "weekly")
+            season: NFL season year, or None for season-less datasets
+            download: Blocking call that downloads the frame
+
+        Returns:
+            The frame
+        """
+        ref = self._read_ref(dataset, season)
+        if ref is not None and (self.offline or self._is_fresh(ref, season)):
+            frame = self._load(ref)
+            if frame is not None:
+                return frame
+
+        if self.offline:
+            raise NFLDataCacheMiss(f"{self._key(dataset, season)} is not cached (offline mode)")
+
+        frame = download()
+        try:
+            self.store(dataset, season, frame)
+        except OSError as e:
+            logger.warning(f"Could not cache {self._key(dataset, season)}: {str(e)}")
+        return frame
+
+    def store(self, dataset: str, season: Optional[int], frame: pd.DataFrame) -> str:
+        """
+        Write a frame and point the dataset's ref at it.
+
+        Args:
+            dataset: Dataset name
+            season: NFL season year, or None
+            frame: Frame to store
+
+        Returns:
+            SHA-256 of the stored object
+        """
+        data, fmt = self._serialize(frame)
+        digest = hashlib.sha256(data).hexdigest()
+        obj = self.root / "objects" / f"{digest}.{fmt}"
+        if not obj.exists():
+            self._write_atomic(obj, data)
+
+        ref = {
+            "dataset": dataset,
+            "season": season,
+            "object": obj.name,
+            "format": fmt,
+            "rows": len(frame),
+            "fetched_at": datetime.utcnow().isoformat(),
+        }
+        with self._lock:
+            previous = self._read_ref(dataset, season)
+            self._write_atomic(self._ref_path(dataset, season), json.dumps(ref).encode())
+            if previous and previous["object"] != obj.name:
+                self._remove_unreferenced(previous["object"])
+        return digest
+
+    def _is_fresh(self, ref: Dict[str, Any], season: Optional[int]) -> bool:
+        if self.refresh == "never":
+            return True
+        if self.refresh == "always":
+            return False
+        if season is not None and season_is_complete(season):
+            return True
+        return datetime.utcnow() - datetime.fromisoformat(ref["fetched_at"]) < self.max_age
+
+    def _load(self, ref: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        path = self.root / "objects" / ref["object"]
+        try:
+            if ref["format"] == "parquet":
+                return pd.read_parquet(path)
+            return pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache object {path.name}: {str(e)}")
+            return None
+
+    def _serialize(self, frame: pd.DataFrame) -> Tuple[bytes, str]:
+        buffer = io.BytesIO()
+        if HAS_PYARROW:
+            try:
+                frame.to_parquet(buffer)
+                return buffer.getvalue(), "parquet"
+            except (ValueError, TypeError, NotImplementedError) as e:
+                logger.debug(f"Falling back to pickle for a frame Parquet cannot store: {str(e)}")
+                buffer = io.BytesIO()
+        frame.to_pickle(buffer, compression=None)
+        return buffer.getvalue(), "pkl"
+
+    def _remove_unreferenced(self, name: str) -> None:
+        for path in (self.root / "refs").glob("*.json"):
+            try:
+                if json.loads(path.read_text())["object"] == name:
+                    return
+            except (OSError, ValueError, KeyError):
+                continue
+        (self.root / "objects" / name).unlink(missing_ok=True)
+
+    def _read_ref(self, dataset: str, season: Optional[int]) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._ref_path(dataset, season).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _ref_path(self, dataset: str, season: Optional[int]) -> Path:
+        return self.root / "refs" / f"{self._key(dataset, season)}.json"
+
+    @staticmethod
+    def _key(dataset: str, season: Optional[int]) -> str:
+        return dataset if season is None else f"{dataset}-{season}"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+# Cache used by NFLDataPyAdapter; built from the environment on first use
+_nfl_data_cache: Optional[NFLDataCache] = None
+_configured = False
+
+
+def configure_nfl_data_cache(
+    root: Optional[Any], refresh: str = "auto", offline: bool = False
+) -> Optional[NFLDataCache]:
+    """
+    Set the cache used by NFLDataPyAdapter instances created afterwards.
+
+    Args:
+        root: Cache directory, or None to turn the cache off
+        refresh: One of REFRESH_POLICIES
+        offline: Never download
+
+    Returns:
+        The configured cache, or None
+    """
+    global _nfl_data_cache, _configured
+    _nfl_data_cache = NFLDataCache(root, refresh=refresh, offline=offline) if root else None
+    _configured = True
+    return _nfl_data_cache
+
+
+def get_nfl_data_cache() -> Optional[NFLDataCache]:
+    """The configured cache, or one from NFL_DATA_CACHE_DIR; None when caching is off."""
+    if not _configured:
+        configure_nfl_data_cache(
+            os.environ.get("NFL_DATA_CACHE_DIR"),
+            refresh=os.environ.get("NFL_DATA_CACHE_REFRESH", "auto"),
+            offline=os.environ.get("NFL_DATA_OFFLINE", "").lower() in ("1", "true", "yes"),
+        )
+    return _nfl_data_cache
@@ -1,12 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+import asyncio
+import functools
 import pandas as pd
 import logging
 import nfl_data_py as nfl
 
+from backend.services.adapters.nfl_data_cache import NFLDataCache, get_nfl_data_cache
 from backend.services.typing_pandas import TypedDataFrame
 from backend.services.typing import safe_float
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# nfl_data_py downloads are I/O bound, so a few threads let several datasets and
+# seasons download at once without blocking the event loop
+NFL_DATA_WORKERS = 4
+
+_executor = ThreadPoolExecutor(max_workers=NFL_DATA_WORKERS, thread_name_prefix="nfl-data")
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking nfl_data_py call on the download thread pool.
+
+    Args:
+        fn: Synchronous callable
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        fn's return value
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _executor, functools.partial(fn, *args, **kwargs)
+    )
+
 
 class NFLDataPyAdapter:
     """
@@ -16,6 +46,21 @@ class NFLDataPyAdapter:
     and team stats from the nfl-data-py package.
     """
 
+    def __init__(self, cache: Optional[NFLDataCache] = None):
+        """
+        Args:
+            cache: Download cache; defaults to the configured one (see nfl_data_cache)
+        """
+        self.cache = cache if cache is not None else get_nfl_data_cache()
+
+    def _download(
+        self, dataset: str, season: Optional[int], fn: Callable[..., pd.DataFrame], *args: Any
+    ) -> pd.DataFrame:
+        """Blocking nfl_data_py call, through the download cache when one is configured."""
+        if self.cache is None:
+            return fn(*args)
+        return self.cache.fetch(dataset, season, functools.partial(fn, *args))
+
     async def get_players(self, season: int) -> TypedDataFrame:
         """
         Get player data for the specified season.
@@ -29,7 +74,7 @@ class NFLDataPyAdapter:
         logger.info(f"Fetching player data (focusing on season {season}) from nfl-data-py")
         try:
             # Import player data - nfl_data_py import_players() doesn't accept a season parameter
-            player_data = nfl.import_players()
+            player_data = await run_blocking(self._download, "players", None, nfl.import_players)
 
             # Filter to only fantasy-relevant positions (QB, RB, WR, TE)
             fantasy_positions = ["QB", "RB", "WR", "TE"]
@@ -60,7 +105,9 @@ class NFLDataPyAdapter:
         logger.info(f"Fetching weekly stats for season {season} from nfl-data-py")
         try:
             # Import weekly data
-            weekly_data = nfl.import_weekly_data([season])
+            weekly_data = await run_blocking(
+                self._download, "weekly", season, nfl.import_weekly_data, [season]
+            )
             logger.info(f"Retrieved {len(weekly_data)} weekly stat entries for season {season}")
             return TypedDataFrame(weekly_data)
         except Exception as e:
@@ -71,6 +118,19 @@ class NFLDataPyAdapter:
         """
         Get team statistics for the specified season.
 
+        Args:
+            season: The NFL season year (e.g., 2023)
+
+        Returns:
+            TypedDataFrame containing team metadata and detailed team stats
+        """
+        # Downloads several datasets and aggregates them, all blocking
+        return await run_blocking(self._fetch_team_stats, season)
+
+    def _fetch_team_stats(self, season: int) -> TypedDataFrame:
+        """
+        Blocking implementation of get_team_stats.
+
         Args:
             season: The NFL season year (e.g., 2023)
 
@@ -80,7 +140,7 @@ class NFLDataPyAdapter:
         logger.info(f"Fetching team stats for season {season} from nfl-data-py")
         try:
             # Import team descriptions for metadata
-            team_desc = nfl.import_team_desc()
+            team_desc = self._download("team_desc", None, nfl.import_team_desc)
             logger.info(f"Retrieved information for {len(team_desc)} teams")
 
             # Use multiple sources to get the most complete team stats
@@ -88,7 +148,7 @@ class NFLDataPyAdapter:
 
             # Source 1: Try to get official seasonal data first
             logger.info(f"Attempting to get seasonal_data for {season}")
-            seasonal_data = nfl.import_seasonal_data([season])
+            seasonal_data = self._download("seasonal", season, nfl.import_seasonal_data, [season])
             if seasonal_data is not None and len(seasonal_data) > 0:
                 # Filter to team-level data if possible
                 team_data = (
@@ -112,7 +172,9 @@ class NFLDataPyAdapter:
             # Source 2: Try to get PFR (Pro Football Reference) seasonal stats
             logger.info(f"Attempting to get seasonal_pfr data for {season}")
             try:
-                pfr_stats = nfl.import_seasonal_pfr([season])
+                pfr_stats = self._download(
+                    "seasonal_pfr", season, nfl.import_seasonal_pfr, [season]
+                )
                 if pfr_stats is not None and len(pfr_stats) > 0:
                     # Filter to team-level data if possible
                     pfr_team_stats = (
@@ -140,7 +202,7 @@ class NFLDataPyAdapter:
 
             # Source 3: Aggregate from weekly player data as fallback
             logger.info(f"Attempting to aggregate stats from weekly data for {season}")
-            weekly_data = nfl.import_weekly_data([season])
+            weekly_data = self._download("weekly", season, nfl.import_weekly_data, [season])
             if weekly_data is not None and len(weekly_data) > 0:
                 # Log column names to debug
                 logger.info(f"Weekly data columns: {weekly_data.columns.tolist()}")
@@ -577,7 +639,9 @@ class NFLDataPyAdapter:
         logger.info(f"Fetching game schedules for season {season} from nfl-data-py")
         try:
             # Import schedules
-            schedule_data = nfl.import_schedules([season])
+            schedule_data = await run_blocking(
+                self._download, "schedules", season, nfl.import_schedules, [season]
+            )
             logger.info(f"Retrieved {len(schedule_data)} schedule entries for season {season}")
             return TypedDataFrame(schedule_data)
         except Exception as e:
@@ -597,7 +661,9 @@ class NFLDataPyAdapter:
         logger.info(f"Fetching team rosters for season {season} from nfl-data-py")
         try:
             # Import rosters
-            roster_data = nfl.import_rosters([season])
+            roster_data = await run_blocking(
+                self._download, "rosters", season, nfl.import_rosters, [season]
+            )
             logger.info(f"Retrieved {len(roster_data)} roster entries for season {season}")
             return TypedDataFrame(roster_data)
         except Exception as e:
@@ -14,6 +14,7 @@ from functools import partial
 from backend.database.models import Player, Projection, BaseStat, Scenario, StatOverride, ImportLog
 from backend.services.projection_service import ProjectionService
 from backend.services.rookie_projection_service import RookieProjectionService
+from backend.services.scenario_delta_service import ScenarioDeltaService
 from backend.services.typing import (
     StatsDict, 
     AdjustmentDict, 
@@ -54,6 +55,7 @@ class BatchService:
         self.db = db
         self.projection_service = ProjectionService(db)
         self.rookie_service = RookieProjectionService(db)
+        self.scenario_deltas = ScenarioDeltaService(db)
         self.failure_threshold = 5  # Default threshold for circuit breaker pattern
 
     async def process_batch(
@@ -220,6 +222,16 @@ class BatchService:
             # Create a mapping for easy lookup
             player_map: Dict[str, Player] = {p.player_id: p for p in players}
 
+            # Scenario projections resolve through the base scenario chain
+            resolved: Dict[str, Projection] = {}
+            if scenario_id:
+                resolved = {
+                    p.player_id: p
+                    for p in self.scenario_deltas.resolve_projections(
+                        scenario_id, season=season, player_ids=player_ids
+                    )
+                }
+
             # Process each player
             for player_id in player_ids:
                 try:
@@ -234,17 +246,20 @@ class BatchService:
                         continue
 
                     # Check if projection already exists
-                    existing = (
-                        self.db.query(Projection)
-                        .filter(
-                            and_(
-                                Projection.player_id == player_id,
-                                Projection.season == season,
-                                Projection.scenario_id == scenario_id,
+                    if scenario_id:
+                        existing = resolved.get(player_id)
+                    else:
+                        existing = (
+                            self.db.query(Projection)
+                            .filter(
+                                and_(
+                                    Projection.player_id == player_id,
+                                    Projection.season == season,
+                                    Projection.scenario_id.is_(None),
+                                )
                             )
+                            .first()
                         )
-                        .first()
-                    )
 
                     if existing:
                         # Add to successful results
@@ -392,37 +407,11 @@ class BatchService:
             Tuple of (filename, file_content as bytes)
         """
         try:
-            # Build the query
-            query = self.db.query(Projection).join(Player)
-
-            # Apply filters if provided
-            if filters:
-                if "player_ids" in filters and filters["player_ids"]:
-                    player_ids = filters["player_ids"]
-                    query = query.filter(Projection.player_id.in_(player_ids))
-                
-                if "team" in filters and filters["team"]:
-                    team = filters["team"]
-                    query = query.filter(Player.team == team)
-                
-                if "position" in filters and filters["position"]:
-                    position = filters["position"]
-                    # Handle both string and list of positions
-                    if isinstance(position, list):
-                        query = query.filter(Player.position.in_(position))
-                    else:
-                        query = query.filter(Player.position == position)
-                
-                if "season" in filters and filters["season"]:
-                    season = filters["season"]
-                    query = query.filter(Projection.season == season)
-                
-                if "scenario_id" in filters and filters["scenario_id"]:
-                    scenario_id = filters["scenario_id"]
-                    query = query.filter(Projection.scenario_id == scenario_id)
-
-            # Execute query
-            projections = query.all()
+            filters = filters or {}
+            if filters.get("scenario_id"):
+                projections = self._scenario_projections(filters)
+            else:
+                projections = self._filtered_projections(filters)
 
             # Generate timestamp for filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -439,6 +428,50 @@ class BatchService:
             logger.error(f"Error exporting projections: {str(e)}")
             raise
 
+    def _scenario_projections(self, filters: Dict[str, Any]) -> List[Projection]:
+        """A scenario's projections, resolved through its base scenario chain."""
+        position = filters.get("position")
+        projections = self.scenario_deltas.resolve_projections(
+            filters["scenario_id"],
+            season=filters.get("season") or None,
+            player_ids=filters.get("player_ids") or None,
+            position=position if isinstance(position, str) and position else None,
+            team=filters.get("team") or None,
+        )
+        if isinstance(position, list) and position:
+            projections = [p for p in projections if p.player.position in position]
+        return projections
+
+    def _filtered_projections(self, filters: Dict[str, Any]) -> List[Projection]:
+        """Stored projections matching the export filters."""
+        # Build the query
+        query = self.db.query(Projection).join(Player)
+
+        # Apply filters if provided
+        if filters:
+            if "player_ids" in filters and filters["player_ids"]:
+                player_ids = filters["player_ids"]
+                query = query.filter(Projection.player_id.in_(player_ids))
+
+            if "team" in filters and filters["team"]:
+                team = filters["team"]
+                query = query.filter(Player.team == team)
+
+            if "position" in filters and filters["position"]:
+                position = filters["position"]
+                # Handle both string and list of positions
+                if isinstance(position, list):
+                    query = query.filter(Player.position.in_(position))
+                else:
+                    query = query.filter(Player.position == position)
+
+            if "season" in filters and filters["season"]:
+                season = filters["season"]
+                query = query.filter(Projection.season == season)
+
+        # Execute query
+        return query.all()
+
     async def _export_to_csv(
         self, projections: List[Projection], timestamp: str, include_metadata: bool
     ) -> Tuple[str, bytes]:
@@ -754,12 +787,8 @@ class BatchService:
 
                     # Apply global adjustments if provided
                     if "adjustments" in template and template["adjustments"]:
-                        # Get all projections for this scenario
-                        projections = (
-                            self.db.query(Projection)
-                            .filter(Projection.scenario_id == scenario_id)
-                            .all()
-                        )
+                        # Get all projections for this scenario, including inherited ones
+                        projections = self.scenario_deltas.resolve_projections(scenario_id)
 
                         adjustments = template["adjustments"]
                         for proj in projections:
@@ -772,16 +801,14 @@ class BatchService:
                     if "player_adjustments" in template and template["player_adjustments"]:
                         player_adjustments = template["player_adjustments"]
                         for player_id, adjustments in player_adjustments.items():
-                            # Find the player's projection in this scenario
-                            proj = (
-                                self.db.query(Projection)
-                                .filter(
-                                    and_(
-                                        Projection.player_id == player_id,
-                                        Projection.scenario_id == scenario_id,
+                            # Find the player's projection in this scenario's chain
+                            proj = next(
+                                iter(
+                                    self.scenario_deltas.resolve_projections(
+                                        scenario_id, player_ids=[player_id]
                                     )
-                                )
-                                .first()
+                                ),
+                                None,
                             )
 
                             if proj:
@@ -0,0 +1,82 @@
+"""
+Commit-time cache invalidation.
+
+Every ORM write is mapped to the cache tags it affects (player:<id>, team:<abbr>:<season>,
+scenario:<id>, ...). Tags collected while a session flushes are invalidated once the
+transaction commits and discarded if it rolls back, so cached reads never outlive the
+rows they were built from. Writes that bypass the unit of work (bulk mappings, Query.update)
+register their tags explicitly with invalidate_on_commit.
+"""
+
+from typing import Any, Iterable, Set
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import logging
+
+from backend.database.models import (
+    BaseStat,
+    GameStats,
+    Player,
+    PlayerSeasonStats,
+    Projection,
+    ProjectionDelta,
+    Scenario,
+    StatOverride,
+    TeamStat,
+)
+from backend.services.cache_service import (
+    PLAYERS_TAG,
+    STATS_TAG,
+    get_cache,
+    player_tag,
+    scenario_tag,
+    team_tag,
+)
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding the tags to invalidate on commit
+PENDING_TAGS_KEY = "cache_invalidation_tags"
+
+
+def tags_for_object(obj: Any) -> Set[str]:
+    """Cache tags affected by writing an ORM object."""
+    if isinstance(obj, (Projection, ProjectionDelta)):
+        return {player_tag(obj.player_id), scenario_tag(obj.scenario_id)}
+    if isinstance(obj, StatOverride):
+        return {player_tag(obj.player_id)}
+    if isinstance(obj, Player):
+        return {player_tag(obj.player_id), PLAYERS_TAG}
+    if isinstance(obj, (GameStats, BaseStat, PlayerSeasonStats)):
+        return {player_tag(obj.player_id), STATS_TAG}
+    if isinstance(obj, TeamStat):
+        return {team_tag(obj.team, obj.season)}
+    if isinstance(obj, Scenario):
+        return {scenario_tag(obj.scenario_id)}
+    return set()
+
+
+def invalidate_on_commit(session: Session, tags: Iterable[str]) -> None:
+    """Invalidate tags when the session's current transaction commits."""
+    session.info.setdefault(PENDING_TAGS_KEY, set()).update(tags)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tags(session: Session, flush_context: Any) -> None:
+    tags: Set[str] = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        tags |= tags_for_object(obj)
+    if tags:
+        invalidate_on_commit(session, tags)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tags(session: Session) -> None:
+    tags = session.info.pop(PENDING_TAGS_KEY, None)
+    if tags:
+        get_cache().invalidate_tags(tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tags(session: Session) -> None:
+    session.info.pop(PENDING_TAGS_KEY, None)
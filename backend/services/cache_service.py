@@ -1,32 +1,180 @@
+import asyncio
 import logging
+import sys
 import time
 import json
 import hashlib
-from typing import Dict, List, Optional, Any, Callable, Tuple, TypeVar, cast, Awaitable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Dict, List, Optional, Any, Callable, Iterable, Set, Tuple, TypeVar, Union, cast, Awaitable
+)
 from datetime import datetime, timedelta
-from threading import RLock
+from threading import Event, Lock, RLock, get_ident
 import functools
 
+from backend.services.shared_cache import SQLiteCacheStore
+
 logger = logging.getLogger(__name__)
 
 # Type variable for generic return types
 T = TypeVar("T")
 
+# Tags for an entry: fixed, or derived from the computed value
+TagsArg = Union[Iterable[str], Callable[[Any], Iterable[str]], None]
+
+# Tag for results that depend on the set of players (listings, searches)
+PLAYERS_TAG = "players"
+
+# Tag for results that depend on historical stat rows (e.g. available seasons)
+STATS_TAG = "stats"
+
+
+# Default memory bounds; least recently used entries are evicted beyond either
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 10000
+
+# Nesting depth walked when estimating the size of a cached value
+SIZE_ESTIMATE_DEPTH = 8
+
+# Seconds past expiry an entry may still be served while it is refreshed in the
+# background, by key prefix. Writes still invalidate these entries immediately.
+DEFAULT_STALE_WINDOWS = {
+    "player_listing": 120,
+    "player_trends": 300,
+    "draft_board": 60,
+}
+
+# Worker threads refreshing stale entries for synchronous callers
+REFRESH_WORKERS = 2
+
+# Seconds between polls of the shared tier's invalidation log. Reads may see another
+# worker's stale local entry for up to this long; this worker's own writes apply at once.
+SHARED_SYNC_INTERVAL = 0.5
+
+
+def estimate_size(value: Any, depth: int = 0) -> int:
+    """
+    Approximate memory footprint of a cached value in bytes.
+
+    Containers are walked recursively; pandas and numpy objects report their own buffers.
+    """
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage) and hasattr(value, "index"):
+        usage = memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if depth >= SIZE_ESTIMATE_DEPTH:
+        return size
+
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(k, depth + 1) + estimate_size(v, depth + 1) for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, depth + 1) for item in value)
+    return size
+
+
+def player_tag(player_id: str) -> str:
+    """Tag for cache entries built from one player's data."""
+    return f"player:{player_id}"
+
+
+def team_tag(team: str, season: int) -> str:
+    """Tag for cache entries built from a team's season."""
+    return f"team:{team}:{season}"
+
+
+def scenario_tag(scenario_id: Optional[str]) -> str:
+    """Tag for cache entries built from a scenario (base projections when None)."""
+    return f"scenario:{scenario_id or 'base'}"
+
+
+class _Flight:
+    """A computation in progress that concurrent callers for the same key wait on."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.owner = get_ident()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
 
 class CacheService:
-    """Service for caching frequently accessed data to improve performance."""
+    """
+    Service for caching frequently accessed data to improve performance.
+
+    Entries are kept in least-recently-used order and evicted once the cache exceeds
+    its byte budget or entry cap. Each entry's size is estimated once when it is set,
+    so the running total stays current without rescanning the cache.
+
+    Key prefixes may be given a stale window: get_or_compute then keeps serving an
+    expired entry for that long while a single background refresh rebuilds it.
 
-    def __init__(self, ttl_seconds: int = 300):
+    A computed value is not cached if one of its tags was invalidated while it was
+    being computed, since it may have been built from data the write replaced.
+
+    With a shared store (l2) the cache is two-tier: local misses fall through to the
+    store, sets are written through, and invalidations reach every worker sharing it.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        stale_windows: Optional[Dict[str, int]] = None,
+        l2: Optional[SQLiteCacheStore] = None,
+        sync_interval: float = SHARED_SYNC_INTERVAL,
+    ):
         """
         Initialize the cache service.
 
         Args:
             ttl_seconds: Default time-to-live for cache entries in seconds
+            max_bytes: Approximate memory budget for cached values
+            max_entries: Maximum number of entries
+            stale_windows: Key prefix -> seconds an expired entry may be served stale
+            l2: Optional store shared with the other workers on the host
+            sync_interval: Seconds between polls of the shared tier for invalidations
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.default_ttl = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.total_bytes = 0
+        self.evictions = 0
         self.locks: Dict[str, RLock] = {}
         self.master_lock = RLock()
+        # Tag -> keys of the entries carrying it
+        self.tag_index: Dict[str, Set[str]] = {}
+        # Computations in progress, shared by concurrent callers for the same key
+        self.flights: Dict[str, _Flight] = {}
+        self.async_flights: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+        self.coalesced = 0
+        # Invalidation generations, recorded while computations are in progress
+        self.generation = 0
+        self.tag_generations: Dict[str, int] = {}
+        self.cleared_generation = 0
+        self.discarded = 0
+        # Stale-while-revalidate
+        self.stale_windows: Dict[str, int] = dict(stale_windows or {})
+        self.stale_hits = 0
+        self.refresh_failures = 0
+        self.refresh_executor: Optional[ThreadPoolExecutor] = None
+        self.refresh_tasks: Set["asyncio.Task[Any]"] = set()
+        # Shared second tier
+        self.l2 = l2
+        self.l2_hits = 0
+        self.sync_interval = sync_interval
+        self.sync_lock = Lock()
+        self.last_sync = float("-inf")
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -38,38 +186,71 @@ class CacheService:
         Returns:
             The cached value or None if not found or expired
         """
-        if key not in self.cache:
-            return None
-
-        entry = self.cache[key]
-        now = time.time()
-
-        # Check if entry is expired
-        if entry["expiry"] < now:
-            self._remove(key)
-            return None
-
-        # Update access time
-        entry["last_access"] = now
-
-        return entry["value"]
-
-    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        self._sync_shared()
+        with self.master_lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                entry = self._load_shared(key)
+                if entry is None:
+                    return None
+
+            now = time.time()
+
+            # Check if entry is expired (entries in their stale window are kept for refresh)
+            if entry["expiry"] < now:
+                if entry["stale_until"] < now:
+                    self._remove(key)
+                return None
+
+            # Update access time and recency
+            entry["last_access"] = now
+            self.cache.move_to_end(key)
+
+            return entry["value"]
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        shared: bool = True,
+    ) -> None:
         """
         Set a value in the cache.
 
+        Values larger than the whole byte budget are not cached.
+
         Args:
             key: The cache key
             value: The value to cache
             ttl_seconds: Optional TTL override in seconds
+            tags: Optional tags (e.g. player:<id>) the entry is invalidated by
+            shared: Write through to the shared tier (False keeps the entry in this process)
         """
         ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
         now = time.time()
-
-        entry = {"value": value, "expiry": now + ttl, "created": now, "last_access": now}
+        entry_tags = frozenset(tags or ())
+        size = len(key) + estimate_size(value)
+
+        entry = {
+            "value": value,
+            "expiry": now + ttl,
+            "stale_until": now + ttl + self.stale_window(key),
+            "created": now,
+            "last_access": now,
+            "tags": entry_tags,
+            "size": size,
+        }
 
         with self._get_lock(key):
-            self.cache[key] = entry
+            with self.master_lock:
+                if not self._store(key, entry):
+                    logger.debug(f"Not caching {key}: {size} bytes exceeds the cache budget")
+                    return
+
+        if shared and self.l2 is not None:
+            self.l2.set(key, value, entry["expiry"], entry["stale_until"], entry_tags)
 
     def delete(self, key: str) -> None:
         """
@@ -79,11 +260,61 @@ class CacheService:
             key: The cache key to delete
         """
         self._remove(key)
+        if self.l2 is not None:
+            self.l2.delete([key])
 
-    def clear(self) -> None:
-        """Clear all cache entries."""
+    def clear(self) -> int:
+        """
+        Clear all cache entries.
+
+        Returns:
+            Number of entries cleared
+        """
+        if self.l2 is not None:
+            self.l2.clear()
+        return self._clear_local()
+
+    def _clear_local(self) -> int:
+        """Clear this process's entries only."""
         with self.master_lock:
+            self.generation += 1
+            self.cleared_generation = self.generation
+            count = len(self.cache)
             self.cache.clear()
+            self.tag_index.clear()
+            self.locks.clear()
+            self.total_bytes = 0
+            return count
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Remove every entry carrying any of the tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of entries removed from this process
+        """
+        if self.l2 is not None:
+            self.l2.invalidate_tags(tags)
+        return self._invalidate_local_tags(tags)
+
+    def _invalidate_local_tags(self, tags: Iterable[str]) -> int:
+        """Remove this process's entries carrying any of the tags."""
+        with self.master_lock:
+            tags = list(tags)
+            self._record_invalidation(tags)
+            keys: Set[str] = set()
+            for tag in tags:
+                keys.update(self.tag_index.get(tag, ()))
+
+        for key in keys:
+            self._remove(key)
+
+        if keys:
+            logger.debug(f"Invalidated {len(keys)} cache entries")
+        return len(keys)
 
     def clear_pattern(self, pattern: str) -> int:
         """
@@ -93,8 +324,14 @@ class CacheService:
             pattern: String pattern to match (simple contains check)
 
         Returns:
-            Number of entries cleared
+            Number of entries cleared from this process
         """
+        if self.l2 is not None:
+            self.l2.clear_pattern(pattern)
+        return self._clear_local_pattern(pattern)
+
+    def _clear_local_pattern(self, pattern: str) -> int:
+        """Clear this process's entries matching a pattern."""
         keys_to_remove = []
 
         # Find all matching keys
@@ -117,27 +354,54 @@ class CacheService:
             Dict with cache stats
         """
         now = time.time()
-        total_entries = len(self.cache)
-        expired_entries = sum(1 for entry in self.cache.values() if entry["expiry"] < now)
-
-        # Calculate size estimation
-        size_bytes = 0
-        for key, entry in self.cache.items():
-            size_bytes += len(key)
-            try:
-                size_bytes += len(json.dumps(entry["value"]))
-            except:
-                # If value can't be JSON serialized, use string representation
-                size_bytes += len(str(entry["value"]))
+        with self.master_lock:
+            total_entries = len(self.cache)
+            expired_entries = sum(1 for entry in self.cache.values() if entry["expiry"] < now)
+            size_bytes = self.total_bytes
 
         return {
             "total_entries": total_entries,
+            "tags": len(self.tag_index),
             "active_entries": total_entries - expired_entries,
             "expired_entries": expired_entries,
             "size_bytes": size_bytes,
             "size_mb": size_bytes / (1024 * 1024),
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "coalesced": self.coalesced,
+            "discarded": self.discarded,
+            "stale_hits": self.stale_hits,
+            "refresh_failures": self.refresh_failures,
+            "l2_hits": self.l2_hits,
+            "shared": self.l2.get_stats() if self.l2 is not None else None,
         }
 
+    def set_stale_window(self, prefix: str, seconds: int) -> None:
+        """
+        Serve entries under a key prefix stale for up to `seconds` after they expire.
+
+        Only affects entries set afterwards. A window of 0 disables stale serving.
+
+        Args:
+            prefix: Key prefix (e.g. "player_listing")
+            seconds: Stale window in seconds
+        """
+        with self.master_lock:
+            if seconds > 0:
+                self.stale_windows[prefix] = seconds
+            else:
+                self.stale_windows.pop(prefix, None)
+
+    def stale_window(self, key: str) -> int:
+        """Stale window for a key: that of its longest configured prefix, else 0."""
+        window = 0
+        matched = -1
+        for prefix, seconds in self.stale_windows.items():
+            if len(prefix) > matched and (key == prefix or key.startswith(prefix + ":")):
+                window, matched = seconds, len(prefix)
+        return window
+
     def cache_key(self, prefix: str, *args: Any, **kwargs: Any) -> str:
         """
         Generate a cache key from prefix and arguments.
@@ -160,13 +424,300 @@ class CacheService:
 
         return f"{prefix}:{hash_value}"
 
-    def cached(self, ttl_seconds: Optional[int] = None, prefix: Optional[str] = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], T],
+        ttl_seconds: Optional[int] = None,
+        tags: TagsArg = None,
+        refresh: Optional[Callable[[], T]] = None,
+    ) -> T:
+        """
+        Return the cached value for a key, computing it once on a miss.
+
+        Concurrent callers that miss on the same key wait for the first caller's
+        computation and share its result (or its exception) instead of recomputing.
+        An expired entry within its stale window is returned immediately while one
+        background thread recomputes it.
+
+        Args:
+            key: The cache key
+            compute: Builds the value on a miss
+            ttl_seconds: Optional TTL override in seconds
+            tags: Tags for the entry, or a function deriving them from the value
+            refresh: Builds the value in a background refresh (defaults to compute).
+                It runs after the caller has returned, so it must not use the
+                caller's request-scoped resources such as its database Session.
+
+        Returns:
+            The cached or computed value
+        """
+        cached_value = self.get(key)
+        if cached_value is not None:
+            return cast(T, cached_value)
+
+        with self.master_lock:
+            cached_value = self.get(key)
+            if cached_value is not None:
+                return cast(T, cached_value)
+
+            stale_value = self._get_stale(key)
+            flight = self.flights.get(key)
+            leader = flight is None or flight.owner == get_ident()
+            if leader:
+                flight = _Flight()
+                self.flights[key] = flight
+
+        if stale_value is not None:
+            if leader:
+                self._refresh_pool().submit(
+                    self._refresh, flight, key, refresh or compute, ttl_seconds, tags
+                )
+            self.stale_hits += 1
+            return cast(T, stale_value)
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            self.coalesced += 1
+            return cast(T, flight.result)
+
+        return self._run_flight(flight, key, compute, ttl_seconds, tags)
+
+    async def get_or_compute_async(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        ttl_seconds: Optional[int] = None,
+        tags: TagsArg = None,
+        refresh: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """
+        Async counterpart of get_or_compute for callers on an event loop.
+
+        Concurrent coroutines that miss on the same key await the first caller's
+        computation. If that caller is cancelled, a waiting caller computes instead.
+        An expired entry within its stale window is returned immediately while a
+        task on the running loop recomputes it.
+
+        Args:
+            key: The cache key
+            compute: Coroutine function building the value on a miss
+            ttl_seconds: Optional TTL override in seconds
+            tags: Tags for the entry, or a function deriving them from the value
+            refresh: Coroutine function building the value in a background refresh
+                (defaults to compute); see get_or_compute
+
+        Returns:
+            The cached or computed value
+        """
+        cached_value = self.get(key)
+        if cached_value is not None:
+            return cast(T, cached_value)
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        pending = self.async_flights.get(flight_key)
+
+        stale_value = self._get_stale(key)
+        if stale_value is not None:
+            if pending is None:
+                future: "asyncio.Future[Any]" = loop.create_future()
+                self.async_flights[flight_key] = future
+                task = loop.create_task(
+                    self._refresh_async(
+                        future, flight_key, key, refresh or compute, ttl_seconds, tags
+                    )
+                )
+                self.refresh_tasks.add(task)
+                task.add_done_callback(self.refresh_tasks.discard)
+            self.stale_hits += 1
+            return cast(T, stale_value)
+
+        if pending is not None:
+            try:
+                result = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # This caller was cancelled, not the computation
+                return await self.get_or_compute_async(
+                    key, compute, ttl_seconds, tags, refresh
+                )
+            self.coalesced += 1
+            return cast(T, result)
+
+        future = loop.create_future()
+        self.async_flights[flight_key] = future
+        return await self._run_async_flight(future, flight_key, key, compute, ttl_seconds, tags)
+
+    def _run_flight(
+        self,
+        flight: _Flight,
+        key: str,
+        compute: Callable[[], T],
+        ttl_seconds: Optional[int],
+        tags: TagsArg,
+    ) -> T:
+        """Compute and cache a value as the flight's leader, then release its waiters."""
+        flight.owner = get_ident()
+        generation = self.generation
+        try:
+            result = compute()
+            self._set_computed(key, result, ttl_seconds, tags, generation)
+            flight.result = result
+            return result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.master_lock:
+                if self.flights.get(key) is flight:
+                    del self.flights[key]
+                self._prune_generations()
+            flight.done.set()
+
+    def _refresh(
+        self,
+        flight: _Flight,
+        key: str,
+        compute: Callable[[], Any],
+        ttl_seconds: Optional[int],
+        tags: TagsArg,
+    ) -> None:
+        """Background refresh of a stale entry; failures leave the stale value in place."""
+        try:
+            self._run_flight(flight, key, compute, ttl_seconds, tags)
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Background refresh of {key} failed: {str(e)}")
+
+    async def _run_async_flight(
+        self,
+        future: "asyncio.Future[Any]",
+        flight_key: Tuple[int, str],
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        ttl_seconds: Optional[int],
+        tags: TagsArg,
+    ) -> T:
+        """Compute and cache a value, resolving the future other coroutines await."""
+        generation = self.generation
+        try:
+            result = await compute()
+            self._set_computed(key, result, ttl_seconds, tags, generation)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't log it as unretrieved
+            raise
+        finally:
+            with self.master_lock:
+                if self.async_flights.get(flight_key) is future:
+                    del self.async_flights[flight_key]
+                self._prune_generations()
+
+    async def _refresh_async(
+        self,
+        future: "asyncio.Future[Any]",
+        flight_key: Tuple[int, str],
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[int],
+        tags: TagsArg,
+    ) -> None:
+        """Background task refreshing a stale entry; failures leave the stale value in place."""
+        try:
+            await self._run_async_flight(future, flight_key, key, compute, ttl_seconds, tags)
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Background refresh of {key} failed: {str(e)}")
+
+    def _set_computed(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int],
+        tags: TagsArg,
+        generation: int,
+    ) -> None:
+        """Cache a computed value unless its tags were invalidated after `generation`."""
+        entry_tags = list(self._resolve_tags(tags, value) or ())
+        self._sync_shared()
+        if not self._invalidated_since(generation, entry_tags):
+            self.set(key, value, ttl_seconds, entry_tags)
+            # An invalidation landing during the set must not leave the entry behind
+            if not self._invalidated_since(generation, entry_tags):
+                return
+            self.delete(key)
+
+        self.discarded += 1
+        logger.debug(f"Not caching {key}: invalidated while it was computed")
+
+    def _invalidated_since(self, generation: int, tags: Iterable[str]) -> bool:
+        """Whether any of the tags (or the whole cache) was invalidated after `generation`."""
+        with self.master_lock:
+            return self.cleared_generation > generation or any(
+                self.tag_generations.get(tag, 0) > generation for tag in tags
+            )
+
+    def _record_invalidation(self, tags: Iterable[str]) -> None:
+        """
+        Note the generation a tag was invalidated at (caller holds the master lock).
+
+        Only computations in progress compare against it, so nothing is kept while
+        none are.
+        """
+        self.generation += 1
+        if self.flights or self.async_flights:
+            for tag in tags:
+                self.tag_generations[tag] = self.generation
+
+    def _prune_generations(self) -> None:
+        """Forget tag generations once no computation needs them (caller holds the master lock)."""
+        if not self.flights and not self.async_flights:
+            self.tag_generations.clear()
+
+    def _get_stale(self, key: str) -> Optional[Any]:
+        """Value of an expired entry that is still within its stale window."""
+        with self.master_lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            now = time.time()
+            if entry["expiry"] < now <= entry["stale_until"]:
+                self.cache.move_to_end(key)
+                return entry["value"]
+            return None
+
+    def _refresh_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for background refreshes, created on first use."""
+        with self.master_lock:
+            if self.refresh_executor is None:
+                self.refresh_executor = ThreadPoolExecutor(
+                    max_workers=REFRESH_WORKERS, thread_name_prefix="cache-refresh"
+                )
+            return self.refresh_executor
+
+    def cached(
+        self,
+        ttl_seconds: Optional[int] = None,
+        prefix: Optional[str] = None,
+        tags: TagsArg = None,
+    ) -> Callable[[Callable[..., T]], Callable[..., T]]:
         """
         Decorator for caching function results.
 
+        Concurrent calls with the same arguments share a single computation.
+
         Args:
             ttl_seconds: Optional TTL override in seconds
             prefix: Optional key prefix override (defaults to function name)
+            tags: Optional tags (or a function of the result) for every cached result
 
         Returns:
             Decorated function
@@ -178,28 +729,29 @@ class CacheService:
                 key_prefix = prefix if prefix is not None else func.__name__
                 cache_key = self.cache_key(key_prefix, *args, **kwargs)
 
-                # Check cache
-                cached_value = self.get(cache_key)
-                if cached_value is not None:
-                    return cast(T, cached_value)
-
-                # Call function and cache result
-                result = func(*args, **kwargs)
-                self.set(cache_key, result, ttl_seconds)
-
-                return result
+                return self.get_or_compute(
+                    cache_key, lambda: func(*args, **kwargs), ttl_seconds, tags
+                )
 
             return wrapper
 
         return decorator
 
-    def cached_async(self, ttl_seconds: Optional[int] = None, prefix: Optional[str] = None) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    def cached_async(
+        self,
+        ttl_seconds: Optional[int] = None,
+        prefix: Optional[str] = None,
+        tags: TagsArg = None,
+    ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
         """
         Decorator for caching async function results.
 
+        Concurrent calls with the same arguments share a single computation.
+
         Args:
             ttl_seconds: Optional TTL override in seconds
             prefix: Optional key prefix override (defaults to function name)
+            tags: Optional tags (or a function of the result) for every cached result
 
         Returns:
             Decorated async function
@@ -211,26 +763,121 @@ class CacheService:
                 key_prefix = prefix if prefix is not None else func.__name__
                 cache_key = self.cache_key(key_prefix, *args, **kwargs)
 
-                # Check cache
-                cached_value = self.get(cache_key)
-                if cached_value is not None:
-                    return cast(T, cached_value)
-
-                # Call function and cache result
-                result = await func(*args, **kwargs)
-                self.set(cache_key, result, ttl_seconds)
-
-                return result
+                return await self.get_or_compute_async(
+                    cache_key, lambda: func(*args, **kwargs), ttl_seconds, tags
+                )
 
             return wrapper
 
         return decorator
 
+    @staticmethod
+    def _resolve_tags(tags: TagsArg, value: Any) -> Optional[Iterable[str]]:
+        """Tags for a computed value."""
+        return tags(value) if callable(tags) else tags
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> bool:
+        """Put an entry in this process's tier (caller holds the master lock)."""
+        self._remove(key)
+        if entry["size"] > self.max_bytes:
+            return False
+
+        self.cache[key] = entry
+        self.total_bytes += entry["size"]
+        for tag in entry["tags"]:
+            self.tag_index.setdefault(tag, set()).add(key)
+
+        self._evict()
+        return True
+
+    def _load_shared(self, key: str) -> Optional[Dict[str, Any]]:
+        """Copy an entry from the shared tier on a local miss (caller holds the master lock)."""
+        if self.l2 is None:
+            return None
+        stored = self.l2.get(key)
+        if stored is None:
+            return None
+
+        value, expiry, stale_until, tags = stored
+        now = time.time()
+        if stale_until < now:
+            return None
+
+        entry = {
+            "value": value,
+            "expiry": expiry,
+            "stale_until": stale_until,
+            "created": now,
+            "last_access": now,
+            "tags": frozenset(tags),
+            "size": len(key) + estimate_size(value),
+        }
+        if not self._store(key, entry):
+            return None
+        self.l2_hits += 1
+        return entry
+
+    def _sync_shared(self) -> None:
+        """
+        Apply invalidations other workers published to the shared tier.
+
+        Polls at most once per sync_interval, outside the master lock; a thread that
+        finds another one already polling skips the poll instead of waiting for it.
+        """
+        if self.l2 is None or time.monotonic() - self.last_sync < self.sync_interval:
+            return
+        if not self.sync_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() - self.last_sync < self.sync_interval:
+                return
+            self.last_sync = time.monotonic()
+            invalidations = self.l2.poll()
+            if invalidations is None:
+                logger.info("Shared cache log was pruned past this worker; clearing local cache")
+                self._clear_local()
+                return
+
+            for kind, payload in invalidations:
+                if kind == "keys":
+                    for key in payload:
+                        self._remove(key)
+                elif kind == "tags":
+                    self._invalidate_local_tags(payload)
+                elif kind == "pattern":
+                    self._clear_local_pattern(payload)
+                elif kind == "clear":
+                    self._clear_local()
+        finally:
+            self.sync_lock.release()
+
     def _remove(self, key: str) -> None:
         """Internal method to remove a cache entry."""
-        with self._get_lock(key):
-            if key in self.cache:
-                del self.cache[key]
+        with self.master_lock:
+            entry = self.cache.pop(key, None)
+            if entry is not None:
+                self.total_bytes -= entry["size"]
+                self._unindex(key, entry["tags"])
+                self.locks.pop(key, None)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is within its bounds."""
+        while len(self.cache) > 1 and (
+            self.total_bytes > self.max_bytes or len(self.cache) > self.max_entries
+        ):
+            oldest = next(iter(self.cache))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _unindex(self, key: str, tags: Iterable[str]) -> None:
+        """Drop a key from the tag index (caller holds the master lock)."""
+        for tag in tags:
+            keys = self.tag_index.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self.tag_index[tag]
 
     def _get_lock(self, key: str) -> RLock:
         """Get or create a lock for the given key."""
@@ -241,7 +888,7 @@ class CacheService:
 
     def cleanup(self) -> int:
         """
-        Remove expired entries from the cache.
+        Remove expired entries from the cache, keeping those still in their stale window.
 
         Returns:
             Number of entries removed
@@ -252,7 +899,7 @@ class CacheService:
         # Find expired entries
         with self.master_lock:
             for key, entry in self.cache.items():
-                if entry["expiry"] < now:
+                if entry["stale_until"] < now:
                     keys_to_remove.append(key)
 
         # Remove expired entries
@@ -266,17 +913,33 @@ class CacheService:
 _cache_instance: Optional[CacheService] = None
 
 
-def get_cache(ttl_seconds: int = 300) -> CacheService:
+def get_cache(
+    ttl_seconds: int = 300,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    stale_windows: Optional[Dict[str, int]] = None,
+    l2_path: Optional[str] = None,
+) -> CacheService:
     """
     Get or create the global cache instance.
 
     Args:
         ttl_seconds: Default TTL for cache entries
+        max_bytes: Approximate memory budget (used when the instance is created)
+        max_entries: Maximum number of entries (used when the instance is created)
+        stale_windows: Stale window per key prefix (defaults to DEFAULT_STALE_WINDOWS)
+        l2_path: Optional SQLite file shared by all workers on the host
 
     Returns:
         The global cache instance
     """
     global _cache_instance
     if _cache_instance is None:
-        _cache_instance = CacheService(ttl_seconds)
-    return _cache_instance
\ No newline at end of file
+        _cache_instance = CacheService(
+            ttl_seconds,
+            max_bytes=max_bytes,
+            max_entries=max_entries,
+            stale_windows=DEFAULT_STALE_WINDOWS if stale_windows is None else stale_windows,
+            l2=SQLiteCacheStore(l2_path) if l2_path else None,
+        )
+    return _cache_instance
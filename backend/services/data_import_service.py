@@ -5,9 +5,10 @@ import logging
 import uuid
 from datetime import datetime
 
-from backend.database.models import Player, BaseStat, GameStats, ImportLog
+from backend.database.models import Player, GameStats, ImportLog
 from backend.services.adapters.web_data_adapter import WebDataAdapter
 from backend.services.active_player_service import ActivePlayerService
+from backend.services.season_stats_service import SeasonStatsService
 from backend.services.typing import ImportMetricsDict, DataImportResultDict, safe_float, safe_dict_get
 from backend.services.typing_pandas import TypedDataFrame, safe_series_get, series_to_float, series_to_int, series_to_str
 
@@ -35,6 +36,7 @@ class DataImportService:
         self.logger = logger or logging.getLogger(__name__)
         self.web_data_adapter = WebDataAdapter()
         self.active_player_service = active_player_service or ActivePlayerService()
+        self.season_stats = SeasonStatsService(db)
 
         # Metrics tracking
         self.metrics: ImportMetricsDict = {
@@ -289,13 +291,12 @@ class DataImportService:
             # Calculate half-PPR fantasy points
             fantasy_points = self._calculate_fantasy_points(totals, position)
 
-            # Create or update BaseStat records
-            for stat_name, value in totals.items():
-                self._create_or_update_base_stat(player_id, season, stat_name, value)
-
-            # Add games and half_ppr
-            self._create_or_update_base_stat(player_id, season, "games", games_played)
-            self._create_or_update_base_stat(player_id, season, "half_ppr", fantasy_points)
+            # Save the season totals, with games and half_ppr
+            self.season_stats.save_season_totals(
+                player_id,
+                season,
+                {**totals, "games": games_played, "half_ppr": fantasy_points},
+            )
 
             # Commit changes
             self.db.commit()
@@ -321,35 +322,6 @@ class DataImportService:
             )
             return False
 
-    def _create_or_update_base_stat(
-        self, player_id: str, season: int, stat_type: str, value: float
-    ) -> None:
-        """Create or update a base stat for a player."""
-        # Check if the stat already exists
-        existing_stat = (
-            self.db.query(BaseStat)
-            .filter(
-                BaseStat.player_id == player_id,
-                BaseStat.season == season,
-                BaseStat.stat_type == stat_type,
-            )
-            .first()
-        )
-
-        if existing_stat:
-            # Update existing stat
-            existing_stat.value = value
-        else:
-            # Create new stat
-            new_stat = BaseStat(
-                stat_id=str(uuid.uuid4()),
-                player_id=player_id,
-                season=season,
-                stat_type=stat_type,
-                value=value,
-            )
-            self.db.add(new_stat)
-
     def _calculate_fantasy_points(self, stats: Dict[str, float], position: str) -> float:
         """
         Calculate half-PPR fantasy points from stats.
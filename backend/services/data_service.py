@@ -1,11 +1,11 @@
 from typing import Dict, List, Optional, cast, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from backend.database.models import Player, BaseStat, GameStats, TeamStat
+from sqlalchemy import and_, func
+from backend.database.models import GAME_STAT_COLUMNS, Player, BaseStat, GameStats, TeamStat
 import logging
 
 from backend.services.typing import (
-    safe_float, safe_dict_get, PlayerDataDict, GameStatsDict, PlayerSplitsDict
+    safe_float, PlayerDataDict, GameStatsDict, PlayerSplitsDict
 )
 
 logger = logging.getLogger(__name__)
@@ -94,6 +94,8 @@ class DataService:
         """
         Get player statistical splits (home/away, win/loss, etc).
 
+        Games are grouped and summed in SQL over the GameStats stat columns.
+
         Args:
             player_id: Player's unique identifier
             season: Season year
@@ -102,48 +104,48 @@ class DataService:
         Returns:
             Dictionary of split statistics
         """
-        game_logs = await self.get_player_game_logs(player_id, season)
-
         if split_type == "home_away":
-            home_games = [g for g in game_logs if g.game_location == "home"]
-            away_games = [g for g in game_logs if g.game_location == "away"]
-
-            return {
-                "home": self._aggregate_game_stats(home_games),
-                "away": self._aggregate_game_stats(away_games),
-            }
-
+            column, splits = GameStats.game_location, {"home": "home", "away": "away"}
         elif split_type == "win_loss":
-            wins = [g for g in game_logs if g.result == "W"]
-            losses = [g for g in game_logs if g.result == "L"]
-
-            return {
-                "wins": self._aggregate_game_stats(wins),
-                "losses": self._aggregate_game_stats(losses),
-            }
-
+            column, splits = GameStats.result, {"W": "wins", "L": "losses"}
         else:
             raise ValueError(f"Unknown split type: {split_type}")
 
-    def _aggregate_game_stats(self, games: List[GameStats]) -> GameStatsDict:
-        """Aggregate statistics from a list of games."""
-        if not games:
-            return {}
+        rows = (
+            self.db.query(
+                column.label("split"),
+                func.count(GameStats.game_stat_id).label("games"),
+                func.sum(GameStats.team_score).label("total_points"),
+                func.sum(GameStats.opponent_score).label("points_allowed"),
+                *[func.sum(getattr(GameStats, stat)).label(stat) for stat in GAME_STAT_COLUMNS],
+            )
+            .filter(
+                GameStats.player_id == player_id,
+                GameStats.season == season,
+                column.in_(list(splits)),
+            )
+            .group_by(column)
+            .all()
+        )
+
+        result: Dict[str, GameStatsDict] = {name: {} for name in splits.values()}
+        for row in rows:
+            result[splits[row.split]] = self._split_stats(row)
+
+        return cast(PlayerSplitsDict, result)
 
-        # Initialize with game counts
+    def _split_stats(self, row: Any) -> GameStatsDict:
+        """Aggregated statistics for one split group."""
         aggregated: GameStatsDict = {
-            "games": len(games),
-            "total_points": sum(safe_float(g.team_score, 0.0) for g in games),
-            "points_allowed": sum(safe_float(g.opponent_score, 0.0) for g in games),
+            "games": row.games,
+            "total_points": safe_float(row.total_points, 0.0),
+            "points_allowed": safe_float(row.points_allowed, 0.0),
         }
 
-        # Aggregate all stats from the JSON field
-        if games and games[0].stats:
-            for stat_key in games[0].stats.keys():
-                try:
-                    aggregated[stat_key] = sum(safe_float(safe_dict_get(g.stats, stat_key, 0.0)) for g in games)
-                except (ValueError, TypeError):
-                    # Skip any non-numeric stats
-                    continue
+        # Stats no game in the group recorded stay absent
+        for stat in GAME_STAT_COLUMNS:
+            value = getattr(row, stat)
+            if value is not None:
+                aggregated[stat] = float(value)
 
         return cast(GameStatsDict, aggregated)
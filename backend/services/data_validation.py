@@ -5,7 +5,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from sqlalchemy.exc import SQLAlchemyError
 
-from backend.database.models import Player, BaseStat, GameStats, TeamStat, Projection
+from backend.database.models import Player, GameStats, TeamStat, Projection
+from backend.services.scenario_delta_service import ScenarioDeltaService
+from backend.services.season_stats_service import SeasonStatsService
 from backend.services.typing import safe_float, safe_dict_get, safe_calculate
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,7 @@ class DataValidationService:
 
     def __init__(self, db: Session):
         self.db = db
+        self.season_stats = SeasonStatsService(db)
         # Define the minimum stats that should exist for each position
         self.required_stats = {
             "QB": {
@@ -96,32 +99,22 @@ class DataValidationService:
         )
 
         # Get games count stat
-        games_stat = (
-            self.db.query(BaseStat)
-            .filter(
-                and_(
-                    BaseStat.player_id == player.player_id,
-                    BaseStat.season == season,
-                    BaseStat.stat_type == "games",
-                )
-            )
-            .first()
-        )
+        games_stat = self.season_stats.get_season_stats(player.player_id, season).get("games")
 
-        if not game_stats and not games_stat:
+        if not game_stats and games_stat is None:
             # No data for this season
             return []
 
         game_count = len(game_stats)
 
-        if not games_stat:
+        if games_stat is None:
             issues.append(
                 f"Player {player.name} has {game_count} game logs but no games count stat"
             )
             self._fix_games_count(player, season, game_count)
-        elif game_count != int(games_stat.value):
+        elif game_count != int(games_stat):
             issues.append(
-                f"Player {player.name} has {game_count} game logs but games stat is {int(games_stat.value)}"
+                f"Player {player.name} has {game_count} game logs but games stat is {int(games_stat)}"
             )
             self._fix_games_count(player, season, game_count)
 
@@ -141,21 +134,9 @@ class DataValidationService:
         if not game_stats:
             return []
 
-        # Get base stats
-        base_stats = (
-            self.db.query(BaseStat)
-            .filter(
-                and_(
-                    BaseStat.player_id == player.player_id,
-                    BaseStat.season == season,
-                    BaseStat.stat_type != "games",  # Exclude games count
-                )
-            )
-            .all()
-        )
-
-        # Convert to dictionary
-        base_stat_dict = {stat.stat_type: stat.value for stat in base_stats}
+        # Get season totals, excluding the games count
+        base_stat_dict = self.season_stats.get_season_stats(player.player_id, season)
+        base_stat_dict.pop("games", None)
 
         # Define stat mapping (similar to the mappings in NFLDataImportService)
         stat_mappings = {
@@ -236,18 +217,14 @@ class DataValidationService:
         """Check if any required stats are missing."""
         issues = []
 
-        # Get all base stats for this player and season
-        base_stats = (
-            self.db.query(BaseStat)
-            .filter(and_(BaseStat.player_id == player.player_id, BaseStat.season == season))
-            .all()
-        )
+        # Get all season totals for this player and season
+        season_stats = self.season_stats.get_season_stats(player.player_id, season)
 
-        if not base_stats:
+        if not season_stats:
             return []
 
         # Get set of stat types that exist
-        existing_stats = {stat.stat_type for stat in base_stats}
+        existing_stats = set(season_stats)
 
         # Check for missing required stats
         required = self.required_stats[player.position]
@@ -265,29 +242,9 @@ class DataValidationService:
     def _fix_games_count(self, player: Player, season: int, game_count: int) -> None:
         """Fix the games count stat."""
         try:
-            games_stat = (
-                self.db.query(BaseStat)
-                .filter(
-                    and_(
-                        BaseStat.player_id == player.player_id,
-                        BaseStat.season == season,
-                        BaseStat.stat_type == "games",
-                    )
-                )
-                .first()
+            self.season_stats.save_season_totals(
+                player.player_id, season, {"games": float(game_count)}
             )
-
-            if games_stat:
-                games_stat.value = float(game_count)
-            else:
-                games_stat = BaseStat(
-                    player_id=player.player_id,
-                    season=season,
-                    stat_type="games",
-                    value=float(game_count),
-                )
-                self.db.add(games_stat)
-
             self.db.flush()
             logger.info(f"Fixed games count for {player.name}: now {game_count}")
         except SQLAlchemyError as e:
@@ -297,22 +254,9 @@ class DataValidationService:
     def _fix_stat_value(self, player: Player, season: int, stat_type: str, value: float) -> None:
         """Fix an incorrect stat value."""
         try:
-            stat = (
-                self.db.query(BaseStat)
-                .filter(
-                    and_(
-                        BaseStat.player_id == player.player_id,
-                        BaseStat.season == season,
-                        BaseStat.stat_type == stat_type,
-                    )
-                )
-                .first()
-            )
-
-            if stat:
-                stat.value = value
-                self.db.flush()
-                logger.info(f"Fixed {stat_type} for {player.name}: now {value}")
+            self.season_stats.save_season_totals(player.player_id, season, {stat_type: value})
+            self.db.flush()
+            logger.info(f"Fixed {stat_type} for {player.name}: now {value}")
         except SQLAlchemyError as e:
             logger.error(f"Error fixing {stat_type} for {player.name}: {str(e)}")
             self.db.rollback()
@@ -320,10 +264,7 @@ class DataValidationService:
     def _add_missing_stat(self, player: Player, season: int, stat_type: str, value: float) -> None:
         """Add a missing stat."""
         try:
-            new_stat = BaseStat(
-                player_id=player.player_id, season=season, stat_type=stat_type, value=value
-            )
-            self.db.add(new_stat)
+            self.season_stats.save_season_totals(player.player_id, season, {stat_type: value})
             self.db.flush()
             logger.info(f"Added missing {stat_type} for {player.name}: {value}")
         except SQLAlchemyError as e:
@@ -364,27 +305,14 @@ class DataValidationService:
             if not players:
                 return [f"No players found for team {team}"]
                 
-            # Retrieve base stats for all players
+            # Season totals for all players, keyed by player_id
             player_ids = [player.player_id for player in players]
-            
-            # Get all base stats for these players in this season
-            all_player_stats = (
-                self.db.query(BaseStat)
-                .filter(
-                    and_(
-                        BaseStat.player_id.in_(player_ids),
-                        BaseStat.season == season,
-                    )
-                )
-                .all()
-            )
-            
-            # Group stats by player_id and stat_type
-            player_stats_by_id = {}
-            for stat in all_player_stats:
-                if stat.player_id not in player_stats_by_id:
-                    player_stats_by_id[stat.player_id] = {}
-                player_stats_by_id[stat.player_id][stat.stat_type] = safe_float(stat.value, 0)
+            player_stats_by_id = {
+                player_id: {stat_type: safe_float(value, 0) for stat_type, value in stats.items()}
+                for player_id, stats in self.season_stats.get_season_stats_map(
+                    season, player_ids
+                ).items()
+            }
             
             # Initialize aggregated stats
             aggregated_stats = {
@@ -657,22 +585,27 @@ class DataValidationService:
         issues = []
         
         try:
-            # Build projection query
-            query = (
-                self.db.query(Projection)
-                .filter(
-                    and_(
-                        Projection.player_id == player_id,
-                        Projection.season == season
+            if scenario_id:
+                # Scenario projections resolve through the base scenario chain
+                projection = next(
+                    iter(
+                        ScenarioDeltaService(self.db).resolve_projections(
+                            scenario_id, season=season, player_ids=[player_id]
+                        )
+                    ),
+                    None,
+                )
+            else:
+                projection = (
+                    self.db.query(Projection)
+                    .filter(
+                        and_(
+                            Projection.player_id == player_id,
+                            Projection.season == season
+                        )
                     )
+                    .first()
                 )
-            )
-            
-            # Add scenario filter if provided
-            if scenario_id:
-                query = query.filter(Projection.scenario_id == scenario_id)
-                
-            projection = query.first()
             
             if not projection:
                 return [f"No projection found for player {player_id} in season {season}"]
@@ -1006,26 +939,31 @@ class DataValidationService:
         results = {}
         
         try:
-            # Build the query to get all players with projections
-            query = (
-                self.db.query(Player)
-                .join(
-                    Projection,
-                    and_(
-                        Player.player_id == Projection.player_id,
-                        Projection.season == season
+            if scenario_id:
+                # Scenario projections resolve through the base scenario chain
+                players = [
+                    projection.player
+                    for projection in ScenarioDeltaService(self.db).resolve_projections(
+                        scenario_id, season=season, position=position
+                    )
+                ]
+            else:
+                # Build the query to get all players with projections
+                query = (
+                    self.db.query(Player)
+                    .join(
+                        Projection,
+                        and_(
+                            Player.player_id == Projection.player_id,
+                            Projection.season == season
+                        )
                     )
                 )
-            )
-            
-            # Add filters if provided
-            if scenario_id:
-                query = query.filter(Projection.scenario_id == scenario_id)
-                
-            if position:
-                query = query.filter(Player.position == position)
-                
-            players = query.all()
+
+                if position:
+                    query = query.filter(Player.position == position)
+
+                players = query.all()
             
             # Validate each player's projections
             for player in players:
@@ -5,6 +5,7 @@ import logging
 from datetime import datetime
 import uuid
 
+from backend.database.executor import run_in_db_thread, run_in_own_session
 from backend.database.models import (
     Player,
     Projection,
@@ -12,7 +13,15 @@ from backend.database.models import (
     DraftBoard,
     RookieProjectionTemplate,
 )
+from backend.services.cache_invalidation import invalidate_on_commit
+from backend.services.cache_service import PLAYERS_TAG, get_cache, scenario_tag
+from backend.services.draft_value_service import (
+    DraftValueEngine,
+    get_draft_values,
+    replacement_depths,
+)
 from backend.services.rookie_projection_service import RookieProjectionService
+from backend.services.scoring_service import ScoringService
 from backend.services.typing import (
     safe_float, safe_dict_get, 
     PlayerDraftDataDict, DraftBoardDict, DraftStatusUpdateDict, DraftResultDict
@@ -29,6 +38,8 @@ class DraftService:
 
     def __init__(self, db: Session):
         self.db = db
+        self.cache = get_cache()
+        self.value_engines = get_draft_values()
         self.rookie_projection_service = RookieProjectionService(db)
 
     async def get_draft_board(
@@ -54,6 +65,39 @@ class DraftService:
         Returns:
             Dict with player list and metadata
         """
+        cache_key = self.cache.cache_key(
+            "draft_board",
+            status=status,
+            position=position,
+            team=team,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
+
+        # Any player write (e.g. a draft pick) or base projection write invalidates the board
+        return await self.cache.get_or_compute_async(
+            cache_key,
+            lambda: run_in_db_thread(
+                self.db, self._query_draft_board, status, position, team, order_by, limit, offset
+            ),
+            tags=[PLAYERS_TAG, scenario_tag(None)],
+            # A stale board is refreshed after the request's Session is closed
+            refresh=lambda: run_in_own_session(
+                self, "_query_draft_board", status, position, team, order_by, limit, offset
+            ),
+        )
+
+    def _query_draft_board(
+        self,
+        status: Optional[str],
+        position: Optional[str],
+        team: Optional[str],
+        order_by: str,
+        limit: int,
+        offset: int,
+    ) -> DraftBoardDict:
+        """Build one page of the draft board (uncached, blocking)."""
         # Build the query with filters
         query = self.db.query(Player)
 
@@ -142,6 +186,64 @@ class DraftService:
 
         return {"players": formatted_players, "total": total_count, "counts": status_counts}
 
+    async def get_value_board(
+        self,
+        draft_board_id: str,
+        position: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Rank available players by value over replacement under a draft board's settings.
+
+        The board's engine is built once and then updated pick by pick, so this only
+        walks the top of the per-position value arrays.
+
+        Args:
+            draft_board_id: Draft board whose scoring rules and league size are used
+            position: Optional position filter
+            limit: Maximum number of players to return
+            offset: Number of players to skip
+
+        Returns:
+            Dict with replacement levels, player rows and totals, or None if the board
+            is missing
+        """
+        engine = self.value_engines.get(draft_board_id)
+        if engine is None:
+            engine = await self._build_value_engine(draft_board_id)
+            if engine is None:
+                return None
+
+        return {
+            "draft_board_id": draft_board_id,
+            "replacement_levels": engine.replacement_levels(),
+            "depths": engine.depths,
+            "total": engine.available_count(position),
+            "players": engine.ranked(position=position, limit=limit, offset=offset),
+        }
+
+    async def _build_value_engine(self, draft_board_id: str) -> Optional[DraftValueEngine]:
+        """Score the board's projections and build its value engine from scratch."""
+        board = self.db.get(DraftBoard, draft_board_id)
+        if not board:
+            return None
+
+        token = self.value_engines.begin(draft_board_id)
+        frame = await ScoringService(self.db).score_draft_board(draft_board_id)
+        drafted_ids = {
+            player_id
+            for (player_id,) in self.db.query(Player.player_id).filter(
+                Player.draft_status == DraftStatus.DRAFTED
+            )
+        }
+        depths = replacement_depths(board.number_of_teams, board.roster_spots, board.settings)
+
+        engine = DraftValueEngine(frame, drafted_ids, depths, token=token)
+        self.value_engines.put(draft_board_id, engine)
+        logger.debug(f"Built draft value engine for board {draft_board_id}")
+        return engine
+
     async def update_draft_status(
         self,
         player_id: str,
@@ -169,6 +271,7 @@ class DraftService:
             if not player:
                 logger.warning(f"Player not found: {player_id}")
                 return None
+            projection_created = False
 
             # Update the status
             try:
@@ -237,12 +340,20 @@ class DraftService:
                             )
 
                             if projection:
+                                projection_created = True
                                 logger.info(
                                     f"Created projection for rookie {player.name} at draft position {draft_position}"
                                 )
 
+            # Value engines current before this commit only need the pick applied; a new
+            # rookie projection changes the scored pool, so those are rebuilt instead
+            live_engines = {} if projection_created else self.value_engines.live()
+
             # Update player and commit changes
             self.db.commit()
+            self.value_engines.record_status(
+                live_engines, player_id, draft_status == DraftStatus.DRAFTED
+            )
             return player
 
         except Exception as e:
@@ -322,8 +433,10 @@ class DraftService:
             self.db.query(Player).update(
                 {"draft_status": DraftStatus.AVAILABLE, "fantasy_team": None, "draft_order": None}
             )
+            invalidate_on_commit(self.db, [PLAYERS_TAG])
 
             self.db.commit()
+            self.value_engines.clear()
             return {"success": True, "reset_count": count}
 
         except Exception as e:
@@ -365,7 +478,9 @@ class DraftService:
             last_pick.fantasy_team = None
             last_pick.draft_order = None
 
+            live_engines = self.value_engines.live()
             self.db.commit()
+            self.value_engines.record_status(live_engines, last_pick.player_id, False)
             return {"success": True, "player": player_info}
 
         except Exception as e:
@@ -440,6 +555,8 @@ class DraftService:
         description: Optional[str] = None,
         season: Optional[int] = None,
         settings: Optional[Dict[str, Any]] = None,
+        number_of_teams: int = 12,
+        roster_spots: int = 15,
     ) -> Optional[DraftBoard]:
         """
         Create a new draft board.
@@ -449,6 +566,8 @@ class DraftService:
             description: Optional description
             season: The season for the draft (defaults to current year)
             settings: Optional configuration settings
+            number_of_teams: Number of teams in the draft
+            roster_spots: Number of roster spots per team
 
         Returns:
             The created draft board or None if creation failed
@@ -465,6 +584,8 @@ class DraftService:
                 description=description,
                 season=season,
                 settings=settings,
+                number_of_teams=number_of_teams,
+                roster_spots=roster_spots,
             )
 
             self.db.add(draft_board)
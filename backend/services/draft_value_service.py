@@ -0,0 +1,339 @@
+"""
+Value-based drafting (VBD) rankings for a draft board.
+
+A player's value over replacement (VORP) is their projected points under the board's
+scoring rules minus the points of the replacement-level player at their position: the
+first player still left once the league has drafted the depth it needs there. Depth
+per position is DraftBoard.number_of_teams x roster_spots, split across positions in
+proportion to the starting lineup (settings["starters"], DEFAULT_STARTERS otherwise).
+While a draft runs the replacement level follows the picks: with d players of a
+position drafted, it is the (depth - d + 1)-th best one still available.
+
+DraftValueEngine keeps each position's players sorted by points, with a Fenwick tree
+over their availability. Recording a pick, moving the replacement level and finding
+the k-th best available player are O(log n), so the ranked board is walked without
+rescanning the pool.
+
+Engines live in this process. DraftService applies its own picks to them; a local
+cache entry tagged with the players and base projection tags marks each engine as
+current, so a pick recorded by another worker or a projection write drops it and the
+engine is rebuilt on the next read.
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+import heapq
+import logging
+import threading
+import uuid
+
+import pandas as pd
+
+from backend.services.cache_service import PLAYERS_TAG, get_cache, scenario_tag
+
+logger = logging.getLogger(__name__)
+
+POSITIONS = ("QB", "RB", "WR", "TE")
+
+# Starters per team at each position; the flex spot is split between RB and WR
+DEFAULT_STARTERS = {"QB": 1.0, "RB": 2.5, "WR": 2.5, "TE": 1.0}
+
+# Engines are rebuilt at least this often even if nothing invalidates them
+DRAFT_VALUE_TTL = 24 * 3600
+
+
+def replacement_depths(
+    number_of_teams: int, roster_spots: int, settings: Optional[Mapping[str, Any]] = None
+) -> Dict[str, int]:
+    """
+    Players of each position the league is expected to draft.
+
+    Args:
+        number_of_teams: Teams in the league
+        roster_spots: Roster spots per team
+        settings: Draft board settings; "starters" overrides DEFAULT_STARTERS per position
+
+    Returns:
+        Position -> draft depth
+    """
+    starters = {**DEFAULT_STARTERS, **((settings or {}).get("starters") or {})}
+    weights = {pos: max(float(starters.get(pos, 0.0)), 0.0) for pos in POSITIONS}
+    total = sum(weights.values()) or 1.0
+    picks = number_of_teams * roster_spots
+    return {pos: int(round(picks * weight / total)) for pos, weight in weights.items()}
+
+
+class _AvailabilityTree:
+    """Fenwick tree over 0/1 availability flags."""
+
+    def __init__(self, flags: Sequence[bool]):
+        n = len(flags)
+        tree = [0] * (n + 1)
+        for i, flag in enumerate(flags, 1):
+            tree[i] += int(flag)
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self.n = n
+        self.tree = tree
+        self.top = 1 << (n.bit_length() - 1) if n else 0
+
+    def add(self, index: int, delta: int) -> None:
+        """Add delta to the flag at a 0-based index."""
+        i = index + 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, k: int) -> int:
+        """0-based index of the k-th (1-based) set flag; k must not exceed the set count."""
+        pos = 0
+        step = self.top
+        while step:
+            nxt = pos + step
+            if nxt <= self.n and self.tree[nxt] < k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+
+class _PositionValues:
+    """One position's players in descending points order and their availability."""
+
+    def __init__(self, position: str, rows: pd.DataFrame, drafted_ids: Set[str], depth: int):
+        self.position = position
+        self.player_ids: List[str] = rows["player_id"].tolist()
+        self.names: List[str] = rows["name"].tolist()
+        self.teams: List[Optional[str]] = rows["team"].tolist()
+        self.points: List[float] = rows["points"].astype(float).tolist()
+        self.available = bytearray(pid not in drafted_ids for pid in self.player_ids)
+        self.tree = _AvailabilityTree(self.available)
+        self.count = sum(self.available)
+        self.drafted = len(self.player_ids) - self.count
+        self.depth = depth
+        self.replacement = 0.0
+        self._update_replacement()
+
+    def set_available(self, index: int, available: bool) -> bool:
+        """Flip one player's availability; returns False if it already had that value."""
+        if bool(self.available[index]) == available:
+            return False
+        self.available[index] = available
+        delta = 1 if available else -1
+        self.tree.add(index, delta)
+        self.count += delta
+        self.drafted -= delta
+        self._update_replacement()
+        return True
+
+    def walk(self) -> Iterator[Tuple[float, "_PositionValues", int, int]]:
+        """(vorp, self, position rank, index) of the available players, best first."""
+        for k in range(1, self.count + 1):
+            i = self.tree.find(k)
+            yield self.points[i] - self.replacement, self, k, i
+
+    def _update_replacement(self) -> None:
+        if not self.count:
+            self.replacement = 0.0
+            return
+        k = min(max(self.depth - self.drafted + 1, 1), self.count)
+        self.replacement = self.points[self.tree.find(k)]
+
+
+class DraftValueEngine:
+    """Live VORP rankings for one draft board."""
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        drafted_ids: Set[str],
+        depths: Mapping[str, int],
+        token: Optional[str] = None,
+    ):
+        """
+        Build the per-position value arrays.
+
+        Args:
+            frame: Scored projections with player_id, name, team, position and points
+            drafted_ids: Players already drafted
+            depths: Position -> draft depth (see replacement_depths)
+            token: Build token from DraftValueRegistry.begin
+        """
+        self.token = token or uuid.uuid4().hex
+        self.lock = threading.Lock()
+        self.depths = dict(depths)
+        self.positions: Dict[str, _PositionValues] = {}
+        self.index: Dict[str, Tuple[_PositionValues, int]] = {}
+
+        frame = frame.sort_values("points", ascending=False, kind="stable").drop_duplicates(
+            "player_id"
+        )
+        for pos in POSITIONS:
+            rows = frame[frame["position"] == pos]
+            values = _PositionValues(pos, rows, drafted_ids, self.depths.get(pos, 0))
+            self.positions[pos] = values
+            for i, player_id in enumerate(values.player_ids):
+                self.index[player_id] = (values, i)
+
+    def set_drafted(self, player_id: str, drafted: bool) -> bool:
+        """
+        Record a pick (or its undo) in O(log n).
+
+        Returns:
+            True if the player is ranked here and their availability changed
+        """
+        entry = self.index.get(player_id)
+        if entry is None:
+            return False
+        values, i = entry
+        with self.lock:
+            return values.set_available(i, not drafted)
+
+    def replacement_levels(self) -> Dict[str, float]:
+        """Current replacement points per position."""
+        with self.lock:
+            return {pos: values.replacement for pos, values in self.positions.items()}
+
+    def available_count(self, position: Optional[str] = None) -> int:
+        """Available players, overall or at one position."""
+        with self.lock:
+            if position:
+                values = self.positions.get(position)
+                return values.count if values else 0
+            return sum(values.count for values in self.positions.values())
+
+    def ranked(
+        self, position: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Available players by value over replacement.
+
+        Positions are already in points order, and subtracting a per-position
+        replacement level keeps that order, so the board is a k-way merge of the
+        positions that stops after offset + limit players.
+
+        Args:
+            position: Only rank this position
+            limit: Maximum number of players to return
+            offset: Number of players to skip
+
+        Returns:
+            Rows with player_id, name, team, position, points, replacement, vorp,
+            position_rank and rank
+        """
+        positions = [position] if position else list(POSITIONS)
+        with self.lock:
+            streams = [self.positions[pos].walk() for pos in positions if pos in self.positions]
+            merged = heapq.merge(*streams, key=lambda row: -row[0])
+
+            result = []
+            for rank, (vorp, values, position_rank, i) in enumerate(
+                islice(merged, offset, offset + limit), offset + 1
+            ):
+                result.append(
+                    {
+                        "player_id": values.player_ids[i],
+                        "name": values.names[i],
+                        "team": values.teams[i],
+                        "position": values.position,
+                        "points": values.points[i],
+                        "replacement": values.replacement,
+                        "vorp": vorp,
+                        "position_rank": position_rank,
+                        "rank": rank,
+                    }
+                )
+            return result
+
+
+class DraftValueRegistry:
+    """This process's DraftValueEngines, keyed by draft board."""
+
+    def __init__(self) -> None:
+        self.engines: Dict[str, DraftValueEngine] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _marker_key(draft_board_id: str) -> str:
+        return f"draft_values:{draft_board_id}"
+
+    def _mark(self, draft_board_id: str, token: str) -> None:
+        # Kept out of the shared tier: other workers have their own engines
+        get_cache().set(
+            self._marker_key(draft_board_id),
+            token,
+            DRAFT_VALUE_TTL,
+            tags=[PLAYERS_TAG, scenario_tag(None)],
+            shared=False,
+        )
+
+    def get(self, draft_board_id: str) -> Optional[DraftValueEngine]:
+        """The board's engine, or None if it was never built or is no longer current."""
+        with self.lock:
+            engine = self.engines.get(draft_board_id)
+            if engine is None:
+                return None
+            if get_cache().get(self._marker_key(draft_board_id)) != engine.token:
+                del self.engines[draft_board_id]
+                return None
+            return engine
+
+    def begin(self, draft_board_id: str) -> str:
+        """
+        Start building an engine; returns the token to build it with.
+
+        The board is marked current before its data is read, so a write committed
+        while the engine is built drops the marker and the engine is not used again.
+        """
+        token = uuid.uuid4().hex
+        with self.lock:
+            self._mark(draft_board_id, token)
+        return token
+
+    def put(self, draft_board_id: str, engine: DraftValueEngine) -> None:
+        """Register an engine built with a token from begin."""
+        with self.lock:
+            self.engines[draft_board_id] = engine
+
+    def live(self) -> Dict[str, DraftValueEngine]:
+        """Engines that are current; take this right before committing a pick."""
+        with self.lock:
+            board_ids = list(self.engines)
+        live = {}
+        for board_id in board_ids:
+            engine = self.get(board_id)
+            if engine is not None:
+                live[board_id] = engine
+        return live
+
+    def record_status(
+        self, engines: Mapping[str, DraftValueEngine], player_id: str, drafted: bool
+    ) -> None:
+        """
+        Apply a committed pick (or undo) to engines that were current before the commit.
+
+        The commit invalidated their markers along with the players tag; the pick is
+        the only change, so they are marked current again instead of rebuilt.
+        """
+        for board_id, engine in engines.items():
+            engine.set_drafted(player_id, drafted)
+            with self.lock:
+                if self.engines.get(board_id) is engine:
+                    self._mark(board_id, engine.token)
+
+    def clear(self) -> None:
+        """Drop every engine (e.g. after a draft reset)."""
+        with self.lock:
+            self.engines.clear()
+
+
+_registry: Optional[DraftValueRegistry] = None
+
+
+def get_draft_values() -> DraftValueRegistry:
+    """Get or create the process's draft value registry."""
+    global _registry
+    if _registry is None:
+        _registry = DraftValueRegistry()
+    return _registry
@@ -0,0 +1,53 @@
+"""
+Import watermarks: the last imported position (e.g., week) of a dataset and season.
+
+Watermarks are ImportLog rows with dataset, season and watermark set; the newest row
+for a (dataset, season) holds the current value. Incremental imports resume after it,
+and derived tables compare against it to tell whether they are stale.
+"""
+
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from backend.database.models import ImportLog
+
+# ImportLog dataset name for the weekly stats watermark
+WEEKLY_STATS_DATASET = "weekly_stats"
+
+
+def get_watermark(db: Session, dataset: str, season: int) -> Optional[int]:
+    """
+    Last imported position recorded for a dataset and season.
+
+    Args:
+        db: Database session
+        dataset: Dataset name (e.g., "weekly_stats")
+        season: NFL season year
+
+    Returns:
+        The watermark, or None if nothing was recorded
+    """
+    row = (
+        db.query(ImportLog.watermark)
+        .filter(
+            ImportLog.dataset == dataset,
+            ImportLog.season == season,
+            ImportLog.watermark.isnot(None),
+        )
+        .order_by(ImportLog.created_at.desc())
+        .first()
+    )
+    return row.watermark if row else None
+
+
+def watermark_log(dataset: str, season: int, watermark: int) -> ImportLog:
+    """ImportLog row recording a new watermark, to be added to the importing transaction."""
+    return ImportLog(
+        operation="watermark",
+        status="success",
+        message=f"{dataset} for {season} imported through {watermark}",
+        dataset=dataset,
+        season=season,
+        watermark=watermark,
+    )
@@ -0,0 +1,280 @@
+"""
+In-process background jobs for long-running operations.
+
+Imports, batch projection runs, league-wide validation and exports take longer than
+clients wait on an HTTP request. JobRunner queues them instead: each job is a row in
+the jobs table (status, progress, result, error), so any worker can report on it, and
+runs on a bounded thread pool with its own event loop and database session, so it
+never blocks the serving loop. Finished jobs are also recorded in ImportLog like the
+other import bookkeeping.
+
+Cancellation sets cancel_requested on the row. A queued job is dropped before it
+starts; a running job is cancelled at its next await, or when it next reports
+progress. Jobs still queued or running when the process stops are marked failed on
+the next startup (see recover_interrupted).
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import json
+import logging
+import threading
+
+from sqlalchemy.orm import Session
+
+from backend.database.database import get_session
+from backend.database.models import ImportLog, Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# Jobs running at once; the rest wait in the queue
+JOB_WORKERS = 2
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+# ImportLog status per finished job status
+LOG_STATUS = {
+    JobStatus.SUCCEEDED: "success",
+    JobStatus.FAILED: "error",
+    JobStatus.CANCELLED: "warning",
+}
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested."""
+
+
+class JobContext:
+    """Handle a running job uses to report progress and check for cancellation."""
+
+    def __init__(self, runner: "JobRunner", job_id: str):
+        self.runner = runner
+        self.job_id = job_id
+
+    def report(self, progress: float, message: Optional[str] = None) -> None:
+        """
+        Record progress, raising JobCancelled if the job was cancelled.
+
+        Args:
+            progress: Fraction complete, 0.0 to 1.0
+            message: Optional description of the current step
+        """
+        cancelled = self.runner._update(
+            self.job_id, progress=min(max(progress, 0.0), 1.0), message=message
+        )
+        if cancelled:
+            raise JobCancelled()
+
+
+# A job function does the work with its own session and returns a JSON-able result
+JobFunction = Callable[[Session, JobContext], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class JobRunner:
+    """Queues job functions on a bounded pool and tracks them in the jobs table."""
+
+    def __init__(
+        self,
+        max_workers: int = JOB_WORKERS,
+        session_factory: Callable[[], Session] = get_session,
+    ):
+        """
+        Args:
+            max_workers: Jobs allowed to run at once
+            session_factory: Creates the sessions jobs and bookkeeping use
+        """
+        self.session_factory = session_factory
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        self._tasks: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Task]] = {}
+
+    def submit(
+        self, operation: str, fn: JobFunction, params: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Queue a job.
+
+        Args:
+            operation: Job type recorded on the row (e.g., "nfl_import")
+            fn: Async function doing the work
+            params: JSON-able parameters recorded on the row
+
+        Returns:
+            The job ID
+        """
+        db = self.session_factory()
+        try:
+            job = Job(operation=operation, status=JobStatus.QUEUED, params=params or {})
+            db.add(job)
+            db.commit()
+            job_id = job.job_id
+        finally:
+            db.close()
+
+        # Held across submit so a job that finishes at once cannot leave a stale entry
+        with self._lock:
+            self._futures[job_id] = self._executor.submit(self._run, job_id, operation, fn)
+        logger.info(f"Queued {operation} job {job_id}")
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Request cancellation of a job.
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            False if the job does not exist or already finished
+        """
+        db = self.session_factory()
+        try:
+            job = db.get(Job, job_id)
+            if job is None or job.status in FINISHED_STATUSES:
+                return False
+            job.cancel_requested = True
+            db.commit()
+        finally:
+            db.close()
+
+        with self._lock:
+            future = self._futures.get(job_id)
+            task = self._tasks.get(job_id)
+        if future is not None and future.cancel():
+            # Never started
+            with self._lock:
+                self._futures.pop(job_id, None)
+            self._finish(job_id, JobStatus.CANCELLED, message="Cancelled before start")
+        elif task is not None:
+            loop, running = task
+            loop.call_soon_threadsafe(running.cancel)
+        return True
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> None:
+        """Block until a job submitted by this runner finishes (mainly for tests and scripts)."""
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None and not future.cancelled():
+            future.result(timeout=timeout)
+
+    def recover_interrupted(self) -> int:
+        """
+        Mark jobs left queued or running by a previous process as failed.
+
+        Returns:
+            Number of jobs marked
+        """
+        db = self.session_factory()
+        try:
+            count = (
+                db.query(Job)
+                .filter(Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]))
+                .update(
+                    {
+                        "status": JobStatus.FAILED,
+                        "error": "Interrupted by a restart",
+                        "finished_at": datetime.utcnow(),
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            return count
+        finally:
+            db.close()
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop accepting work."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_id: str, operation: str, fn: JobFunction) -> None:
+        if self._update(job_id, status=JobStatus.RUNNING, started_at=datetime.utcnow()):
+            self._finish(job_id, JobStatus.CANCELLED, message="Cancelled before start")
+            return
+
+        db = self.session_factory()
+        try:
+            result = asyncio.run(self._execute(job_id, fn, db))
+            # Results may hold datetimes and numpy scalars; store them as JSON can
+            result = json.loads(json.dumps(result, default=str)) if result is not None else None
+            self._finish(job_id, JobStatus.SUCCEEDED, progress=1.0, result=result)
+        except (JobCancelled, asyncio.CancelledError):
+            db.rollback()
+            self._finish(job_id, JobStatus.CANCELLED, message="Cancelled")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"{operation} job {job_id} failed: {str(e)}")
+            self._finish(job_id, JobStatus.FAILED, error=str(e))
+        finally:
+            db.close()
+            with self._lock:
+                self._futures.pop(job_id, None)
+
+    async def _execute(self, job_id: str, fn: JobFunction, db: Session) -> Optional[Dict]:
+        task = asyncio.current_task()
+        with self._lock:
+            self._tasks[job_id] = (asyncio.get_running_loop(), task)
+        try:
+            return await fn(db, JobContext(self, job_id))
+        finally:
+            with self._lock:
+                self._tasks.pop(job_id, None)
+
+    def _update(self, job_id: str, **values: Any) -> bool:
+        """Update a job row; returns whether cancellation was requested."""
+        db = self.session_factory()
+        try:
+            job = db.get(Job, job_id)
+            if job is None:
+                return True
+            for key, value in values.items():
+                setattr(job, key, value)
+            db.commit()
+            return job.cancel_requested
+        finally:
+            db.close()
+
+    def _finish(self, job_id: str, status: JobStatus, **values: Any) -> None:
+        """Record a job's outcome on its row and in ImportLog."""
+        db = self.session_factory()
+        try:
+            job = db.get(Job, job_id)
+            if job is None or job.status in FINISHED_STATUSES:
+                return
+            job.status = status
+            job.finished_at = datetime.utcnow()
+            for key, value in values.items():
+                setattr(job, key, value)
+
+            duration = (
+                (job.finished_at - job.started_at).total_seconds() if job.started_at else 0.0
+            )
+            db.add(
+                ImportLog(
+                    operation=f"job_{job.operation}",
+                    status=LOG_STATUS[status],
+                    message=job.error or job.message or f"Job {status.value}",
+                    details={"job_id": job_id, "duration_seconds": duration},
+                )
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error recording outcome of job {job_id}: {str(e)}")
+        finally:
+            db.close()
+
+
+# Singleton runner instance
+_job_runner: Optional[JobRunner] = None
+
+
+def get_job_runner() -> JobRunner:
+    """Get or create the global job runner."""
+    global _job_runner
+    if _job_runner is None:
+        _job_runner = JobRunner()
+    return _job_runner
@@ -0,0 +1,325 @@
+"""
+Mock-draft simulation for draft prep.
+
+Runs thousands of snake drafts under a draft board's league settings and reports how
+likely each player is to still be available at each pick.
+
+The pick model: every team in every simulated draft has its own view of the board,
+the player's ADP plus normal noise that grows with ADP (late picks are less
+predictable). On the clock, a team takes the best-ranked available player at a
+position it has not filled up to its limit. ADP comes from the caller where given;
+other players are ranked by value over replacement under the board's scoring rules.
+
+Simulations run as arrays: a chunk of drafts advances one pick at a time, with every
+draft's choice made by one argmin over a (drafts x players) matrix. Chunks run in a
+process pool across cores. Each chunk's RNG comes from one SeedSequence in chunk
+order, so a seed reproduces the same result whatever the number of workers.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Mapping, Optional, Sequence
+import asyncio
+import logging
+import multiprocessing
+import os
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from backend.database.models import DraftBoard
+from backend.services.draft_value_service import (
+    POSITIONS,
+    DraftValueEngine,
+    replacement_depths,
+)
+from backend.services.scoring_service import ScoringService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMULATIONS = 1000
+MAX_SIMULATIONS = 20000
+
+# Drafts per chunk; chunk boundaries fix the RNG streams, so this must not depend on
+# the worker count
+SIMULATIONS_PER_CHUNK = 250
+
+# Worker processes for the simulation pool
+MOCK_DRAFT_WORKERS = max(1, min(os.cpu_count() or 1, 8))
+
+# Standard deviation of a team's view of a player, as a fraction of ADP (with a floor)
+ADP_SPREAD = 0.2
+MIN_ADP_SPREAD = 1.5
+
+# Players beyond this many past the last pick are left out of the pool
+POOL_MARGIN = 60
+
+# Most players of each position one team drafts unless settings["position_limits"] says otherwise
+DEFAULT_POSITION_LIMITS = {"QB": 3, "RB": 8, "WR": 8, "TE": 3}
+
+
+def snake_team(pick: int, teams: int) -> int:
+    """Team (0-based) on the clock at a 0-based overall pick of a snake draft."""
+    draft_round, slot = divmod(pick, teams)
+    return slot if draft_round % 2 == 0 else teams - 1 - slot
+
+
+def simulate_drafts(
+    adp: np.ndarray,
+    positions: np.ndarray,
+    limits: np.ndarray,
+    teams: int,
+    rounds: int,
+    simulations: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """
+    Simulate a chunk of snake drafts.
+
+    Args:
+        adp: ADP per player, shape (players,)
+        positions: Position index per player, shape (players,)
+        limits: Most players of each position index one team drafts
+        teams: Teams in the draft
+        rounds: Picks per team
+        simulations: Drafts to simulate
+        seed: RNG seed sequence for this chunk
+
+    Returns:
+        Counts of the 0-based pick each player was taken at, shape
+        (players, teams * rounds + 1); the last column counts drafts they went undrafted
+    """
+    rng = np.random.default_rng(seed)
+    count = len(adp)
+    total = teams * rounds
+
+    spread = np.maximum(adp * ADP_SPREAD, MIN_ADP_SPREAD)
+    perceived = adp + rng.standard_normal((simulations, teams, count)) * spread
+
+    available = np.ones((simulations, count), dtype=bool)
+    taken = np.full((simulations, count), total)
+    filled = np.zeros((simulations, teams, len(limits)), dtype=np.int64)
+    drafts = np.arange(simulations)
+
+    for pick in range(total):
+        team = snake_team(pick, teams)
+        full = filled[:, team, :] >= limits
+        eligible = available & ~full[:, positions]
+        scores = np.where(eligible, perceived[:, team, :], np.inf)
+        choice = scores.argmin(axis=1)
+
+        # A team with every position full passes
+        picked = np.isfinite(scores[drafts, choice])
+        rows, chosen = drafts[picked], choice[picked]
+        available[rows, chosen] = False
+        taken[rows, chosen] = pick
+        filled[rows, team, positions[chosen]] += 1
+
+    cells = np.arange(count)[None, :] * (total + 1) + taken
+    return np.bincount(cells.ravel(), minlength=count * (total + 1)).reshape(count, total + 1)
+
+
+class MockDraftResult:
+    """Pick distributions from a batch of simulated drafts."""
+
+    def __init__(
+        self,
+        players: pd.DataFrame,
+        counts: np.ndarray,
+        teams: int,
+        rounds: int,
+        simulations: int,
+        seed: int,
+    ):
+        """
+        Args:
+            players: Pool rows (player_id, name, team, position, points, vorp, adp), in
+                counts order
+            counts: Drafts each player was taken at each 0-based pick, last column undrafted
+            teams: Teams in the draft
+            rounds: Picks per team
+            simulations: Drafts simulated
+            seed: Seed the drafts were simulated with
+        """
+        self.players = players
+        self.counts = counts
+        self.teams = teams
+        self.rounds = rounds
+        self.simulations = simulations
+        self.seed = seed
+
+    @property
+    def total_picks(self) -> int:
+        return self.teams * self.rounds
+
+    def slot_picks(self, draft_slot: int) -> List[int]:
+        """1-based overall picks of a 1-based draft slot."""
+        return [
+            pick + 1
+            for pick in range(self.total_picks)
+            if snake_team(pick, self.teams) == draft_slot - 1
+        ]
+
+    def availability(self, picks: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Probability each player is still available when a pick comes up.
+
+        Args:
+            picks: 1-based overall picks (default: every pick)
+
+        Returns:
+            Array of shape (players, picks)
+        """
+        # Taken at this pick or later (or never) means available at it
+        remaining = np.cumsum(self.counts[:, ::-1], axis=1)[:, ::-1] / self.simulations
+        columns = np.arange(self.total_picks) if picks is None else np.asarray(picks) - 1
+        return remaining[:, columns]
+
+    def summary(self) -> pd.DataFrame:
+        """Pool rows with the probability of being drafted and the mean pick when drafted."""
+        drafted = self.counts[:, :-1].sum(axis=1)
+        pick_sum = self.counts[:, :-1] @ np.arange(1, self.total_picks + 1)
+        summary = self.players.copy()
+        summary["drafted_probability"] = drafted / self.simulations
+        summary["mean_pick"] = np.where(drafted > 0, pick_sum / np.maximum(drafted, 1), np.nan)
+        return summary
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_mock_draft_pool() -> ProcessPoolExecutor:
+    """Get or create the simulation process pool."""
+    global _pool
+    if _pool is None:
+        # Spawned workers do not inherit the server's threads and locks
+        _pool = ProcessPoolExecutor(
+            max_workers=MOCK_DRAFT_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+def shutdown_mock_draft_pool() -> None:
+    """Stop the simulation pool's worker processes."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+class MockDraftService:
+    """Simulates drafts under a draft board's league settings."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def simulate(
+        self,
+        draft_board_id: str,
+        simulations: int = DEFAULT_SIMULATIONS,
+        seed: Optional[int] = None,
+        rounds: Optional[int] = None,
+        adp: Optional[Mapping[str, float]] = None,
+        workers: Optional[int] = None,
+    ) -> Optional[MockDraftResult]:
+        """
+        Simulate drafts for a draft board.
+
+        Args:
+            draft_board_id: Draft board whose teams, roster spots, scoring and
+                position limits are used
+            simulations: Drafts to simulate
+            seed: RNG seed; the same seed reproduces the same result
+            rounds: Picks per team (defaults to the board's roster spots)
+            adp: Optional player_id -> ADP; other players are ranked by value over
+                replacement
+            workers: Worker processes (default: the shared pool; 1 runs in a thread)
+
+        Returns:
+            MockDraftResult, or None if the board is missing
+        """
+        if not 1 <= simulations <= MAX_SIMULATIONS:
+            raise ValueError(f"simulations must be between 1 and {MAX_SIMULATIONS}")
+
+        board = self.db.get(DraftBoard, draft_board_id)
+        if not board:
+            return None
+
+        teams = board.number_of_teams
+        rounds = rounds or board.roster_spots
+        if teams < 1 or rounds < 1:
+            raise ValueError("Draft board needs at least one team and one round")
+
+        players = await self._player_pool(board, teams * rounds, adp or {})
+        settings = board.settings or {}
+        limits = {**DEFAULT_POSITION_LIMITS, **(settings.get("position_limits") or {})}
+        position_index = {pos: i for i, pos in enumerate(POSITIONS)}
+
+        # Unseeded runs still report a seed that reproduces them
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        sizes = [SIMULATIONS_PER_CHUNK] * (simulations // SIMULATIONS_PER_CHUNK)
+        if simulations % SIMULATIONS_PER_CHUNK:
+            sizes.append(simulations % SIMULATIONS_PER_CHUNK)
+        streams = np.random.SeedSequence(seed).spawn(len(sizes))
+        args = (
+            players["adp"].to_numpy(dtype=float),
+            players["position"].map(position_index).to_numpy(dtype=np.int64),
+            np.array([limits[pos] for pos in POSITIONS], dtype=np.int64),
+            teams,
+            rounds,
+        )
+
+        # workers=1 runs on the default thread pool, without process startup costs
+        own_pool = None
+        if workers is None:
+            executor: Optional[Executor] = get_mock_draft_pool()
+        elif workers == 1:
+            executor = None
+        else:
+            executor = own_pool = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+        loop = asyncio.get_running_loop()
+        try:
+            chunks = await asyncio.gather(
+                *[
+                    loop.run_in_executor(executor, simulate_drafts, *args, size, stream)
+                    for size, stream in zip(sizes, streams)
+                ]
+            )
+        finally:
+            if own_pool is not None:
+                own_pool.shutdown(wait=False)
+        counts = np.sum(chunks, axis=0)
+
+        logger.info(
+            f"Simulated {simulations} drafts for board {draft_board_id} "
+            f"({teams} teams, {rounds} rounds, {len(players)} players)"
+        )
+        return MockDraftResult(players, counts, teams, rounds, simulations, seed)
+
+    async def _player_pool(
+        self, board: DraftBoard, total_picks: int, adp: Mapping[str, float]
+    ) -> pd.DataFrame:
+        """Projected players ordered by ADP, trimmed to the picks that will be made."""
+        frame = await ScoringService(self.db).score_draft_board(board.draft_board_id)
+        depths = replacement_depths(board.number_of_teams, board.roster_spots, board.settings)
+
+        # Players without an ADP take their value-over-replacement rank
+        ranked = DraftValueEngine(frame, set(), depths).ranked(limit=len(frame))
+        players = pd.DataFrame(
+            ranked, columns=["player_id", "name", "team", "position", "points", "vorp", "rank"]
+        )
+        players["adp"] = [
+            float(adp.get(player_id, rank))
+            for player_id, rank in zip(players["player_id"], players["rank"])
+        ]
+        players = players.sort_values(["adp", "rank"], kind="mergesort")
+        return (
+            players.head(total_picks + POOL_MARGIN)[
+                ["player_id", "name", "team", "position", "points", "vorp", "adp"]
+            ]
+            .reset_index(drop=True)
+        )
@@ -1,7 +1,7 @@
-from typing import Dict, List, Optional, Any, Tuple, TypedDict, cast
+from typing import Callable, Dict, List, Optional, Any, Tuple, TypedDict, cast
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_
+from sqlalchemy import and_, func, insert
 import asyncio
 import pandas as pd
 import numpy as np
@@ -10,7 +10,14 @@ import uuid
 from datetime import datetime
 import uuid
 
-from backend.database.models import Player, BaseStat, TeamStat, GameStats, ImportLog
+from backend.database.models import (
+    GAME_STAT_COLUMNS,
+    BaseStat,
+    GameStats,
+    ImportLog,
+    Player,
+    TeamStat,
+)
 from backend.services.adapters.nfl_data_py_adapter import NFLDataPyAdapter
 from backend.services.adapters.nfl_api_adapter import NFLApiAdapter
 from backend.services.typing import (
@@ -21,10 +28,95 @@ from backend.services.typing import (
     safe_dict_get, 
     safe_calculate
 )
-from backend.services.active_player_service import ActivePlayerService
+from backend.services.active_player_service import ActivePlayerService
+from backend.services.season_stats_service import SeasonStatsService
+from backend.services.cache_invalidation import invalidate_on_commit
+from backend.services.cache_service import STATS_TAG, player_tag
+from backend.services.import_watermark import (
+    WEEKLY_STATS_DATASET,
+    get_watermark,
+    watermark_log,
+)
+from backend.services.stat_variance_service import StatVarianceService
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany batch when bulk inserting weekly stats
+WEEKLY_STATS_BATCH_SIZE = 5000
+
+# Game context for weeks missing from the schedule
+DEFAULT_GAME_CONTEXT = {
+    "opponent": "UNK",
+    "location": "home",
+    "result": "U",
+    "team_score": 0,
+    "opponent_score": 0,
+}
+
+# Stats kept in season totals per position (other positions are scored as receivers)
+SEASON_TOTAL_STATS = {
+    "QB": [
+        "pass_attempts",
+        "completions",
+        "pass_yards",
+        "pass_td",
+        "interceptions",
+        "rush_attempts",
+        "rush_yards",
+        "rush_td",
+    ],
+    "RB": [
+        "rush_attempts",
+        "rush_yards",
+        "rush_td",
+        "targets",
+        "receptions",
+        "rec_yards",
+        "rec_td",
+    ],
+    "WR": [
+        "targets",
+        "receptions",
+        "rec_yards",
+        "rec_td",
+        "rush_attempts",
+        "rush_yards",
+        "rush_td",
+    ],
+}
+RECEIVER_TOTAL_STATS = ["targets", "receptions", "rec_yards", "rec_td"]
+
+# Efficiency metrics per position: metric -> (numerator, denominator, scale)
+SEASON_TOTAL_METRICS = {
+    "QB": {
+        "comp_pct": ("completions", "pass_attempts", 100),
+        "yards_per_att": ("pass_yards", "pass_attempts", 1),
+        "pass_td_rate": ("pass_td", "pass_attempts", 100),
+        "int_rate": ("interceptions", "pass_attempts", 100),
+    },
+    "RB": {
+        "yards_per_carry": ("rush_yards", "rush_attempts", 1),
+        "catch_rate": ("receptions", "targets", 100),
+    },
+}
+RECEIVER_TOTAL_METRICS = {
+    "catch_rate": ("receptions", "targets", 100),
+    "yards_per_target": ("rec_yards", "targets", 1),
+    "yards_per_reception": ("rec_yards", "receptions", 1),
+}
+
+# Half-PPR points per unit, as used for imported season totals
+HALF_PPR_POINTS = {
+    "pass_yards": 0.04,
+    "pass_td": 4,
+    "interceptions": -1,
+    "rush_yards": 0.1,
+    "rush_td": 6,
+    "rec_yards": 0.1,
+    "rec_td": 6,
+    "receptions": 0.5,
+}
+
 
 # Service-specific TypedDict definitions
 class ImportMetricsDict(TypedDict, total=False):
@@ -83,6 +175,15 @@ class NFLDataImportService:
         self.logger = logger or logging.getLogger(__name__)
         self.nfl_data_adapter = NFLDataPyAdapter()
         self.nfl_api_adapter = NFLApiAdapter()
+        self.season_stats = SeasonStatsService(db)
+        self.stat_variance = StatVarianceService(db)
+
+        # Downloads started ahead of their stage by import_seasons, keyed by
+        # (adapter method, season)
+        self._prefetched: Dict[Tuple[str, int], asyncio.Future] = {}
+
+        # Optional progress callback (fraction complete, message), e.g. a job's report
+        self.progress: Optional[Callable[[float, str], None]] = None
 
         # Metrics tracking
         self.metrics: ImportMetricsDict = {
@@ -174,12 +275,14 @@ class NFLDataImportService:
             "metrics": self.metrics
         })
 
-    async def import_season(self, season: int) -> ImportResultDict:
+    async def import_season(self, season: int, incremental: bool = False) -> ImportResultDict:
         """
         Import complete season data from all sources.
 
         Args:
             season: NFL season year (e.g., 2023)
+            incremental: Only import weeks after the season's watermark and recalculate
+                totals for the players in them (see _import_new_weeks)
 
         Returns:
             Dictionary containing import results
@@ -190,49 +293,19 @@ class NFLDataImportService:
             # Log the start of import
             self._log_import("season_import_start", "info", f"Starting import for season {season}")
 
-            # Step 1: Import player data
-            self.logger.info(f"Step 1: Importing player data for season {season}")
-            player_results = await self.import_players(season)
-
-            # Step 2: Import weekly stats
-            self.logger.info(f"Step 2: Importing weekly stats for season {season}")
-            weekly_results = await self.import_weekly_stats(season)
-
-            # Step 3: Import team stats
-            self.logger.info(f"Step 3: Importing team stats for season {season}")
-            team_results = await self.import_team_stats(season)
-
-            # Step 4: Calculate season totals
-            self.logger.info(f"Step 4: Calculating season totals for season {season}")
-            totals_results = await self.calculate_season_totals(season)
-
-            # Step 5: Validate and fix data
-            self.logger.info(f"Step 5: Validating data for season {season}")
-            validation_results = await self.validate_data(season)
+            if incremental:
+                results = await self._import_new_weeks(season)
+            else:
+                results = await self._import_season_stages(season)
 
             # Log successful completion
             self._log_import(
                 "season_import_complete",
                 "success",
                 f"Completed import for season {season}",
-                {
-                    "player_results": player_results,
-                    "weekly_results": weekly_results,
-                    "team_results": team_results,
-                    "totals_results": totals_results,
-                    "validation_results": validation_results,
-                },
+                results,
             )
 
-            # Return combined results
-            results: Dict[str, Any] = {
-                "players": player_results,
-                "weekly_stats": weekly_results,
-                "team_stats": team_results,
-                "season_totals": totals_results,
-                "validation": validation_results,
-            }
-
             # Get monitoring results and merge with results
             monitoring_results = self.end_monitoring()
             return cast(ImportResultDict, {**results, **monitoring_results})
@@ -251,6 +324,185 @@ class NFLDataImportService:
             # Close API adapter session
             await self.nfl_api_adapter.close()
 
+    async def import_seasons(self, seasons: List[int]) -> Dict[str, Any]:
+        """
+        Import several seasons, overlapping downloads with processing.
+
+        Every season's datasets start downloading up front on the adapter's thread
+        pool. The database-writing stages still run one season at a time, each
+        awaiting only the downloads it needs, so later seasons keep downloading
+        while earlier ones are written.
+
+        Args:
+            seasons: NFL season years (e.g., [2021, 2022, 2023])
+
+        Returns:
+            Dictionary with results per season under "seasons", plus monitoring metrics
+        """
+        self.start_monitoring()
+
+        try:
+            self._log_import(
+                "season_import_start", "info", f"Starting import for seasons {seasons}"
+            )
+            self._prefetch(seasons)
+
+            season_results: Dict[int, Any] = {}
+            for season in seasons:
+                self.logger.info(f"Importing season {season}")
+                season_results[season] = await self._import_season_stages(season)
+                self._log_import(
+                    "season_import_complete",
+                    "success",
+                    f"Completed import for season {season}",
+                    season_results[season],
+                )
+
+            monitoring_results = self.end_monitoring()
+            return {"seasons": season_results, **monitoring_results}
+
+        except Exception as e:
+            self.metrics["errors"] += 1
+            self.logger.error(f"Error importing seasons {seasons}: {str(e)}")
+            self._log_import(
+                "season_import_error", "error", f"Error importing seasons {seasons}: {str(e)}"
+            )
+            raise
+        finally:
+            # Drop downloads a failed import never reached
+            for future in self._prefetched.values():
+                if not future.cancel():
+                    future.exception()  # retrieved so a failed download isn't reported again
+            self._prefetched.clear()
+            await self.nfl_api_adapter.close()
+
+    async def _import_season_stages(self, season: int) -> Dict[str, Any]:
+        """
+        Run the import stages for one season in order.
+
+        Args:
+            season: NFL season year (e.g., 2023)
+
+        Returns:
+            Dictionary with each stage's results
+        """
+        # Step 1: Import player data
+        self._step(0, 5, f"Step 1: Importing player data for season {season}")
+        player_results = await self.import_players(season)
+
+        # Step 2: Import weekly stats
+        self._step(1, 5, f"Step 2: Importing weekly stats for season {season}")
+        weekly_results = await self.import_weekly_stats(season)
+
+        # Step 3: Import team stats
+        self._step(2, 5, f"Step 3: Importing team stats for season {season}")
+        team_results = await self.import_team_stats(season)
+
+        # Step 4: Calculate season totals
+        self._step(3, 5, f"Step 4: Calculating season totals for season {season}")
+        totals_results = await self.calculate_season_totals(season)
+
+        # Step 5: Validate and fix data
+        self._step(4, 5, f"Step 5: Validating data for season {season}")
+        validation_results = await self.validate_data(season)
+
+        return {
+            "players": player_results,
+            "weekly_stats": weekly_results,
+            "team_stats": team_results,
+            "season_totals": totals_results,
+            "validation": validation_results,
+        }
+
+    async def _import_new_weeks(self, season: int) -> Dict[str, Any]:
+        """
+        Import the weeks after the season's watermark and update totals for their players.
+
+        Player, team stat and validation stages are left to full imports.
+
+        Args:
+            season: NFL season year (e.g., 2023)
+
+        Returns:
+            Dictionary with the weekly import and season totals results
+        """
+        self._step(0, 2, f"Importing new weeks for season {season}")
+        weekly_results = await self.import_weekly_stats(season, incremental=True)
+
+        weeks = weekly_results["weeks"]
+        if not weeks:
+            self.logger.info(f"No new weeks for season {season}")
+            totals_results = {"totals_created": 0, "players_processed": 0}
+        else:
+            player_ids = [
+                player_id
+                for (player_id,) in self.db.query(GameStats.player_id)
+                .filter(GameStats.season == season, GameStats.week.in_(weeks))
+                .distinct()
+            ]
+            self._step(1, 2, f"Updating season totals for {len(player_ids)} players")
+            totals_results = await self.calculate_season_totals(season, player_ids=player_ids)
+
+        return {"weekly_stats": weekly_results, "season_totals": totals_results}
+
+    def _step(self, done: int, total: int, message: str) -> None:
+        """Log a stage and report it to the progress callback, if any."""
+        self.logger.info(message)
+        if self.progress is not None:
+            self.progress(done / total, message)
+
+    def get_watermark(self, dataset: str, season: int) -> Optional[int]:
+        """
+        Last imported position (e.g., week) recorded for a dataset and season.
+
+        Args:
+            dataset: Dataset name (e.g., "weekly_stats")
+            season: NFL season year
+
+        Returns:
+            The watermark, or None if nothing was recorded
+        """
+        return get_watermark(self.db, dataset, season)
+
+    def _set_watermark(self, dataset: str, season: int, watermark: int) -> None:
+        """Record a watermark as part of the current transaction."""
+        self.db.add(watermark_log(dataset, season, watermark))
+
+    def _prefetch(self, seasons: List[int]) -> None:
+        """
+        Start every download the season stages need.
+
+        The player list is the same for every season, so it is downloaded once.
+
+        Args:
+            seasons: NFL season years
+        """
+        if not seasons:
+            return
+        players = asyncio.ensure_future(self.nfl_data_adapter.get_players(seasons[-1]))
+        for season in seasons:
+            self._prefetched[("get_players", season)] = players
+            for method in ("get_weekly_stats", "get_schedules", "get_team_stats"):
+                self._prefetched[(method, season)] = asyncio.ensure_future(
+                    getattr(self.nfl_data_adapter, method)(season)
+                )
+
+    async def _fetch(self, method: str, season: int) -> Any:
+        """
+        Result of an adapter download, using one started by _prefetch if there is one.
+
+        Args:
+            method: NFLDataPyAdapter method name (e.g., "get_weekly_stats")
+            season: NFL season year
+
+        Returns:
+            The adapter method's result
+        """
+        future = self._prefetched.pop((method, season), None)
+        if future is not None:
+            return await future
+        return await getattr(self.nfl_data_adapter, method)(season)
+
     async def import_players(self, season: int, limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Import player data for the specified season.
@@ -265,7 +517,7 @@ class NFLDataImportService:
         try:
             # Get player data from nfl-data-py
             self.logger.info(f"Importing players for season {season}")
-            player_data = await self.nfl_data_adapter.get_players(season)
+            player_data = await self._fetch("get_players", season)
             self.metrics["requests_made"] += 1
 
             # Apply limit if specified (for testing with small batches)
@@ -281,19 +533,19 @@ class NFLDataImportService:
                 self.logger.info(
                     f"Additional filtering: removed {original_count - len(player_data)} non-fantasy players"
                 )
-            # Filter to only active players based on CSV roster
-            try:
-                active_service = ActivePlayerService()
-                pre_active_count = len(player_data)
-                # The adapter DataFrame may use 'display_name' and 'team_abbr'
-                player_data = active_service.filter_active(player_data)
-                removed = pre_active_count - len(player_data)
-                if removed > 0:
-                    self.logger.info(
-                        f"Filtering inactive players: removed {removed} players not on active roster"
-                    )
-            except Exception as e:
-                self.logger.warning(f"Active player filtering failed: {e}")
+            # Filter to only active players based on CSV roster
+            try:
+                active_service = ActivePlayerService()
+                pre_active_count = len(player_data)
+                # The adapter DataFrame may use 'display_name' and 'team_abbr'
+                player_data = active_service.filter_active(player_data)
+                removed = pre_active_count - len(player_data)
+                if removed > 0:
+                    self.logger.info(
+                        f"Filtering inactive players: removed {removed} players not on active roster"
+                    )
+            except Exception as e:
+                self.logger.warning(f"Active player filtering failed: {e}")
 
             # Process and transform data
             players_added = 0
@@ -415,25 +667,36 @@ class NFLDataImportService:
             raise Exception(f"Error importing player data: {str(e)}")
 
     async def import_weekly_stats(
-        self, season: int, player_limit: Optional[int] = None
+        self,
+        season: int,
+        player_limit: Optional[int] = None,
+        replace: bool = False,
+        incremental: bool = False,
     ) -> Dict[str, Any]:
         """
         Import weekly statistics for the specified season.
 
+        Existing (player_id, season, week) keys are prefetched once, stats are mapped
+        column-wise per position and new rows are inserted in batches.
+
         Args:
             season: NFL season year (e.g., 2023)
             player_limit: Optional limit on number of players to process (for testing)
+            replace: Delete the season's existing rows for the imported players and
+                re-insert them, instead of skipping weeks that are already imported
+            incremental: Only import weeks after the season's "weekly_stats" watermark
 
         Returns:
-            Dictionary containing import results
+            Dictionary containing import results; "weeks" lists the weeks processed.
+            Unless player_limit is set, the watermark moves to the newest week.
         """
         try:
             self.logger.info(f"Importing weekly stats for season {season}")
-            weekly_data = await self.nfl_data_adapter.get_weekly_stats(season)
+            weekly_data = await self._fetch("get_weekly_stats", season)
             self.metrics["requests_made"] += 1
 
             # Get game schedules for additional context
-            schedules = await self.nfl_data_adapter.get_schedules(season)
+            schedules = await self._fetch("get_schedules", season)
             self.metrics["requests_made"] += 1
 
             # Create a lookup for game information
@@ -460,13 +723,11 @@ class NFLDataImportService:
                         "opponent_score": game.get("home_score", 0),
                     }
 
-            # Process and transform data
-            stats_added = 0
-            errors = 0
-
             # Always filter for fantasy-relevant players
             fantasy_positions = ["QB", "RB", "WR", "TE"]
-            query = self.db.query(Player).filter(Player.position.in_(fantasy_positions))
+            query = self.db.query(Player.player_id, Player.position, Player.team).filter(
+                Player.position.in_(fantasy_positions)
+            )
 
             # If player_limit is specified, add the limit
             if player_limit:
@@ -480,106 +741,57 @@ class NFLDataImportService:
                 )
 
             # Execute query to get players
-            players = query.all()
-            player_ids = [p.player_id for p in players]
-            self.logger.info(f"Selected {len(player_ids)} players for import")
+            players = pd.DataFrame(
+                query.all(), columns=["player_id", "position", "team"]
+            ).set_index("player_id")
+            self.logger.info(f"Selected {len(players)} players for import")
 
             # Filter weekly_data to only include these players
             original_count = len(weekly_data)
-            weekly_data = weekly_data[weekly_data["player_id"].isin(player_ids)]
+            weekly_data = weekly_data[weekly_data["player_id"].isin(players.index)]
             self.logger.info(
                 f"Filtered weekly stats from {original_count} to {len(weekly_data)} entries for fantasy-relevant players"
             )
 
-            for _, row in weekly_data.iterrows():
-                # Skip rows with missing player_id
-                if pd.isna(row.get("player_id")):
-                    continue
-
-                # Check if player exists
-                player = self.db.query(Player).filter(Player.player_id == row["player_id"]).first()
-
-                if not player:
-                    continue  # Skip if player not in database
-
-                # Extract week and team
-                week = int(row["week"]) if not pd.isna(row.get("week")) else 0
-                team = (
-                    row.get("recent_team") if not pd.isna(row.get("recent_team")) else player.team
-                )
-
-                # Check if weekly stat already exists
-                existing_stat = (
-                    self.db.query(GameStats)
-                    .filter(
-                        GameStats.player_id == row["player_id"],
-                        GameStats.season == season,
-                        GameStats.week == week,
-                    )
-                    .first()
-                )
-
-                if existing_stat:
-                    continue  # Skip if already imported
-
-                # Get game context data
-                game_key = f"{team}_{week}"
-                game_context = game_info.get(
-                    game_key,
-                    {
-                        "opponent": "UNK",
-                        "location": "home",
-                        "result": "U",
-                        "team_score": 0,
-                        "opponent_score": 0,
-                    },
+            watermark = self.get_watermark(WEEKLY_STATS_DATASET, season) if incremental else None
+            if watermark is not None:
+                weekly_data = weekly_data[weekly_data["week"] > watermark]
+                self.logger.info(
+                    f"Incremental import: {len(weekly_data)} entries after week {watermark}"
                 )
+            player_ids = weekly_data["player_id"].unique().tolist()
+            weeks = sorted(int(week) for week in weekly_data["week"].dropna().unique())
 
-                # Use position-specific stat mappings
-                position = player.position
-                stats = {}
+            if replace and player_ids:
+                self.db.query(GameStats).filter(
+                    GameStats.season == season, GameStats.player_id.in_(player_ids)
+                ).delete(synchronize_session=False)
 
-                # Import all available stat columns for this position
-                for our_name, nfl_name in self.stat_mappings.get(position, {}).items():
-                    if nfl_name in row and not pd.isna(row[nfl_name]):
-                        stats[our_name] = float(row[nfl_name])
-
-                # Create new game stat
-                try:
-                    game_stat = GameStats(
-                        game_stat_id=str(uuid.uuid4()),
-                        player_id=row["player_id"],
-                        season=season,
-                        week=week,
-                        opponent=game_context["opponent"],
-                        game_location=game_context["location"],
-                        result=game_context["result"],
-                        team_score=game_context["team_score"],
-                        opponent_score=game_context["opponent_score"],
-                        stats=stats,
-                    )
-
-                    self.db.add(game_stat)
-                    stats_added += 1
-                    self.metrics["game_stats_processed"] += 1
+            # Prefetch the weeks already imported instead of checking row by row
+            existing_query = self.db.query(GameStats.player_id, GameStats.week).filter(
+                GameStats.season == season
+            )
+            if watermark is not None:
+                existing_query = existing_query.filter(GameStats.week > watermark)
+            existing = {(player_id, week) for player_id, week in existing_query}
 
-                    # Commit in batches to avoid memory issues
-                    if stats_added % 100 == 0:
-                        self.db.commit()
+            rows = self._weekly_stat_rows(season, weekly_data, players, game_info, existing)
+            for start in range(0, len(rows), WEEKLY_STATS_BATCH_SIZE):
+                self.db.execute(insert(GameStats), rows[start : start + WEEKLY_STATS_BATCH_SIZE])
 
-                except Exception as e:
-                    self.logger.error(
-                        f"Error processing game stat for {player.name} week {week}: {str(e)}"
-                    )
-                    import traceback
+            # Bulk writes bypass the unit of work, so their cache tags are registered here
+            invalidate_on_commit(
+                self.db, [player_tag(player_id) for player_id in player_ids] + [STATS_TAG]
+            )
+            stats_added = len(rows)
+            self.metrics["game_stats_processed"] += stats_added
 
-                    self.logger.debug(f"Stack trace: {traceback.format_exc()}")
-                    errors += 1
+            if weeks and not player_limit:
+                self._set_watermark(WEEKLY_STATS_DATASET, season, max(weeks[-1], watermark or 0))
 
-            # Final commit
             self.db.commit()
 
-            results = {"weekly_stats_added": stats_added, "errors": errors}
+            results = {"weekly_stats_added": stats_added, "errors": 0, "weeks": weeks}
 
             # Log success
             self._log_import(
@@ -603,6 +815,91 @@ class NFLDataImportService:
             )
             raise Exception(f"Error importing weekly stats: {str(e)}")
 
+    def _weekly_stat_rows(
+        self,
+        season: int,
+        weekly_data: pd.DataFrame,
+        players: pd.DataFrame,
+        game_info: Dict[str, Dict[str, Any]],
+        existing: set,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build GameStats insert rows from weekly data, column-wise.
+
+        Args:
+            season: NFL season year
+            weekly_data: nfl_data_py weekly rows for known players
+            players: Frame indexed by player_id with position and team
+            game_info: Game context keyed by "<team>_<week>"
+            existing: (player_id, week) keys already imported for the season
+
+        Returns:
+            List of column dicts for new rows; the first row wins for duplicate weeks
+        """
+        frame = weekly_data.dropna(subset=["player_id"]).reset_index(drop=True)
+        week = frame["week"].fillna(0).astype(int) if "week" in frame else 0
+        frame = frame.assign(week=week).drop_duplicates(["player_id", "week"])
+        frame = frame[
+            [key not in existing for key in zip(frame["player_id"], frame["week"])]
+        ]
+        if frame.empty:
+            return []
+
+        # Team falls back to the player's roster team, then keys the game context
+        position = frame["player_id"].map(players["position"])
+        team = frame["player_id"].map(players["team"])
+        if "recent_team" in frame:
+            team = frame["recent_team"].fillna(team)
+        context = pd.DataFrame.from_dict(
+            game_info, orient="index", columns=list(DEFAULT_GAME_CONTEXT)
+        )
+        context = context.reindex(team.astype(str) + "_" + frame["week"].astype(str))
+        context = context.fillna(DEFAULT_GAME_CONTEXT).set_axis(frame.index)
+
+        stats = pd.Series([{}] * len(frame), index=frame.index, dtype=object)
+        for pos, index in frame.groupby(position).groups.items():
+            mapping = {
+                nfl_name: our_name
+                for our_name, nfl_name in self.stat_mappings.get(pos, {}).items()
+                if nfl_name in frame
+            }
+            values = frame.loc[index, list(mapping)].rename(columns=mapping).astype(float)
+            stats.loc[index] = pd.Series(
+                [
+                    {name: value for name, value in record.items() if not pd.isna(value)}
+                    for record in values.to_dict("records")
+                ],
+                index=index,
+                dtype=object,
+            )
+
+        created_at = datetime.utcnow()
+        return [
+            {
+                "game_stat_id": str(uuid.uuid4()),
+                "player_id": player_id,
+                "season": season,
+                "week": week,
+                "opponent": opponent,
+                "game_location": location,
+                "result": result,
+                "team_score": int(team_score),
+                "opponent_score": int(opponent_score),
+                "stats": stat_dict,
+                "created_at": created_at,
+            }
+            for player_id, week, opponent, location, result, team_score, opponent_score, stat_dict in zip(
+                frame["player_id"],
+                frame["week"].tolist(),
+                context["opponent"],
+                context["location"],
+                context["result"],
+                context["team_score"],
+                context["opponent_score"],
+                stats,
+            )
+        ]
+
     async def import_team_stats(self, season: int) -> Dict[str, Any]:
         """
         Import team statistics for the specified season.
@@ -615,7 +912,7 @@ class NFLDataImportService:
         """
         try:
             self.logger.info(f"Importing team stats for season {season}")
-            team_data = await self.nfl_data_adapter.get_team_stats(season)
+            team_data = await self._fetch("get_team_stats", season)
             self.metrics["requests_made"] += 1
 
             teams_processed = 0
@@ -686,12 +983,19 @@ class NFLDataImportService:
             self._log_import("team_stats_import", "error", f"Error importing team stats: {str(e)}")
             raise Exception(f"Error importing team stats: {str(e)}")
 
-    async def calculate_season_totals(self, season: int) -> Dict[str, Any]:
+    async def calculate_season_totals(
+        self, season: int, player_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Calculate season totals from weekly data.
 
+        The season is aggregated in one pass: game counts and stat sums come from a
+        single grouped query, position totals, efficiency metrics and half-PPR points
+        are computed column-wise, and the results are bulk upserted.
+
         Args:
             season: NFL season year (e.g., 2023)
+            player_ids: Only recalculate these players (default: everyone with game stats)
 
         Returns:
             Dictionary containing calculation results
@@ -699,164 +1003,24 @@ class NFLDataImportService:
         try:
             self.logger.info(f"Calculating season totals for {season}")
 
-            # Get all players with game stats for this season
-            players = (
-                self.db.query(Player)
-                .join(GameStats, Player.player_id == GameStats.player_id)
-                .filter(GameStats.season == season)
-                .distinct()
-                .all()
-            )
-
-            self.logger.info(f"Found {len(players)} players with game stats for season {season}")
-
-            totals_created = 0
-
-            for player in players:
-                # Get all game stats for this player and season
-                game_stats = (
-                    self.db.query(GameStats)
-                    .filter(GameStats.player_id == player.player_id, GameStats.season == season)
-                    .all()
-                )
-
-                if not game_stats:
-                    continue
-
-                # Count games and aggregate stats
-                games_played = len(game_stats)
-                position = player.position
-
-                # Initialize totals dictionary
-                totals = {}
-
-                # Aggregate stats based on position
-                if position == "QB":
-                    # Aggregate QB stats
-                    totals = {
-                        "pass_attempts": sum(g.stats.get("pass_attempts", 0) for g in game_stats),
-                        "completions": sum(g.stats.get("completions", 0) for g in game_stats),
-                        "pass_yards": sum(g.stats.get("pass_yards", 0) for g in game_stats),
-                        "pass_td": sum(g.stats.get("pass_td", 0) for g in game_stats),
-                        "interceptions": sum(g.stats.get("interceptions", 0) for g in game_stats),
-                        "rush_attempts": sum(g.stats.get("rush_attempts", 0) for g in game_stats),
-                        "rush_yards": sum(g.stats.get("rush_yards", 0) for g in game_stats),
-                        "rush_td": sum(g.stats.get("rush_td", 0) for g in game_stats),
-                    }
+            frame = self._season_totals_frame(season, player_ids)
+            self.logger.info(f"Found {len(frame)} players with game stats for season {season}")
 
-                    # Calculate efficiency metrics
-                    if "pass_attempts" in totals and totals["pass_attempts"] > 0:
-                        totals["comp_pct"] = round(
-                            totals["completions"] / totals["pass_attempts"] * 100, 1
-                        )
-                        totals["yards_per_att"] = round(
-                            totals["pass_yards"] / totals["pass_attempts"], 1
-                        )
-                        totals["pass_td_rate"] = round(
-                            totals["pass_td"] / totals["pass_attempts"] * 100, 1
-                        )
-                        totals["int_rate"] = round(
-                            totals["interceptions"] / totals["pass_attempts"] * 100, 1
-                        )
+            totals_by_player = self._season_totals_records(frame)
+            totals_created = self.season_stats.bulk_save_season_totals(season, totals_by_player)
 
-                elif position == "RB":
-                    # Aggregate RB stats
-                    totals = {
-                        "rush_attempts": sum(g.stats.get("rush_attempts", 0) for g in game_stats),
-                        "rush_yards": sum(g.stats.get("rush_yards", 0) for g in game_stats),
-                        "rush_td": sum(g.stats.get("rush_td", 0) for g in game_stats),
-                        "targets": sum(g.stats.get("targets", 0) for g in game_stats),
-                        "receptions": sum(g.stats.get("receptions", 0) for g in game_stats),
-                        "rec_yards": sum(g.stats.get("rec_yards", 0) for g in game_stats),
-                        "rec_td": sum(g.stats.get("rec_td", 0) for g in game_stats),
-                    }
-
-                    # Calculate efficiency metrics
-                    if "rush_attempts" in totals and totals["rush_attempts"] > 0:
-                        totals["yards_per_carry"] = round(
-                            totals["rush_yards"] / totals["rush_attempts"], 1
-                        )
-                    if "targets" in totals and totals["targets"] > 0:
-                        totals["catch_rate"] = round(
-                            totals["receptions"] / totals["targets"] * 100, 1
-                        )
-
-                else:  # WR and TE
-                    # Aggregate WR/TE stats
-                    totals = {
-                        "targets": sum(g.stats.get("targets", 0) for g in game_stats),
-                        "receptions": sum(g.stats.get("receptions", 0) for g in game_stats),
-                        "rec_yards": sum(g.stats.get("rec_yards", 0) for g in game_stats),
-                        "rec_td": sum(g.stats.get("rec_td", 0) for g in game_stats),
-                    }
-
-                    # Add rushing stats for WRs
-                    if position == "WR":
-                        totals.update(
-                            {
-                                "rush_attempts": sum(
-                                    g.stats.get("rush_attempts", 0) for g in game_stats
-                                ),
-                                "rush_yards": sum(g.stats.get("rush_yards", 0) for g in game_stats),
-                                "rush_td": sum(g.stats.get("rush_td", 0) for g in game_stats),
-                            }
-                        )
-
-                    # Calculate efficiency metrics
-                    if "targets" in totals and totals["targets"] > 0:
-                        totals["catch_rate"] = round(
-                            totals["receptions"] / totals["targets"] * 100, 1
-                        )
-                        totals["yards_per_target"] = round(
-                            totals["rec_yards"] / totals["targets"], 1
-                        )
-                    if "receptions" in totals and totals["receptions"] > 0:
-                        totals["yards_per_reception"] = round(
-                            totals["rec_yards"] / totals["receptions"], 1
-                        )
-
-                # Calculate half-PPR fantasy points
-                fantasy_points = self._calculate_fantasy_points(totals, position)
-
-                # Create or update BaseStat records
-                existing_stats = self._get_player_base_stats(player.player_id, season)
-
-                # Update base stats in database
-                # Check if existing_stats has elements
-                if existing_stats and len(existing_stats) > 0:
-                    # Update existing base stats
-                    for stat_name, value in totals.items():
-                        self._update_base_stat(existing_stats, stat_name, value)
-
-                    # Update games and half_ppr
-                    games_stat = next((s for s in existing_stats if s.stat_type == "games"), None)
-                    if games_stat:
-                        games_stat.value = games_played
-                    else:
-                        self._create_base_stat(player.player_id, season, "games", games_played)
-
-                    half_ppr_stat = next(
-                        (s for s in existing_stats if s.stat_type == "half_ppr"), None
-                    )
-                    if half_ppr_stat:
-                        half_ppr_stat.value = fantasy_points
-                    else:
-                        self._create_base_stat(player.player_id, season, "half_ppr", fantasy_points)
-                else:
-                    # Create new base stats for all values
-                    for stat_name, value in totals.items():
-                        self._create_base_stat(player.player_id, season, stat_name, value)
-
-                    # Add games and half_ppr
-                    self._create_base_stat(player.player_id, season, "games", games_played)
-                    self._create_base_stat(player.player_id, season, "half_ppr", fantasy_points)
-
-                    totals_created += 1
+            # Keep the stored week-to-week variance moments in step with the game logs;
+            # the whole season is refreshed so its rows are stamped current
+            variance_rows = self.stat_variance.refresh_season(season)
 
             # Commit changes
             self.db.commit()
 
-            results = {"totals_created": totals_created, "players_processed": len(players)}
+            results = {
+                "totals_created": totals_created,
+                "players_processed": len(frame),
+                "variance_rows": variance_rows,
+            }
 
             # Log success
             self._log_import(
@@ -877,6 +1041,76 @@ class NFLDataImportService:
             )
             raise Exception(f"Error calculating season totals: {str(e)}")
 
+    def _season_totals_frame(
+        self, season: int, player_ids: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Per-player game counts and stat sums for a season, grouped in SQL over the
+        GameStats stat columns.
+
+        Args:
+            season: NFL season year
+            player_ids: Optional players to restrict to
+
+        Returns:
+            Frame indexed by player_id with position, games and GAME_STAT_COLUMNS sums
+        """
+        query = (
+            self.db.query(
+                GameStats.player_id,
+                Player.position,
+                func.count(GameStats.game_stat_id).label("games"),
+                *[
+                    func.coalesce(func.sum(getattr(GameStats, stat)), 0).label(stat)
+                    for stat in GAME_STAT_COLUMNS
+                ],
+            )
+            .join(Player, Player.player_id == GameStats.player_id)
+            .filter(GameStats.season == season)
+            .group_by(GameStats.player_id, Player.position)
+        )
+        if player_ids is not None:
+            query = query.filter(GameStats.player_id.in_(player_ids))
+        rows = query.all()
+        columns = ["player_id", "position", "games"] + GAME_STAT_COLUMNS
+        return pd.DataFrame(rows, columns=columns).set_index("player_id")
+
+    def _season_totals_records(self, frame: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """
+        Position totals, efficiency metrics and half-PPR points for each player.
+
+        Args:
+            frame: Output of _season_totals_frame
+
+        Returns:
+            {player_id: {stat_type: value}}, with metrics left out where their
+            denominator is zero
+        """
+        records: Dict[str, Dict[str, float]] = {}
+        for position, group in frame.groupby("position", sort=False):
+            stats = SEASON_TOTAL_STATS.get(position, RECEIVER_TOTAL_STATS)
+            totals = group[stats].astype(float)
+
+            # half_ppr only counts the stats kept for the position
+            totals["half_ppr"] = sum(
+                totals[stat] * points for stat, points in HALF_PPR_POINTS.items() if stat in stats
+            ).round(1)
+
+            for metric, (numerator, denominator, scale) in SEASON_TOTAL_METRICS.get(
+                position, RECEIVER_TOTAL_METRICS
+            ).items():
+                ratio = totals[numerator] / totals[denominator] * scale
+                totals[metric] = ratio.round(1).where(totals[denominator] > 0)
+
+            totals["games"] = group["games"].astype(float)
+
+            for player_id, row in totals.to_dict("index").items():
+                records[player_id] = {
+                    stat: value for stat, value in row.items() if not pd.isna(value)
+                }
+
+        return records
+
     async def validate_data(self, season: int) -> Dict[str, Any]:
         """
         Validate imported data for consistency and completeness.
@@ -1042,6 +1276,11 @@ class NFLDataImportService:
 
             # Commit fixes
             if issues_fixed > 0:
+                # Fixes were made on the BaseStat rows; carry them into the season rows
+                self.db.flush()
+                self.season_stats.sync_from_base_stats(
+                    season, [player.player_id for player in players]
+                )
                 self.db.commit()
 
             results = {
@@ -1105,21 +1344,10 @@ class NFLDataImportService:
         Returns:
             Fantasy points in half-PPR scoring
         """
-        points = 0.0
-
-        # Passing points - use safe_float to handle potentially null values
-        points += safe_float(safe_dict_get(stats, "pass_yards"), 0.0) * 0.04  # 1 point per 25 yards
-        points += safe_float(safe_dict_get(stats, "pass_td"), 0.0) * 4  # 4 points per passing TD
-        points -= safe_float(safe_dict_get(stats, "interceptions"), 0.0) * 1  # -1 point per interception
-
-        # Rushing points
-        points += safe_float(safe_dict_get(stats, "rush_yards"), 0.0) * 0.1  # 1 point per 10 yards
-        points += safe_float(safe_dict_get(stats, "rush_td"), 0.0) * 6  # 6 points per rushing TD
-
-        # Receiving points
-        points += safe_float(safe_dict_get(stats, "rec_yards"), 0.0) * 0.1  # 1 point per 10 yards
-        points += safe_float(safe_dict_get(stats, "rec_td"), 0.0) * 6  # 6 points per receiving TD
-        points += safe_float(safe_dict_get(stats, "receptions"), 0.0) * 0.5  # 0.5 points per reception (half-PPR)
+        points = sum(
+            safe_float(safe_dict_get(stats, stat), 0.0) * value
+            for stat, value in HALF_PPR_POINTS.items()
+        )
 
         return round(points, 1)
 
@@ -1266,35 +1494,12 @@ class NFLDataImportService:
             # Calculate half-PPR fantasy points
             fantasy_points = self._calculate_fantasy_points(totals, position)
 
-            # Create or update BaseStat records
-            existing_stats = self._get_player_base_stats(player_id, season)
-
-            # Update base stats in database
-            if existing_stats and len(existing_stats) > 0:
-                # Update existing base stats
-                for stat_name, value in totals.items():
-                    self._update_base_stat(existing_stats, stat_name, value)
-
-                # Update games and half_ppr
-                games_stat = next((s for s in existing_stats if s.stat_type == "games"), None)
-                if games_stat:
-                    games_stat.value = games_played
-                else:
-                    self._create_base_stat(player_id, season, "games", games_played)
-
-                half_ppr_stat = next((s for s in existing_stats if s.stat_type == "half_ppr"), None)
-                if half_ppr_stat:
-                    half_ppr_stat.value = fantasy_points
-                else:
-                    self._create_base_stat(player_id, season, "half_ppr", fantasy_points)
-            else:
-                # Create new base stats for all values
-                for stat_name, value in totals.items():
-                    self._create_base_stat(player_id, season, stat_name, value)
-
-                # Add games and half_ppr
-                self._create_base_stat(player_id, season, "games", games_played)
-                self._create_base_stat(player_id, season, "half_ppr", fantasy_points)
+            # Write the season row (and its BaseStat mirror)
+            self.season_stats.save_season_totals(
+                player_id,
+                season,
+                {**totals, "games": games_played, "half_ppr": fantasy_points},
+            )
 
             # Commit changes
             self.db.commit()
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Any, Union, TypedDict, cast
+from typing import Dict, List, Optional, Any, Set, Union, TypedDict, cast
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from datetime import datetime
@@ -6,8 +6,17 @@ import uuid
 import logging
 import pandas as pd
 
+from backend.database.executor import run_in_db_thread
 from backend.database.models import Player, BaseStat, Projection, TeamStat, Scenario
 from backend.services.active_player_service import ActivePlayerService
+from backend.services.cache_invalidation import invalidate_on_commit
+from backend.services.cache_service import player_tag, scenario_tag
+from backend.services.scenario_delta_service import (
+    ScenarioDeltaService,
+    parse_virtual_projection_id,
+)
+from backend.services.season_stats_service import SeasonStatsService
+from backend.services.stat_derivation import STAT_GRAPH
 from backend.services.typing import safe_float
 
 logger = logging.getLogger(__name__)
@@ -44,6 +53,67 @@ class ProjectionError(Exception):
     pass
 
 
+# Positions that receive base projections
+FANTASY_POSITIONS = ["QB", "RB", "WR", "TE"]
+
+# Team-level columns used as context when building projections in bulk
+TEAM_CONTEXT_COLUMNS = [
+    "pass_attempts",
+    "pass_yards",
+    "pass_td",
+    "rush_attempts",
+    "rush_yards",
+    "rush_td",
+    "targets",
+    "receptions",
+    "rec_yards",
+    "rec_td",
+]
+
+# Counting stats carried over from previous-season totals
+VOLUME_STAT_COLUMNS = [
+    "pass_attempts",
+    "completions",
+    "pass_yards",
+    "pass_td",
+    "interceptions",
+    "rush_attempts",
+    "rush_yards",
+    "rush_td",
+    "targets",
+    "receptions",
+    "rec_yards",
+    "rec_td",
+]
+
+# Projection columns populated by the bulk projection builder
+PROJECTION_STAT_COLUMNS = VOLUME_STAT_COLUMNS + [
+    "yards_per_att",
+    "comp_pct",
+    "pass_td_rate",
+    "yards_per_carry",
+    "rush_td_rate",
+    "catch_pct",
+    "yards_per_target",
+    "rec_td_rate",
+    "rush_share",
+    "target_share",
+]
+
+# Derived metrics refreshed after the counting stats are regressed
+REGRESSION_DERIVED_COLUMNS = list(STAT_GRAPH.affected(VOLUME_STAT_COLUMNS))
+
+# Columns written back by the bulk regression path
+REGRESSION_OUTPUT_COLUMNS = VOLUME_STAT_COLUMNS + REGRESSION_DERIVED_COLUMNS
+
+# Projection columns loaded by the bulk regression path
+REGRESSION_FRAME_COLUMNS = REGRESSION_OUTPUT_COLUMNS + [
+    "sacks",
+    "sack_yards",
+    "fumbles",
+]
+
+
 class ProjectionService:
     def __init__(self, db: Session, active_player_service=None):
         self.db = db
@@ -58,7 +128,39 @@ class ProjectionService:
             "scoring_rate": (0.5, 1.5),
             "int_rate": (0.5, 1.5),
         }
-        
+
+        # Regression weights for different metrics
+        # These determine how much we weight historical vs current season data
+        self.regression_weights = {
+            # QB metrics
+            "pass_attempts": 0.65,  # 65% current, 35% historical
+            "completions": 0.65,
+            "pass_yards": 0.65,
+            "pass_td": 0.6,  # TDs have higher variance, so more regression
+            "interceptions": 0.5,  # INTs have high variance, so 50/50 split
+            "comp_pct": 0.7,  # Completion % is fairly stable
+            "yards_per_att": 0.65,
+
+            # RB metrics
+            "rush_attempts": 0.7,
+            "rush_yards": 0.65,
+            "rush_td": 0.6,
+            "yards_per_carry": 0.6,  # YPC has variance year to year
+
+            # Receiving metrics (RB/WR/TE)
+            "targets": 0.7,
+            "receptions": 0.7,
+            "rec_yards": 0.65,
+            "rec_td": 0.55,  # Receiving TDs have high variance
+            "catch_pct": 0.7,
+            "yards_per_target": 0.65,
+
+            # Usage metrics (defaults)
+            "snap_share": 0.75,
+            "target_share": 0.7,
+            "rush_share": 0.7,
+        }
+
     def filter_active_players(self, players: List[Player], season: Optional[int] = None) -> List[Player]:
         """
         Filter a list of Player objects to include only active players.
@@ -115,39 +217,7 @@ class ProjectionService:
             logger.error(f"Error filtering active players: {str(e)}")
             
         return players
-        
-        # Regression weights for different metrics
-        # These determine how much we weight historical vs current season data
-        self.regression_weights = {
-            # QB metrics
-            "pass_attempts": 0.65,  # 65% current, 35% historical
-            "completions": 0.65,
-            "pass_yards": 0.65,
-            "pass_td": 0.6,  # TDs have higher variance, so more regression
-            "interceptions": 0.5,  # INTs have high variance, so 50/50 split
-            "comp_pct": 0.7,  # Completion % is fairly stable
-            "yards_per_att": 0.65,
-            
-            # RB metrics
-            "rush_attempts": 0.7,
-            "rush_yards": 0.65,
-            "rush_td": 0.6,
-            "yards_per_carry": 0.6,  # YPC has variance year to year
-            
-            # Receiving metrics (RB/WR/TE)
-            "targets": 0.7,
-            "receptions": 0.7,
-            "rec_yards": 0.65,
-            "rec_td": 0.55,  # Receiving TDs have high variance
-            "catch_pct": 0.7,
-            "yards_per_target": 0.65,
-            
-            # Usage metrics (defaults)
-            "snap_share": 0.75,
-            "target_share": 0.7,
-            "rush_share": 0.7,
-        }
-        
+
     def _safe_calculate_share_factor(self, new_share: float, current_share: Any) -> float:
         """Safely calculate a relative share factor between new and current share values.
         
@@ -176,6 +246,29 @@ class ProjectionService:
             logger.error(f"Error calculating share factor: {str(e)}")
             # Return a safe default if anything goes wrong
             return new_share
+
+    @staticmethod
+    def _scale_values(
+        values: Dict[str, Any], fields: List[str], factor: float, dirty: Set[str]
+    ) -> None:
+        """Scale the non-null fields of a projection value dict and mark them dirty."""
+        for field in fields:
+            if values.get(field) is not None:
+                values[field] = float(values[field]) * factor
+                dirty.add(field)
+
+    def _apply_target_share_values(
+        self, values: Dict[str, Any], new_share: float, dirty: Set[str]
+    ) -> None:
+        """Move a projection value dict to a new target share, scaling receiving volume."""
+        relative_factor = self._safe_calculate_share_factor(new_share, values.get("target_share"))
+
+        # Store the target_share value (as a percentage between 0-0.5)
+        values["target_share"] = min(0.5, max(0.0, new_share))
+
+        self._scale_values(values, ["targets", "rec_yards", "rec_td"], relative_factor, dirty)
+        # Slight reduction in catch rate
+        self._scale_values(values, ["receptions"], relative_factor * 0.95, dirty)
             
     async def apply_statistical_regression(
         self, player_id: str, season: int, scenario_id: Optional[str] = None
@@ -202,49 +295,45 @@ class ProjectionService:
                 return None
                 
             # Get the player's current projection
-            query = self.db.query(Projection).filter(
-                and_(
-                    Projection.player_id == player_id,
-                    Projection.season == season
-                )
-            )
-            
+            scenario_deltas = ScenarioDeltaService(self.db)
             if scenario_id:
-                query = query.filter(Projection.scenario_id == scenario_id)
+                # Scenario projections resolve through the base scenario chain
+                current_projection = next(
+                    iter(
+                        scenario_deltas.resolve_projections(
+                            scenario_id, season=season, player_ids=[player_id]
+                        )
+                    ),
+                    None,
+                )
             else:
                 # If no scenario, get the base projection
-                query = query.filter(Projection.scenario_id.is_(None))
-                
-            current_projection = query.first()
+                current_projection = (
+                    self.db.query(Projection)
+                    .filter(
+                        and_(
+                            Projection.player_id == player_id,
+                            Projection.season == season,
+                            Projection.scenario_id.is_(None),
+                        )
+                    )
+                    .first()
+                )
             if not current_projection:
                 logger.error(f"No projection found for player {player_id} in season {season}")
                 return None
                 
             # Get historical stats (from previous season)
             previous_season = season - 1
-            historical_stats = (
-                self.db.query(BaseStat)
-                .filter(
-                    and_(
-                        BaseStat.player_id == player_id,
-                        BaseStat.season == previous_season,
-                        BaseStat.week.is_(None)  # Season totals
-                    )
-                )
-                .all()
+            hist_stats_dict = SeasonStatsService(self.db).get_season_stats(
+                player_id, previous_season
             )
             
             # If no historical stats, no regression can be applied
-            if not historical_stats:
+            if not hist_stats_dict:
                 logger.info(f"No historical stats found for player {player_id}, skipping regression")
                 return current_projection
                 
-            # Convert historical stats to a more usable format
-            hist_stats_dict = {}
-            for stat in historical_stats:
-                if stat.stat_type and stat.value is not None:
-                    hist_stats_dict[stat.stat_type] = float(stat.value)
-            
             # Create a map from BaseStat stat_type to Projection field names
             # This is needed because the field names might not match exactly
             stat_mapping = {
@@ -264,6 +353,7 @@ class ProjectionService:
             }
             
             # Apply regression to each stat
+            regressed_fields = set()
             for hist_stat, proj_field in stat_mapping.items():
                 # Only process if we have historical data for this stat
                 if hist_stat in hist_stats_dict:
@@ -282,51 +372,17 @@ class ProjectionService:
                     
                     # Update the projection with the regressed value
                     setattr(current_projection, proj_field, regressed_value)
+                    regressed_fields.add(proj_field)
             
-            # Recalculate efficiency metrics based on the regressed stats
-            # For QB
-            if player.position == "QB" and current_projection.pass_attempts > 0:
-                if current_projection.completions is not None:
-                    current_projection.comp_pct = (
-                        current_projection.completions / current_projection.pass_attempts * 100
-                    )
-                    
-                if current_projection.pass_yards is not None:
-                    current_projection.yards_per_att = (
-                        current_projection.pass_yards / current_projection.pass_attempts
-                    )
-                    
-                if current_projection.pass_td is not None:
-                    current_projection.pass_td_rate = (
-                        current_projection.pass_td / current_projection.pass_attempts
-                    )
-            
-            # For rushing stats (QB/RB)
-            if current_projection.rush_attempts is not None and current_projection.rush_attempts > 0:
-                if current_projection.rush_yards is not None:
-                    current_projection.yards_per_carry = (
-                        current_projection.rush_yards / current_projection.rush_attempts
-                    )
-            
-            # For receiving stats (RB/WR/TE)
-            if current_projection.targets is not None and current_projection.targets > 0:
-                if current_projection.receptions is not None:
-                    current_projection.catch_pct = (
-                        current_projection.receptions / current_projection.targets * 100
-                    )
-                    
-                if current_projection.rec_yards is not None:
-                    current_projection.yards_per_target = (
-                        current_projection.rec_yards / current_projection.targets
-                    )
-            
-            # Recalculate fantasy points
-            current_projection.half_ppr = current_projection.calculate_fantasy_points()
+            # Recalculate efficiency metrics and fantasy points from the regressed stats
+            STAT_GRAPH.recompute(current_projection, regressed_fields)
             
             # Set updated timestamp
             current_projection.updated_at = datetime.utcnow()
             
-            # Save changes
+            # Save changes (inherited scenario projections as deltas)
+            if scenario_deltas.is_inherited(current_projection):
+                scenario_deltas.save_projections(scenario_id, [current_projection])
             self.db.commit()
             return current_projection
             
@@ -336,7 +392,9 @@ class ProjectionService:
             return None
 
     async def get_projection(self, projection_id: str) -> Optional[Projection]:
-        """Retrieve a specific projection."""
+        """Retrieve a specific projection (virtual scenario IDs resolve through the chain)."""
+        if parse_virtual_projection_id(projection_id):
+            return ScenarioDeltaService(self.db).resolve_projection(projection_id)
         return self.db.query(Projection).filter(Projection.projection_id == projection_id).first()
 
     async def get_player_projections(
@@ -347,6 +405,27 @@ class ProjectionService:
         scenario_id: Optional[str] = None,
     ) -> List[Projection]:
         """Retrieve projections with optional filters."""
+        return await run_in_db_thread(
+            self.db, self._query_player_projections, player_id, team, season, scenario_id
+        )
+
+    def _query_player_projections(
+        self,
+        player_id: Optional[str],
+        team: Optional[str],
+        season: Optional[int],
+        scenario_id: Optional[str],
+    ) -> List[Projection]:
+        """Load projections with optional filters (blocking)."""
+        if scenario_id:
+            # Scenario projections resolve through the base scenario chain
+            return ScenarioDeltaService(self.db).resolve_projections(
+                scenario_id,
+                season=season,
+                player_ids=[player_id] if player_id else None,
+                team=team,
+            )
+
         query = self.db.query(Projection)
 
         if player_id:
@@ -358,9 +437,6 @@ class ProjectionService:
         if season:
             query = query.filter(Projection.season == season)
 
-        if scenario_id:
-            query = query.filter(Projection.scenario_id == scenario_id)
-
         return query.all()
 
     async def get_projection_by_player(self, player_id: str, season: int) -> Optional[Projection]:
@@ -391,15 +467,11 @@ class ProjectionService:
                 return None
 
             # Get historical stats from previous season
-            base_stats = (
-                self.db.query(BaseStat)
-                .filter(and_(BaseStat.player_id == player_id, BaseStat.season == season - 1))
-                .all()
-            )
+            season_stats = SeasonStatsService(self.db).get_season_stats(player_id, season - 1)
 
             # Calculate baseline projection
             projection = await self._calculate_base_projection(
-                player, team_stats, base_stats, season
+                player, team_stats, season_stats, season
             )
 
             if projection:
@@ -417,6 +489,126 @@ class ProjectionService:
             self.db.rollback()
             return None
 
+    async def build_season_projections(
+        self, season: int, scenario_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build base projections for every fantasy-relevant player in a season at once.
+
+        This is the set-based equivalent of calling create_base_projection for each
+        player. Player, team and previous-season totals are loaded with one query each,
+        the position-specific projection logic runs as column operations, and the
+        results are bulk inserted in a single commit. Players that already have a
+        projection for the season and scenario are skipped.
+
+        Args:
+            season: Season to build projections for
+            scenario_id: Optional scenario ID to attach the projections to
+
+        Returns:
+            Dictionary with results summary
+        """
+        try:
+            players_df = pd.DataFrame(
+                self.db.query(Player.player_id, Player.team, Player.position)
+                .filter(Player.position.in_(FANTASY_POSITIONS))
+                .all(),
+                columns=["player_id", "team", "position"],
+            )
+
+            if players_df.empty:
+                return {"success": False, "message": "No players found", "count": 0}
+
+            # Skip players that already have a projection for this season/scenario
+            if scenario_id:
+                # Scenario projections resolve through the base scenario chain
+                existing_ids = {
+                    p.player_id
+                    for p in ScenarioDeltaService(self.db).resolve_projections(
+                        scenario_id, season=season
+                    )
+                }
+            else:
+                existing_ids = {
+                    row[0]
+                    for row in self.db.query(Projection.player_id)
+                    .filter(Projection.season == season, Projection.scenario_id.is_(None))
+                    .all()
+                }
+            skipped_count = int(players_df["player_id"].isin(existing_ids).sum())
+            players_df = players_df[~players_df["player_id"].isin(existing_ids)]
+
+            # Team context for the season (first row per team, as create_base_projection)
+            team_df = pd.DataFrame(
+                self.db.query(
+                    TeamStat.team, *[getattr(TeamStat, col) for col in TEAM_CONTEXT_COLUMNS]
+                )
+                .filter(TeamStat.season == season)
+                .all(),
+                columns=["team"] + TEAM_CONTEXT_COLUMNS,
+            ).drop_duplicates(subset="team", keep="first")
+
+            # Previous season totals for all players in one query
+            history_df = SeasonStatsService(self.db).season_stats_frame(season - 1)
+
+            frame = self._build_projection_frame(players_df, team_df, history_df)
+
+            missing_team = players_df[~players_df["player_id"].isin(frame["player_id"])]
+            errors = [
+                f"Team stats not found for {row.team} in {season} (player {row.player_id})"
+                for row in missing_team.itertuples()
+            ]
+
+            if frame.empty:
+                return {
+                    "success": not errors,
+                    "message": f"No projections built for season {season}",
+                    "count": 0,
+                    "skipped": skipped_count,
+                    "errors": errors if errors else None,
+                }
+
+            frame["projection_id"] = [str(uuid.uuid4()) for _ in range(len(frame))]
+            frame["scenario_id"] = scenario_id
+            frame["season"] = season
+            frame["games"] = 17  # Full season
+
+            # NaN marks stats that the per-player path leaves unset
+            records = frame.drop(columns=["team", "position"]).astype(object)
+            rows = records.where(records.notna(), None).to_dict("records")
+
+            self.db.bulk_insert_mappings(Projection, rows)
+            # Bulk inserts bypass the unit of work, so their cache tags are registered here
+            invalidate_on_commit(
+                self.db,
+                [player_tag(player_id) for player_id in frame["player_id"]]
+                + [scenario_tag(scenario_id)],
+            )
+            self.db.commit()
+
+            logger.info(
+                f"Built {len(rows)} projections for season {season} "
+                f"({skipped_count} existing skipped, {len(errors)} without team stats)"
+            )
+
+            return {
+                "success": True,
+                "message": f"Built {len(rows)} projections for season {season}",
+                "count": len(rows),
+                "skipped": skipped_count,
+                "projection_ids": dict(zip(frame["player_id"], frame["projection_id"])),
+                "errors": errors if errors else None,
+            }
+
+        except Exception as e:
+            logger.error(f"Error building season projections: {str(e)}")
+            self.db.rollback()
+            return {
+                "success": False,
+                "message": f"Error building season projections: {str(e)}",
+                "count": 0,
+            }
+
     async def update_projection(
         self, projection_id: str, adjustments: AdjustmentDict
     ) -> Optional[Projection]:
@@ -430,6 +622,13 @@ class ProjectionService:
                 .first()
             )
 
+            # Inherited scenario projections are updated through a delta
+            scenario_deltas = ScenarioDeltaService(self.db)
+            if not projection and parse_virtual_projection_id(projection_id):
+                projection = scenario_deltas.resolve_projection(projection_id)
+                if projection:
+                    projection_id = projection.projection_id
+
             if not projection:
                 return None
 
@@ -491,186 +690,62 @@ class ProjectionService:
                 f"Before adjustments: pass_td={projection_values.get('pass_td', 'N/A')}, rush_td={projection_values.get('rush_td', 'N/A')}, rec_td={projection_values.get('rec_td', 'N/A')}"
             )
 
-            # Apply adjustments based on player position
+            # Apply adjustments based on player position. Only the adjusted stats are
+            # tracked here; the derived metrics that follow them are refreshed afterwards.
+            dirty: Set[str] = set()
+
             if player.position == "QB":
                 # QB adjustments
                 if "pass_volume" in adjustments:
-                    factor = adjustments["pass_volume"]
-                    if projection_values.get("pass_attempts") is not None:
-                        projection_values["pass_attempts"] = float(projection_values["pass_attempts"]) * factor
-                    if projection_values.get("completions") is not None:
-                        projection_values["completions"] = float(projection_values["completions"]) * factor
-                    if projection_values.get("pass_yards") is not None:
-                        projection_values["pass_yards"] = float(projection_values["pass_yards"]) * factor
-                    
-                    pass_attempts = projection_values.get("pass_attempts")
-                    if pass_attempts is not None and float(pass_attempts) > 0:
-                        pass_yards = projection_values.get("pass_yards")
-                        completions = projection_values.get("completions")
-                        
-                        if pass_yards is not None:
-                            projection_values["yards_per_att"] = float(pass_yards) / float(pass_attempts)
-                        
-                        if completions is not None:
-                            projection_values["comp_pct"] = (
-                                float(completions) / float(pass_attempts) * 100
-                            )
+                    self._scale_values(
+                        projection_values,
+                        ["pass_attempts", "completions", "pass_yards"],
+                        adjustments["pass_volume"],
+                        dirty,
+                    )
 
                 if "td_rate" in adjustments:
                     factor = adjustments["td_rate"]
-                    pass_td = projection_values.get("pass_td")
-                    if pass_td is not None:
-                        old_pass_td = float(pass_td)
-                        projection_values["pass_td"] = old_pass_td * factor
-                        logger.debug(
-                            f"QB td_rate adjustment: {old_pass_td} -> {projection_values['pass_td']} (factor: {factor})"
-                        )
-                        
-                        pass_attempts = projection_values.get("pass_attempts")
-                        if pass_attempts is not None and float(pass_attempts) > 0:
-                            projection_values["pass_td_rate"] = (
-                                float(projection_values["pass_td"]) / float(pass_attempts)
-                            )
+                    old_pass_td = projection_values.get("pass_td")
+                    self._scale_values(projection_values, ["pass_td"], factor, dirty)
+                    logger.debug(
+                        f"QB td_rate adjustment: {old_pass_td} -> {projection_values.get('pass_td')} (factor: {factor})"
+                    )
 
                 if "int_rate" in adjustments:
-                    int_rate = adjustments["int_rate"]
-                    interceptions = projection_values.get("interceptions")
-                    if interceptions is not None:
-                        projection_values["interceptions"] = float(interceptions) * int_rate
+                    self._scale_values(
+                        projection_values, ["interceptions"], adjustments["int_rate"], dirty
+                    )
 
                 if "rush_volume" in adjustments:
-                    factor = adjustments["rush_volume"]
-                    
-                    rush_attempts = projection_values.get("rush_attempts")
-                    if rush_attempts is not None:
-                        projection_values["rush_attempts"] = float(rush_attempts) * factor
-                    
-                    rush_yards = projection_values.get("rush_yards")
-                    if rush_yards is not None:
-                        projection_values["rush_yards"] = float(rush_yards) * factor
-                    
-                    rush_td = projection_values.get("rush_td")
-                    if rush_td is not None:
-                        projection_values["rush_td"] = float(rush_td) * factor
-                    
-                    updated_rush_attempts = projection_values.get("rush_attempts")
-                    updated_rush_yards = projection_values.get("rush_yards")
-                    
-                    if (updated_rush_attempts is not None and 
-                        updated_rush_yards is not None and 
-                        float(updated_rush_attempts) > 0):
-                        projection_values["yards_per_carry"] = (
-                            float(updated_rush_yards) / float(updated_rush_attempts)
-                        )
+                    self._scale_values(
+                        projection_values,
+                        ["rush_attempts", "rush_yards", "rush_td"],
+                        adjustments["rush_volume"],
+                        dirty,
+                    )
 
             elif player.position == "RB":
                 # RB adjustments
                 if "rush_volume" in adjustments:
-                    factor = adjustments["rush_volume"]
-                    
-                    rush_attempts = projection_values.get("rush_attempts")
-                    if rush_attempts is not None:
-                        projection_values["rush_attempts"] = float(rush_attempts) * factor
-                    
-                    rush_yards = projection_values.get("rush_yards")
-                    if rush_yards is not None:
-                        projection_values["rush_yards"] = float(rush_yards) * factor
-                    
-                    rush_td = projection_values.get("rush_td")
-                    if rush_td is not None:
-                        projection_values["rush_td"] = float(rush_td) * factor
-                    
-                    updated_rush_attempts = projection_values.get("rush_attempts")
-                    updated_rush_yards = projection_values.get("rush_yards")
-                    
-                    if (updated_rush_attempts is not None and 
-                        updated_rush_yards is not None and 
-                        float(updated_rush_attempts) > 0):
-                        projection_values["yards_per_carry"] = (
-                            float(updated_rush_yards) / float(updated_rush_attempts)
-                        )
+                    self._scale_values(
+                        projection_values,
+                        ["rush_attempts", "rush_yards", "rush_td"],
+                        adjustments["rush_volume"],
+                        dirty,
+                    )
 
                 if "target_share" in adjustments:
-                    factor = adjustments["target_share"]
-                    # Get the current target_share
-                    current_target_share = projection_values.get("target_share", 0.0)
-                    
-                    # Use our safe helper function to calculate the relative multiplier
-                    relative_factor = self._safe_calculate_share_factor(factor, current_target_share)
-                    
-                    # Store the target_share value (as a percentage between 0-0.5)
-                    projection_values["target_share"] = min(0.5, max(0.0, factor))
-                    
-                    # Apply the relative factor to all receiving stats
-                    targets = projection_values.get("targets")
-                    if targets is not None:
-                        projection_values["targets"] = float(targets) * relative_factor
-                    
-                    receptions = projection_values.get("receptions")
-                    if receptions is not None:
-                        projection_values["receptions"] = float(receptions) * relative_factor * 0.95
-                    
-                    rec_yards = projection_values.get("rec_yards")
-                    if rec_yards is not None:
-                        projection_values["rec_yards"] = float(rec_yards) * relative_factor
-                    
-                    rec_td = projection_values.get("rec_td")
-                    if rec_td is not None:
-                        projection_values["rec_td"] = float(rec_td) * relative_factor
-                    
-                    updated_targets = projection_values.get("targets")
-                    updated_receptions = projection_values.get("receptions")
-                    updated_rec_yards = projection_values.get("rec_yards")
-                    updated_rec_td = projection_values.get("rec_td")
-                    
-                    # Safely handle target-based calculations
-                    if updated_targets is not None:
-                        try:
-                            targets_float = float(updated_targets)
-                            if targets_float > 0:
-                                # Calculate catch_pct if receptions are available
-                                if updated_receptions is not None:
-                                    try:
-                                        receptions_float = float(updated_receptions)
-                                        projection_values["catch_pct"] = (receptions_float / targets_float) * 100
-                                    except (ValueError, TypeError):
-                                        pass
-                                
-                                # Calculate yards_per_target if rec_yards are available
-                                if updated_rec_yards is not None:
-                                    try:
-                                        rec_yards_float = float(updated_rec_yards)
-                                        projection_values["yards_per_target"] = rec_yards_float / targets_float
-                                    except (ValueError, TypeError):
-                                        pass
-                                
-                                # Calculate rec_td_rate if rec_td are available
-                                if updated_rec_td is not None:
-                                    try:
-                                        rec_td_float = float(updated_rec_td)
-                                        projection_values["rec_td_rate"] = rec_td_float / targets_float
-                                    except (ValueError, TypeError):
-                                        pass
-                        except (ValueError, TypeError):
-                            # Skip calculations if targets can't be converted to float
-                            pass
+                    self._apply_target_share_values(
+                        projection_values, adjustments["target_share"], dirty
+                    )
 
                 # Apply td_rate adjustment for RBs
                 if "td_rate" in adjustments:
                     factor = adjustments["td_rate"]
-                    
-                    rush_td = projection_values.get("rush_td")
-                    rec_td = projection_values.get("rec_td")
-                    
-                    old_rush_td = float(rush_td) if rush_td is not None else 0.0
-                    old_rec_td = float(rec_td) if rec_td is not None else 0.0
-                    
-                    if rush_td is not None:
-                        projection_values["rush_td"] = old_rush_td * factor
-                    
-                    if rec_td is not None:
-                        projection_values["rec_td"] = old_rec_td * factor
-                    
+                    old_rush_td = projection_values.get("rush_td")
+                    old_rec_td = projection_values.get("rec_td")
+                    self._scale_values(projection_values, ["rush_td", "rec_td"], factor, dirty)
                     logger.debug(
                         f"RB td_rate adjustment: rush_td {old_rush_td} -> {projection_values.get('rush_td', 'N/A')}, rec_td {old_rec_td} -> {projection_values.get('rec_td', 'N/A')} (factor: {factor})"
                     )
@@ -678,78 +753,14 @@ class ProjectionService:
             elif player.position in ["WR", "TE"]:
                 # WR/TE adjustments
                 if "target_share" in adjustments:
-                    factor = adjustments["target_share"]
-                    # Get the current target_share
-                    current_target_share = projection_values.get("target_share", 0.0)
-                    
-                    # Use our safe helper function to calculate the relative multiplier
-                    relative_factor = self._safe_calculate_share_factor(factor, current_target_share)
-                    
-                    # Store the target_share value (as a percentage between 0-0.5)
-                    projection_values["target_share"] = min(0.5, max(0.0, factor))
-                    
-                    # Apply the relative factor to all receiving stats
-                    targets = projection_values.get("targets")
-                    if targets is not None:
-                        projection_values["targets"] = float(targets) * relative_factor
-                    
-                    receptions = projection_values.get("receptions")
-                    if receptions is not None:
-                        projection_values["receptions"] = float(receptions) * relative_factor * 0.95
-                    
-                    rec_yards = projection_values.get("rec_yards")
-                    if rec_yards is not None:
-                        projection_values["rec_yards"] = float(rec_yards) * relative_factor
-                    
-                    rec_td = projection_values.get("rec_td")
-                    if rec_td is not None:
-                        projection_values["rec_td"] = float(rec_td) * relative_factor
-                    
-                    updated_targets = projection_values.get("targets")
-                    updated_receptions = projection_values.get("receptions")
-                    updated_rec_yards = projection_values.get("rec_yards")
-                    updated_rec_td = projection_values.get("rec_td")
-                    
-                    # Safely handle target-based calculations
-                    if updated_targets is not None:
-                        try:
-                            targets_float = float(updated_targets)
-                            if targets_float > 0:
-                                # Calculate catch_pct if receptions are available
-                                if updated_receptions is not None:
-                                    try:
-                                        receptions_float = float(updated_receptions)
-                                        projection_values["catch_pct"] = (receptions_float / targets_float) * 100
-                                    except (ValueError, TypeError):
-                                        pass
-                                
-                                # Calculate yards_per_target if rec_yards are available
-                                if updated_rec_yards is not None:
-                                    try:
-                                        rec_yards_float = float(updated_rec_yards)
-                                        projection_values["yards_per_target"] = rec_yards_float / targets_float
-                                    except (ValueError, TypeError):
-                                        pass
-                                
-                                # Calculate rec_td_rate if rec_td are available
-                                if updated_rec_td is not None:
-                                    try:
-                                        rec_td_float = float(updated_rec_td)
-                                        projection_values["rec_td_rate"] = rec_td_float / targets_float
-                                    except (ValueError, TypeError):
-                                        pass
-                        except (ValueError, TypeError):
-                            # Skip calculations if targets can't be converted to float
-                            pass
+                    self._apply_target_share_values(
+                        projection_values, adjustments["target_share"], dirty
+                    )
 
                 if "td_rate" in adjustments:
                     factor = adjustments["td_rate"]
-                    rec_td = projection_values.get("rec_td")
-                    old_rec_td = float(rec_td) if rec_td is not None else 0.0
-                    
-                    if rec_td is not None:
-                        projection_values["rec_td"] = old_rec_td * factor
-                    
+                    old_rec_td = projection_values.get("rec_td")
+                    self._scale_values(projection_values, ["rec_td"], factor, dirty)
                     logger.debug(
                         f"WR/TE td_rate adjustment: rec_td {old_rec_td} -> {projection_values.get('rec_td', 'N/A')} (factor: {factor})"
                     )
@@ -760,19 +771,23 @@ class ProjectionService:
                     adjusted_snap_share = current_snap_share * adjustments["snap_share"]
                     projection_values["snap_share"] = min(1.0, adjusted_snap_share)
 
-            # Calculate fantasy points
-            # First, update the projection with our adjusted values
+            # Update the projection with our adjusted values
             for key, value in projection_values.items():
                 setattr(projection, key, value)
 
-            # Calculate fantasy points
+            # Refresh only the derived metrics downstream of the adjusted stats
             original_half_ppr = projection.half_ppr if projection.half_ppr else 0.0
-            calculated_half_ppr = projection.calculate_fantasy_points()
-            projection_values["half_ppr"] = calculated_half_ppr
+            for field in STAT_GRAPH.recompute(projection, dirty):
+                projection_values[field] = getattr(projection, field)
 
-            logger.info(f"Fantasy points: original={original_half_ppr}, new={calculated_half_ppr}")
+            logger.info(f"Fantasy points: original={original_half_ppr}, new={projection.half_ppr}")
             logger.info(f"TD values: rush_td={projection.rush_td}, rec_td={projection.rec_td}")
 
+            if scenario_deltas.is_inherited(projection):
+                scenario_deltas.save_projections(projection.scenario_id, [projection])
+                self.db.commit()
+                return projection
+
             # Persist the changes - update the existing record with our values
             update_stmt = {
                 key: value for key, value in projection_values.items() if key != "projection_id"
@@ -940,28 +955,36 @@ class ProjectionService:
             Dictionary with results summary
         """
         try:
-            # Build query for projections
-            query = self.db.query(Projection)
-            
-            if player_id:
-                query = query.filter(Projection.player_id == player_id)
-            elif team or position:
-                # Join with Player table for team/position filtering
-                query = query.join(Player)
-                
-                if team:
-                    query = query.filter(Player.team == team)
-                    
-                if position:
-                    query = query.filter(Player.position == position)
-            
-            if season:
-                query = query.filter(Projection.season == season)
-                
+            scenario_deltas = ScenarioDeltaService(self.db)
             if scenario_id:
-                query = query.filter(Projection.scenario_id == scenario_id)
-                
-            projections = query.all()
+                # Scenario projections resolve through the base scenario chain
+                projections = scenario_deltas.resolve_projections(
+                    scenario_id,
+                    season=season,
+                    player_ids=[player_id] if player_id else None,
+                    position=None if player_id else position,
+                    team=None if player_id else team,
+                )
+            else:
+                # Build query for projections
+                query = self.db.query(Projection)
+
+                if player_id:
+                    query = query.filter(Projection.player_id == player_id)
+                elif team or position:
+                    # Join with Player table for team/position filtering
+                    query = query.join(Player)
+
+                    if team:
+                        query = query.filter(Player.team == team)
+
+                    if position:
+                        query = query.filter(Player.position == position)
+
+                if season:
+                    query = query.filter(Projection.season == season)
+
+                projections = query.all()
             
             if not projections:
                 return {"success": False, "message": "No projections found matching criteria", "count": 0}
@@ -979,57 +1002,8 @@ class ProjectionService:
                         error_messages.append(f"Player not found for projection {projection.projection_id}")
                         continue
                     
-                    # Calculate QB metrics
-                    if player.position == "QB":
-                        # Calculate completion percentage
-                        if (projection.pass_attempts is not None and 
-                            projection.pass_attempts > 0 and 
-                            projection.completions is not None):
-                            projection.comp_pct = (projection.completions / projection.pass_attempts) * 100
-                            
-                        # Calculate yards per attempt
-                        if (projection.pass_attempts is not None and 
-                            projection.pass_attempts > 0 and 
-                            projection.pass_yards is not None):
-                            projection.yards_per_att = projection.pass_yards / projection.pass_attempts
-                            
-                        # Calculate TD rate
-                        if (projection.pass_attempts is not None and 
-                            projection.pass_attempts > 0 and 
-                            projection.pass_td is not None):
-                            projection.pass_td_rate = projection.pass_td / projection.pass_attempts
-                            
-                        # Calculate INT rate
-                        if (projection.pass_attempts is not None and 
-                            projection.pass_attempts > 0 and 
-                            projection.interceptions is not None):
-                            projection.int_rate = projection.interceptions / projection.pass_attempts
-                    
-                    # Calculate rushing metrics for all positions
-                    if (projection.rush_attempts is not None and 
-                        projection.rush_attempts > 0 and 
-                        projection.rush_yards is not None):
-                        projection.yards_per_carry = projection.rush_yards / projection.rush_attempts
-                        
-                        if projection.rush_td is not None:
-                            projection.rush_td_rate = projection.rush_td / projection.rush_attempts
-                    
-                    # Calculate receiving metrics for relevant positions
-                    if player.position in ["RB", "WR", "TE"]:
-                        if (projection.targets is not None and 
-                            projection.targets > 0):
-                            
-                            # Calculate catch percentage
-                            if projection.receptions is not None:
-                                projection.catch_pct = (projection.receptions / projection.targets) * 100
-                                
-                            # Calculate yards per target
-                            if projection.rec_yards is not None:
-                                projection.yards_per_target = projection.rec_yards / projection.targets
-                                
-                            # Calculate receiving TD rate
-                            if projection.rec_td is not None:
-                                projection.rec_td_rate = projection.rec_td / projection.targets
+                    # Recalculate every metric derived from the counting stats
+                    STAT_GRAPH.recompute(projection, VOLUME_STAT_COLUMNS)
                     
                     # Set usage metrics if they are not set
                     # These are specifically for team context and require team stats
@@ -1042,9 +1016,6 @@ class ProjectionService:
                         elif player.position == "WR" or player.position == "TE":
                             projection.snap_share = 0.7  # Typical for starting receivers
                     
-                    # Recalculate fantasy points
-                    projection.half_ppr = projection.calculate_fantasy_points()
-                    
                     # Set updated timestamp
                     projection.updated_at = datetime.utcnow()
                     
@@ -1053,7 +1024,9 @@ class ProjectionService:
                 except Exception as e:
                     error_messages.append(f"Error updating metrics for projection {projection.projection_id}: {str(e)}")
             
-            # Commit all changes
+            # Commit all changes (inherited scenario projections as deltas)
+            if scenario_id:
+                scenario_deltas.save_projections(scenario_id, projections)
             self.db.commit()
             
             return {
@@ -1075,12 +1048,18 @@ class ProjectionService:
     ) -> Dict[str, Any]:
         """
         Apply statistical regression to a batch of players, filtered by team and/or position.
+
+        Set-based counterpart of apply_statistical_regression: the current projections
+        and previous-season totals of the whole filtered population are loaded with one
+        query each, the regression blend and efficiency recomputation run as array math,
+        and all regressed projections are written back in a single bulk update.
         
         Args:
             team: Optional team filter
             position: Optional position filter
             season: Season to apply regression to
             scenario_id: Optional scenario ID
+            active_only: Whether to restrict the batch to active players
             
         Returns:
             Dictionary with results summary
@@ -1106,29 +1085,97 @@ class ProjectionService:
             
             if not players:
                 return {"success": False, "message": "No players found matching criteria", "count": 0}
-                
-            # Track results
-            success_count = 0
-            error_messages = []
-            
-            # Process each player
-            for player in players:
-                try:
-                    # Apply regression
-                    result = await self.apply_statistical_regression(
-                        player_id=player.player_id,
-                        season=season,
-                        scenario_id=scenario_id
+
+            player_names = {p.player_id: p.name for p in players}
+
+            # Current projections for the filtered population in one query
+            projection_columns = ["projection_id", "player_id"] + REGRESSION_FRAME_COLUMNS
+            scenario_deltas = ScenarioDeltaService(self.db)
+            inherited: Dict[str, Projection] = {}
+            if scenario_id:
+                # Scenario projections resolve through the base scenario chain
+                resolved = scenario_deltas.resolve_projections(
+                    scenario_id, season=season, position=position, team=team
+                )
+                inherited = {
+                    p.projection_id: p for p in resolved if scenario_deltas.is_inherited(p)
+                }
+                projection_rows = [
+                    [getattr(p, col) for col in projection_columns] + [p.player.position]
+                    for p in resolved
+                ]
+            else:
+                projection_query = (
+                    self.db.query(
+                        *[getattr(Projection, col) for col in projection_columns], Player.position
                     )
-                    
-                    if result:
-                        success_count += 1
-                    else:
-                        error_messages.append(f"Failed to apply regression for {player.name}")
-                        
-                except Exception as e:
-                    error_messages.append(f"Error applying regression for {player.name}: {str(e)}")
-            
+                    .join(Player, Player.player_id == Projection.player_id)
+                    .filter(Projection.season == season, Projection.scenario_id.is_(None))
+                )
+
+                if team:
+                    projection_query = projection_query.filter(Player.team == team)
+
+                if position:
+                    projection_query = projection_query.filter(Player.position == position)
+
+                projection_rows = projection_query.all()
+
+            projections_df = pd.DataFrame(
+                projection_rows, columns=projection_columns + ["position"]
+            )
+            projections_df = projections_df[
+                projections_df["player_id"].isin(set(player_names))
+            ].drop_duplicates(subset="player_id", keep="first")
+
+            # Previous season totals for the same population in one query
+            history_df = SeasonStatsService(self.db).season_stats_frame(
+                season - 1, team=team, position=position
+            )
+
+            # Players without a projection cannot be regressed
+            projected_ids = set(projections_df["player_id"])
+            error_messages = [
+                f"Failed to apply regression for {name}"
+                for player_id, name in player_names.items()
+                if player_id not in projected_ids
+            ]
+
+            regressed = self._regress_projection_frame(projections_df, history_df)
+
+            if not regressed.empty:
+                regressed["updated_at"] = datetime.utcnow()
+                records = regressed.astype(object)
+                rows = records.where(records.notna(), None).to_dict("records")
+
+                # Inherited scenario projections are stored as deltas, owned rows in bulk
+                for row in rows:
+                    projection = inherited.get(row["projection_id"])
+                    if projection is not None:
+                        for column in REGRESSION_OUTPUT_COLUMNS:
+                            setattr(projection, column, row[column])
+                if inherited:
+                    scenario_deltas.save_projections(scenario_id, list(inherited.values()))
+                rows = [row for row in rows if row["projection_id"] not in inherited]
+
+                self.db.bulk_update_mappings(Projection, rows)
+                regressed_players = projections_df.loc[
+                    projections_df["projection_id"].isin(regressed["projection_id"]), "player_id"
+                ]
+                invalidate_on_commit(
+                    self.db,
+                    [player_tag(player_id) for player_id in regressed_players]
+                    + [scenario_tag(scenario_id)],
+                )
+                self.db.commit()
+
+            # Projections without history are returned unchanged, as in the per-player path
+            success_count = len(projections_df)
+            logger.info(
+                f"Applied regression to {success_count} of {len(players)} players "
+                f"({len(regressed)} projections updated)"
+            )
+
             return {
                 "success": True,
                 "message": f"Applied regression to {success_count} of {len(players)} players",
@@ -1138,7 +1185,51 @@ class ProjectionService:
             
         except Exception as e:
             logger.error(f"Error in batch regression: {str(e)}")
+            self.db.rollback()
             return {"success": False, "message": f"Error in batch regression: {str(e)}", "count": 0}
+
+    def _regress_projection_frame(
+        self, projections: pd.DataFrame, history: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Vectorized regression blend used by batch_apply_regression.
+
+        Args:
+            projections: Frame of current projections (projection_id, player_id, position
+                and REGRESSION_FRAME_COLUMNS)
+            history: Previous-season totals indexed by player_id, one column per stat
+
+        Returns:
+            Frame keyed by projection_id with the regressed stats, efficiency metrics and
+            half_ppr for every projection that had historical data
+        """
+        output_columns = ["projection_id"] + REGRESSION_OUTPUT_COLUMNS
+        if projections.empty or history.empty:
+            return pd.DataFrame(columns=output_columns)
+
+        hist = history.reindex(columns=VOLUME_STAT_COLUMNS).astype(float)
+        # Players whose totals hold none of the volume stats have nothing to blend
+        hist = hist.dropna(how="all").add_prefix("hist_")
+
+        # Only projections with historical stats are regressed
+        frame = projections.merge(hist, left_on="player_id", right_index=True, how="inner")
+        if frame.empty:
+            return pd.DataFrame(columns=output_columns)
+
+        frame[REGRESSION_FRAME_COLUMNS] = frame[REGRESSION_FRAME_COLUMNS].astype(float)
+
+        # Weighted average: weight * current + (1 - weight) * historical
+        for stat in VOLUME_STAT_COLUMNS:
+            weight = self.regression_weights.get(stat, 0.65)
+            current = frame[stat]
+            historical = frame[f"hist_{stat}"]
+            blended = (weight * current) + ((1 - weight) * historical)
+            frame[stat] = blended.where(current.notna() & historical.notna(), current)
+
+        # Recalculate efficiency metrics and fantasy points from the regressed stats
+        frame = STAT_GRAPH.recompute_frame(frame, VOLUME_STAT_COLUMNS)
+
+        return frame[output_columns].reset_index(drop=True)
     
     async def recalculate_shares(self, projection_id: str) -> Optional[Projection]:
         """Recalculate share metrics for a projection based on team totals."""
@@ -1211,16 +1302,11 @@ class ProjectionService:
             return None
 
     async def _calculate_base_projection(
-        self, player: Player, team_stats: TeamStat, base_stats: List[BaseStat], season: int
+        self, player: Player, team_stats: TeamStat, season_stats: Dict[str, float], season: int
     ) -> Optional[Projection]:
         """Calculate baseline projection from historical data."""
         try:
-            # Convert base stats to dictionary for easier access
-            stats_dict: StatsDict = {
-                cast(str, stat.stat_type): float(stat.value) 
-                for stat in base_stats 
-                if stat.stat_type and stat.value is not None
-            }
+            stats_dict = cast(StatsDict, dict(season_stats))
 
             # If no historical stats, estimate from team context
             if not stats_dict:
@@ -1666,3 +1752,166 @@ class ProjectionService:
                 projection.rush_share = projection.rush_attempts / team_stats.rush_attempts
             else:
                 projection.rush_share = 0.0
+
+    def _build_projection_frame(
+        self, players_df: pd.DataFrame, team_df: pd.DataFrame, history_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Vectorized counterpart of _calculate_base_projection for many players.
+
+        Args:
+            players_df: Frame with player_id, team and position columns
+            team_df: Frame with one row per team and the TEAM_CONTEXT_COLUMNS
+            history_df: Previous-season totals indexed by player_id, one column per stat
+
+        Returns:
+            Frame with one row per projectable player and the projection stat columns
+        """
+        team_context = team_df.copy()
+        team_context[TEAM_CONTEXT_COLUMNS] = team_context[TEAM_CONTEXT_COLUMNS].astype(float)
+        team_context = team_context.rename(
+            columns={col: f"team_{col}" for col in TEAM_CONTEXT_COLUMNS}
+        )
+
+        # Players without team stats are skipped, as in create_base_projection
+        frame = players_df.merge(team_context, on="team", how="inner")
+
+        frame["has_history"] = frame["player_id"].isin(history_df.index)
+        history = history_df.reindex(columns=VOLUME_STAT_COLUMNS).astype(float)
+        frame = frame.merge(history, left_on="player_id", right_index=True, how="left")
+        frame = frame.reset_index(drop=True)
+
+        position_builders = {
+            "QB": self._build_qb_columns,
+            "RB": self._build_rb_columns,
+            "WR": self._build_receiver_columns,
+            "TE": self._build_receiver_columns,
+        }
+
+        parts = []
+        for position, group in frame.groupby("position", sort=False):
+            builder = position_builders.get(position)
+            if builder:
+                parts.append(builder(group))
+
+        columns = ["player_id", "team", "position"] + PROJECTION_STAT_COLUMNS
+        if not parts:
+            return pd.DataFrame(columns=columns + ["half_ppr"])
+
+        result = pd.concat(parts).reindex(columns=columns)
+        result["half_ppr"] = self._half_ppr_points(result)
+
+        return result.reset_index(drop=True)
+
+    def _build_qb_columns(self, group: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized _set_qb_stats (with _estimate_qb_stats fallback)."""
+        pick = self._history_or_estimate
+        out = group[["player_id", "team", "position"]].copy()
+
+        out["pass_attempts"] = pick(
+            group, "pass_attempts", group["team_pass_attempts"], group["team_pass_attempts"] * 0.95
+        )
+        out["completions"] = pick(
+            group, "completions", group["team_receptions"], group["team_receptions"] * 0.95
+        )
+        out["pass_yards"] = pick(
+            group, "pass_yards", group["team_pass_yards"], group["team_pass_yards"] * 0.95
+        )
+        out["pass_td"] = pick(group, "pass_td", group["team_pass_td"], group["team_pass_td"] * 0.95)
+        out["interceptions"] = pick(group, "interceptions", 0, group["team_pass_attempts"] * 0.02)
+        out["rush_attempts"] = pick(group, "rush_attempts", 0, 40)
+        out["rush_yards"] = pick(group, "rush_yards", 0, 200)
+        out["rush_td"] = pick(group, "rush_td", 0, 2)
+
+        # Efficiency metrics
+        out["yards_per_att"] = self._ratio(out["pass_yards"], out["pass_attempts"])
+        out["comp_pct"] = self._ratio(out["completions"], out["pass_attempts"], 100)
+        out["pass_td_rate"] = self._ratio(out["pass_td"], out["pass_attempts"])
+        out["yards_per_carry"] = self._ratio(out["rush_yards"], out["rush_attempts"])
+
+        # Share metrics
+        out["rush_share"] = self._share(out["rush_attempts"], group["team_rush_attempts"])
+
+        return out
+
+    def _build_rb_columns(self, group: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized _set_rb_stats (with _estimate_rb_stats fallback)."""
+        pick = self._history_or_estimate
+        out = group[["player_id", "team", "position"]].copy()
+
+        out["rush_attempts"] = pick(group, "rush_attempts", 0, group["team_rush_attempts"] * 0.4)
+        out["rush_yards"] = pick(group, "rush_yards", 0, group["team_rush_yards"] * 0.4)
+        out["rush_td"] = pick(group, "rush_td", 0, group["team_rush_td"] * 0.4)
+        out["targets"] = pick(group, "targets", 0, group["team_targets"] * 0.1)
+        out["receptions"] = pick(group, "receptions", 0, group["team_receptions"] * 0.1)
+        out["rec_yards"] = pick(group, "rec_yards", 0, group["team_rec_yards"] * 0.08)
+        out["rec_td"] = pick(group, "rec_td", 0, group["team_rec_td"] * 0.08)
+
+        # Efficiency metrics
+        out["yards_per_carry"] = self._ratio(out["rush_yards"], out["rush_attempts"])
+        out["rush_td_rate"] = self._ratio(out["rush_td"], out["rush_attempts"])
+        out["catch_pct"] = self._ratio(out["receptions"], out["targets"], 100)
+        out["yards_per_target"] = self._ratio(out["rec_yards"], out["targets"])
+        out["rec_td_rate"] = self._ratio(out["rec_td"], out["targets"])
+
+        # Share metrics
+        out["rush_share"] = self._share(out["rush_attempts"], group["team_rush_attempts"])
+        out["target_share"] = self._share(out["targets"], group["team_targets"])
+
+        return out
+
+    def _build_receiver_columns(self, group: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized _set_receiver_stats (with _estimate_receiver_stats fallback)."""
+        pick = self._history_or_estimate
+        out = group[["player_id", "team", "position"]].copy()
+
+        out["targets"] = pick(group, "targets", 0, group["team_targets"] * 0.15)
+        out["receptions"] = pick(group, "receptions", 0, group["team_receptions"] * 0.15)
+        out["rec_yards"] = pick(group, "rec_yards", 0, group["team_rec_yards"] * 0.15)
+        out["rec_td"] = pick(group, "rec_td", 0, group["team_rec_td"] * 0.15)
+        out["rush_attempts"] = pick(group, "rush_attempts", 0, 0)
+        out["rush_yards"] = pick(group, "rush_yards", 0, 0)
+        out["rush_td"] = pick(group, "rush_td", 0, 0)
+
+        # Efficiency metrics
+        out["catch_pct"] = self._ratio(out["receptions"], out["targets"], 100)
+        out["yards_per_target"] = self._ratio(out["rec_yards"], out["targets"])
+        out["rec_td_rate"] = self._ratio(out["rec_td"], out["targets"])
+        out["yards_per_carry"] = self._ratio(out["rush_yards"], out["rush_attempts"])
+
+        # Share metrics
+        out["target_share"] = self._share(out["targets"], group["team_targets"])
+        out["rush_share"] = self._share(out["rush_attempts"], group["team_rush_attempts"])
+
+        return out
+
+    @staticmethod
+    def _history_or_estimate(
+        group: pd.DataFrame, stat: str, default: Union[float, pd.Series], estimate: Union[float, pd.Series]
+    ) -> pd.Series:
+        """
+        Pick a stat column the way the per-player setters do.
+
+        Players with any previous-season totals use their value (or the setter's
+        default when that stat is missing); players without history use the
+        team-context estimate.
+        """
+        historical = group[stat].where(group[stat].notna(), default)
+        return historical.where(group["has_history"], estimate).astype(float)
+
+    @staticmethod
+    def _ratio(numerator: pd.Series, denominator: pd.Series, scale: float = 1.0) -> pd.Series:
+        """Element-wise numerator / denominator * scale, left unset where denominator <= 0."""
+        valid = denominator.gt(0) & numerator.notna()
+        return (numerator / denominator * scale).where(valid)
+
+    @staticmethod
+    def _share(value: pd.Series, team_total: pd.Series) -> pd.Series:
+        """Element-wise share of a team total, 0.0 when either side is missing or zero."""
+        valid = team_total.gt(0) & value.notna() & value.ne(0)
+        return (value / team_total).where(valid, 0.0)
+
+    @staticmethod
+    def _half_ppr_points(frame: pd.DataFrame) -> pd.Series:
+        """Vectorized Projection.calculate_fantasy_points for half-PPR scoring."""
+        return STAT_GRAPH.evaluate_frame("half_ppr", frame)
@@ -0,0 +1,297 @@
+"""
+Monte Carlo simulation of projection outcomes.
+
+ProjectionVarianceService gives analytic normal intervals one stat at a time. This
+engine draws whole seasons instead: for every projection in a season or scenario it
+draws correlated outcomes for each stat and scores every draw, which gives fantasy
+point distributions with percentiles and boom/bust probabilities.
+
+The model, per position:
+
+- coefficients of variation come from ProjectionVarianceService, scaled for projected
+  games the same way calculate_variance does, or from per-player overrides
+- stats are correlated through the position correlation matrix
+- draws use a Gaussian copula with lognormal marginals, so every stat keeps its
+  projected mean and coefficient of variation and is never negative
+- draws are scored with ScoringRules; whatever is not simulated (sacks, fumbles,
+  net-yardage adjustments) adds its projected points to every draw
+
+All players of a position are drawn together in a few large array operations. The
+RNG is seeded per position from a single seed, so a seed reproduces the same draws
+for the same projection set.
+"""
+
+from typing import Dict, List, Mapping, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from backend.services.projection_variance_service import ProjectionVarianceService
+from backend.services.scoring_service import HALF_PPR_RULES, ScoringRules, ScoringService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DRAWS = 5000
+MAX_DRAWS = 20000
+
+# Fantasy point percentiles reported per projection (10th is the floor, 90th the ceiling)
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# A draw booms above this multiple of the projection and busts below this one
+BOOM_FACTOR = 1.2
+BUST_FACTOR = 0.8
+
+# Values drawn per array operation (players x draws x stats), bounds peak memory
+CHUNK_VALUES = 4_000_000
+
+FULL_SEASON_GAMES = 17.0
+
+
+class SimulationResult:
+    """Simulated outcomes for a set of projections."""
+
+    def __init__(
+        self,
+        summary: pd.DataFrame,
+        points: np.ndarray,
+        stats: Dict[str, np.ndarray],
+        draws: int,
+        seed: Optional[int],
+    ):
+        """
+        Args:
+            summary: One row per projection with percentiles and boom/bust probabilities
+            points: Fantasy points per draw, shape (projections, draws), rows in summary order
+            stats: Stat name -> draws of that stat (NaN for positions that do not simulate it)
+            draws: Draws per projection
+            seed: Seed the draws were made with
+        """
+        self.summary = summary
+        self.points = points
+        self.stats = stats
+        self.draws = draws
+        self.seed = seed
+
+
+class ProjectionSimulationService:
+    """Draws correlated stat outcomes for whole projection sets at once."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.variance = ProjectionVarianceService(db)
+
+    async def simulate_season(
+        self,
+        season: int,
+        scenario_id: Optional[str] = None,
+        draws: int = DEFAULT_DRAWS,
+        seed: Optional[int] = None,
+        rules: ScoringRules = HALF_PPR_RULES,
+        position: Optional[str] = None,
+        coefficients: Optional[Mapping[str, Mapping[str, float]]] = None,
+        keep_stats: bool = False,
+    ) -> SimulationResult:
+        """
+        Simulate every projection of a season or scenario.
+
+        Args:
+            season: Projection season
+            scenario_id: Optional scenario (base projections when omitted)
+            draws: Simulated seasons per projection
+            seed: RNG seed; the same seed reproduces the same draws
+            rules: Scoring rules applied to each draw
+            position: Optional position filter
+            coefficients: Optional player_id -> {stat: coefficient of variation}
+                overriding the position defaults
+            keep_stats: Keep the per-stat draws as well as the fantasy points
+
+        Returns:
+            SimulationResult
+        """
+        frame = ScoringService(self.db).load_frame(
+            season, scenario_id, extra_columns=["games", "half_ppr"]
+        )
+        if position:
+            frame = frame[frame["position"] == position]
+        return self.simulate_frame(
+            frame,
+            draws=draws,
+            seed=seed,
+            rules=rules,
+            coefficients=coefficients,
+            keep_stats=keep_stats,
+        )
+
+    def simulate_frame(
+        self,
+        frame: pd.DataFrame,
+        draws: int = DEFAULT_DRAWS,
+        seed: Optional[int] = None,
+        rules: ScoringRules = HALF_PPR_RULES,
+        coefficients: Optional[Mapping[str, Mapping[str, float]]] = None,
+        keep_stats: bool = False,
+    ) -> SimulationResult:
+        """
+        Simulate a frame of projections.
+
+        Args:
+            frame: Projection rows with projection_id, player_id, position, games and
+                stat columns (name and team are passed through when present)
+            draws: Simulated seasons per projection
+            seed: RNG seed
+            rules: Scoring rules applied to each draw
+            coefficients: Optional per-player coefficient of variation overrides
+            keep_stats: Keep the per-stat draws
+
+        Returns:
+            SimulationResult
+        """
+        if not 1 <= draws <= MAX_DRAWS:
+            raise ValueError(f"draws must be between 1 and {MAX_DRAWS}")
+
+        # A stable row order keeps seeded draws independent of query order
+        frame = frame.sort_values("projection_id", kind="mergesort").reset_index(drop=True)
+        count = len(frame)
+        if not count:
+            return SimulationResult(
+                self._summarize(frame, np.zeros(0), np.zeros((0, draws))),
+                np.zeros((0, draws)),
+                {},
+                draws,
+                seed,
+            )
+
+        projected = rules.score_frame(frame).to_numpy()
+        points = np.repeat(projected[:, None], draws, axis=1)
+        stat_draws: Dict[str, np.ndarray] = {}
+
+        # One stream per known position, so adding a position does not shift the others
+        positions = list(self.variance.variance_coefficients)
+        streams = np.random.SeedSequence(seed).spawn(len(positions))
+        position_values = frame["position"].to_numpy()
+
+        for position, stream in zip(positions, streams):
+            rows = np.flatnonzero(position_values == position)
+            if not len(rows):
+                continue
+
+            stats = list(self.variance.variance_coefficients[position])
+            subset = frame.iloc[rows]
+            means = self._stat_matrix(subset, stats)
+            coef_var = self._coefficient_matrix(subset, position, stats, coefficients)
+            lower = np.linalg.cholesky(self.variance.correlation_matrix(position, stats))
+            rng = np.random.default_rng(stream)
+
+            # Points the simulated stats are worth at their projected means
+            expected = rules.score(dict(zip(stats, means.T)), position)
+
+            chunk = max(1, CHUNK_VALUES // (draws * len(stats)))
+            for start in range(0, len(rows), chunk):
+                part = slice(start, start + chunk)
+                values = self._draw(means[part], coef_var[part], lower, draws, rng)
+                simulated = rules.score(
+                    {stat: values[..., i] for i, stat in enumerate(stats)}, position
+                )
+                target = rows[part]
+                points[target] += simulated - expected[part][:, None]
+
+                if keep_stats:
+                    for i, stat in enumerate(stats):
+                        if stat not in stat_draws:
+                            stat_draws[stat] = np.full((count, draws), np.nan)
+                        stat_draws[stat][target] = values[..., i]
+
+        return SimulationResult(
+            summary=self._summarize(frame, projected, points),
+            points=points,
+            stats=stat_draws,
+            draws=draws,
+            seed=seed,
+        )
+
+    @staticmethod
+    def _draw(
+        means: np.ndarray,
+        coef_var: np.ndarray,
+        lower: np.ndarray,
+        draws: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """
+        Correlated lognormal draws with the given means and coefficients of variation.
+
+        Args:
+            means: Projected values, shape (players, stats)
+            coef_var: Coefficients of variation, shape (players, stats)
+            lower: Cholesky factor of the stat correlation matrix
+            draws: Draws per player
+            rng: Random generator
+
+        Returns:
+            Array of shape (players, draws, stats)
+        """
+        normal = rng.standard_normal((means.shape[0], draws, means.shape[1])) @ lower.T
+        sigma = np.sqrt(np.log1p(coef_var**2))[:, None, :]
+        return means[:, None, :] * np.exp(sigma * normal - sigma**2 / 2)
+
+    @staticmethod
+    def _stat_matrix(frame: pd.DataFrame, stats: List[str]) -> np.ndarray:
+        """Projected values of the simulated stats; missing or negative values count as zero."""
+        values = np.column_stack(
+            [
+                frame[stat].astype(float).to_numpy()
+                if stat in frame.columns
+                else np.zeros(len(frame))
+                for stat in stats
+            ]
+        )
+        return np.clip(np.nan_to_num(values, nan=0.0), 0.0, None)
+
+    def _coefficient_matrix(
+        self,
+        frame: pd.DataFrame,
+        position: str,
+        stats: List[str],
+        overrides: Optional[Mapping[str, Mapping[str, float]]],
+    ) -> np.ndarray:
+        """Coefficients of variation per player and stat, scaled for projected games."""
+        defaults = self.variance.variance_coefficients[position]
+        coef_var = np.tile([defaults[stat] for stat in stats], (len(frame), 1))
+
+        if overrides:
+            for i, player_id in enumerate(frame["player_id"]):
+                player_coefs = overrides.get(player_id)
+                if not player_coefs:
+                    continue
+                for j, stat in enumerate(stats):
+                    if player_coefs.get(stat) is not None:
+                        coef_var[i, j] = float(player_coefs[stat])
+
+        # Same games adjustment as ProjectionVarianceService.calculate_variance
+        if "games" in frame.columns:
+            games = pd.to_numeric(frame["games"], errors="coerce").to_numpy(dtype=float)
+            games = np.where(games > 0, games, FULL_SEASON_GAMES)
+            coef_var = coef_var * np.sqrt(FULL_SEASON_GAMES / games)[:, None]
+
+        return coef_var
+
+    @staticmethod
+    def _summarize(frame: pd.DataFrame, projected: np.ndarray, points: np.ndarray) -> pd.DataFrame:
+        """Percentiles and boom/bust probabilities per projection."""
+        columns = [
+            col
+            for col in ["projection_id", "player_id", "name", "team", "position"]
+            if col in frame.columns
+        ]
+        summary = frame[columns].copy()
+        summary["projected"] = projected
+        summary["mean"] = points.mean(axis=1)
+        summary["std_dev"] = points.std(axis=1)
+        for pct in PERCENTILES:
+            summary[f"p{pct}"] = np.percentile(points, pct, axis=1) if len(points) else []
+
+        summary["boom_prob"] = (points >= projected[:, None] * BOOM_FACTOR).mean(axis=1)
+        summary["bust_prob"] = (points <= projected[:, None] * BUST_FACTOR).mean(axis=1)
+        return summary
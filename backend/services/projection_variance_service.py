@@ -1,6 +1,5 @@
-from typing import Dict, List, Optional, Tuple, Any, Union, cast
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Any, Union, cast
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 import numpy as np
 import pandas as pd
 import logging
@@ -8,7 +7,15 @@ import uuid
 from datetime import datetime
 import math
 
-from backend.database.models import Player, Projection, BaseStat, GameStats, Scenario
+from backend.database.models import (
+    GAME_STAT_COLUMNS,
+    Player,
+    Projection,
+    BaseStat,
+    Scenario,
+)
+from backend.services.scoring_service import HALF_PPR_RULES, ScoringService
+from backend.services.stat_variance_service import StatVarianceService
 from backend.services.typing import (
     StatsDict, PlayerDict, safe_float, safe_dict_get, safe_calculate, 
     VarianceCoefficientDict, ConfidenceIntervalDict, IntervalsByConfidenceDict,
@@ -17,6 +24,22 @@ from backend.services.typing import (
 
 logger = logging.getLogger(__name__)
 
+# Seasons of game logs used for historical coefficients
+HISTORY_SEASONS = 3
+
+# Games with a stat needed before the player's own coefficient replaces the default
+MIN_HISTORY_GAMES = 8
+
+# Half-PPR points per unit of the stats fantasy point variance is built from (the
+# scored stats that game logs record)
+FANTASY_POINT_WEIGHTS = {
+    stat: points
+    for stat, points in HALF_PPR_RULES.points.items()
+    if stat in GAME_STAT_COLUMNS
+}
+
+FULL_SEASON_GAMES = 17.0
+
 
 class ProjectionVarianceService:
     """Service for calculating projection variance and confidence intervals."""
@@ -257,136 +280,168 @@ class ProjectionVarianceService:
             logger.error(f"Error generating projection range: {str(e)}")
             return cast(ProjectionRangeDict, {})
 
+    async def calculate_variance_batch(
+        self,
+        season: int,
+        scenario_id: Optional[str] = None,
+        position: Optional[str] = None,
+        confidence: float = 0.80,
+        use_historical: bool = True,
+        adjust_for_games: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Variance and ranges for every projection in a season or scenario.
+
+        Same model as calculate_variance, but projections and game-log history are
+        loaded with one query each and the intervals are computed as arrays.
+
+        Args:
+            season: Projection season
+            scenario_id: Optional scenario (base projections when omitted)
+            position: Optional position filter
+            confidence: Confidence level of the lower/upper bounds (closest supported level)
+            use_historical: Whether to use historical game-to-game variance
+            adjust_for_games: Whether to adjust variance for projected games
+
+        Returns:
+            Columnar result: parallel lists per player column, and mean, std_dev,
+            lower and upper lists for half_ppr and each stat (None where a stat does
+            not apply to the player's position)
+        """
+        conf_level = min(self.confidence_z.keys(), key=lambda x: abs(x - safe_float(confidence)))
+        z_score = self.confidence_z[conf_level]
+
+        frame = ScoringService(self.db).load_frame(
+            season,
+            scenario_id,
+            with_stats=False,
+            extra_columns=["games", "half_ppr", *GAME_STAT_COLUMNS],
+        )
+        if position:
+            frame = frame[frame["position"] == position]
+        frame = frame.reset_index(drop=True)
+
+        positions = frame["position"].to_numpy()
+        historical = (
+            await self.historical_coefficients(dict(zip(frame["player_id"], positions)), season)
+            if use_historical and len(frame)
+            else {}
+        )
+
+        # Coefficient per player and stat; NaN where the position does not project the stat
+        coef_var = np.full((len(frame), len(GAME_STAT_COLUMNS)), np.nan)
+        for i, (player_id, player_position) in enumerate(zip(frame["player_id"], positions)):
+            model = historical.get(player_id) or self.variance_coefficients.get(player_position, {})
+            for j, stat in enumerate(GAME_STAT_COLUMNS):
+                if stat in model:
+                    coef_var[i, j] = model[stat]
+
+        values = frame[GAME_STAT_COLUMNS].astype(float).to_numpy()
+        applies = ~np.isnan(coef_var) & (np.nan_to_num(values) > 0)
+        std_devs = np.where(applies, values * coef_var, 0.0)
+
+        if adjust_for_games:
+            # Variance scales with sqrt(n) for independent events
+            games = pd.to_numeric(frame["games"], errors="coerce").to_numpy(dtype=float)
+            scale = np.sqrt(FULL_SEASON_GAMES / np.where(games > 0, games, FULL_SEASON_GAMES))
+            std_devs = std_devs * scale[:, None]
+
+        # Fantasy point variance per position group
+        fp_columns = [GAME_STAT_COLUMNS.index(stat) for stat in FANTASY_POINT_WEIGHTS]
+        fp_std = np.zeros(len(frame))
+        for player_position in pd.unique(positions):
+            rows = positions == player_position
+            fp_std[rows] = self._fantasy_point_std(std_devs[rows][:, fp_columns], player_position)
+
+        def interval(mean: np.ndarray, std_dev: np.ndarray, mask: np.ndarray) -> Dict[str, list]:
+            columns = {
+                "mean": mean,
+                "std_dev": std_dev,
+                "lower": np.maximum(0.0, mean - z_score * std_dev),
+                "upper": mean + z_score * std_dev,
+            }
+            return {
+                name: np.where(mask, np.round(column, 2).astype(object), None).tolist()
+                for name, column in columns.items()
+            }
+
+        half_ppr = frame["half_ppr"].astype(float).to_numpy()
+        return {
+            "season": season,
+            "scenario_id": scenario_id,
+            "confidence": f"{conf_level:.2f}",
+            "count": len(frame),
+            "players": {
+                column: frame[column].tolist()
+                for column in ["projection_id", "player_id", "name", "team", "position", "games"]
+            },
+            "half_ppr": interval(half_ppr, fp_std, np.ones(len(frame), dtype=bool)),
+            "stats": {
+                stat: interval(values[:, j], std_devs[:, j], applies[:, j])
+                for j, stat in enumerate(GAME_STAT_COLUMNS)
+                if applies[:, j].any()
+            },
+        }
+
     async def _build_historical_variance(self, player_id: str, season: int) -> VarianceCoefficientDict:
         """
         Build variance coefficients using historical game-to-game variance.
         """
+        player = None
         try:
             # Get player
             player = self.db.query(Player).get(player_id)
             if not player:
                 return {}
 
-            # Get game stats for previous seasons (up to 3 years)
-            game_stats = (
-                self.db.query(GameStats)
-                .filter(
-                    and_(
-                        GameStats.player_id == player_id,
-                        GameStats.season >= season - 3,
-                        GameStats.season < season,
-                    )
-                )
-                .all()
-            )
+            coefficients = await self.historical_coefficients({player_id: player.position}, season)
+            return coefficients[player_id]
 
-            if not game_stats:
-                # No historical data, use default coefficients
-                return cast(VarianceCoefficientDict, self.variance_coefficients.get(player.position, {}))
-
-            # Build variance model based on position
-            variance_model: VarianceCoefficientDict = {}
+        except Exception as e:
+            logger.error(f"Error building historical variance: {str(e)}")
+            position = player.position if player else None
+            return cast(VarianceCoefficientDict, dict(self.variance_coefficients.get(position, {})))
 
-            if player.position == "QB":
-                # Calculate variance for QB stats
-                pass_attempts = [
-                    float(g.stats.get("att", 0)) for g in game_stats if "att" in g.stats
-                ]
-                completions = [float(g.stats.get("cmp", 0)) for g in game_stats if "cmp" in g.stats]
-                pass_yards = [
-                    float(g.stats.get("pass_yds", 0)) for g in game_stats if "pass_yds" in g.stats
-                ]
-                pass_td = [
-                    float(g.stats.get("pass_td", 0)) for g in game_stats if "pass_td" in g.stats
-                ]
-                interceptions = [
-                    float(g.stats.get("int", 0)) for g in game_stats if "int" in g.stats
-                ]
-                rush_attempts = [
-                    float(g.stats.get("rush_att", 0)) for g in game_stats if "rush_att" in g.stats
-                ]
-                rush_yards = [
-                    float(g.stats.get("rush_yds", 0)) for g in game_stats if "rush_yds" in g.stats
-                ]
-                rush_td = [
-                    float(g.stats.get("rush_td", 0)) for g in game_stats if "rush_td" in g.stats
-                ]
+    async def historical_coefficients(
+        self, players: Mapping[str, str], season: int
+    ) -> Dict[str, VarianceCoefficientDict]:
+        """
+        Week-to-week coefficients of variation for many players at once.
 
-                # Calculate coefficient of variation (std_dev / mean) for each stat if we have enough data
-                if pass_attempts and len(pass_attempts) >= 8:
-                    variance_model["pass_attempts"] = np.std(pass_attempts) / max(
-                        1, np.mean(pass_attempts)
-                    )
-                if completions and len(completions) >= 8:
-                    variance_model["completions"] = np.std(completions) / max(
-                        1, np.mean(completions)
-                    )
-                if pass_yards and len(pass_yards) >= 8:
-                    variance_model["pass_yards"] = np.std(pass_yards) / max(1, np.mean(pass_yards))
-                if pass_td and len(pass_td) >= 8:
-                    variance_model["pass_td"] = np.std(pass_td) / max(1, np.mean(pass_td))
-                if interceptions and len(interceptions) >= 8:
-                    variance_model["interceptions"] = np.std(interceptions) / max(
-                        1, np.mean(interceptions)
-                    )
-                if rush_attempts and len(rush_attempts) >= 8:
-                    variance_model["rush_attempts"] = np.std(rush_attempts) / max(
-                        1, np.mean(rush_attempts)
-                    )
-                if rush_yards and len(rush_yards) >= 8:
-                    variance_model["rush_yards"] = np.std(rush_yards) / max(1, np.mean(rush_yards))
-                if rush_td and len(rush_td) >= 8:
-                    variance_model["rush_td"] = np.std(rush_td) / max(1, np.mean(rush_td))
-
-            elif player.position in ["RB", "WR", "TE"]:
-                # Calculate variance for RB/WR/TE stats
-                rush_attempts = [
-                    float(g.stats.get("rush_att", 0)) for g in game_stats if "rush_att" in g.stats
-                ]
-                rush_yards = [
-                    float(g.stats.get("rush_yds", 0)) for g in game_stats if "rush_yds" in g.stats
-                ]
-                rush_td = [
-                    float(g.stats.get("rush_td", 0)) for g in game_stats if "rush_td" in g.stats
-                ]
-                targets = [float(g.stats.get("tgt", 0)) for g in game_stats if "tgt" in g.stats]
-                receptions = [float(g.stats.get("rec", 0)) for g in game_stats if "rec" in g.stats]
-                rec_yards = [
-                    float(g.stats.get("rec_yds", 0)) for g in game_stats if "rec_yds" in g.stats
-                ]
-                rec_td = [
-                    float(g.stats.get("rec_td", 0)) for g in game_stats if "rec_td" in g.stats
-                ]
+        Reads each player's count, mean and mean square per stat over the previous
+        HISTORY_SEASONS seasons from the moments the import pipeline stores. Stats with
+        fewer than MIN_HISTORY_GAMES games fall back to the position default.
 
-                # Calculate coefficient of variation for each stat if we have enough data
-                if rush_attempts and len(rush_attempts) >= 8:
-                    variance_model["rush_attempts"] = np.std(rush_attempts) / max(
-                        1, np.mean(rush_attempts)
-                    )
-                if rush_yards and len(rush_yards) >= 8:
-                    variance_model["rush_yards"] = np.std(rush_yards) / max(1, np.mean(rush_yards))
-                if rush_td and len(rush_td) >= 8:
-                    variance_model["rush_td"] = np.std(rush_td) / max(1, np.mean(rush_td))
-                if targets and len(targets) >= 8:
-                    variance_model["targets"] = np.std(targets) / max(1, np.mean(targets))
-                if receptions and len(receptions) >= 8:
-                    variance_model["receptions"] = np.std(receptions) / max(1, np.mean(receptions))
-                if rec_yards and len(rec_yards) >= 8:
-                    variance_model["rec_yards"] = np.std(rec_yards) / max(1, np.mean(rec_yards))
-                if rec_td and len(rec_td) >= 8:
-                    variance_model["rec_td"] = np.std(rec_td) / max(1, np.mean(rec_td))
-
-            # Fill in gaps with default coefficients
-            default_coefs = self.variance_coefficients.get(player.position, {})
-            for stat, coef in default_coefs.items():
-                if stat not in variance_model:
-                    variance_model[stat] = coef
-
-            return variance_model
+        Args:
+            players: Player ID -> position
+            season: Season being projected (its own games are excluded)
 
-        except Exception as e:
-            logger.error(f"Error building historical variance: {str(e)}")
-            return cast(VarianceCoefficientDict, self.variance_coefficients.get(player.position, {}))
+        Returns:
+            Player ID -> coefficients for the position's stats
+        """
+        history = self._history_moments(list(players), season)
+
+        result: Dict[str, VarianceCoefficientDict] = {}
+        for player_id, position in players.items():
+            defaults = self.variance_coefficients.get(position, {})
+            model = cast(VarianceCoefficientDict, dict(defaults))
+            if player_id in history.index:
+                row = history.loc[player_id]
+                for stat in defaults:
+                    if row[f"{stat}_n"] >= MIN_HISTORY_GAMES:
+                        mean = row[f"{stat}_mean"]
+                        std_dev = math.sqrt(max(row[f"{stat}_sq"] - mean**2, 0.0))
+                        model[stat] = std_dev / max(1.0, mean)
+            result[player_id] = model
+        return result
+
+    def _history_moments(self, player_ids: Sequence[str], season: int) -> pd.DataFrame:
+        """
+        Per-player game count, mean and mean square of every GAME_STAT_COLUMNS stat over
+        the HISTORY_SEASONS seasons before a season, read from the stored moments.
+        """
+        seasons = range(season - HISTORY_SEASONS, season)
+        return StatVarianceService(self.db).moments(player_ids, seasons)
 
     async def _calculate_fantasy_point_variance(
         self, projection: Projection, stat_variances: VarianceResultDict, position: str
@@ -395,53 +450,18 @@ class ProjectionVarianceService:
         Calculate variance for fantasy points based on component stat variances.
         This accounts for correlations between stats.
         """
-        # Define fantasy point weights in half PPR
-        fp_weights = {
-            "pass_yards": 0.04,  # 1 per 25 yards
-            "pass_td": 4.0,
-            "interceptions": -2.0,
-            "rush_yards": 0.1,  # 1 per 10 yards
-            "rush_td": 6.0,
-            "receptions": 0.5,  # Half PPR
-            "rec_yards": 0.1,  # 1 per 10 yards
-            "rec_td": 6.0,
-        }
-
         # Base fantasy point calculation
         fp_base = projection.half_ppr
 
-        # Calculate variance components and correlations
-        variance_sum = 0.0
-
-        # Define correlation matrix based on position
-        correlations = self._get_stat_correlations(position)
-
-        # Add variance contribution from each stat
-        for stat1, weight1 in fp_weights.items():
-            if stat1 not in stat_variances:
-                continue
-
-            var1 = stat_variances[stat1]["std_dev"] ** 2
-            variance_sum += (weight1**2) * var1
-
-            # Add covariance terms
-            for stat2, weight2 in fp_weights.items():
-                if stat1 >= stat2 or stat2 not in stat_variances:
-                    continue
-
-                # Get correlation between stat1 and stat2
-                corr = correlations.get((stat1, stat2), 0.0)
-
-                # Calculate covariance term
-                std_dev1 = safe_float(stat_variances[stat1]["std_dev"])
-                std_dev2 = safe_float(stat_variances[stat2]["std_dev"])
-                covariance = corr * std_dev1 * std_dev2
-
-                # Add to variance sum (twice for each pair)
-                variance_sum += 2 * safe_float(weight1) * safe_float(weight2) * covariance
-
-        # Calculate standard deviation of fantasy points
-        fp_std_dev = math.sqrt(max(0, variance_sum))
+        std_devs = np.array(
+            [
+                [
+                    safe_float(stat_variances[stat]["std_dev"]) if stat in stat_variances else 0.0
+                    for stat in FANTASY_POINT_WEIGHTS
+                ]
+            ]
+        )
+        fp_std_dev = float(self._fantasy_point_std(std_devs, position)[0])
 
         # Calculate confidence intervals
         intervals: IntervalsByConfidenceDict = {}
@@ -642,3 +662,41 @@ class ProjectionVarianceService:
             }
 
         return {}
+
+    def correlation_matrix(self, position: str, stats: List[str]) -> np.ndarray:
+        """
+        Correlation matrix over the given stats for a position.
+
+        The pairwise correlations are not always jointly consistent, so a matrix that
+        is not positive definite is replaced by the nearest one with a unit diagonal.
+        """
+        index = {stat: i for i, stat in enumerate(stats)}
+        matrix = np.eye(len(stats))
+        for (stat1, stat2), corr in self._get_stat_correlations(position).items():
+            if stat1 in index and stat2 in index:
+                matrix[index[stat1], index[stat2]] = corr
+                matrix[index[stat2], index[stat1]] = corr
+
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        if eigenvalues.min() <= 0:
+            clipped = np.clip(eigenvalues, 1e-6, None)
+            matrix = (eigenvectors * clipped) @ eigenvectors.T
+            scale = np.sqrt(np.diag(matrix))
+            matrix = matrix / np.outer(scale, scale)
+        return matrix
+
+    def _fantasy_point_std(self, std_devs: np.ndarray, position: str) -> np.ndarray:
+        """
+        Fantasy point standard deviation from correlated stat standard deviations.
+
+        Args:
+            std_devs: Stat standard deviations, shape (players, FANTASY_POINT_WEIGHTS)
+            position: Position whose correlations apply
+
+        Returns:
+            Standard deviation per player
+        """
+        weighted = std_devs * np.array(list(FANTASY_POINT_WEIGHTS.values()))
+        correlations = self.correlation_matrix(position, list(FANTASY_POINT_WEIGHTS))
+        variance = np.einsum("pi,ij,pj->p", weighted, correlations, weighted)
+        return np.sqrt(np.clip(variance, 0.0, None))
@@ -1,14 +1,29 @@
 from typing import Dict, List, Optional, Any, Tuple, Union, cast
 from sqlalchemy.orm import Session, joinedload, contains_eager
-from sqlalchemy import and_, or_, desc, func, text
+from sqlalchemy import and_, or_, desc, text
 import logging
 from datetime import datetime
 import asyncio
 import pandas as pd
 
-from backend.database.models import Player, Projection, BaseStat, GameStats, Scenario
-from backend.services.cache_service import get_cache
+from backend.database.executor import run_in_db_thread, run_in_own_session
+from backend.database.models import (
+    GAME_STAT_COLUMNS,
+    BaseStat,
+    GameStats,
+    Player,
+    Projection,
+    Scenario,
+)
+from backend.services.cache_service import (
+    PLAYERS_TAG,
+    STATS_TAG,
+    get_cache,
+    player_tag,
+    scenario_tag,
+)
 from backend.services.active_player_service import ActivePlayerService
+from backend.services.season_stats_service import SeasonStatsService
 from backend.services.typing import (
     safe_float, safe_dict_get, 
     PlayerQueryResultDict, QueryResultDict, PlayerProjectionDataDict
@@ -16,6 +31,9 @@ from backend.services.typing import (
 
 logger = logging.getLogger(__name__)
 
+# Cached query results are invalidated by tag on every write, so they can live longer
+QUERY_CACHE_TTL = 1800
+
 
 class QueryService:
     """Service for optimized database queries and player listings."""
@@ -64,11 +82,43 @@ class QueryService:
             active_only=active_only,
         )
 
-        # Check cache
-        cached_result = self.cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        # Pages ordered by projected points shift with any base projection write
+        def tags(result: Tuple[List[PlayerQueryResultDict], int]) -> List[str]:
+            extra = [PLAYERS_TAG]
+            if sort_by == "fantasy_points" and include_projections:
+                extra.append(scenario_tag(None))
+            return self._player_tags([p["player_id"] for p in result[0]], *extra)
+
+        # Concurrent misses on the same key share one query, run off the event loop. A
+        # stale page is refreshed after the request's Session is closed, on one of its own
+        return await self.cache.get_or_compute_async(
+            cache_key,
+            lambda: run_in_db_thread(
+                self.db, self._query_player_listing,
+                filters, include_projections, include_stats, page, page_size,
+                sort_by, sort_dir, active_only,
+            ),
+            QUERY_CACHE_TTL,
+            tags=tags,
+            refresh=lambda: run_in_own_session(
+                self, "_query_player_listing",
+                filters, include_projections, include_stats, page, page_size,
+                sort_by, sort_dir, active_only,
+            ),
+        )
 
+    def _query_player_listing(
+        self,
+        filters: Optional[Dict[str, Any]],
+        include_projections: bool,
+        include_stats: bool,
+        page: int,
+        page_size: int,
+        sort_by: str,
+        sort_dir: str,
+        active_only: bool,
+    ) -> Tuple[List[PlayerQueryResultDict], int]:
+        """Build one page of the player listing (uncached, blocking)."""
         # Start building query
         query = self.db.query(Player)
 
@@ -82,23 +132,6 @@ class QueryService:
                 ),
             ).options(contains_eager(Player.projections))
 
-        if include_stats:
-            # Join the most recent season's base stats
-            subquery = (
-                self.db.query(BaseStat.player_id, func.max(BaseStat.season).label("latest_season"))
-                .group_by(BaseStat.player_id)
-                .subquery()
-            )
-
-            query = query.outerjoin(
-                BaseStat,
-                and_(
-                    BaseStat.player_id == Player.player_id,
-                    BaseStat.season == subquery.c.latest_season,
-                    BaseStat.week == None,  # Only season totals
-                ),
-            ).options(contains_eager(Player.base_stats))
-
         # Apply filters
         if filters:
             if "name" in filters:
@@ -205,6 +238,15 @@ class QueryService:
                 # Log error but continue with unfiltered players
                 logger.error(f"Error filtering active players: {str(e)}")
         
+        # Latest season totals for the page, one row per player
+        latest_stats = (
+            SeasonStatsService(self.db).get_latest_season_stats(
+                [p.player_id for p in filtered_players]
+            )
+            if include_stats
+            else {}
+        )
+
         # Format result
         result: List[PlayerQueryResultDict] = []
         for player in filtered_players:
@@ -246,21 +288,18 @@ class QueryService:
                     player_data["projection"] = projection_data
 
             if include_stats:
-                # Process base stats
+                # Most recent season's totals
                 stats_data: Dict[str, Dict[str, float]] = {}
-                for stat in player.base_stats:
-                    season_str = str(stat.season)
-                    if season_str not in stats_data:
-                        stats_data[season_str] = {}
-                    stats_data[season_str][stat.stat_type] = safe_float(stat.value)
+                if player.player_id in latest_stats:
+                    latest_season, season_totals = latest_stats[player.player_id]
+                    stats_data[str(latest_season)] = {
+                        stat_type: safe_float(value) for stat_type, value in season_totals.items()
+                    }
 
                 player_data["stats"] = stats_data
 
             result.append(player_data)
 
-        # Cache the result
-        self.cache.set(cache_key, (result, total_count), 300)  # 5 minute cache
-
         return result, total_count
 
     async def search_players(
@@ -284,11 +323,23 @@ class QueryService:
             active_only=active_only
         )
 
-        # Check cache
-        cached_result = self.cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        # Concurrent misses on the same key share one query, run off the event loop
+        return await self.cache.get_or_compute_async(
+            cache_key,
+            lambda: run_in_db_thread(
+                self.db, self._query_player_search, search_term, position, limit, active_only
+            ),
+            QUERY_CACHE_TTL,
+            tags=lambda result: self._player_tags([p["player_id"] for p in result], PLAYERS_TAG),
+            refresh=lambda: run_in_own_session(
+                self, "_query_player_search", search_term, position, limit, active_only
+            ),
+        )
 
+    def _query_player_search(
+        self, search_term: str, position: Optional[str], limit: int, active_only: bool
+    ) -> List[PlayerQueryResultDict]:
+        """Run a player name search (uncached, blocking)."""
         # Build query for partial name matching
         query = self.db.query(Player).filter(Player.name.ilike(f"%{search_term}%"))
 
@@ -357,9 +408,6 @@ class QueryService:
             for player in filtered_players
         ]
 
-        # Cache the result
-        self.cache.set(cache_key, result, 300)  # 5 minute cache
-
         return result
 
     async def get_player_stats_optimized(
@@ -378,11 +426,19 @@ class QueryService:
         # Build cache key
         cache_key = self.cache.cache_key("player_stats", player_id=player_id, seasons=seasons)
 
-        # Check cache
-        cached_result = self.cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        # Concurrent misses on the same key share one query, run off the event loop
+        return await self.cache.get_or_compute_async(
+            cache_key,
+            lambda: run_in_db_thread(self.db, self._query_player_stats, player_id, seasons),
+            QUERY_CACHE_TTL,
+            tags=[player_tag(player_id)],
+            refresh=lambda: run_in_own_session(self, "_query_player_stats", player_id, seasons),
+        )
 
+    def _query_player_stats(
+        self, player_id: str, seasons: Optional[List[int]]
+    ) -> Dict[str, Any]:
+        """Load a player's stats by season (uncached, blocking)."""
         # Get player info
         player = self.db.query(Player).get(player_id)
         if not player:
@@ -461,9 +517,6 @@ class QueryService:
             "stats": stats_by_season,
         }
 
-        # Cache the result
-        self.cache.set(cache_key, result, 300)  # 5 minute cache
-
         return result
 
     async def get_available_seasons(self, player_id: Optional[str] = None) -> List[int]:
@@ -479,11 +532,17 @@ class QueryService:
         # Build cache key
         cache_key = self.cache.cache_key("available_seasons", player_id=player_id)
 
-        # Check cache
-        cached_result = self.cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        # Concurrent misses on the same key share one query, run off the event loop
+        return await self.cache.get_or_compute_async(
+            cache_key,
+            lambda: run_in_db_thread(self.db, self._query_available_seasons, player_id),
+            3600,  # 1 hour cache
+            tags=[player_tag(player_id)] if player_id else [STATS_TAG],
+            refresh=lambda: run_in_own_session(self, "_query_available_seasons", player_id),
+        )
 
+    def _query_available_seasons(self, player_id: Optional[str]) -> List[int]:
+        """Seasons with stats, newest first (uncached, blocking)."""
         # Build query
         if player_id:
             # Get seasons for a specific player
@@ -500,9 +559,6 @@ class QueryService:
         # Sort in descending order (newest first)
         seasons.sort(reverse=True)
 
-        # Cache the result
-        self.cache.set(cache_key, seasons, 3600)  # 1 hour cache
-
         return seasons
 
     async def compare_players(
@@ -530,11 +586,23 @@ class QueryService:
             stats=",".join(stats) if stats else "all",
         )
 
-        # Check cache
-        cached_result = self.cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        # Concurrent misses on the same key share one query, run off the event loop
+        return await self.cache.get_or_compute_async(
+            cache_key,
+            lambda: run_in_db_thread(
+                self.db, self._query_player_comparison, player_ids, season, stats
+            ),
+            QUERY_CACHE_TTL,
+            tags=self._player_tags(player_ids),
+            refresh=lambda: run_in_own_session(
+                self, "_query_player_comparison", player_ids, season, stats
+            ),
+        )
 
+    def _query_player_comparison(
+        self, player_ids: List[str], season: Optional[int], stats: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build the side-by-side comparison of several players (uncached, blocking)."""
         # Get players
         players = self.db.query(Player).filter(Player.player_id.in_(player_ids)).all()
 
@@ -549,6 +617,15 @@ class QueryService:
 
         projections = projections_query.all()
 
+        # Season totals for every compared player in one query
+        season_stats = (
+            SeasonStatsService(self.db).get_season_stats_map(
+                season, [player.player_id for player in players]
+            )
+            if season
+            else {}
+        )
+
         # Organize data by player
         player_data = []
 
@@ -616,19 +693,7 @@ class QueryService:
 
             # Get player stats if a season is specified
             if season:
-                base_stats = (
-                    self.db.query(BaseStat)
-                    .filter(
-                        BaseStat.player_id == player.player_id,
-                        BaseStat.season == season,
-                        BaseStat.week == None,  # Season totals only
-                    )
-                    .all()
-                )
-
-                # Format stats into a dictionary
-                for stat in base_stats:
-                    player_info["stats"][stat.stat_type] = stat.value
+                player_info["stats"].update(season_stats.get(player.player_id, {}))
 
             player_data.append(player_info)
 
@@ -642,9 +707,6 @@ class QueryService:
         # Create final result
         result = {"players": player_data, "stats": sorted(list(comparison_stats))}
 
-        # Cache the result
-        self.cache.set(cache_key, result, 300)  # 5 minute cache
-
         return result
 
     async def get_player_trends(
@@ -669,19 +731,46 @@ class QueryService:
             stats=",".join(stats) if stats else "all",
         )
 
-        # Check cache
-        cached_result = self.cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        # Concurrent misses on the same key share one query, run off the event loop
+        return await self.cache.get_or_compute_async(
+            cache_key,
+            lambda: run_in_db_thread(
+                self.db, self._query_player_trends, player_id, season, stats
+            ),
+            QUERY_CACHE_TTL,
+            tags=[player_tag(player_id)],
+            refresh=lambda: run_in_own_session(
+                self, "_query_player_trends", player_id, season, stats
+            ),
+        )
 
+    def _query_player_trends(
+        self, player_id: str, season: Optional[int], stats: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build a player's weekly trend data (uncached, blocking)."""
         # Get player
         player = self.db.query(Player).get(player_id)
         if not player:
             return {}
 
+        # Requests limited to stat columns never touch the stats JSON
+        typed_stats = bool(stats) and all(stat in GAME_STAT_COLUMNS for stat in stats)
+        stat_columns = (
+            [getattr(GameStats, stat) for stat in stats] if typed_stats else [GameStats.stats]
+        )
+
         # Get game stats
         game_stats_query = (
-            self.db.query(GameStats)
+            self.db.query(
+                GameStats.season,
+                GameStats.week,
+                GameStats.opponent,
+                GameStats.game_location,
+                GameStats.result,
+                GameStats.team_score,
+                GameStats.opponent_score,
+                *stat_columns,
+            )
             .filter(GameStats.player_id == player_id)
             .order_by(GameStats.season, GameStats.week)
         )
@@ -717,8 +806,14 @@ class QueryService:
                 "stats": {},
             }
 
-            # Add stats from JSON
-            for stat_name, stat_value in game.stats.items():
+            if typed_stats:
+                game_values = {
+                    stat: getattr(game, stat) for stat in stats if getattr(game, stat) is not None
+                }
+            else:
+                game_values = game.stats
+
+            for stat_name, stat_value in game_values.items():
                 # Filter to requested stats if provided
                 if stats and stat_name not in stats:
                     continue
@@ -763,11 +858,13 @@ class QueryService:
                     else:
                         stat_values[i]["trend"] = "neutral"  # Not enough data
 
-        # Cache the result
-        self.cache.set(cache_key, trend_data, 300)  # 5 minute cache
-
         return trend_data
 
+    @staticmethod
+    def _player_tags(player_ids: List[str], *extra: str) -> List[str]:
+        """Cache tags for a result built from the given players."""
+        return [player_tag(player_id) for player_id in player_ids] + list(extra)
+
     async def get_player_watchlist(
         self, user_id: str, filters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
@@ -820,11 +917,31 @@ class QueryService:
             page_size=page_size,
         )
 
-        # Check cache
-        cached_result = self.cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        # Concurrent misses on the same key share one query, run off the event loop
+        return await self.cache.get_or_compute_async(
+            cache_key,
+            lambda: run_in_db_thread(
+                self.db, self._query_advanced_search,
+                search_term, filters, sort_by, sort_dir, page, page_size,
+            ),
+            QUERY_CACHE_TTL,
+            tags=lambda result: self._player_tags([p["player_id"] for p in result[0]], PLAYERS_TAG),
+            refresh=lambda: run_in_own_session(
+                self, "_query_advanced_search",
+                search_term, filters, sort_by, sort_dir, page, page_size,
+            ),
+        )
 
+    def _query_advanced_search(
+        self,
+        search_term: Optional[str],
+        filters: Optional[Dict[str, Any]],
+        sort_by: str,
+        sort_dir: str,
+        page: int,
+        page_size: int,
+    ) -> Tuple[List[PlayerQueryResultDict], int]:
+        """Run one page of the advanced player search (uncached, blocking)."""
         # Start building query
         query = self.db.query(Player)
 
@@ -940,7 +1057,4 @@ class QueryService:
 
             result.append(player_data)
 
-        # Cache the result
-        self.cache.set(cache_key, (result, total_count), 300)  # 5 minute cache
-
         return result, total_count
@@ -9,6 +9,7 @@ from pathlib import Path
 from datetime import datetime
 
 from backend.database.models import Player, Projection, TeamStat, Scenario, RookieProjectionTemplate
+from backend.services.scenario_delta_service import ScenarioDeltaService
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,7 @@ class RookieProjectionService:
 
     def __init__(self, db: Session):
         self.db = db
+        self.scenario_deltas = ScenarioDeltaService(db)
         self.rookie_comp_model = {
             "QB": {
                 "high": {
@@ -305,18 +307,28 @@ class RookieProjectionService:
         """
         Create or update a projection for a rookie player.
         """
-        # Check if projection already exists
-        projection = (
-            self.db.query(Projection)
-            .filter(
-                and_(
-                    Projection.player_id == player.player_id,
-                    Projection.season == season,
-                    Projection.scenario_id == scenario_id,
+        # Check if projection already exists (through the base chain for a scenario)
+        if scenario_id:
+            projection = next(
+                iter(
+                    self.scenario_deltas.resolve_projections(
+                        scenario_id, season=season, player_ids=[player.player_id]
+                    )
+                ),
+                None,
+            )
+        else:
+            projection = (
+                self.db.query(Projection)
+                .filter(
+                    and_(
+                        Projection.player_id == player.player_id,
+                        Projection.season == season,
+                        Projection.scenario_id.is_(None),
+                    )
                 )
+                .first()
             )
-            .first()
-        )
 
         # Use rookie data for initial projection
         projected_stats = rookie_data.get("projected_stats", {})
@@ -445,6 +457,10 @@ class RookieProjectionService:
         # Calculate fantasy points
         projection.half_ppr = projection.calculate_fantasy_points()
 
+        # Inherited scenario projections are stored as deltas
+        if scenario_id and self.scenario_deltas.is_inherited(projection):
+            self.scenario_deltas.save_projections(scenario_id, [projection])
+
         return projection
 
     async def _enhance_with_comp_model(
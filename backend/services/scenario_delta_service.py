@@ -0,0 +1,585 @@
+"""
+Copy-on-write resolution of scenario projections.
+
+A scenario cloned from a base scenario starts out with no rows of its own. Its
+projections resolve through the base_scenario_id chain: the nearest scenario that owns
+a Projection row for a player supplies the values, and every ProjectionDelta further
+down the chain overlays the fields it changed.
+
+Base projections (no scenario) sit below the root of every chain, but a scenario only
+includes a base player once it holds a delta for them, so a root scenario stays a
+selection of players rather than a copy of the whole base set. seed_from_base adds
+those deltas (empty ones are kept as seeds).
+
+Inherited projections are returned as transient Projection objects with a virtual
+projection_id ("<scenario_id>:<source projection_id>"). Writing one back with
+save_projections stores only the fields that differ from the base; materialize_projection
+turns it into a real row when something needs to reference it (e.g. a StatOverride).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, func
+from datetime import datetime
+import uuid
+import logging
+
+import numpy as np
+
+from backend.database.models import Player, Projection, ProjectionDelta, Scenario, StatOverride
+
+logger = logging.getLogger(__name__)
+
+# Columns that identify a projection rather than hold projected values
+PROJECTION_IDENTITY_COLUMNS = {
+    "projection_id",
+    "player_id",
+    "scenario_id",
+    "season",
+    "created_at",
+    "updated_at",
+}
+
+# Every projection column a scenario may change
+PROJECTION_VALUE_COLUMNS = [
+    column.name
+    for column in Projection.__table__.columns
+    if column.name not in PROJECTION_IDENTITY_COLUMNS
+]
+
+VIRTUAL_ID_SEPARATOR = ":"
+
+ProjectionKey = Tuple[str, int]  # (player_id, season)
+
+# Chain level of the base projections, below the root scenario
+BASE_LEVEL = -1
+
+
+def virtual_projection_id(scenario_id: str, source_projection_id: str) -> str:
+    """Projection ID under which a scenario exposes a projection it inherits."""
+    return f"{scenario_id}{VIRTUAL_ID_SEPARATOR}{source_projection_id}"
+
+
+def parse_virtual_projection_id(projection_id: str) -> Optional[Tuple[str, str]]:
+    """Split a virtual projection ID into (scenario_id, source projection_id)."""
+    if not projection_id or VIRTUAL_ID_SEPARATOR not in projection_id:
+        return None
+    scenario_id, source_projection_id = projection_id.split(VIRTUAL_ID_SEPARATOR, 1)
+    return scenario_id, source_projection_id
+
+
+def _json_value(value: Any) -> Any:
+    """Plain Python value for a delta's JSON column."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class ScenarioDeltaService:
+    """
+    Reads and writes scenario projections as deltas from their base scenario.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        # Virtual projection ID -> values inherited from the base, used to diff on save
+        self._base_values: Dict[str, Dict[str, Any]] = {}
+        # Virtual IDs of base projections only the scenario's own delta seeds
+        self._seeded: Set[str] = set()
+
+    def scenario_chain(self, scenario_id: str) -> List[str]:
+        """
+        Scenario IDs from the root of the base_scenario_id chain down to the scenario.
+
+        A cycle in the chain is cut at the first repeated scenario.
+        """
+        chain: List[str] = []
+        current: Optional[str] = scenario_id
+        while current and current not in chain:
+            chain.append(current)
+            current = (
+                self.db.query(Scenario.base_scenario_id)
+                .filter(Scenario.scenario_id == current)
+                .scalar()
+            )
+        return list(reversed(chain))
+
+    def resolve_projections(
+        self,
+        scenario_id: str,
+        season: Optional[int] = None,
+        player_ids: Optional[Iterable[str]] = None,
+        position: Optional[str] = None,
+        team: Optional[str] = None,
+    ) -> List[Projection]:
+        """
+        Effective projections of a scenario.
+
+        Rows the scenario owns are returned as they are; inherited projections (from
+        the chain, or from the base projections for players seeded by a delta) are
+        returned as transient Projection objects with virtual IDs and their deltas applied.
+
+        Args:
+            scenario_id: Scenario ID
+            season: Optional season filter
+            player_ids: Optional player filter
+            position: Optional position filter
+            team: Optional team filter
+
+        Returns:
+            List of Projection objects, one per player and season
+        """
+        chain = self.scenario_chain(scenario_id)
+        player_ids = list(player_ids) if player_ids is not None else None
+
+        row_query = self._filtered(
+            self.db.query(Projection).options(selectinload(Projection.player)),
+            Projection,
+            chain,
+            season,
+            player_ids,
+            position,
+            team,
+        )
+        owned_rows = row_query.all()
+
+        levels = {chain_id: level for level, chain_id in enumerate(chain)}
+        deltas: Dict[ProjectionKey, Dict[int, ProjectionDelta]] = {}
+        delta_query = self._filtered(
+            self.db.query(ProjectionDelta), ProjectionDelta, chain, season, player_ids, position, team
+        )
+        for delta in delta_query.all():
+            deltas.setdefault((delta.player_id, delta.season), {})[levels[delta.scenario_id]] = delta
+
+        if len(chain) == 1 and not deltas:
+            return owned_rows
+
+        rows: Dict[ProjectionKey, Dict[int, Projection]] = {}
+        for row in owned_rows:
+            rows.setdefault((row.player_id, row.season), {})[levels[row.scenario_id]] = row
+
+        # Players no scenario in the chain owns resolve from the base projections
+        for key, row in self._base_rows([key for key in deltas if key not in rows]).items():
+            rows[key] = {BASE_LEVEL: row}
+
+        leaf = len(chain) - 1
+        projections: List[Projection] = []
+        for key, owned in rows.items():
+            top = max(owned)
+            source = owned[top]
+            if top == leaf:
+                projections.append(source)
+                continue
+
+            values = {column: getattr(source, column) for column in PROJECTION_VALUE_COLUMNS}
+            updated_at = source.updated_at
+            for level in range(top + 1, len(chain)):
+                if level == leaf:
+                    base_values = dict(values)
+                delta = deltas.get(key, {}).get(level)
+                if delta:
+                    values.update(
+                        (field, value)
+                        for field, value in (delta.changes or {}).items()
+                        if field in values
+                    )
+                    updated_at = max(updated_at, delta.updated_at) if updated_at else delta.updated_at
+
+            projection = Projection(
+                projection_id=virtual_projection_id(scenario_id, source.projection_id),
+                player_id=source.player_id,
+                scenario_id=scenario_id,
+                season=source.season,
+                created_at=source.created_at,
+                updated_at=updated_at,
+                **values,
+            )
+            # Attach the player without cascading the transient copy into the session
+            set_committed_value(projection, "player", source.player)
+            self._base_values[projection.projection_id] = base_values
+            if top == BASE_LEVEL and min(deltas[key]) == leaf:
+                self._seeded.add(projection.projection_id)
+            projections.append(projection)
+
+        return projections
+
+    def resolve_projection(self, projection_id: str) -> Optional[Projection]:
+        """Look up a projection by real or virtual ID."""
+        parsed = parse_virtual_projection_id(projection_id)
+        if not parsed:
+            return self.db.get(Projection, projection_id)
+
+        scenario_id, source_projection_id = parsed
+        source = self.db.get(Projection, source_projection_id)
+        if not source:
+            return None
+
+        matches = self.resolve_projections(
+            scenario_id, season=source.season, player_ids=[source.player_id]
+        )
+        return matches[0] if matches else None
+
+    def is_inherited(self, projection: Projection) -> bool:
+        """Whether a projection was resolved from the base and is not a stored row."""
+        return projection.projection_id in self._base_values
+
+    def save_projections(self, scenario_id: str, projections: Iterable[Projection]) -> int:
+        """
+        Store the changes made to resolved projections as deltas.
+
+        Rows the scenario owns are flushed with the session as usual; inherited
+        projections keep only the fields that differ from the base.
+
+        Args:
+            scenario_id: Scenario the projections were resolved for
+            projections: Projections returned by resolve_projections
+
+        Returns:
+            Number of inherited projections written back
+        """
+        written = 0
+        for projection in projections:
+            base_values = self._base_values.get(projection.projection_id)
+            if base_values is None or projection.scenario_id != scenario_id:
+                continue
+
+            changes = {
+                column: _json_value(getattr(projection, column))
+                for column in PROJECTION_VALUE_COLUMNS
+                if getattr(projection, column) != base_values.get(column)
+            }
+            self._write_delta(
+                scenario_id,
+                projection.player_id,
+                projection.season,
+                changes,
+                keep_empty=projection.projection_id in self._seeded,
+            )
+            written += 1
+
+        self.db.flush()
+        return written
+
+    def materialize_projection(self, projection_id: str) -> Optional[Projection]:
+        """
+        Give a scenario its own row for an inherited projection.
+
+        The row takes the resolved values and a copy of the source row's overrides; the
+        scenario's delta for the player is folded into it. Real rows are returned as is.
+
+        Args:
+            projection_id: Real or virtual projection ID
+
+        Returns:
+            Stored Projection object or None if not found
+        """
+        projection = self.resolve_projection(projection_id)
+        if projection is None or not self.is_inherited(projection):
+            return projection
+
+        scenario_id, source_projection_id = parse_virtual_projection_id(projection.projection_id)
+        row = self.copy_projection(projection, scenario_id, source_projection_id)
+        self.db.query(ProjectionDelta).filter(
+            and_(
+                ProjectionDelta.scenario_id == scenario_id,
+                ProjectionDelta.player_id == projection.player_id,
+                ProjectionDelta.season == projection.season,
+            )
+        ).delete(synchronize_session=False)
+        self._base_values.pop(projection.projection_id, None)
+        self._seeded.discard(projection.projection_id)
+
+        self.db.flush()
+        return row
+
+    def seed_from_base(
+        self, scenario_id: str, player_ids: Iterable[str], season: Optional[int] = None
+    ) -> int:
+        """
+        Include base projections in a scenario without copying them.
+
+        Players the scenario does not already resolve get an empty delta over their
+        base projection (the newest one when no season is given).
+
+        Args:
+            scenario_id: Scenario ID
+            player_ids: Players to include
+            season: Optional season (default: each player's newest base projection)
+
+        Returns:
+            Number of players seeded
+        """
+        player_ids = list(player_ids)
+        query = self.db.query(Projection.player_id, Projection.season).filter(
+            and_(Projection.scenario_id.is_(None), Projection.player_id.in_(player_ids))
+        )
+        if season is not None:
+            query = query.filter(Projection.season == season)
+        base_keys: Dict[str, int] = {}
+        for player_id, row_season in query.order_by(Projection.created_at):
+            base_keys[player_id] = row_season
+
+        resolved = {
+            (p.player_id, p.season)
+            for p in self.resolve_projections(scenario_id, season=season, player_ids=player_ids)
+        }
+        seeded = 0
+        for player_id, row_season in base_keys.items():
+            if (player_id, row_season) not in resolved:
+                self._write_delta(scenario_id, player_id, row_season, {}, keep_empty=True)
+                seeded += 1
+
+        self.db.flush()
+        return seeded
+
+    def rebase_children(self, scenario_id: str) -> int:
+        """
+        Re-point the scenarios based on a scenario at its own base, keeping their values.
+
+        Called before the scenario is deleted. Rows the scenario owns are copied into each
+        child that inherits them; its deltas are merged under the child's own deltas.
+
+        Args:
+            scenario_id: Scenario about to be removed from the chain
+
+        Returns:
+            Number of child scenarios rebased
+        """
+        scenario = self.db.get(Scenario, scenario_id)
+        children = (
+            self.db.query(Scenario).filter(Scenario.base_scenario_id == scenario_id).all()
+        )
+        if not scenario or not children:
+            return 0
+
+        rows = {
+            (row.player_id, row.season): row
+            for row in self.db.query(Projection).filter(Projection.scenario_id == scenario_id)
+        }
+        deltas = {
+            (delta.player_id, delta.season): delta
+            for delta in self.db.query(ProjectionDelta).filter(
+                ProjectionDelta.scenario_id == scenario_id
+            )
+        }
+
+        for child in children:
+            child_rows = {
+                (player_id, season)
+                for player_id, season in self.db.query(
+                    Projection.player_id, Projection.season
+                ).filter(Projection.scenario_id == child.scenario_id)
+            }
+            child_deltas = {
+                (delta.player_id, delta.season): delta
+                for delta in self.db.query(ProjectionDelta).filter(
+                    ProjectionDelta.scenario_id == child.scenario_id
+                )
+            }
+
+            for key, row in rows.items():
+                if key in child_rows:
+                    continue
+                copy = self.copy_projection(row, child.scenario_id)
+                child_delta = child_deltas.pop(key, None)
+                if child_delta:
+                    for field, value in (child_delta.changes or {}).items():
+                        if field in PROJECTION_VALUE_COLUMNS:
+                            setattr(copy, field, value)
+                    self.db.delete(child_delta)
+
+            for key, delta in deltas.items():
+                if key in child_rows or key in rows:
+                    continue
+                child_delta = child_deltas.get(key)
+                merged = {**(delta.changes or {}), **(child_delta.changes if child_delta else {})}
+                # An empty merge still seeds base projections into the child
+                self._write_delta(child.scenario_id, key[0], key[1], merged, keep_empty=True)
+
+            child.base_scenario_id = scenario.base_scenario_id
+
+        self.db.flush()
+        return len(children)
+
+    def fingerprint(self, scenario_id: str, season: int) -> Tuple[Any, ...]:
+        """Cheap aggregate that changes whenever any scenario in the chain is written to."""
+        chain = self.scenario_chain(scenario_id)
+        count, last_update, total = (
+            self.db.query(
+                func.count(Projection.projection_id),
+                func.max(Projection.updated_at),
+                func.sum(Projection.half_ppr),
+            )
+            .filter(and_(Projection.scenario_id.in_(chain), Projection.season == season))
+            .one()
+        )
+        delta_count, delta_update = (
+            self.db.query(func.count(ProjectionDelta.delta_id), func.max(ProjectionDelta.updated_at))
+            .filter(and_(ProjectionDelta.scenario_id.in_(chain), ProjectionDelta.season == season))
+            .one()
+        )
+        # Base projections seeded into the chain by its deltas
+        seeded_count, seeded_update = (
+            self.db.query(func.count(Projection.projection_id), func.max(Projection.updated_at))
+            .filter(
+                and_(
+                    Projection.scenario_id.is_(None),
+                    Projection.season == season,
+                    Projection.player_id.in_(
+                        self.db.query(ProjectionDelta.player_id).filter(
+                            and_(
+                                ProjectionDelta.scenario_id.in_(chain),
+                                ProjectionDelta.season == season,
+                            )
+                        )
+                    ),
+                )
+            )
+            .one()
+            if delta_count
+            else (0, None)
+        )
+        return (
+            tuple(chain),
+            count,
+            str(last_update),
+            total,
+            delta_count,
+            str(delta_update),
+            seeded_count,
+            str(seeded_update),
+        )
+
+    def copy_projection(
+        self, source: Projection, scenario_id: str, override_source_id: Optional[str] = None
+    ) -> Projection:
+        """
+        Add a stored copy of a projection to a scenario, with the source row's overrides.
+
+        Args:
+            source: Projection to copy (stored or resolved)
+            scenario_id: Scenario receiving the copy
+            override_source_id: Row whose overrides are copied (defaults to the source)
+
+        Returns:
+            The new Projection, added to the session
+        """
+        row = Projection(
+            projection_id=str(uuid.uuid4()),
+            player_id=source.player_id,
+            scenario_id=scenario_id,
+            season=source.season,
+            **{column: getattr(source, column) for column in PROJECTION_VALUE_COLUMNS},
+        )
+        self.db.add(row)
+
+        overrides = (
+            self.db.query(StatOverride)
+            .filter(StatOverride.projection_id == (override_source_id or source.projection_id))
+            .all()
+        )
+        for override in overrides:
+            self.db.add(
+                StatOverride(
+                    override_id=str(uuid.uuid4()),
+                    player_id=override.player_id,
+                    projection_id=row.projection_id,
+                    stat_name=override.stat_name,
+                    calculated_value=override.calculated_value,
+                    manual_value=override.manual_value,
+                    notes=override.notes,
+                )
+            )
+
+        return row
+
+    def _write_delta(
+        self,
+        scenario_id: str,
+        player_id: str,
+        season: int,
+        changes: Dict[str, Any],
+        keep_empty: bool = False,
+    ) -> None:
+        """
+        Insert, replace or remove the delta for one player in a scenario.
+
+        A delta without changes is removed unless keep_empty is set (it seeds a base
+        projection into the scenario).
+        """
+        delta = (
+            self.db.query(ProjectionDelta)
+            .filter(
+                and_(
+                    ProjectionDelta.scenario_id == scenario_id,
+                    ProjectionDelta.player_id == player_id,
+                    ProjectionDelta.season == season,
+                )
+            )
+            .first()
+        )
+
+        if not changes and not keep_empty:
+            if delta:
+                self.db.delete(delta)
+            return
+
+        if delta:
+            delta.changes = dict(changes)
+            delta.updated_at = datetime.utcnow()
+        else:
+            self.db.add(
+                ProjectionDelta(
+                    delta_id=str(uuid.uuid4()),
+                    scenario_id=scenario_id,
+                    player_id=player_id,
+                    season=season,
+                    changes=dict(changes),
+                )
+            )
+
+    def _base_rows(self, keys: List[ProjectionKey]) -> Dict[ProjectionKey, Projection]:
+        """Newest base projection (no scenario) for each (player_id, season)."""
+        if not keys:
+            return {}
+        wanted = set(keys)
+        query = (
+            self.db.query(Projection)
+            .options(selectinload(Projection.player))
+            .filter(
+                and_(
+                    Projection.scenario_id.is_(None),
+                    Projection.player_id.in_({player_id for player_id, _ in wanted}),
+                    Projection.season.in_({season for _, season in wanted}),
+                )
+            )
+            .order_by(Projection.created_at)
+        )
+        return {
+            (row.player_id, row.season): row
+            for row in query
+            if (row.player_id, row.season) in wanted
+        }
+
+    @staticmethod
+    def _filtered(
+        query: Any,
+        model: Any,
+        chain: List[str],
+        season: Optional[int],
+        player_ids: Optional[List[str]],
+        position: Optional[str],
+        team: Optional[str],
+    ) -> Any:
+        """Apply the shared chain/season/player filters to a Projection or delta query."""
+        query = query.filter(model.scenario_id.in_(chain))
+        if season is not None:
+            query = query.filter(model.season == season)
+        if player_ids is not None:
+            query = query.filter(model.player_id.in_(player_ids))
+        if position or team:
+            query = query.join(Player, Player.player_id == model.player_id)
+            if position:
+                query = query.filter(Player.position == position)
+            if team:
+                query = query.filter(Player.team == team)
+        return query
@@ -5,9 +5,12 @@ from datetime import datetime
 import uuid
 import logging
 
-from backend.database.models import Scenario, Projection, Player, StatOverride, TeamStat
+from backend.database.models import (
+    Scenario, Projection, ProjectionDelta, Player, TeamStat
+)
 from backend.services.projection_service import ProjectionService
 from backend.services.override_service import OverrideService
+from backend.services.scenario_delta_service import ScenarioDeltaService
 from backend.services.typing import (
     safe_float, safe_dict_get, 
     ScenarioInfoDict, PlayerScenarioDataDict, ScenarioComparisonResultDict,
@@ -27,6 +30,7 @@ class ScenarioService:
         self.db = db
         self.projection_service = ProjectionService(db)
         self.override_service = OverrideService(db)
+        self.scenario_deltas = ScenarioDeltaService(db)
 
     async def create_scenario(
         self,
@@ -80,6 +84,9 @@ class ScenarioService:
         """
         Get all projections for a scenario with optional filters.
 
+        Projections inherited from the base scenario chain are resolved with the
+        scenario's deltas applied.
+
         Args:
             scenario_id: Scenario ID
             position: Optional position filter
@@ -88,24 +95,16 @@ class ScenarioService:
         Returns:
             List of Projection objects
         """
-        query = self.db.query(Projection).filter(Projection.scenario_id == scenario_id)
-
-        if position or team:
-            query = query.join(Player)
-
-            if position:
-                query = query.filter(Player.position == position)
-
-            if team:
-                query = query.filter(Player.team == team)
-
-        return query.all()
+        return self.scenario_deltas.resolve_projections(scenario_id, position=position, team=team)
 
     async def clone_scenario(
         self, source_scenario_id: str, new_name: str, new_description: Optional[str] = None
     ) -> Optional[Scenario]:
         """
-        Clone an existing scenario with all its projections and overrides.
+        Clone an existing scenario.
+
+        The clone stores no projections of its own: it reads through to the source
+        scenario (including its overrides) and only records the fields it later changes.
 
         Args:
             source_scenario_id: Source scenario ID to clone
@@ -115,117 +114,18 @@ class ScenarioService:
         Returns:
             Newly created Scenario object or None if failed
         """
-        try:
-            # Get source scenario
-            source_scenario = await self.get_scenario(source_scenario_id)
-            if not source_scenario:
-                logger.error(f"Source scenario {source_scenario_id} not found")
-                return None
-
-            # Create new scenario with proper reference to the source
-            new_scenario = await self.create_scenario(
-                name=new_name, 
-                description=new_description, 
-                is_baseline=False,
-                base_scenario_id=source_scenario_id  # Set base scenario reference directly
-            )
-
-            if not new_scenario:
-                return None
-
-            # Clone all projections
-            source_projections = await self.get_scenario_projections(source_scenario_id)
-
-            for source_proj in source_projections:
-                # Clone the projection
-                new_proj = Projection(
-                    projection_id=str(uuid.uuid4()),
-                    player_id=source_proj.player_id,
-                    scenario_id=new_scenario.scenario_id,
-                    season=source_proj.season,
-                    games=source_proj.games,
-                    half_ppr=source_proj.half_ppr,
-                    # Copy all stats
-                    # Passing
-                    pass_attempts=source_proj.pass_attempts,
-                    completions=source_proj.completions,
-                    pass_yards=source_proj.pass_yards,
-                    pass_td=source_proj.pass_td,
-                    interceptions=source_proj.interceptions,
-                    # Enhanced passing
-                    gross_pass_yards=source_proj.gross_pass_yards,
-                    sacks=source_proj.sacks,
-                    sack_yards=source_proj.sack_yards,
-                    net_pass_yards=source_proj.net_pass_yards,
-                    pass_td_rate=source_proj.pass_td_rate,
-                    int_rate=source_proj.int_rate,
-                    sack_rate=source_proj.sack_rate,
-                    # Rushing
-                    rush_attempts=source_proj.rush_attempts,
-                    rush_yards=source_proj.rush_yards,
-                    rush_td=source_proj.rush_td,
-                    # Enhanced rushing
-                    gross_rush_yards=source_proj.gross_rush_yards,
-                    fumbles=source_proj.fumbles,
-                    fumble_rate=source_proj.fumble_rate,
-                    net_rush_yards=source_proj.net_rush_yards,
-                    rush_td_rate=source_proj.rush_td_rate,
-                    # Receiving
-                    targets=source_proj.targets,
-                    receptions=source_proj.receptions,
-                    rec_yards=source_proj.rec_yards,
-                    rec_td=source_proj.rec_td,
-                    # Usage
-                    snap_share=source_proj.snap_share,
-                    target_share=source_proj.target_share,
-                    rush_share=source_proj.rush_share,
-                    redzone_share=source_proj.redzone_share,
-                    # Efficiency
-                    pass_att_pct=source_proj.pass_att_pct,
-                    comp_pct=source_proj.comp_pct,
-                    yards_per_att=source_proj.yards_per_att,
-                    net_yards_per_att=source_proj.net_yards_per_att,
-                    rush_att_pct=source_proj.rush_att_pct,
-                    yards_per_carry=source_proj.yards_per_carry,
-                    net_yards_per_carry=source_proj.net_yards_per_carry,
-                    tar_pct=source_proj.tar_pct,
-                    catch_pct=source_proj.catch_pct,
-                    yards_per_target=source_proj.yards_per_target,
-                    rec_td_rate=source_proj.rec_td_rate,
-                    # Override flags
-                    has_overrides=source_proj.has_overrides,
-                    is_fill_player=source_proj.is_fill_player,
-                )
-
-                self.db.add(new_proj)
-
-                # If source had overrides, clone those too
-                if source_proj.has_overrides:
-                    source_overrides = await self.override_service.get_projection_overrides(
-                        source_proj.projection_id
-                    )
-
-                    for override in source_overrides:
-                        new_override = StatOverride(
-                            override_id=str(uuid.uuid4()),
-                            player_id=override.player_id,
-                            projection_id=new_proj.projection_id,
-                            stat_name=override.stat_name,
-                            calculated_value=override.calculated_value,
-                            manual_value=override.manual_value,
-                            notes=f"Cloned from scenario: {source_scenario.name}",
-                        )
-
-                        self.db.add(new_override)
-
-            self.db.commit()
-            return new_scenario
-
-        except Exception as e:
-            logger.error(f"Error cloning scenario: {str(e)}")
-            self.db.rollback()
+        source_scenario = await self.get_scenario(source_scenario_id)
+        if not source_scenario:
+            logger.error(f"Source scenario {source_scenario_id} not found")
             return None
 
+        return await self.create_scenario(
+            name=new_name,
+            description=new_description,
+            is_baseline=False,
+            base_scenario_id=source_scenario_id,
+        )
+
     async def update_scenario(self, scenario_id: str, data: Dict) -> Optional[Scenario]:
         """
         Update scenario properties.
@@ -260,6 +160,8 @@ class ScenarioService:
         """
         Delete a scenario and all its projections.
 
+        Scenarios based on it are re-pointed at its base first, keeping their values.
+
         Args:
             scenario_id: Scenario ID to delete
 
@@ -272,8 +174,13 @@ class ScenarioService:
                 logger.error(f"Scenario {scenario_id} not found")
                 return False
 
-            # Get all projections for this scenario
-            projections = await self.get_scenario_projections(scenario_id)
+            # Scenarios built on this one keep their values
+            self.scenario_deltas.rebase_children(scenario_id)
+
+            # Get the projections this scenario owns
+            projections = (
+                self.db.query(Projection).filter(Projection.scenario_id == scenario_id).all()
+            )
 
             # Delete all overrides for each projection
             for projection in projections:
@@ -286,6 +193,10 @@ class ScenarioService:
 
                 self.db.delete(projection)
 
+            self.db.query(ProjectionDelta).filter(
+                ProjectionDelta.scenario_id == scenario_id
+            ).delete(synchronize_session=False)
+
             # Delete the scenario
             self.db.delete(scenario)
             self.db.commit()
@@ -664,74 +575,34 @@ class ScenarioService:
                 logger.error(f"Player {player_id} not found")
                 return None
 
-            # Check if player already has a projection in this scenario
-            existing_proj = (
-                self.db.query(Projection)
-                .filter(
-                    and_(Projection.player_id == player_id, Projection.scenario_id == scenario_id)
-                )
-                .first()
-            )
-
-            if existing_proj:
-                # Update existing projection
-                for stat, value in adjustments.items():
-                    if hasattr(existing_proj, stat):
-                        setattr(existing_proj, stat, value)
-
-                # Recalculate fantasy points
-                if hasattr(existing_proj, "calculate_fantasy_points"):
-                    existing_proj.half_ppr = existing_proj.calculate_fantasy_points()
-
-                self.db.commit()
-                return existing_proj
-
-            # Find the base projection for this player
-            base_proj = (
-                self.db.query(Projection)
-                .filter(and_(Projection.player_id == player_id, Projection.scenario_id.is_(None)))
-                .order_by(Projection.created_at.desc())
-                .first()
-            )
-
-            if not base_proj:
-                logger.error(f"No base projection found for player {player_id}")
-                return None
-
-            # Create a new projection for this scenario
-            new_proj = Projection(
-                projection_id=str(uuid.uuid4()),
-                player_id=player_id,
-                scenario_id=scenario_id,
-                season=base_proj.season,
-                games=base_proj.games,
-                half_ppr=base_proj.half_ppr,
+            # The player's projection through the scenario chain; a player the chain
+            # does not have yet is seeded from their newest base projection
+            projections = self.scenario_deltas.resolve_projections(
+                scenario_id, player_ids=[player_id]
             )
-
-            # Copy all stats from base projection
-            for column in Projection.__table__.columns:
-                if column.name not in [
-                    "projection_id",
-                    "player_id",
-                    "scenario_id",
-                    "created_at",
-                    "updated_at",
-                ]:
-                    setattr(new_proj, column.name, getattr(base_proj, column.name))
+            if not projections:
+                if not self.scenario_deltas.seed_from_base(scenario_id, [player_id]):
+                    logger.error(f"No base projection found for player {player_id}")
+                    return None
+                projections = self.scenario_deltas.resolve_projections(
+                    scenario_id, player_ids=[player_id]
+                )
+            projection = max(projections, key=lambda p: p.season)
 
             # Apply adjustments
             for stat, value in adjustments.items():
-                if hasattr(new_proj, stat):
-                    setattr(new_proj, stat, value)
+                if hasattr(projection, stat):
+                    setattr(projection, stat, value)
 
             # Recalculate fantasy points
-            if hasattr(new_proj, "calculate_fantasy_points"):
-                new_proj.half_ppr = new_proj.calculate_fantasy_points()
+            if hasattr(projection, "calculate_fantasy_points"):
+                projection.half_ppr = projection.calculate_fantasy_points()
 
-            self.db.add(new_proj)
+            # Owned rows flush with the session; inherited ones are stored as deltas
+            self.scenario_deltas.save_projections(scenario_id, [projection])
             self.db.commit()
 
-            return new_proj
+            return projection
 
         except Exception as e:
             logger.error(f"Error adding player to scenario: {str(e)}")
@@ -752,13 +623,10 @@ class ScenarioService:
             Projection object or None if not found
         """
         try:
-            return (
-                self.db.query(Projection)
-                .filter(
-                    and_(Projection.player_id == player_id, Projection.scenario_id == scenario_id)
-                )
-                .first()
+            projections = self.scenario_deltas.resolve_projections(
+                scenario_id, player_ids=[player_id]
             )
+            return projections[0] if projections else None
         except Exception as e:
             logger.error(f"Error getting player scenario projection: {str(e)}")
             return None
@@ -806,13 +674,14 @@ class ScenarioService:
                 self.db.flush()
                 player_id = new_player.player_id
 
-            # Check if this player already has a projection in this scenario
-            existing_projection = (
-                self.db.query(Projection)
-                .filter(
-                    and_(Projection.player_id == player_id, Projection.scenario_id == scenario_id)
-                )
-                .first()
+            # Check if this player already has a projection in this scenario's chain
+            existing_projection = next(
+                iter(
+                    self.scenario_deltas.resolve_projections(
+                        scenario_id, season=season, player_ids=[player_id]
+                    )
+                ),
+                None,
             )
 
             if existing_projection:
@@ -822,6 +691,7 @@ class ScenarioService:
                         setattr(existing_projection, stat, value)
 
                 existing_projection.is_fill_player = True
+                self.scenario_deltas.save_projections(scenario_id, [existing_projection])
                 self.db.commit()
                 return existing_projection
             else:
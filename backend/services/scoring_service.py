@@ -0,0 +1,381 @@
+"""
+Fantasy scoring for projections.
+
+ScoringRules is the one definition of how projection stats turn into fantasy points:
+the built-in standard, half-PPR and PPR formats (PRESET_RULES) and custom rules stored
+on a draft board. Projection.calculate_fantasy_points and the variance weights in
+projection_variance_service are derived from the presets.
+
+ScoringService scores whole projection sets as frames and caches each scoring
+system's points column per season and scenario.
+"""
+
+from typing import Dict, List, Optional, Any, Mapping, Sequence, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+import hashlib
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+
+from backend.database.models import Player, Projection, DraftBoard
+from backend.services.cache_service import get_cache, scenario_tag
+from backend.services.scenario_delta_service import ScenarioDeltaService
+
+logger = logging.getLogger(__name__)
+
+# Projection stats a scoring rule may award points for
+SCORABLE_STATS = [
+    "pass_attempts",
+    "completions",
+    "pass_yards",
+    "pass_td",
+    "interceptions",
+    "sacks",
+    "rush_attempts",
+    "rush_yards",
+    "rush_td",
+    "fumbles",
+    "targets",
+    "receptions",
+    "rec_yards",
+    "rec_td",
+]
+
+# Yardage stats scored from their net column when one is available
+NET_YARD_COLUMNS = {"pass_yards": "net_pass_yards", "rush_yards": "net_rush_yards"}
+
+# Every projection column the scorer may read
+SCORING_INPUT_COLUMNS = SCORABLE_STATS + list(NET_YARD_COLUMNS.values())
+
+# Points per unit for the built-in formats (matches Projection.calculate_fantasy_points)
+STANDARD_POINTS = {
+    "pass_yards": 1 / 25,
+    "pass_td": 4.0,
+    "interceptions": -2.0,
+    "rush_yards": 1 / 10,
+    "rush_td": 6.0,
+    "fumbles": -2.0,
+    "rec_yards": 1 / 10,
+    "rec_td": 6.0,
+}
+
+PRESET_POINTS = {
+    "standard": STANDARD_POINTS,
+    "half": {**STANDARD_POINTS, "receptions": 0.5},
+    "ppr": {**STANDARD_POINTS, "receptions": 1.0},
+}
+
+# Cached score columns expire after an hour even if projections are unchanged
+SCORE_CACHE_TTL = 3600
+
+
+class ScoringRules:
+    """
+    A fantasy scoring system: points per unit of each projection stat, with optional
+    per-position additions (e.g. a TE reception premium).
+
+    Rules are plain data so they can live in DraftBoard.settings["scoring"]:
+
+        {"preset": "half", "points": {"pass_td": 6}, "position_points": {"TE": {"receptions": 0.5}}}
+    """
+
+    def __init__(
+        self,
+        points: Optional[Mapping[str, float]] = None,
+        position_points: Optional[Mapping[str, Mapping[str, float]]] = None,
+        use_net_yards: bool = True,
+    ):
+        self.points = {stat: float(value) for stat, value in (points or {}).items() if value}
+        self.position_points = {
+            position: {stat: float(value) for stat, value in stats.items() if value}
+            for position, stats in (position_points or {}).items()
+        }
+        self.use_net_yards = use_net_yards
+
+        unknown = set(self.points).union(
+            *[stats.keys() for stats in self.position_points.values()]
+        ) - set(SCORABLE_STATS)
+        if unknown:
+            raise ValueError(f"Unknown scoring stats: {', '.join(sorted(unknown))}")
+
+    @classmethod
+    def preset(cls, name: str) -> "ScoringRules":
+        """Built-in scoring format (standard, half or ppr)."""
+        if name not in PRESET_POINTS:
+            raise ValueError(f"Unknown scoring preset: {name}")
+        return cls(points=PRESET_POINTS[name])
+
+    @classmethod
+    def from_dict(cls, data: Optional[Mapping[str, Any]]) -> "ScoringRules":
+        """
+        Build rules from a settings dict. Points listed under "points" override the
+        preset (half-PPR when no preset is given).
+        """
+        data = data or {}
+        points = dict(cls.preset(data.get("preset", "half")).points)
+        points.update(data.get("points") or {})
+        return cls(
+            points=points,
+            position_points=data.get("position_points"),
+            use_net_yards=data.get("use_net_yards", True),
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Mapping[str, Any]]) -> "ScoringRules":
+        """Rules stored under the "scoring" key of DraftBoard.settings."""
+        return cls.from_dict((settings or {}).get("scoring"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "points": dict(sorted(self.points.items())),
+            "position_points": {
+                position: dict(sorted(stats.items()))
+                for position, stats in sorted(self.position_points.items())
+            },
+            "use_net_yards": self.use_net_yards,
+        }
+
+    @property
+    def rule_hash(self) -> str:
+        """Stable hash of the rules, used to key cached scores."""
+        return hashlib.md5(json.dumps(self.to_dict(), sort_keys=True).encode()).hexdigest()
+
+    def score(
+        self, values: Mapping[str, Any], positions: Optional[Any] = None
+    ) -> np.ndarray:
+        """
+        Score arrays of projection stats. Missing stats count as zero.
+
+        Args:
+            values: Stat name -> array (or scalar) of values
+            positions: Optional array of positions for the per-position points
+
+        Returns:
+            Array of fantasy points
+        """
+
+        def column(stat: str) -> np.ndarray:
+            value = np.asarray(values.get(stat, np.nan), dtype=float)
+            net_stat = NET_YARD_COLUMNS.get(stat)
+            if self.use_net_yards and net_stat and values.get(net_stat) is not None:
+                net = np.asarray(values[net_stat], dtype=float)
+                value = np.where(np.isnan(net), value, net)
+            return np.nan_to_num(value, nan=0.0)
+
+        shape = np.broadcast(*[np.asarray(v) for v in values.values()]).shape if values else ()
+        points = np.zeros(shape)
+        for stat, per_unit in self.points.items():
+            points = points + column(stat) * per_unit
+
+        if self.position_points and positions is not None:
+            positions = np.asarray(positions)
+            for position, stats in self.position_points.items():
+                mask = positions == position
+                for stat, per_unit in stats.items():
+                    points = points + np.where(mask, column(stat) * per_unit, 0.0)
+
+        return points
+
+    def score_frame(self, frame: pd.DataFrame, position_column: str = "position") -> pd.Series:
+        """Score every row of a projection frame at once."""
+        values = {
+            stat: frame[stat].astype(float).to_numpy()
+            for stat in SCORING_INPUT_COLUMNS
+            if stat in frame.columns
+        }
+        if not values:
+            return pd.Series(0.0, index=frame.index)
+        positions = frame[position_column].to_numpy() if position_column in frame.columns else None
+        return pd.Series(self.score(values, positions), index=frame.index)
+
+
+PRESET_RULES = {name: ScoringRules.preset(name) for name in PRESET_POINTS}
+
+HALF_PPR_RULES = PRESET_RULES["half"]
+
+
+class ScoringService:
+    """
+    Scores whole projection sets under arbitrary scoring rules.
+
+    Score columns are cached per (season, scenario, rule hash) and keyed on a
+    fingerprint of the projection set, so any projection write invalidates them.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.cache = get_cache()
+
+    async def score_draft_board(
+        self,
+        draft_board_id: str,
+        season: Optional[int] = None,
+        scenario_id: Optional[str] = None,
+        position: Optional[str] = None,
+        formats: Optional[List[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Rank projections under a draft board's scoring rules.
+
+        Args:
+            draft_board_id: Draft board whose settings hold the scoring rules
+            season: Projection season (defaults to the board's season)
+            scenario_id: Optional scenario (base projections when omitted)
+            position: Optional position filter
+            formats: Optional built-in formats (standard, half, ppr) to add as columns
+
+        Returns:
+            Frame ordered by the board's "points" column, or None if the board is missing
+        """
+        board = self.db.get(DraftBoard, draft_board_id)
+        if not board:
+            return None
+
+        rules: Dict[str, ScoringRules] = {"points": ScoringRules.from_settings(board.settings)}
+        for name in formats or []:
+            rules[name] = ScoringRules.preset(name)
+
+        result = await self.score_projections(
+            rules, season=season or board.season, scenario_id=scenario_id, position=position
+        )
+        return result.sort_values("points", ascending=False).reset_index(drop=True)
+
+    async def score_projections(
+        self,
+        rules: Mapping[str, ScoringRules],
+        season: int,
+        scenario_id: Optional[str] = None,
+        position: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Score every projection of a season/scenario under several scoring systems.
+
+        Args:
+            rules: Column name -> scoring rules
+            season: Projection season
+            scenario_id: Optional scenario (base projections when omitted)
+            position: Optional position filter applied to the result
+
+        Returns:
+            Frame with projection_id, player_id, name, team, position and one points
+            column per scoring system
+        """
+        fingerprint = self._fingerprint(season, scenario_id)
+        scores: Dict[str, pd.Series] = {}
+        missing: List[Tuple[str, ScoringRules, str]] = []
+
+        for name, rule in rules.items():
+            key = self._cache_key(season, scenario_id, rule)
+            entry = self.cache.get(key)
+            if entry is not None and entry["fingerprint"] == fingerprint:
+                scores[name] = entry["points"]
+            else:
+                missing.append((name, rule, key))
+
+        # Stat columns are only loaded when at least one scoring system needs scoring
+        frame = self.load_frame(season, scenario_id, with_stats=bool(missing))
+        index = frame["projection_id"]
+
+        # Scores are invalidated by a write to any scenario they resolve through
+        tags = [
+            scenario_tag(chain_id)
+            for chain_id in (
+                ScenarioDeltaService(self.db).scenario_chain(scenario_id) if scenario_id else [None]
+            )
+        ]
+        for name, rule, key in missing:
+            points = pd.Series(rule.score_frame(frame).to_numpy(), index=index)
+            self.cache.set(
+                key, {"fingerprint": fingerprint, "points": points}, SCORE_CACHE_TTL, tags=tags
+            )
+            scores[name] = points
+
+        result = frame[["projection_id", "player_id", "name", "team", "position"]].copy()
+        for name in rules:
+            result[name] = scores[name].reindex(index).to_numpy()
+
+        if position:
+            result = result[result["position"] == position]
+
+        return result.reset_index(drop=True)
+
+    def invalidate(self, scenario_id: Optional[str] = None) -> int:
+        """Drop cached score columns for a scenario (base projections when omitted)."""
+        return self.cache.invalidate_tags([scenario_tag(scenario_id)])
+
+    def load_frame(
+        self,
+        season: int,
+        scenario_id: Optional[str],
+        with_stats: bool = True,
+        extra_columns: Sequence[str] = (),
+    ) -> pd.DataFrame:
+        """
+        Load every projection of a season or scenario as a frame in one query.
+
+        Args:
+            season: Projection season
+            scenario_id: Optional scenario, resolved through its base chain (base
+                projections when omitted)
+            with_stats: Include the SCORING_INPUT_COLUMNS
+            extra_columns: Further Projection columns to include
+
+        Returns:
+            Frame with projection_id, player_id, the requested columns, name, team and
+            position
+        """
+        columns = ["projection_id", "player_id"] + (SCORING_INPUT_COLUMNS if with_stats else [])
+        columns += [col for col in extra_columns if col not in columns]
+        if scenario_id:
+            # Scenario projections resolve through the base scenario chain
+            projections = ScenarioDeltaService(self.db).resolve_projections(scenario_id, season=season)
+            return pd.DataFrame(
+                [
+                    [getattr(p, col) for col in columns]
+                    + [p.player.name, p.player.team, p.player.position]
+                    for p in projections
+                ],
+                columns=columns + ["name", "team", "position"],
+            )
+
+        query = (
+            self.db.query(
+                *[getattr(Projection, col) for col in columns],
+                Player.name,
+                Player.team,
+                Player.position,
+            )
+            .join(Player, Player.player_id == Projection.player_id)
+            .filter(self._projection_filter(season))
+        )
+        return pd.DataFrame(query.all(), columns=columns + ["name", "team", "position"])
+
+    def _fingerprint(self, season: int, scenario_id: Optional[str]) -> Tuple[Any, ...]:
+        """Cheap aggregate that changes whenever the projection set is written to."""
+        if scenario_id:
+            return ScenarioDeltaService(self.db).fingerprint(scenario_id, season)
+        count, last_update, total = (
+            self.db.query(
+                func.count(Projection.projection_id),
+                func.max(Projection.updated_at),
+                func.sum(Projection.half_ppr),
+            )
+            .filter(self._projection_filter(season))
+            .one()
+        )
+        return (count, str(last_update), total)
+
+    @staticmethod
+    def _projection_filter(season: int) -> Any:
+        """Base projections (no scenario) for a season."""
+        return and_(Projection.season == season, Projection.scenario_id.is_(None))
+
+    @staticmethod
+    def _cache_prefix(scenario_id: Optional[str]) -> str:
+        return f"fantasy_scores:{scenario_id or 'base'}"
+
+    def _cache_key(self, season: int, scenario_id: Optional[str], rules: ScoringRules) -> str:
+        return f"{self._cache_prefix(scenario_id)}:{season}:{rules.rule_hash}"
@@ -0,0 +1,495 @@
+"""
+Season totals stored one typed row per player and season.
+
+BaseStat keeps season totals as one row per (player, season, stat_type), so every
+reader used to aggregate 10-20 rows back into a dict. PlayerSeasonStats holds the same
+totals as typed columns; stat types without a column go to its extra JSON.
+
+Writes go through save_season_totals, which also mirrors the values into BaseStat for
+readers that have not moved over yet. Reads fall back to BaseStat for player-seasons
+that have no PlayerSeasonStats row (data imported before the table existed and not yet
+migrated with sync_from_base_stats).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+from datetime import datetime
+import logging
+import uuid
+
+import pandas as pd
+
+from backend.database.models import BaseStat, Player, PlayerSeasonStats, SEASON_STAT_FIELDS
+from backend.services.cache_invalidation import invalidate_on_commit
+from backend.services.cache_service import STATS_TAG, player_tag
+
+logger = logging.getLogger(__name__)
+
+StatMap = Dict[str, float]  # stat_type -> value
+SeasonKey = Tuple[str, int]  # (player_id, season)
+
+
+class SeasonStatsService:
+    """
+    Reads and writes season totals through the wide PlayerSeasonStats table.
+    """
+
+    def __init__(self, db: Session, mirror_base_stats: bool = True):
+        """
+        Args:
+            db: Database session
+            mirror_base_stats: Also write saved totals into BaseStat rows
+        """
+        self.db = db
+        self.mirror_base_stats = mirror_base_stats
+
+    def get_season_stats(self, player_id: str, season: int) -> StatMap:
+        """
+        Season totals for one player.
+
+        Args:
+            player_id: Player ID
+            season: Season year
+
+        Returns:
+            {stat_type: value}, empty if the player has no totals for the season
+        """
+        row = self._find_row(player_id, season)
+        if row is not None:
+            return row.to_stat_dict()
+        return self._legacy_stats(season=season, player_ids=[player_id]).get(
+            (player_id, season), {}
+        )
+
+    def get_season_stats_map(
+        self, season: int, player_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, StatMap]:
+        """
+        Season totals for many players in one query (plus one for legacy rows).
+
+        Args:
+            season: Season year
+            player_ids: Players to load, or None for every player with totals
+
+        Returns:
+            {player_id: {stat_type: value}} for players with totals
+        """
+        ids = None if player_ids is None else list(player_ids)
+        query = self.db.query(PlayerSeasonStats).filter(PlayerSeasonStats.season == season)
+        if ids is not None:
+            query = query.filter(PlayerSeasonStats.player_id.in_(ids))
+
+        result = {row.player_id: row.to_stat_dict() for row in query.all()}
+        for (player_id, _), stats in self._legacy_stats(season=season, player_ids=ids).items():
+            result.setdefault(player_id, stats)
+        return result
+
+    def get_latest_season_stats(self, player_ids: Iterable[str]) -> Dict[str, Tuple[int, StatMap]]:
+        """
+        Totals from each player's most recent season with data.
+
+        Args:
+            player_ids: Players to load
+
+        Returns:
+            {player_id: (season, {stat_type: value})}
+        """
+        ids = list(player_ids)
+        if not ids:
+            return {}
+
+        result: Dict[str, Tuple[int, StatMap]] = {}
+        rows = (
+            self.db.query(PlayerSeasonStats)
+            .filter(PlayerSeasonStats.player_id.in_(ids))
+            .order_by(PlayerSeasonStats.season)
+            .all()
+        )
+        for row in rows:
+            result[row.player_id] = (row.season, row.to_stat_dict())
+
+        # Legacy totals only matter where they are newer than the wide rows
+        legacy_latest = {
+            player_id: season
+            for player_id, season in (
+                self.db.query(BaseStat.player_id, func.max(BaseStat.season))
+                .filter(BaseStat.player_id.in_(ids), BaseStat.week.is_(None))
+                .group_by(BaseStat.player_id)
+                .all()
+            )
+            if player_id not in result or season > result[player_id][0]
+        }
+        if legacy_latest:
+            legacy = self._legacy_stats(
+                seasons=set(legacy_latest.values()), player_ids=list(legacy_latest)
+            )
+            for player_id, season in legacy_latest.items():
+                if (player_id, season) in legacy:
+                    result[player_id] = (season, legacy[(player_id, season)])
+
+        return result
+
+    def season_stats_frame(
+        self, season: int, team: Optional[str] = None, position: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Season totals as a wide frame for the vectorized projection paths.
+
+        Args:
+            season: Season year
+            team: Optional team filter
+            position: Optional position filter
+
+        Returns:
+            Frame indexed by player_id with one float column per SEASON_STAT_FIELDS entry,
+            one row per player with totals
+        """
+        query = (
+            self.db.query(
+                PlayerSeasonStats.player_id,
+                *[getattr(PlayerSeasonStats, name) for name in SEASON_STAT_FIELDS],
+            )
+            .join(Player, Player.player_id == PlayerSeasonStats.player_id)
+            .filter(PlayerSeasonStats.season == season)
+        )
+        legacy_query = (
+            self.db.query(BaseStat.player_id, BaseStat.stat_type, BaseStat.value)
+            .join(Player, Player.player_id == BaseStat.player_id)
+            .filter(
+                and_(
+                    BaseStat.season == season,
+                    BaseStat.week.is_(None),
+                    ~self._has_wide_row(BaseStat.player_id, BaseStat.season),
+                )
+            )
+        )
+        if team:
+            query = query.filter(Player.team == team)
+            legacy_query = legacy_query.filter(Player.team == team)
+        if position:
+            query = query.filter(Player.position == position)
+            legacy_query = legacy_query.filter(Player.position == position)
+
+        frame = pd.DataFrame(query.all(), columns=["player_id"] + SEASON_STAT_FIELDS)
+        frame = frame.set_index("player_id")
+
+        legacy = pd.DataFrame(legacy_query.all(), columns=["player_id", "stat_type", "value"])
+        if not legacy.empty:
+            legacy = legacy.pivot_table(
+                index="player_id", columns="stat_type", values="value", aggfunc="last"
+            ).reindex(columns=SEASON_STAT_FIELDS)
+            frame = pd.concat([frame, legacy]) if not frame.empty else legacy
+
+        return frame.astype(float)
+
+    def save_season_totals(
+        self, player_id: str, season: int, totals: Dict[str, Any]
+    ) -> PlayerSeasonStats:
+        """
+        Create or update a player's season totals. Stats not in totals keep their values.
+
+        The caller commits.
+
+        Args:
+            player_id: Player ID
+            season: Season year
+            totals: {stat_type: value}, including games and half_ppr when known
+
+        Returns:
+            The PlayerSeasonStats row
+        """
+        row = self._find_row(player_id, season)
+        if row is None:
+            # Seed from legacy rows so totals not being saved now are not lost
+            legacy = self._legacy_stats(season=season, player_ids=[player_id])
+            row = PlayerSeasonStats(player_id=player_id, season=season, extra={})
+            self._apply(row, legacy.get((player_id, season), {}))
+            self.db.add(row)
+
+        self._apply(row, totals)
+
+        if self.mirror_base_stats:
+            self._mirror(player_id, season, totals)
+
+        return row
+
+    def bulk_save_season_totals(self, season: int, totals_by_player: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Set-based save_season_totals for many players of one season.
+
+        Existing rows and mirror rows are prefetched with one query each, then written
+        with bulk inserts and updates instead of one ORM object at a time. The caller
+        commits.
+
+        Args:
+            season: Season year
+            totals_by_player: {player_id: {stat_type: value}}
+
+        Returns:
+            Number of players that had no totals for the season before
+        """
+        if not totals_by_player:
+            return 0
+
+        # Make pending ORM changes visible to the prefetch queries
+        self.db.flush()
+        player_ids = list(totals_by_player)
+
+        existing = {
+            player_id: (season_stats_id, extra or {})
+            for season_stats_id, player_id, extra in self.db.query(
+                PlayerSeasonStats.season_stats_id,
+                PlayerSeasonStats.player_id,
+                PlayerSeasonStats.extra,
+            )
+            .filter(
+                PlayerSeasonStats.season == season,
+                PlayerSeasonStats.player_id.in_(player_ids),
+            )
+            .all()
+        }
+        legacy = self._legacy_stats(
+            season=season, player_ids=[pid for pid in player_ids if pid not in existing]
+        )
+
+        now = datetime.utcnow()
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        for player_id, totals in totals_by_player.items():
+            if player_id in existing:
+                season_stats_id, extra = existing[player_id]
+                values = dict(totals)
+            else:
+                # Seed from legacy rows, as save_season_totals does
+                season_stats_id, extra = str(uuid.uuid4()), {}
+                values = {**legacy.get((player_id, season), {}), **totals}
+
+            row: Dict[str, Any] = {"season_stats_id": season_stats_id, "updated_at": now}
+            extra = dict(extra)
+            for stat_type, value in values.items():
+                value = None if value is None else float(value)
+                if stat_type in SEASON_STAT_FIELDS:
+                    row[stat_type] = value
+                elif value is not None:
+                    extra[stat_type] = value
+            row["extra"] = extra
+
+            if player_id in existing:
+                updates.append(row)
+            else:
+                row.update(player_id=player_id, season=season, created_at=now)
+                inserts.append(row)
+
+        if inserts:
+            self.db.bulk_insert_mappings(PlayerSeasonStats, inserts)
+        if updates:
+            self.db.bulk_update_mappings(PlayerSeasonStats, updates)
+
+        if self.mirror_base_stats:
+            self._bulk_mirror(season, totals_by_player)
+
+        # Bulk writes bypass the unit of work, so their cache tags are registered here
+        invalidate_on_commit(
+            self.db, [player_tag(player_id) for player_id in player_ids] + [STATS_TAG]
+        )
+
+        created = len(player_ids) - len(existing) - len({pid for pid, _ in legacy})
+        logger.info(
+            f"Saved season {season} totals for {len(player_ids)} players "
+            f"({len(inserts)} new rows, {len(updates)} updated)"
+        )
+        return created
+
+    def sync_from_base_stats(
+        self, season: Optional[int] = None, player_ids: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Copy BaseStat season totals into PlayerSeasonStats (the table's migration).
+
+        Existing rows are overwritten with the BaseStat values. The caller commits.
+
+        Args:
+            season: Only migrate this season (all seasons if None)
+            player_ids: Only migrate these players (all players if None)
+
+        Returns:
+            Number of player-seasons written
+        """
+        ids = None if player_ids is None else list(player_ids)
+        legacy = self._legacy_stats(
+            seasons=None if season is None else {season}, player_ids=ids, include_migrated=True
+        )
+        if not legacy:
+            return 0
+
+        query = self.db.query(PlayerSeasonStats)
+        if season is not None:
+            query = query.filter(PlayerSeasonStats.season == season)
+        if ids is not None:
+            query = query.filter(PlayerSeasonStats.player_id.in_(ids))
+        existing = {(row.player_id, row.season): row for row in query.all()}
+
+        for (player_id, row_season), stats in legacy.items():
+            row = existing.get((player_id, row_season))
+            if row is None:
+                row = PlayerSeasonStats(player_id=player_id, season=row_season, extra={})
+                self.db.add(row)
+            self._apply(row, stats)
+
+        logger.info(f"Synced {len(legacy)} player-seasons from BaseStat")
+        return len(legacy)
+
+    def _find_row(self, player_id: str, season: int) -> Optional[PlayerSeasonStats]:
+        """The wide row for a player-season, including one added but not yet flushed."""
+        for obj in self.db.new:
+            if (
+                isinstance(obj, PlayerSeasonStats)
+                and obj.player_id == player_id
+                and obj.season == season
+            ):
+                return obj
+        return (
+            self.db.query(PlayerSeasonStats)
+            .filter(
+                PlayerSeasonStats.player_id == player_id, PlayerSeasonStats.season == season
+            )
+            .first()
+        )
+
+    def _legacy_stats(
+        self,
+        season: Optional[int] = None,
+        seasons: Optional[Iterable[int]] = None,
+        player_ids: Optional[List[str]] = None,
+        include_migrated: bool = False,
+    ) -> Dict[SeasonKey, StatMap]:
+        """
+        BaseStat season totals grouped by player-season.
+
+        Args:
+            season: Single season filter
+            seasons: Season set filter
+            player_ids: Player filter
+            include_migrated: Also return player-seasons that have a wide row
+
+        Returns:
+            {(player_id, season): {stat_type: value}}
+        """
+        query = self.db.query(
+            BaseStat.player_id, BaseStat.season, BaseStat.stat_type, BaseStat.value
+        ).filter(BaseStat.week.is_(None))
+        if season is not None:
+            query = query.filter(BaseStat.season == season)
+        if seasons is not None:
+            query = query.filter(BaseStat.season.in_(list(seasons)))
+        if player_ids is not None:
+            query = query.filter(BaseStat.player_id.in_(player_ids))
+        if not include_migrated:
+            query = query.filter(~self._has_wide_row(BaseStat.player_id, BaseStat.season))
+
+        result: Dict[SeasonKey, StatMap] = {}
+        for player_id, row_season, stat_type, value in query.all():
+            if stat_type and value is not None:
+                result.setdefault((player_id, row_season), {})[stat_type] = float(value)
+        return result
+
+    def _has_wide_row(self, player_id_column: Any, season_column: Any) -> Any:
+        """EXISTS clause matching player-seasons that already have a wide row."""
+        return (
+            self.db.query(PlayerSeasonStats.season_stats_id)
+            .filter(
+                PlayerSeasonStats.player_id == player_id_column,
+                PlayerSeasonStats.season == season_column,
+            )
+            .exists()
+        )
+
+    @staticmethod
+    def _apply(row: PlayerSeasonStats, totals: Dict[str, Any]) -> None:
+        """Write totals into the typed columns, and the rest into extra."""
+        extra = dict(row.extra or {})
+        for stat_type, value in totals.items():
+            value = None if value is None else float(value)
+            if stat_type in SEASON_STAT_FIELDS:
+                setattr(row, stat_type, value)
+            elif value is not None:
+                extra[stat_type] = value
+        row.extra = extra
+
+    def _bulk_mirror(self, season: int, totals_by_player: Dict[str, Dict[str, Any]]) -> None:
+        """Write many players' totals into the legacy BaseStat rows with bulk statements."""
+        existing = {
+            (player_id, stat_type): stat_id
+            for stat_id, player_id, stat_type in self.db.query(
+                BaseStat.stat_id, BaseStat.player_id, BaseStat.stat_type
+            )
+            .filter(
+                BaseStat.season == season,
+                BaseStat.week.is_(None),
+                BaseStat.player_id.in_(list(totals_by_player)),
+            )
+            .all()
+        }
+
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        for player_id, totals in totals_by_player.items():
+            for stat_type, value in totals.items():
+                if value is None:
+                    continue
+                stat_id = existing.get((player_id, stat_type))
+                if stat_id is not None:
+                    updates.append({"stat_id": stat_id, "value": float(value)})
+                else:
+                    inserts.append(
+                        {
+                            "stat_id": str(uuid.uuid4()),
+                            "player_id": player_id,
+                            "season": season,
+                            "stat_type": stat_type,
+                            "value": float(value),
+                        }
+                    )
+
+        if inserts:
+            self.db.bulk_insert_mappings(BaseStat, inserts)
+        if updates:
+            self.db.bulk_update_mappings(BaseStat, updates)
+
+    def _mirror(self, player_id: str, season: int, totals: Dict[str, Any]) -> None:
+        """Write totals into the legacy BaseStat season-total rows."""
+        existing = {
+            stat.stat_type: stat
+            for stat in self.db.query(BaseStat)
+            .filter(
+                BaseStat.player_id == player_id,
+                BaseStat.season == season,
+                BaseStat.week.is_(None),
+            )
+            .all()
+        }
+        for obj in self.db.new:
+            if (
+                isinstance(obj, BaseStat)
+                and obj.player_id == player_id
+                and obj.season == season
+                and obj.week is None
+            ):
+                existing[obj.stat_type] = obj
+
+        for stat_type, value in totals.items():
+            if value is None:
+                continue
+            stat = existing.get(stat_type)
+            if stat is not None:
+                stat.value = float(value)
+            else:
+                self.db.add(
+                    BaseStat(
+                        player_id=player_id,
+                        season=season,
+                        stat_type=stat_type,
+                        value=float(value),
+                    )
+                )
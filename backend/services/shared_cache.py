@@ -0,0 +1,329 @@
+"""
+Shared second-tier store for CacheService.
+
+Each uvicorn worker keeps its own in-memory cache. SQLiteCacheStore adds a tier behind
+it that every worker on the host shares through one SQLite file: entries set by one
+worker are read by the others on a local miss, and every invalidation (delete, tag,
+pattern, clear) is appended to a log that the other workers replay before serving
+from memory. No external service is needed.
+
+Values are pickled and zlib-compressed, so the file must only be writable by the
+application itself.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# Invalidation log rows are kept this long; a worker that falls further behind
+# drops its whole in-memory tier instead of replaying
+INVALIDATION_RETENTION = 2 * 3600
+
+# Expired entries and old log rows are pruned once every this many writes
+PRUNE_EVERY = 500
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        expiry REAL NOT NULL,
+        stale_until REAL NOT NULL,
+        tags TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cache_entry_tags (
+        tag TEXT NOT NULL,
+        key TEXT NOT NULL,
+        PRIMARY KEY (tag, key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_cache_entry_tags_key ON cache_entry_tags (key)",
+    """
+    CREATE TABLE IF NOT EXISTS cache_invalidations (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        origin TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        created REAL NOT NULL
+    )
+    """,
+]
+
+# A stored entry: (value, expiry, stale_until, tags)
+StoredEntry = Tuple[Any, float, float, List[str]]
+
+# An invalidation from another worker: (kind, payload); kind is keys, tags, pattern or clear
+Invalidation = Tuple[str, Any]
+
+
+class SQLiteCacheStore:
+    """
+    Cache tier shared by every process that opens the same SQLite file.
+
+    Store errors are logged and treated as misses, so a broken or locked file only
+    costs the shared tier, never the request.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the shared store.
+
+        Args:
+            path: SQLite file shared by the workers
+        """
+        self.path = path
+        self.origin = uuid.uuid4().hex
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.writes = 0
+
+        conn = self._connection()
+        for statement in SCHEMA:
+            conn.execute(statement)
+        self.last_seq = self._max_seq(conn)
+
+    def get(self, key: str) -> Optional[StoredEntry]:
+        """
+        Look up an entry.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            (value, expiry, stale_until, tags) or None if missing or unreadable
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT value, expiry, stale_until, tags FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value = pickle.loads(zlib.decompress(row[0]))
+            return value, row[1], row[2], json.loads(row[3])
+        except Exception as e:
+            logger.warning(f"Shared cache read of {key} failed: {str(e)}")
+            return None
+
+    def set(
+        self, key: str, value: Any, expiry: float, stale_until: float, tags: Iterable[str]
+    ) -> bool:
+        """
+        Store an entry, replacing any previous one.
+
+        Args:
+            key: The cache key
+            value: Picklable value
+            expiry: Expiry timestamp
+            stale_until: Timestamp until which the entry may be served stale
+            tags: Invalidation tags
+
+        Returns:
+            True if the entry was stored
+        """
+        try:
+            blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        except Exception as e:
+            logger.debug(f"Not sharing {key}: value is not picklable ({str(e)})")
+            return False
+
+        tags = sorted(set(tags))
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, expiry, stale_until, tags) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, blob, expiry, stale_until, json.dumps(tags)),
+                )
+                conn.execute("DELETE FROM cache_entry_tags WHERE key = ?", (key,))
+                conn.executemany(
+                    "INSERT INTO cache_entry_tags (tag, key) VALUES (?, ?)",
+                    [(tag, key) for tag in tags],
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache write of {key} failed: {str(e)}")
+            return False
+
+        self._count_write()
+        return True
+
+    def delete(self, keys: Iterable[str]) -> None:
+        """Remove entries and tell the other workers to drop them."""
+        keys = list(keys)
+        self._invalidate(
+            "keys", keys, "key IN (SELECT value FROM json_each(?))", json.dumps(keys)
+        )
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Remove entries carrying any of the tags, in every worker."""
+        tags = list(tags)
+        self._invalidate(
+            "tags",
+            tags,
+            "key IN (SELECT key FROM cache_entry_tags "
+            "WHERE tag IN (SELECT value FROM json_each(?)))",
+            json.dumps(tags),
+        )
+
+    def clear_pattern(self, pattern: str) -> None:
+        """Remove entries whose key contains the pattern, in every worker."""
+        self._invalidate("pattern", pattern, "instr(key, ?) > 0", pattern)
+
+    def clear(self) -> None:
+        """Remove every entry, in every worker."""
+        self._invalidate("clear", None, "1", None)
+
+    def poll(self) -> Optional[List[Invalidation]]:
+        """
+        Invalidations published by other workers since the last poll.
+
+        Cheap when nothing was written: PRAGMA data_version only changes when another
+        connection commits to the file. The version is per connection, so each thread
+        tracks its own; the log position is shared.
+
+        Returns:
+            List of (kind, payload), or None when the log was pruned past this
+            worker's position and its in-memory tier must be dropped
+        """
+        with self.lock:
+            try:
+                conn = self._connection()
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == getattr(self.local, "data_version", None):
+                    return []
+
+                conn.execute("BEGIN")
+                try:
+                    max_seq = self._max_seq(conn)
+                    rows = conn.execute(
+                        "SELECT seq, origin, kind, payload FROM cache_invalidations "
+                        "WHERE seq > ? ORDER BY seq",
+                        (self.last_seq,),
+                    ).fetchall() if max_seq > self.last_seq else []
+                finally:
+                    conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                logger.warning(f"Shared cache poll failed: {str(e)}")
+                return []
+
+            gap = max_seq > self.last_seq and (not rows or rows[0][0] != self.last_seq + 1)
+            self.local.data_version = data_version
+            self.last_seq = max(self.last_seq, max_seq)
+            if gap:
+                return None
+
+        return [
+            (kind, json.loads(payload))
+            for seq, origin, kind, payload in rows
+            if origin != self.origin
+        ]
+
+    def prune(self) -> int:
+        """
+        Drop entries past their stale window and log rows past the retention period.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                removed = conn.execute(
+                    "DELETE FROM cache_entries WHERE stale_until < ?", (now,)
+                ).rowcount
+                conn.execute(
+                    "DELETE FROM cache_entry_tags WHERE key NOT IN (SELECT key FROM cache_entries)"
+                )
+                conn.execute(
+                    "DELETE FROM cache_invalidations WHERE created < ?",
+                    (now - INVALIDATION_RETENTION,),
+                )
+            return removed
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache prune failed: {str(e)}")
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count and file location of the shared tier."""
+        try:
+            entries = self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        except sqlite3.Error:
+            entries = None
+        return {"path": self.path, "entries": entries, "last_invalidation": self.last_seq}
+
+    def _invalidate(self, kind: str, payload: Any, where: str, param: Any) -> None:
+        """Delete matching entries and append the invalidation to the log, atomically."""
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                params = () if param is None else (param,)
+                keys = json.dumps([
+                    row[0]
+                    for row in conn.execute(f"SELECT key FROM cache_entries WHERE {where}", params)
+                ])
+                for table in ("cache_entries", "cache_entry_tags"):
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE key IN (SELECT value FROM json_each(?))",
+                        (keys,),
+                    )
+                conn.execute(
+                    "INSERT INTO cache_invalidations (origin, kind, payload, created) "
+                    "VALUES (?, ?, ?, ?)",
+                    (self.origin, kind, json.dumps(payload), now),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Shared cache invalidation ({kind}) failed: {str(e)}")
+            return
+
+        self._count_write()
+
+    def _count_write(self) -> None:
+        with self.lock:
+            self.writes += 1
+            due = self.writes % PRUNE_EVERY == 0
+        if due:
+            self.prune()
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connection())
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection in autocommit mode (transactions are explicit)."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    @staticmethod
+    def _max_seq(conn: sqlite3.Connection) -> int:
+        row = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'cache_invalidations'"
+        ).fetchone()
+        return row[0] if row else 0
+
+
+class _Transaction:
+    """Write transaction taking the database lock up front (BEGIN IMMEDIATE)."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
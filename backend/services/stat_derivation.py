@@ -0,0 +1,290 @@
+"""
+Declarative derivation graph for projection metrics.
+
+Every derived projection field (efficiency rates, net yardage and fantasy points) is
+declared once here together with the fields it is computed from. Callers mark the
+inputs they changed as dirty and the graph recomputes only the downstream fields, in
+dependency order, either on a single projection (ORM object or dict) or on a frame
+of projections.
+
+Conventions:
+    comp_pct and catch_pct are stored as percentages (0-100); every other rate is a
+    plain ratio. A formula that cannot be evaluated (missing input, zero denominator)
+    leaves the existing value untouched.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from backend.services.scoring_service import HALF_PPR_RULES, NET_YARD_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+
+def _ratio(numerator: Any, denominator: Any, scale: float = 1.0) -> Any:
+    """Element-wise numerator / denominator, NaN where the denominator is not positive."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator * scale / denominator, np.nan)
+
+
+# Fields read by the half-PPR scoring rules
+HALF_PPR_INPUTS = tuple(sorted(set(HALF_PPR_RULES.points) | set(NET_YARD_COLUMNS.values())))
+
+
+def _half_ppr(*values: Any) -> Any:
+    """Half-PPR points from the HALF_PPR_INPUTS values, in order."""
+    return HALF_PPR_RULES.score(dict(zip(HALF_PPR_INPUTS, values)))
+
+
+class DerivedStat:
+    """A projection field computed from other projection fields."""
+
+    def __init__(self, name: str, inputs: Sequence[str], formula: Callable[..., Any]):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.formula = formula
+
+    def __repr__(self) -> str:
+        return f"DerivedStat({self.name!r}, inputs={self.inputs!r})"
+
+
+class StatDerivationGraph:
+    """
+    Dependency graph over derived projection fields.
+
+    Nodes are evaluated in topological order, so a derived field may itself feed other
+    derived fields (e.g. sack_yards -> net_pass_yards -> half_ppr).
+    """
+
+    def __init__(self, stats: Iterable[DerivedStat]):
+        self.nodes: Dict[str, DerivedStat] = {}
+        for stat in stats:
+            if stat.name in self.nodes:
+                raise ValueError(f"Derived stat {stat.name} declared twice")
+            self.nodes[stat.name] = stat
+
+        # Reverse edges: field -> derived fields that read it
+        self.dependents: Dict[str, Set[str]] = {}
+        for stat in self.nodes.values():
+            for field in stat.inputs:
+                self.dependents.setdefault(field, set()).add(stat.name)
+
+        self.order = self._topological_order()
+        self._position = {name: index for index, name in enumerate(self.order)}
+        self._affected_cache: Dict[frozenset, Tuple[str, ...]] = {}
+
+    def _topological_order(self) -> List[str]:
+        """Order derived fields so that every node comes after its derived inputs."""
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Cycle in stat derivation graph at {name}")
+            state[name] = 1
+            for field in self.nodes[name].inputs:
+                if field in self.nodes:
+                    visit(field)
+            state[name] = 2
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name)
+        return order
+
+    def affected(self, dirty: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Return every derived field downstream of the dirty fields, in evaluation order.
+
+        A dirty field that is itself derived is not recomputed (it was set explicitly),
+        but its dependents are.
+        """
+        key = frozenset(dirty)
+        cached = self._affected_cache.get(key)
+        if cached is not None:
+            return cached
+
+        seen: Set[str] = set()
+        stack = [dependent for field in key for dependent in self.dependents.get(field, ())]
+        while stack:
+            name = stack.pop()
+            if name in seen or name in key:
+                continue
+            seen.add(name)
+            stack.extend(self.dependents.get(name, ()))
+
+        result = tuple(sorted(seen, key=self._position.__getitem__))
+        self._affected_cache[key] = result
+        return result
+
+    def recompute(self, target: Any, dirty: Iterable[str]) -> List[str]:
+        """
+        Recompute the fields affected by the dirty inputs on a single projection.
+
+        Args:
+            target: Projection ORM object or dict of projection values (updated in place)
+            dirty: Names of the fields that changed
+
+        Returns:
+            Names of the derived fields that were written
+        """
+        if isinstance(target, dict):
+            read: Callable[[str], Any] = target.get
+            write: Callable[[str, Any], None] = target.__setitem__
+        else:
+            read = lambda field: getattr(target, field, None)  # noqa: E731
+            write = lambda field, value: setattr(target, field, value)  # noqa: E731
+
+        updated: List[str] = []
+        for name in self.affected(dirty):
+            node = self.nodes[name]
+            args = [self._scalar(read(field)) for field in node.inputs]
+            value = float(node.formula(*args))
+            if np.isnan(value):
+                continue
+            write(name, value)
+            updated.append(name)
+
+        return updated
+
+    def recompute_frame(self, frame: pd.DataFrame, dirty: Iterable[str]) -> pd.DataFrame:
+        """
+        Recompute the fields affected by the dirty inputs on a frame of projections.
+
+        Missing input columns are treated as missing values. Rows where a formula cannot
+        be evaluated keep their existing value.
+
+        Args:
+            frame: One row per projection
+            dirty: Names of the columns that changed
+
+        Returns:
+            Copy of the frame with every affected derived column recomputed
+        """
+        result = frame.copy()
+        for name in self.affected(dirty):
+            values = self.evaluate_frame(name, result)
+            if name in result.columns:
+                result[name] = values.where(values.notna(), result[name])
+            else:
+                result[name] = values
+
+        return result
+
+    def evaluate_frame(self, name: str, frame: pd.DataFrame) -> pd.Series:
+        """Evaluate one derived field for every row of a frame (NaN where undefined)."""
+        node = self.nodes[name]
+        args = [
+            frame[field].astype(float).to_numpy()
+            if field in frame.columns
+            else np.full(len(frame), np.nan)
+            for field in node.inputs
+        ]
+        return pd.Series(np.asarray(node.formula(*args), dtype=float), index=frame.index)
+
+    @staticmethod
+    def _scalar(value: Any) -> np.float64:
+        """Convert a projection value to a numpy float, using NaN for missing values."""
+        if value is None:
+            return np.float64(np.nan)
+        try:
+            return np.float64(value)
+        except (TypeError, ValueError):
+            return np.float64(np.nan)
+
+
+DERIVED_STATS: List[DerivedStat] = [
+    # Passing
+    DerivedStat("comp_pct", ("completions", "pass_attempts"), lambda c, a: _ratio(c, a, 100.0)),
+    DerivedStat("yards_per_att", ("pass_yards", "pass_attempts"), _ratio),
+    DerivedStat("pass_td_rate", ("pass_td", "pass_attempts"), _ratio),
+    DerivedStat("int_rate", ("interceptions", "pass_attempts"), _ratio),
+    # Average sack costs about 7 yards
+    DerivedStat("sack_yards", ("sacks",), lambda sacks: sacks * 7.0),
+    DerivedStat("sack_rate", ("sacks", "pass_attempts"), lambda s, a: _ratio(s, a + s)),
+    DerivedStat("net_pass_yards", ("pass_yards", "sack_yards"), lambda y, s: y - s),
+    DerivedStat("net_yards_per_att", ("net_pass_yards", "pass_attempts"), _ratio),
+    # Rushing
+    DerivedStat("yards_per_carry", ("rush_yards", "rush_attempts"), _ratio),
+    DerivedStat("rush_td_rate", ("rush_td", "rush_attempts"), _ratio),
+    DerivedStat("fumble_rate", ("fumbles", "rush_attempts"), _ratio),
+    # Average fumble costs about 5 yards; missing fumbles count as none
+    DerivedStat(
+        "net_rush_yards", ("rush_yards", "fumbles"), lambda y, f: y - np.nan_to_num(f) * 5.0
+    ),
+    DerivedStat("net_yards_per_carry", ("net_rush_yards", "rush_attempts"), _ratio),
+    # Receiving
+    DerivedStat("catch_pct", ("receptions", "targets"), lambda r, t: _ratio(r, t, 100.0)),
+    DerivedStat("yards_per_target", ("rec_yards", "targets"), _ratio),
+    DerivedStat("rec_td_rate", ("rec_td", "targets"), _ratio),
+    # Fantasy points
+    DerivedStat("half_ppr", HALF_PPR_INPUTS, _half_ppr),
+]
+
+STAT_GRAPH = StatDerivationGraph(DERIVED_STATS)
+
+# Counting stats and the rate that ties each one to its volume driver. When a volume
+# stat is changed by hand, the counting stats that follow it are rescaled to keep
+# these rates (percentages are divided by 100).
+VOLUME_DEPENDENTS: Dict[str, List[Tuple[str, str, float]]] = {
+    "pass_attempts": [
+        ("completions", "comp_pct", 100.0),
+        ("pass_yards", "yards_per_att", 1.0),
+        ("pass_td", "pass_td_rate", 1.0),
+        ("interceptions", "int_rate", 1.0),
+    ],
+    "rush_attempts": [
+        ("rush_yards", "yards_per_carry", 1.0),
+        ("rush_td", "rush_td_rate", 1.0),
+    ],
+    "targets": [
+        ("receptions", "catch_pct", 100.0),
+        ("rec_yards", "yards_per_target", 1.0),
+        ("rec_td", "rec_td_rate", 1.0),
+    ],
+}
+
+
+def scale_volume_dependents(
+    target: Any, volume_stat: str, previous_volume: Optional[float] = None
+) -> List[str]:
+    """
+    Rescale the counting stats that follow a volume stat after it changed.
+
+    With a previous volume the counting stats keep their ratio to it; otherwise the
+    stored rate for each counting stat is applied to the new volume.
+
+    Args:
+        target: Projection ORM object with the new volume already set
+        volume_stat: Volume stat that changed (pass_attempts, rush_attempts or targets)
+        previous_volume: Volume before the change, if known
+
+    Returns:
+        Names of the counting stats that were rescaled
+    """
+    new_volume = getattr(target, volume_stat, None)
+    if not new_volume:
+        return []
+
+    scaled: List[str] = []
+    for stat, rate_field, rate_scale in VOLUME_DEPENDENTS.get(volume_stat, []):
+        if previous_volume:
+            current = getattr(target, stat, None)
+            if current is None:
+                continue
+            rate = current / previous_volume
+        else:
+            stored_rate = getattr(target, rate_field, None)
+            if not stored_rate:
+                continue
+            rate = stored_rate / rate_scale
+
+        setattr(target, stat, new_volume * rate)
+        scaled.append(stat)
+
+    return scaled
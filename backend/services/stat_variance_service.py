@@ -0,0 +1,259 @@
+"""
+Stored week-to-week variance moments per player, season and stat.
+
+Historical coefficients of variation only change when game logs are imported, so
+instead of aggregating raw GameStats on every variance request the import pipeline
+keeps a StatVariance row per (player, season, stat) with the game count, sum and sum
+of squares of the stat. Moments of several seasons combine by addition, so a
+coefficient over any window of seasons is read from a handful of indexed rows.
+
+calculate_season_totals refreshes a season's rows after every import. A full-season
+refresh stamps its rows with the season's game log version (row count, newest row and
+stat total), so re-imports and GameStats written outside the pipeline show up as a
+version change. Reads never write: seasons whose rows are missing, unstamped or behind
+the current version are aggregated from the game logs for the requested players until
+the next refresh.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import pandas as pd
+from sqlalchemy import Float, cast, func, insert
+from sqlalchemy.orm import Session
+
+from backend.database.models import GAME_STAT_COLUMNS, GameStats, StatVariance
+
+logger = logging.getLogger(__name__)
+
+# Keys older imports used in GameStats.stats for the GAME_STAT_COLUMNS stats
+LEGACY_STAT_KEYS = {
+    "pass_attempts": "att",
+    "completions": "cmp",
+    "pass_yards": "pass_yds",
+    "pass_td": "pass_td",
+    "interceptions": "int",
+    "rush_attempts": "rush_att",
+    "rush_yards": "rush_yds",
+    "rush_td": "rush_td",
+    "targets": "tgt",
+    "receptions": "rec",
+    "rec_yards": "rec_yds",
+    "rec_td": "rec_td",
+}
+
+# Rows per executemany batch when writing moments
+STAT_VARIANCE_BATCH_SIZE = 5000
+
+
+def stat_value(stat: str):
+    """SQL expression for a game's value of a stat, falling back to its older JSON key."""
+    return func.coalesce(
+        getattr(GameStats, stat),
+        cast(func.json_extract(GameStats.stats, f"$.{LEGACY_STAT_KEYS[stat]}"), Float),
+    )
+
+
+class StatVarianceService:
+    """Maintains and reads the StatVariance moments."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_season(self, season: int, player_ids: Optional[Sequence[str]] = None) -> int:
+        """
+        Recompute a season's moments from its game logs in one grouped query.
+
+        Only a full-season refresh stamps the rows with the season's version; rows
+        written for a subset of players are unstamped, so the season reads as stale
+        until it is refreshed in full. Changes are left in the current transaction for
+        the caller to commit.
+
+        Args:
+            season: NFL season year
+            player_ids: Only recompute these players (default: the whole season)
+
+        Returns:
+            Number of rows written
+        """
+        existing = self.db.query(StatVariance).filter(StatVariance.season == season)
+        version = None
+        if player_ids is None:
+            version = self.season_versions([season]).get(season)
+        else:
+            existing = existing.filter(StatVariance.player_id.in_(player_ids))
+
+        computed_at = datetime.utcnow()
+        rows = [
+            {
+                "player_id": player_id,
+                "season": season,
+                "stat": stat,
+                "games": games,
+                "total": total,
+                "total_sq": total_sq,
+                "version": version,
+                "computed_at": computed_at,
+            }
+            for player_id, stat, games, total, total_sq in self._game_moments([season], player_ids)
+        ]
+
+        existing.delete(synchronize_session=False)
+        for start in range(0, len(rows), STAT_VARIANCE_BATCH_SIZE):
+            self.db.execute(insert(StatVariance), rows[start : start + STAT_VARIANCE_BATCH_SIZE])
+
+        logger.info(f"Stored {len(rows)} variance moments for season {season}")
+        return len(rows)
+
+    def season_versions(self, seasons: Iterable[int]) -> Dict[int, str]:
+        """
+        Version of each season's game logs: row count, newest row and the total of every
+        stat, so inserts, deletes, replace re-imports and edits all change it.
+
+        Args:
+            seasons: Seasons to check
+
+        Returns:
+            {season: version} for seasons with game logs
+        """
+        stat_total = sum(func.coalesce(stat_value(stat), 0.0) for stat in GAME_STAT_COLUMNS)
+        rows = (
+            self.db.query(
+                GameStats.season,
+                func.count(GameStats.game_stat_id),
+                func.max(GameStats.created_at),
+                func.sum(stat_total),
+            )
+            .filter(GameStats.season.in_(list(seasons)))
+            .group_by(GameStats.season)
+        )
+        return {
+            season: f"{count}:{newest}:{total!r}" for season, count, newest, total in rows
+        }
+
+    def stale_seasons(self, seasons: Iterable[int]) -> List[int]:
+        """
+        Seasons whose stored moments do not match their game logs.
+
+        A season is current only when every row carries the season's current version;
+        seasons without game logs or moments are current.
+
+        Args:
+            seasons: Seasons about to be read
+
+        Returns:
+            Stale seasons, in the order given
+        """
+        seasons = list(seasons)
+        current = self.season_versions(seasons)
+        stored = {
+            season: (rows, stamped, low, high)
+            for season, rows, stamped, low, high in self.db.query(
+                StatVariance.season,
+                func.count(StatVariance.stat_variance_id),
+                func.count(StatVariance.version),
+                func.min(StatVariance.version),
+                func.max(StatVariance.version),
+            )
+            .filter(StatVariance.season.in_(seasons))
+            .group_by(StatVariance.season)
+        }
+
+        stale = []
+        for season in seasons:
+            version = current.get(season)
+            if season not in stored:
+                if version is not None:
+                    stale.append(season)
+                continue
+            rows, stamped, low, high = stored[season]
+            if stamped < rows or low != high or low != version:
+                stale.append(season)
+        return stale
+
+    def moments(self, player_ids: Sequence[str], seasons: Iterable[int]) -> pd.DataFrame:
+        """
+        Moments per player and stat combined over several seasons.
+
+        Args:
+            player_ids: Players to read
+            seasons: Seasons to combine
+
+        Returns:
+            Frame indexed by player_id with "<stat>_n", "<stat>_mean" and "<stat>_sq"
+            (mean square) columns for every GAME_STAT_COLUMNS stat
+        """
+        seasons = list(seasons)
+        stale = self.stale_seasons(seasons)
+        stored_seasons = [season for season in seasons if season not in stale]
+
+        query = (
+            self.db.query(
+                StatVariance.player_id,
+                StatVariance.stat,
+                func.sum(StatVariance.games),
+                func.sum(StatVariance.total),
+                func.sum(StatVariance.total_sq),
+            )
+            .filter(StatVariance.season.in_(stored_seasons))
+            .group_by(StatVariance.player_id, StatVariance.stat)
+        )
+        if len(player_ids) == 1:
+            query = query.filter(StatVariance.player_id == player_ids[0])
+        elif player_ids:
+            query = query.filter(StatVariance.player_id.in_(list(player_ids)))
+        rows = query.all() if stored_seasons else []
+
+        if stale:
+            # Stale seasons are read from the game logs until the import pipeline
+            # refreshes them
+            logger.info(f"Variance moments for seasons {stale} are stale; using game logs")
+            rows += self._game_moments(stale, list(player_ids) or None)
+
+        frame = pd.DataFrame(rows, columns=["player_id", "stat", "n", "total", "total_sq"])
+        frame = frame.groupby(["player_id", "stat"], as_index=False).sum()
+        frame["mean"] = frame["total"] / frame["n"]
+        frame["sq"] = frame["total_sq"] / frame["n"]
+
+        wide = frame.pivot(index="player_id", columns="stat", values=["n", "mean", "sq"])
+        columns: Dict[str, pd.Series] = {}
+        for stat in GAME_STAT_COLUMNS:
+            for moment in ("n", "mean", "sq"):
+                key = (moment, stat)
+                columns[f"{stat}_{moment}"] = (
+                    wide[key] if key in wide.columns else pd.Series(0.0, index=wide.index)
+                )
+        return pd.DataFrame(columns, index=wide.index).fillna(0.0)
+
+    def _game_moments(
+        self, seasons: Sequence[int], player_ids: Optional[Sequence[str]] = None
+    ) -> List[Tuple[str, str, Any, Any, Any]]:
+        """
+        Moments aggregated from the game logs in one grouped query.
+
+        Args:
+            seasons: Seasons to combine
+            player_ids: Only these players (default: everyone)
+
+        Returns:
+            (player_id, stat, games, total, total_sq) rows for stats with games
+        """
+        columns = []
+        for stat in GAME_STAT_COLUMNS:
+            value = stat_value(stat)
+            columns += [func.count(value), func.sum(value), func.sum(value * value)]
+
+        query = self.db.query(GameStats.player_id, *columns).filter(
+            GameStats.season.in_(list(seasons))
+        )
+        if player_ids is not None:
+            query = query.filter(GameStats.player_id.in_(list(player_ids)))
+
+        rows = []
+        for player_id, *moments in query.group_by(GameStats.player_id):
+            for i, stat in enumerate(GAME_STAT_COLUMNS):
+                games, total, total_sq = moments[3 * i : 3 * i + 3]
+                if games:
+                    rows.append((player_id, stat, games, total, total_sq))
+        return rows
@@ -7,8 +7,11 @@ import uuid
 from datetime import datetime
 
 # Import at module level instead of within function
-from backend.database.models import Player, TeamStat, Projection, Scenario
+from backend.database.models import Player, TeamStat, Projection
 from backend.services.adapters.nfl_data_py_adapter import NFLDataPyAdapter
+from backend.services.cache_invalidation import invalidate_on_commit
+from backend.services.cache_service import team_tag
+from backend.services.scenario_delta_service import ScenarioDeltaService
 from backend.services.typing import (
     PlayerUsageDict,
     UsageMetricDict, 
@@ -320,133 +323,34 @@ class TeamStatService:
                     f"Found projection: player_id={proj.player_id}, scenario_id={proj.scenario_id}"
                 )
 
-            # Now filter by scenario_id
-            query = self.db.query(Projection).filter(
-                and_(Projection.player_id.in_(player_ids), Projection.season == season)
-            )
+            scenario_deltas = ScenarioDeltaService(self.db)
 
-            # Filter by scenario_id if provided
             if scenario_id:
-                query = query.filter(Projection.scenario_id == scenario_id)
-
-            projections = query.all()
+                # Scenario projections resolve through the base scenario chain; inherited
+                # ones are written back as deltas below
+                projections = scenario_deltas.resolve_projections(
+                    scenario_id, season=season, player_ids=player_ids
+                )
+            else:
+                projections = (
+                    self.db.query(Projection)
+                    .filter(and_(Projection.player_id.in_(player_ids), Projection.season == season))
+                    .all()
+                )
 
             # Log for debugging
             logger.info(
                 f"Found {len(projections)} projections for team {team} in season {season} with scenario_id {scenario_id}"
             )
 
-            # If there are no projections and a scenario_id is provided, we need to clone from base projections
+            # A scenario without projections for the team starts from the base
+            # projections, seeded as deltas rather than copied
             if len(projections) == 0 and scenario_id:
-                logger.info(
-                    f"No projections found for scenario_id {scenario_id}, cloning from base projections"
-                )
-
-                # Try to find a source scenario to clone from
-                # First check if the scenario already has a base scenario ID
-                source_scenario = None
-
-                if scenario_id:
-                    logger.debug(f"Looking up scenario with ID {scenario_id}")
-                    scenario = (
-                        self.db.query(Scenario).filter(Scenario.scenario_id == scenario_id).first()
-                    )
-                    if scenario:
-                        logger.debug(
-                            f"Found scenario: name={scenario.name}, base_scenario_id={scenario.base_scenario_id}"
-                        )
-                        if scenario.base_scenario_id:
-                            source_scenario = scenario.base_scenario_id
-                            logger.info(
-                                f"Found base scenario {source_scenario} for scenario {scenario_id}"
-                            )
-                    else:
-                        logger.debug(f"No scenario found with ID {scenario_id}")
-
-                # Get the source projections to clone from
-                # (either base scenario or projections with no scenario_id)
-                base_query = self.db.query(Projection).filter(
-                    and_(Projection.player_id.in_(player_ids), Projection.season == season)
+                seeded = scenario_deltas.seed_from_base(scenario_id, player_ids, season=season)
+                projections = scenario_deltas.resolve_projections(
+                    scenario_id, season=season, player_ids=player_ids
                 )
-
-                if source_scenario:
-                    # Use the base scenario_id as the source
-                    base_query = base_query.filter(Projection.scenario_id == source_scenario)
-                else:
-                    # If no base scenario, try to find projections with no scenario_id
-                    base_query = base_query.filter(Projection.scenario_id.is_(None))
-
-                base_projections = base_query.all()
-
-                logger.info(f"Found {len(base_projections)} base projections to clone")
-
-                # Clone each projection with the new scenario_id
-                for base_proj in base_projections:
-                    player = next((p for p in players if p.player_id == base_proj.player_id), None)
-                    if not player:
-                        continue
-
-                    # Create a new projection for the scenario
-                    new_proj = Projection(
-                        projection_id=str(uuid.uuid4()),
-                        player_id=base_proj.player_id,
-                        scenario_id=scenario_id,
-                        season=season,
-                        games=base_proj.games,
-                        half_ppr=base_proj.half_ppr,
-                        # Copy all stats
-                        pass_attempts=base_proj.pass_attempts,
-                        completions=base_proj.completions,
-                        pass_yards=base_proj.pass_yards,
-                        pass_td=base_proj.pass_td,
-                        interceptions=base_proj.interceptions,
-                        rush_attempts=base_proj.rush_attempts,
-                        rush_yards=base_proj.rush_yards,
-                        rush_td=base_proj.rush_td,
-                        targets=base_proj.targets,
-                        receptions=base_proj.receptions,
-                        rec_yards=base_proj.rec_yards,
-                        rec_td=base_proj.rec_td,
-                        # Efficiency metrics
-                        pass_td_rate=base_proj.pass_td_rate,
-                        comp_pct=base_proj.comp_pct,
-                        yards_per_att=base_proj.yards_per_att,
-                        yards_per_carry=base_proj.yards_per_carry,
-                        rec_td_rate=base_proj.rec_td_rate,
-                        # Usage metrics
-                        snap_share=base_proj.snap_share,
-                        target_share=base_proj.target_share,
-                        rush_share=base_proj.rush_share,
-                        redzone_share=base_proj.redzone_share,
-                    )
-
-                    self.db.add(new_proj)
-
-                # Commit the new projections
-                try:
-                    self.db.commit()
-
-                    # Get the newly created projections
-                    projections = (
-                        self.db.query(Projection)
-                        .filter(
-                            and_(
-                                Projection.player_id.in_(player_ids),
-                                Projection.season == season,
-                                Projection.scenario_id == scenario_id,
-                            )
-                        )
-                        .all()
-                    )
-
-                    logger.info(
-                        f"Created {len(projections)} new projections for scenario_id {scenario_id}"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Error creating scenario projections: {str(e)}")
-                    self.db.rollback()
-                    return []
+                logger.info(f"Seeded {seeded} base projections into scenario_id {scenario_id}")
 
             # Calculate total pass attempts and targets to ensure we maintain the proper ratio
             total_pass_attempts = sum(
@@ -647,6 +551,9 @@ class TeamStatService:
                             proj.half_ppr = proj.calculate_fantasy_points()
 
             # Save all changes
+            if scenario_id:
+                scenario_deltas.save_projections(scenario_id, projections)
+            invalidate_on_commit(self.db, [team_tag(team, season)])
             self.db.commit()
             return updated_projections
 
@@ -2,9 +2,7 @@
 import os
 import sys
 import pytest
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 import uuid
 import pandas as pd
 from fastapi.testclient import TestClient
@@ -20,7 +18,7 @@ logger = logging.getLogger(__name__)
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from backend.database.database import Base, get_db
+from backend.database.database import Base, create_database_engine, get_db
 from backend.database.models import Player, BaseStat, TeamStat, Projection
 from backend.services.team_stat_service import TeamStatService
 from backend.main import app as main_app
@@ -47,11 +45,7 @@ TEST_SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 @pytest.fixture(scope="function")
 def test_engine():
     """Create a test database engine."""
-    engine = create_engine(
-        TEST_SQLALCHEMY_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+    engine = create_database_engine(TEST_SQLALCHEMY_DATABASE_URL, profile="test")
     Base.metadata.create_all(bind=engine)
     yield engine
     Base.metadata.drop_all(bind=engine)
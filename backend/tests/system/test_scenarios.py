@@ -319,22 +319,19 @@ class TestScenarios:
 
             # Skip player 2 and 3 for simplicity
 
-            # Verify projections using direct DB query
-            print("Querying database directly...")
-            db_proj = (
-                test_db.query(Projection)
-                .filter(
-                    Projection.player_id == qb_player.player_id,
-                    Projection.scenario_id == scenario.scenario_id,
-                )
-                .first()
+            # Verify the stored projection; a player added from the base projections
+            # is stored as a delta, so read it back through the scenario
+            print("Reading the stored scenario projection...")
+            db_proj = await services["scenario"].get_player_scenario_projection(
+                scenario.scenario_id, qb_player.player_id
             )
 
-            print(f"Direct DB query result: {db_proj is not None}")
+            print(f"Stored projection found: {db_proj is not None}")
 
             # Basic assertion
             assert qb_scenario_proj is not None, "QB scenario projection wasn't created"
-            assert db_proj is not None, "DB query didn't find the projection"
+            assert db_proj is not None, "Stored scenario projection wasn't found"
+            assert db_proj.pass_attempts == pytest.approx(qb_adjustments["pass_attempts"])
 
             # Simple check on fantasy points
             assert qb_scenario_proj.half_ppr < qb_proj.half_ppr
@@ -1,4 +1,6 @@
 import pytest
+import asyncio
+import threading
 import time
 import json
 from unittest.mock import patch, MagicMock
@@ -94,6 +96,26 @@ class TestCacheService:
         assert cache.get("prefix_key2") is None
         assert cache.get("other_key") == "value3"
 
+    def test_invalidate_tags(self):
+        """Entries are removed by any of their tags and the index is kept in sync."""
+        cache = CacheService()
+        cache.set("listing", "value1", tags=["players", "player:a", "player:b"])
+        cache.set("stats_a", "value2", tags=["player:a"])
+        cache.set("stats_b", "value3", tags=["player:b"])
+
+        removed = cache.invalidate_tags(["player:a"])
+        assert removed == 2
+        assert cache.get("listing") is None
+        assert cache.get("stats_a") is None
+        assert cache.get("stats_b") == "value3"
+        assert "player:a" not in cache.tag_index
+        assert cache.tag_index["player:b"] == {"stats_b"}
+
+        # Overwriting an entry replaces its tags
+        cache.set("stats_b", "value4", tags=["player:c"])
+        assert cache.invalidate_tags(["player:b"]) == 0
+        assert cache.invalidate_tags(["player:c"]) == 1
+
     def test_cleanup(self):
         """Test cleaning up expired entries."""
         cache = CacheService(ttl_seconds=1)
@@ -181,6 +203,195 @@ class TestCacheService:
         assert result2 == 3
         assert counter == 1  # Counter shouldn't increment
 
+    def test_cached_single_flight_threads(self):
+        """Concurrent misses on one key run the function once and share its result."""
+        cache = CacheService()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @cache.cached()
+        def slow(x):
+            calls.append(x)
+            started.set()
+            release.wait(5)
+            return x * 2
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(slow(21))) for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert calls == [21]
+        assert results == [42] * 5
+        assert cache.get_stats()["coalesced"] == 4
+        assert cache.flights == {}
+
+    @pytest.mark.asyncio
+    async def test_cached_async_single_flight(self):
+        """Concurrent coroutines share one computation, including its failure."""
+        cache = CacheService()
+        calls = []
+
+        @cache.cached_async(tags=lambda result: [f"value:{result}"])
+        async def slow(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            if x < 0:
+                raise ValueError("negative")
+            return x * 2
+
+        results = await asyncio.gather(*[slow(5) for _ in range(4)])
+        assert results == [10] * 4
+        assert calls == [5]
+        assert "value:10" in cache.tag_index
+
+        errors = await asyncio.gather(*[slow(-1) for _ in range(3)], return_exceptions=True)
+        assert calls == [5, -1]
+        assert all(isinstance(error, ValueError) for error in errors)
+        assert cache.async_flights == {}
+
+        # Failures are not cached
+        with pytest.raises(ValueError):
+            await slow(-1)
+        assert calls == [5, -1, -1]
+
+    def test_invalidation_during_compute_is_not_cached(self):
+        """A result computed across an invalidation of its tags is returned but not cached."""
+        cache = CacheService()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return "before write"
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                cache.get_or_compute("listing:a", slow, tags=["player:1"])
+            )
+        )
+        thread.start()
+        started.wait(5)
+        cache.invalidate_tags(["player:1"])
+        release.set()
+        thread.join(5)
+
+        assert results == ["before write"]
+        assert cache.get("listing:a") is None
+        assert cache.get_stats()["discarded"] == 1
+        assert cache.tag_generations == {}
+
+        # Invalidations of other tags, or with nothing in flight, do not discard
+        cache.invalidate_tags(["player:1"])
+        assert cache.get_or_compute("listing:a", lambda: "after write", tags=["player:1"]) == (
+            "after write"
+        )
+        assert cache.get("listing:a") == "after write"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_async_compute_is_not_cached(self):
+        """Async computations that span an invalidation of their tags are not cached."""
+        cache = CacheService()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await release.wait()
+            return "before write"
+
+        task = asyncio.ensure_future(
+            cache.get_or_compute_async("trends:x", slow, tags=lambda result: ["player:1"])
+        )
+        await started.wait()
+        cache.invalidate_tags(["player:2"])
+        cache.invalidate_tags(["player:1"])
+        release.set()
+
+        assert await task == "before write"
+        assert cache.get("trends:x") is None
+        assert cache.get_stats()["discarded"] == 1
+
+        started.clear()
+        task = asyncio.ensure_future(cache.get_or_compute_async("trends:x", slow, tags=["player:1"]))
+        await started.wait()
+        cache.invalidate_tags(["player:2"])
+        assert await task == "before write"
+        assert cache.get("trends:x") == "before write"
+
+    def test_stale_while_revalidate_sync(self):
+        """An expired entry in its stale window is served while a thread refreshes it."""
+        cache = CacheService(stale_windows={"listing": 60})
+        versions = iter(["v1", "v2"])
+        refreshed = threading.Event()
+
+        def build():
+            value = next(versions)
+            if value == "v2":
+                refreshed.set()
+            return value
+
+        with patch("services.cache_service.time.time", return_value=1000):
+            assert cache.get_or_compute("listing:a", build, ttl_seconds=10) == "v1"
+        assert cache.stale_window("listing:a") == 60
+        assert cache.stale_window("other:a") == 0
+
+        with patch("services.cache_service.time.time", return_value=1020):
+            assert cache.get("listing:a") is None
+            assert cache.get_or_compute("listing:a", build, ttl_seconds=10) == "v1"
+            assert refreshed.wait(5)
+            cache.refresh_executor.shutdown(wait=True)
+            assert cache.get("listing:a") == "v2"
+        assert cache.get_stats()["stale_hits"] == 1
+
+        # Past the stale window the caller recomputes and waits
+        with patch("services.cache_service.time.time", return_value=1200):
+            assert cache.get_or_compute("listing:a", lambda: "v3", ttl_seconds=10) == "v3"
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate_async(self):
+        """Async callers get the stale value; one task refreshes it, failures keep it."""
+        cache = CacheService()
+        cache.set_stale_window("trends", 60)
+        calls = []
+
+        async def build():
+            calls.append(1)
+            await asyncio.sleep(0)
+            if len(calls) == 2:
+                raise RuntimeError("database unavailable")
+            return len(calls)
+
+        with patch("services.cache_service.time.time", return_value=1000):
+            assert await cache.get_or_compute_async("trends:x", build, ttl_seconds=10) == 1
+
+        with patch("services.cache_service.time.time", return_value=1020):
+            results = await asyncio.gather(
+                *[cache.get_or_compute_async("trends:x", build, ttl_seconds=10) for _ in range(3)]
+            )
+            assert results == [1, 1, 1]
+            await asyncio.gather(*cache.refresh_tasks)
+            assert cache.get_stats()["refresh_failures"] == 1
+
+            assert await cache.get_or_compute_async("trends:x", build, ttl_seconds=10) == 1
+            await asyncio.gather(*cache.refresh_tasks)
+            assert cache.get("trends:x") == 3
+        assert len(calls) == 3
+
+        # Invalidation is never served stale
+        cache.set("trends:y", "old", ttl_seconds=10, tags=["player:1"])
+        cache.invalidate_tags(["player:1"])
+        assert await cache.get_or_compute_async("trends:y", build) == 4
+
     def test_memory_management(self):
         """Test memory usage estimation."""
         cache = CacheService()
@@ -194,6 +405,46 @@ class TestCacheService:
         assert stats["size_bytes"] > 11000  # Should be at least the sum of data sizes
         assert stats["size_mb"] == stats["size_bytes"] / (1024 * 1024)
 
+    def test_lru_eviction_by_entry_cap(self):
+        """The least recently used entry is evicted once the entry cap is exceeded."""
+        cache = CacheService(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+
+        cache.set("c", 3, tags=["tag"])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_lru_eviction_by_byte_budget(self):
+        """Size is tracked incrementally and entries are evicted to stay within budget."""
+        cache = CacheService(max_bytes=30000)
+        cache.set("first", "x" * 10000, tags=["old"])
+        cache.set("second", "y" * 10000)
+        size_two = cache.get_stats()["size_bytes"]
+        assert 20000 < size_two < 30000
+
+        cache.set("third", "z" * 10000)
+
+        assert cache.get("first") is None
+        assert "old" not in cache.tag_index
+        assert cache.get_stats()["size_bytes"] <= 30000
+
+        # Replacing an entry swaps its size rather than adding to it
+        cache.set("third", "z")
+        assert cache.get_stats()["size_bytes"] < size_two
+
+        # A value larger than the whole budget is never cached
+        cache.set("huge", "h" * 40000)
+        assert cache.get("huge") is None
+        assert cache.get("second") is not None
+
+        cache.clear()
+        assert cache.get_stats()["size_bytes"] == 0
+
     def test_thread_safety_with_locks(self):
         """Test that locks are used for thread safety."""
         cache = CacheService()
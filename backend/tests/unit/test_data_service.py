@@ -1,4 +1,5 @@
 import pytest
+from backend.database.models import GameStats
 from backend.services import DataService
 
 
@@ -86,3 +87,47 @@ class TestDataService:
         assert rush_yards.value == 1459
         rec_td = next(stat for stat in mccaffrey_stats if stat.stat_type == "rec_td")
         assert rec_td.value == 7
+
+    @pytest.mark.asyncio
+    async def test_get_player_splits(self, service, test_db, sample_players):
+        """Splits are summed in SQL from the GameStats stat columns."""
+        mccaffrey_id = sample_players["ids"]["Christian McCaffrey"]
+        games = [
+            (1, "home", "W", 30, 7, {"rush_yards": 152, "rush_td": 1, "targets": 7}),
+            (2, "away", "W", 30, 23, {"rush_yards": 116, "rush_td": 1}),
+            (3, "home", "L", 10, 24, {"rush_yards": 83, "rec_yards": 34}),
+        ]
+        for week, location, result, scored, allowed, stats in games:
+            test_db.add(
+                GameStats(
+                    player_id=mccaffrey_id,
+                    season=2023,
+                    week=week,
+                    opponent="OPP",
+                    game_location=location,
+                    result=result,
+                    team_score=scored,
+                    opponent_score=allowed,
+                    stats=stats,
+                )
+            )
+        test_db.commit()
+
+        splits = await service.get_player_splits(mccaffrey_id, 2023, "home_away")
+        assert splits["home"]["games"] == 2
+        assert splits["home"]["total_points"] == 40
+        assert splits["home"]["rush_yards"] == 235
+        assert splits["home"]["rec_yards"] == 34
+        assert splits["away"] == {
+            "games": 1, "total_points": 30, "points_allowed": 23, "rush_yards": 116, "rush_td": 1
+        }
+
+        splits = await service.get_player_splits(mccaffrey_id, 2023, "win_loss")
+        assert splits["wins"]["rush_td"] == 2
+        assert splits["losses"]["games"] == 1
+        assert await service.get_player_splits(mccaffrey_id, 2022, "win_loss") == {
+            "wins": {}, "losses": {}
+        }
+
+        with pytest.raises(ValueError):
+            await service.get_player_splits(mccaffrey_id, 2023, "day_night")
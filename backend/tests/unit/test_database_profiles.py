@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import inspect, text
+
+from backend.database.database import DATABASE_PROFILES, create_database_engine, upgrade_schema
+import backend.database.models  # noqa: F401  (registers the tables)
+
+
+class TestDatabaseProfiles:
+    def _pragma(self, engine, name):
+        with engine.connect() as conn:
+            return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+    def test_serving_profile_pragmas(self, tmp_path):
+        """Every pooled connection gets WAL, relaxed syncs and the busy timeout."""
+        engine = create_database_engine(f"sqlite:///{tmp_path / 'serving.db'}", "serving")
+
+        assert self._pragma(engine, "journal_mode") == "wal"
+        assert self._pragma(engine, "synchronous") == 1  # NORMAL
+        assert self._pragma(engine, "busy_timeout") == 5000
+        assert self._pragma(engine, "temp_store") == 2  # MEMORY
+        assert self._pragma(engine, "cache_size") == -64000
+        assert engine.pool.size() == DATABASE_PROFILES["serving"]["pool"]["pool_size"]
+        engine.dispose()
+
+    def test_bulk_import_profile(self, tmp_path):
+        engine = create_database_engine(f"sqlite:///{tmp_path / 'bulk.db'}", "bulk_import")
+
+        assert self._pragma(engine, "wal_autocheckpoint") == 10000
+        assert self._pragma(engine, "busy_timeout") == 30000
+        engine.dispose()
+
+    def test_test_profile_and_unknown_profile(self):
+        engine = create_database_engine("sqlite:///:memory:", "test")
+        assert self._pragma(engine, "synchronous") == 0
+
+        with pytest.raises(ValueError):
+            create_database_engine("sqlite:///:memory:", "fast")
+
+    def test_upgrade_schema_adds_game_stat_columns(self, tmp_path):
+        """Databases created before the stat columns existed get them on upgrade."""
+        engine = create_database_engine(f"sqlite:///{tmp_path / 'old.db'}", "test")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE game_stats (game_stat_id VARCHAR PRIMARY KEY, player_id VARCHAR, "
+                "season INTEGER, week INTEGER, opponent VARCHAR, game_location VARCHAR, "
+                "result VARCHAR, team_score INTEGER, opponent_score INTEGER, stats JSON, "
+                "created_at DATETIME)"
+            ))
+            conn.execute(text(
+                "INSERT INTO game_stats (game_stat_id, season, week, stats) "
+                "VALUES ('g1', 2023, 1, '{\"rush_yards\": 87, \"rush_td\": \"2\"}')"
+            ))
+
+        upgrade_schema(engine)
+        upgrade_schema(engine)  # idempotent
+
+        with engine.connect() as conn:
+            row = conn.execute(text("SELECT rush_yards, rush_td, rec_yards FROM game_stats")).one()
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT week FROM game_stats "
+                "WHERE season = 2023 AND week = 1 AND rush_yards > 50"
+            )).all()
+        assert tuple(row) == (87.0, 2.0, None)
+        assert "ix_game_stats_season_week_rush_yards" in str(plan)
+        engine.dispose()
+
+    def test_upgrade_schema_adds_nullable_columns(self, tmp_path):
+        engine = create_database_engine(f"sqlite:///{tmp_path / 'old.db'}", "test")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE import_logs (log_id VARCHAR PRIMARY KEY, operation VARCHAR, "
+                "status VARCHAR, message VARCHAR, details JSON, created_at DATETIME)"
+            ))
+
+        upgrade_schema(engine)
+
+        columns = {c["name"] for c in inspect(engine).get_columns("import_logs")}
+        indexes = {i["name"] for i in inspect(engine).get_indexes("import_logs")}
+        assert {"dataset", "season", "watermark"} <= columns
+        assert "ix_import_logs_dataset_season" in indexes
+        engine.dispose()
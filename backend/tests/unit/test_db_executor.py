@@ -0,0 +1,105 @@
+import pytest
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.executor import run_in_db_thread
+from backend.database.models import Player
+from backend.services.query_service import QUERY_CACHE_TTL, QueryService
+from backend.services.cache_service import get_cache
+
+
+class TestDbExecutor:
+    @pytest.mark.asyncio
+    async def test_blocking_work_leaves_loop_free(self, test_db):
+        """The event loop keeps running while a blocking query is in flight."""
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        def slow_count():
+            time.sleep(0.1)
+            return test_db.query(Player).count()
+
+        started = time.perf_counter()
+        count, _ = await asyncio.gather(run_in_db_thread(test_db, slow_count), ticker())
+
+        assert count == 0
+        assert len(ticks) == 5 and ticks[-1] - started < 0.1
+
+    @pytest.mark.asyncio
+    async def test_calls_on_one_session_are_serialized(self, test_db):
+        active = []
+        overlaps = []
+
+        def work():
+            active.append(threading.get_ident())
+            if len(active) > 1:
+                overlaps.append(True)
+            time.sleep(0.02)
+            active.pop()
+
+        await asyncio.gather(*[run_in_db_thread(test_db, work) for _ in range(4)])
+        assert overlaps == []
+
+    @pytest.mark.asyncio
+    async def test_query_service_reads_off_loop(self, test_db, sample_players):
+        get_cache().clear()
+        loop_thread = threading.get_ident()
+        seen = []
+        service = QueryService(test_db)
+        original = service._query_player_search
+
+        def spy(*args):
+            seen.append(threading.get_ident())
+            return original(*args)
+
+        service._query_player_search = spy
+        results = await asyncio.gather(*[service.search_players("Mahomes") for _ in range(3)])
+
+        assert [p["name"] for p in results[0]] == ["Patrick Mahomes"]
+        assert len(seen) == 1 and seen[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_stale_refresh_uses_its_own_session(self, test_engine, sample_players):
+        """A background refresh runs after the request's Session is closed."""
+        cache = get_cache()
+        cache.clear()
+        cache.set_stale_window("player_search", 60)
+        request_db = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)()
+        service = QueryService(request_db)
+        before = cache.get_stats()
+
+        try:
+            with patch("backend.services.cache_service.time.time", return_value=1000):
+                first = await service.search_players("Mahomes", active_only=False)
+
+            # The request is over: get_db has closed its Session
+            request_db.close()
+
+            def closed(*args, **kwargs):
+                raise AssertionError("request Session used after the request")
+
+            request_db.query = closed
+
+            with patch(
+                "backend.services.cache_service.time.time",
+                return_value=1000 + QUERY_CACHE_TTL + 10,
+            ):
+                stale = await service.search_players("Mahomes", active_only=False)
+                await asyncio.gather(*cache.refresh_tasks)
+                refreshed = await service.search_players("Mahomes", active_only=False)
+        finally:
+            cache.set_stale_window("player_search", 0)
+
+        assert [p["name"] for p in first] == ["Patrick Mahomes"]
+        assert stale == first
+        assert refreshed == first
+        after = cache.get_stats()
+        assert after["refresh_failures"] == before["refresh_failures"]
+        assert after["stale_hits"] == before["stale_hits"] + 1
@@ -0,0 +1,148 @@
+import pytest
+import uuid
+import pandas as pd
+
+from backend.database.models import DraftBoard, Projection
+from backend.services.cache_service import get_cache
+from backend.services.draft_service import DraftService
+from backend.services.draft_value_service import DraftValueEngine, replacement_depths
+
+
+def value_frame(rows):
+    return pd.DataFrame(
+        [
+            {"player_id": pid, "name": pid.upper(), "team": "KC", "position": pos, "points": pts}
+            for pid, pos, pts in rows
+        ]
+    )
+
+
+class TestDraftValueEngine:
+    def test_replacement_depths_follow_league_size(self):
+        depths = replacement_depths(12, 14, None)
+        assert depths == {"QB": 24, "RB": 60, "WR": 60, "TE": 24}
+
+        superflex = replacement_depths(10, 10, {"starters": {"QB": 2, "RB": 2, "WR": 3, "TE": 1}})
+        assert superflex == {"QB": 25, "RB": 25, "WR": 38, "TE": 12}
+
+    def test_replacement_level_moves_with_picks(self):
+        frame = value_frame([(f"rb{i}", "RB", 100 - 20 * i) for i in range(5)])
+        engine = DraftValueEngine(frame, set(), {"RB": 2})
+
+        # Two RBs will be drafted, so the third best is the replacement
+        assert engine.replacement_levels()["RB"] == 60
+        assert engine.ranked(limit=1)[0]["vorp"] == 40
+
+        # Drafting a starter leaves the replacement where it was
+        assert engine.set_drafted("rb0", True)
+        assert engine.replacement_levels()["RB"] == 60
+        assert engine.ranked(limit=1)[0]["player_id"] == "rb1"
+
+        # A reach below the line uses up demand, so the line moves up
+        engine.set_drafted("rb3", True)
+        assert engine.replacement_levels()["RB"] == 80
+        assert [row["player_id"] for row in engine.ranked()] == ["rb1", "rb2", "rb4"]
+
+        # Repeated and unknown updates are no-ops; undo restores the line
+        assert not engine.set_drafted("rb3", True)
+        assert not engine.set_drafted("nobody", True)
+        engine.set_drafted("rb3", False)
+        assert engine.replacement_levels()["RB"] == 60
+        assert engine.available_count("RB") == 4
+
+    def test_ranked_merges_positions_by_vorp(self):
+        frame = value_frame(
+            [
+                ("qb0", "QB", 380),
+                ("qb1", "QB", 300),
+                ("qb2", "QB", 290),
+                ("rb0", "RB", 250),
+                ("rb1", "RB", 180),
+                ("rb2", "RB", 100),
+            ]
+        )
+        engine = DraftValueEngine(frame, {"rb0"}, {"QB": 1, "RB": 1})
+
+        ranked = engine.ranked()
+        assert [row["player_id"] for row in ranked] == ["qb0", "qb1", "rb1", "qb2", "rb2"]
+        assert ranked[0]["vorp"] == 80
+        assert ranked[2] == {
+            "player_id": "rb1",
+            "name": "RB1",
+            "team": "KC",
+            "position": "RB",
+            "points": 180.0,
+            "replacement": 180.0,
+            "vorp": 0.0,
+            "position_rank": 1,
+            "rank": 3,
+        }
+
+        page = engine.ranked(limit=2, offset=1)
+        assert [(row["player_id"], row["rank"]) for row in page] == [("qb1", 2), ("rb1", 3)]
+        assert [row["player_id"] for row in engine.ranked(position="RB")] == ["rb1", "rb2"]
+        assert engine.available_count() == 5
+
+
+class TestDraftValueBoard:
+    @pytest.fixture(scope="function")
+    def board(self, test_db, sample_players):
+        """Single-team board that drafts one QB, with base projections for both QBs."""
+        get_cache().clear()
+        ids = sample_players["ids"]
+        for name, pass_yards, pass_td in [("Patrick Mahomes", 4800, 38), ("Brock Purdy", 4000, 28)]:
+            projection = Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids[name], season=2024, games=17,
+                half_ppr=0.0, pass_attempts=550, completions=370, pass_yards=pass_yards,
+                pass_td=pass_td, interceptions=10,
+            )
+            projection.half_ppr = projection.calculate_fantasy_points()
+            test_db.add(projection)
+
+        board = DraftBoard(
+            draft_board_id=str(uuid.uuid4()), name="One QB", season=2024, number_of_teams=1,
+            roster_spots=1, settings={"starters": {"QB": 1, "RB": 0, "WR": 0, "TE": 0}},
+        )
+        test_db.add(board)
+        test_db.commit()
+        return board
+
+    @pytest.mark.asyncio
+    async def test_value_board_follows_picks(self, test_db, sample_players, board):
+        ids = sample_players["ids"]
+        service = DraftService(test_db)
+
+        result = await service.get_value_board(board.draft_board_id, position="QB")
+        purdy_points = result["replacement_levels"]["QB"]
+        assert [row["name"] for row in result["players"]] == ["Patrick Mahomes", "Brock Purdy"]
+        assert result["players"][1]["vorp"] == 0
+        assert result["players"][0]["vorp"] == pytest.approx(
+            result["players"][0]["points"] - purdy_points
+        )
+        engine = service.value_engines.get(board.draft_board_id)
+
+        # A pick is applied to the existing engine instead of rebuilding it
+        await service.update_draft_status(ids["Patrick Mahomes"], "drafted", fantasy_team="Team 1")
+        result = await service.get_value_board(board.draft_board_id)
+        assert service.value_engines.get(board.draft_board_id) is engine
+        assert [row["name"] for row in result["players"]] == ["Brock Purdy"]
+        assert result["total"] == 1
+
+        await service.undo_last_draft_pick()
+        result = await service.get_value_board(board.draft_board_id)
+        assert result["total"] == 2
+        assert service.value_engines.get(board.draft_board_id) is engine
+
+        # A projection write invalidates the engine
+        purdy = test_db.query(Projection).filter(Projection.player_id == ids["Brock Purdy"]).one()
+        purdy.pass_td = 50
+        purdy.half_ppr = purdy.calculate_fantasy_points()
+        test_db.commit()
+        assert service.value_engines.get(board.draft_board_id) is None
+
+        result = await service.get_value_board(board.draft_board_id)
+        assert result["players"][0]["name"] == "Brock Purdy"
+
+    @pytest.mark.asyncio
+    async def test_missing_board(self, test_db):
+        assert await DraftService(test_db).get_value_board(str(uuid.uuid4())) is None
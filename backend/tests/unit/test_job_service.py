@@ -0,0 +1,133 @@
+import pytest
+import threading
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from backend.api.routes.jobs import router
+from backend.database.database import Base, create_database_engine, get_db
+from backend.database.models import ImportLog, Job, JobStatus
+from backend.services.job_service import JobRunner, get_job_runner
+
+
+class TestJobRunner:
+    @pytest.fixture
+    def job_engine(self, tmp_path):
+        # Jobs use the database from worker threads, so they need a pooled file
+        # database rather than the single shared in-memory connection
+        engine = create_database_engine(f"sqlite:///{tmp_path / 'jobs.db'}", profile="serving")
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def test_db(self, job_engine):
+        db = sessionmaker(bind=job_engine, autoflush=False)()
+        yield db
+        db.close()
+
+    @pytest.fixture
+    def runner(self, job_engine):
+        runner = JobRunner(
+            max_workers=1, session_factory=sessionmaker(bind=job_engine, autoflush=False)
+        )
+        yield runner
+        runner.shutdown()
+
+    def test_job_records_progress_result_and_log(self, runner, test_db):
+        async def work(db, job):
+            job.report(0.5, "halfway")
+            return {"imported": 3}
+
+        job_id = runner.submit("nfl_import", work, {"season": 2023})
+        runner.wait(job_id, timeout=10)
+
+        job = test_db.get(Job, job_id)
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.progress == 1.0
+        assert job.message == "halfway"
+        assert job.result == {"imported": 3}
+        assert job.params == {"season": 2023}
+        assert job.started_at is not None and job.finished_at is not None
+
+        log = test_db.query(ImportLog).filter(ImportLog.operation == "job_nfl_import").one()
+        assert log.status == "success"
+        assert log.details["job_id"] == job_id
+
+    def test_failed_job_records_error(self, runner, test_db):
+        async def work(db, job):
+            raise ValueError("no data for season")
+
+        job_id = runner.submit("nfl_import", work)
+        runner.wait(job_id, timeout=10)
+
+        job = test_db.get(Job, job_id)
+        assert job.status == JobStatus.FAILED
+        assert job.error == "no data for season"
+        assert test_db.query(ImportLog).one().status == "error"
+
+    def test_cancel_queued_and_running_jobs(self, runner, test_db):
+        started = threading.Event()
+        release = threading.Event()
+
+        async def blocking(db, job):
+            started.set()
+            release.wait(timeout=10)
+            job.report(0.9)
+            return {"finished": True}
+
+        async def never_runs(db, job):
+            raise AssertionError("cancelled job ran")
+
+        running_id = runner.submit("export_projections", blocking)
+        queued_id = runner.submit("export_projections", never_runs)
+        assert started.wait(timeout=10)
+
+        # The pool has one worker, so the second job is still queued
+        assert runner.cancel(queued_id)
+        assert runner.cancel(running_id)
+        release.set()
+        runner.wait(running_id, timeout=10)
+
+        test_db.expire_all()
+        assert test_db.get(Job, queued_id).status == JobStatus.CANCELLED
+        assert test_db.get(Job, running_id).status == JobStatus.CANCELLED
+        assert not runner.cancel(running_id)
+
+    def test_recover_interrupted(self, runner, test_db):
+        test_db.add(Job(operation="nfl_import", status=JobStatus.RUNNING))
+        test_db.commit()
+
+        assert runner.recover_interrupted() == 1
+        test_db.expire_all()
+        assert test_db.query(Job).one().status == JobStatus.FAILED
+
+    def test_job_routes(self, runner, test_db):
+        async def work(db, job):
+            return {"filename": "projections.csv", "media_type": "text/csv", "content": "a,b\n"}
+
+        app = FastAPI()
+        app.include_router(router, prefix="/api/jobs")
+        app.dependency_overrides[get_db] = lambda: test_db
+        app.dependency_overrides[get_job_runner] = lambda: runner
+        client = TestClient(app)
+
+        job_id = runner.submit("export_projections", work)
+        runner.wait(job_id, timeout=10)
+
+        response = client.get(f"/api/jobs/{job_id}")
+        assert response.status_code == 200
+        assert response.json()["status"] == "succeeded"
+        assert response.json()["result"]["filename"] == "projections.csv"
+
+        # Listing jobs leaves out their results
+        listing = client.get("/api/jobs/")
+        assert [job["job_id"] for job in listing.json()] == [job_id]
+        assert "result" not in listing.json()[0]
+
+        download = client.get(f"/api/jobs/{job_id}/download")
+        assert download.text == "a,b\n"
+        assert "projections.csv" in download.headers["content-disposition"]
+
+        assert client.post(f"/api/jobs/{job_id}/cancel").status_code == 409
+        assert client.get("/api/jobs/missing").status_code == 404
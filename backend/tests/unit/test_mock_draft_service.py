@@ -0,0 +1,130 @@
+import pytest
+import uuid
+import numpy as np
+
+from backend.database.models import DraftBoard, Projection
+from backend.services.cache_service import get_cache
+from backend.services.mock_draft_service import MockDraftService, simulate_drafts, snake_team
+
+
+def run_drafts(adp, positions, limits, teams, rounds, simulations=200, seed=1):
+    return simulate_drafts(
+        np.array(adp, dtype=float),
+        np.array(positions),
+        np.array(limits),
+        teams,
+        rounds,
+        simulations,
+        np.random.SeedSequence(seed),
+    )
+
+
+class TestSimulateDrafts:
+    def test_snake_order(self):
+        assert [snake_team(pick, 3) for pick in range(7)] == [0, 1, 2, 2, 1, 0, 0]
+
+    def test_counts_follow_adp(self):
+        # ADPs far apart relative to the pick noise
+        counts = run_drafts([1, 30, 300, 3000], [0, 1, 2, 3], [1, 1, 1, 1], teams=2, rounds=1)
+
+        assert counts.shape == (4, 3)
+        assert (counts.sum(axis=1) == 200).all()
+        assert counts[0, 0] == 200
+        assert counts[1, 1] == 200
+        assert counts[2:, 2].tolist() == [200, 200]
+
+    def test_position_limits(self):
+        # One team, one QB allowed: the second QB is passed over for the RB
+        counts = run_drafts([1, 20, 50], [0, 0, 1], [1, 2, 2, 2], teams=1, rounds=2)
+
+        assert counts[0, 0] == 200
+        assert counts[1, 2] == 200
+        assert counts[2, 1] == 200
+
+
+class TestMockDraftService:
+    @pytest.fixture(scope="function")
+    def board(self, test_db, sample_players):
+        """Two teams, two rounds, and base projections for the four sample players."""
+        get_cache().clear()
+        ids = sample_players["ids"]
+        rows = [
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Patrick Mahomes"], season=2024,
+                games=17, half_ppr=0.0, pass_attempts=600, completions=400, pass_yards=4800,
+                pass_td=38, interceptions=10,
+            ),
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Brock Purdy"], season=2024,
+                games=17, half_ppr=0.0, pass_attempts=520, completions=350, pass_yards=4000,
+                pass_td=28, interceptions=9,
+            ),
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Travis Kelce"], season=2024,
+                games=16, half_ppr=0.0, targets=140, receptions=98, rec_yards=1200, rec_td=10,
+            ),
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Christian McCaffrey"],
+                season=2024, games=16, half_ppr=0.0, rush_attempts=280, rush_yards=1400,
+                rush_td=14, targets=110, receptions=88, rec_yards=750, rec_td=5,
+            ),
+        ]
+        for projection in rows:
+            projection.half_ppr = projection.calculate_fantasy_points()
+            test_db.add(projection)
+
+        board = DraftBoard(
+            draft_board_id=str(uuid.uuid4()), name="Mock", season=2024, number_of_teams=2,
+            roster_spots=2,
+        )
+        test_db.add(board)
+        test_db.commit()
+        return board
+
+    @pytest.mark.asyncio
+    async def test_seeded_results_reproduce(self, test_db, sample_players, board):
+        service = MockDraftService(test_db)
+        ids = sample_players["ids"]
+        adp = {ids["Travis Kelce"]: 0.5}
+
+        runs = [
+            await service.simulate(
+                board.draft_board_id, simulations=300, seed=7, adp=adp, workers=workers
+            )
+            for workers in (1, 1, 2)
+        ]
+        first, again, pooled = runs
+
+        assert first.seed == 7
+        assert np.array_equal(first.counts, again.counts)
+        assert np.array_equal(first.counts, pooled.counts)
+
+        # Four players, four picks: everyone goes, and the ADP override leads the pool
+        summary = first.summary()
+        assert summary["player_id"].iloc[0] == ids["Travis Kelce"]
+        assert summary["drafted_probability"].tolist() == [1.0] * 4
+        assert first.slot_picks(1) == [1, 4]
+
+        availability = first.availability()
+        assert availability.shape == (4, 4)
+        assert (availability[:, 0] == 1.0).all()
+        assert (np.diff(availability, axis=1) <= 0).all()
+
+    @pytest.mark.asyncio
+    async def test_unseeded_run_reports_its_seed(self, test_db, board):
+        service = MockDraftService(test_db)
+
+        result = await service.simulate(board.draft_board_id, simulations=50, workers=1)
+        replay = await service.simulate(
+            board.draft_board_id, simulations=50, seed=result.seed, workers=1
+        )
+
+        assert np.array_equal(result.counts, replay.counts)
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests(self, test_db, board):
+        service = MockDraftService(test_db)
+
+        assert await service.simulate(str(uuid.uuid4())) is None
+        with pytest.raises(ValueError):
+            await service.simulate(board.draft_board_id, simulations=0)
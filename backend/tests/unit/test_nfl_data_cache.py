@@ -0,0 +1,88 @@
+import pytest
+import json
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from backend.services.adapters.nfl_data_cache import (
+    NFLDataCache,
+    NFLDataCacheMiss,
+    season_is_complete,
+)
+from backend.services.adapters.nfl_data_py_adapter import NFLDataPyAdapter
+
+
+class TestNFLDataCache:
+    @pytest.fixture
+    def frame(self):
+        return pd.DataFrame(
+            {"player_id": ["p1", "p2"], "week": [1, 2], "passing_yards": [250.0, None]}
+        )
+
+    def test_second_fetch_skips_download(self, tmp_path, frame):
+        cache = NFLDataCache(tmp_path)
+        download = MagicMock(return_value=frame)
+
+        first = cache.fetch("weekly", 2020, download)
+        second = NFLDataCache(tmp_path).fetch("weekly", 2020, download)
+
+        assert download.call_count == 1
+        pd.testing.assert_frame_equal(first, frame)
+        pd.testing.assert_frame_equal(second, frame)
+
+    def test_refresh_policies(self, tmp_path, frame):
+        download = MagicMock(return_value=frame)
+        NFLDataCache(tmp_path).fetch("players", None, download)
+
+        # Season-less and current-season frames expire after max_age under "auto"
+        ref_path = tmp_path / "refs" / "players.json"
+        ref = json.loads(ref_path.read_text())
+        ref["fetched_at"] = (datetime.utcnow() - timedelta(days=1)).isoformat()
+        ref_path.write_text(json.dumps(ref))
+
+        NFLDataCache(tmp_path, refresh="never").fetch("players", None, download)
+        assert download.call_count == 1
+        NFLDataCache(tmp_path).fetch("players", None, download)
+        assert download.call_count == 2
+        NFLDataCache(tmp_path, refresh="always").fetch("players", None, download)
+        assert download.call_count == 3
+
+        assert season_is_complete(2023, today=date(2024, 3, 1))
+        assert not season_is_complete(2024, today=date(2025, 2, 9))
+
+    def test_offline_mode(self, tmp_path, frame):
+        download = MagicMock(return_value=frame)
+        NFLDataCache(tmp_path, refresh="always").fetch("weekly", 2020, download)
+
+        offline = NFLDataCache(tmp_path, refresh="always", offline=True)
+        pd.testing.assert_frame_equal(offline.fetch("weekly", 2020, download), frame)
+        with pytest.raises(NFLDataCacheMiss):
+            offline.fetch("weekly", 2021, download)
+        assert download.call_count == 1
+
+    def test_objects_are_content_addressed(self, tmp_path, frame):
+        cache = NFLDataCache(tmp_path)
+        first = cache.store("weekly", 2020, frame)
+        assert cache.store("weekly", 2021, frame) == first
+        assert len(list((tmp_path / "objects").iterdir())) == 1
+
+        # Replacing a frame drops its old object once nothing refers to it
+        changed = frame.assign(week=[3, 4])
+        cache.store("weekly", 2020, changed)
+        cache.store("weekly", 2021, changed)
+        assert len(list((tmp_path / "objects").iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def test_adapter_uses_cache(self, tmp_path, frame):
+        adapter = NFLDataPyAdapter(cache=NFLDataCache(tmp_path))
+        download = MagicMock(return_value=frame)
+
+        with patch(
+            "backend.services.adapters.nfl_data_py_adapter.nfl.import_weekly_data", download
+        ):
+            await adapter.get_weekly_stats(2020)
+            result = await adapter.get_weekly_stats(2020)
+
+        download.assert_called_once_with([2020])
+        assert len(result) == 2
@@ -1,10 +1,13 @@
 import pytest
+import asyncio
+import threading
 from unittest.mock import patch, MagicMock, AsyncMock
 import pandas as pd
 import numpy as np
 from sqlalchemy.orm import Session
 
 from backend.services.nfl_data_import_service import NFLDataImportService
+from backend.services.adapters.nfl_data_py_adapter import NFLDataPyAdapter
 from backend.database.models import Player, BaseStat, GameStats, TeamStat
 
 
@@ -699,3 +702,57 @@ class TestNFLDataImportService:
 
         # WR: 7*0.5 + 110*0.1 + 1*6 + 10*0.1 = 3.5 + 11 + 6 + 1 = 21.5
         assert abs(wr_points - 21.5) < 0.1
+
+    @pytest.mark.asyncio
+    async def test_import_seasons_overlaps_downloads(self, mock_db):
+        """All downloads start before the first season is written."""
+        service = NFLDataImportService(mock_db)
+        service._log_import = MagicMock()
+        service.nfl_api_adapter = AsyncMock()
+        events = []
+
+        def download(method):
+            async def fetch(season):
+                events.append(("download", method, season))
+                await asyncio.sleep(0)
+                return f"{method}-{season}"
+
+            return fetch
+
+        for method in ("get_players", "get_weekly_stats", "get_schedules", "get_team_stats"):
+            setattr(service.nfl_data_adapter, method, download(method))
+
+        async def stages(season):
+            weekly = await service._fetch("get_weekly_stats", season)
+            players = await service._fetch("get_players", season)
+            events.append(("stages", season, weekly, players))
+            return {"season": season}
+
+        service._import_season_stages = stages
+
+        result = await service.import_seasons([2022, 2023])
+
+        assert result["seasons"] == {2022: {"season": 2022}, 2023: {"season": 2023}}
+        # The player list is downloaded once for both seasons
+        assert len([e for e in events if e[0] == "download"]) == 7
+        assert [e[0] for e in events[-2:]] == ["stages", "stages"]
+        assert events[-2] == ("stages", 2022, "get_weekly_stats-2022", "get_players-2023")
+        assert service._prefetched == {}
+
+    @pytest.mark.asyncio
+    async def test_adapter_downloads_run_off_loop(self):
+        loop_thread = threading.get_ident()
+        seen = []
+
+        def import_weekly_data(seasons):
+            seen.append(threading.get_ident())
+            return pd.DataFrame({"season": seasons})
+
+        with patch(
+            "backend.services.adapters.nfl_data_py_adapter.nfl.import_weekly_data",
+            import_weekly_data,
+        ):
+            result = await NFLDataPyAdapter().get_weekly_stats(2023)
+
+        assert len(result) == 1
+        assert seen and seen[0] != loop_thread
@@ -2,6 +2,8 @@ import pytest
 import uuid
 from sqlalchemy.orm import Session
 from backend.services.override_service import OverrideService
+from backend.services.query_service import QueryService
+from backend.services.cache_service import get_cache, player_tag
 from backend.database.models import StatOverride, Projection, Player, BaseStat
 
 
@@ -28,7 +30,7 @@ class TestOverrideService:
             pass_yards=4800,
             pass_td=38,
             interceptions=10,
-            comp_pct=0.667,
+            comp_pct=66.7,
             yards_per_att=8.0,
             pass_td_rate=0.063,
             int_rate=0.017,
@@ -107,6 +109,33 @@ class TestOverrideService:
         assert round(updated_proj.yards_per_att, 3) == round(original_yards_per_att, 3)
         assert round(updated_proj.pass_td_rate, 3) == round(original_pass_td_rate, 3)
 
+    @pytest.mark.asyncio
+    async def test_create_override_invalidates_cached_listing(
+        self, service, test_db, sample_projection
+    ):
+        """Committing an override drops cached results tagged with the player."""
+        cache = get_cache()
+        cache.clear()
+        query_service = QueryService(test_db)
+        await query_service.get_players_optimized(
+            include_projections=True, active_only=False
+        )
+        assert player_tag(sample_projection.player_id) in cache.tag_index
+
+        await service.create_override(
+            player_id=sample_projection.player_id,
+            projection_id=sample_projection.projection_id,
+            stat_name="pass_td",
+            manual_value=45,
+        )
+
+        assert player_tag(sample_projection.player_id) not in cache.tag_index
+        players, _ = await query_service.get_players_optimized(
+            include_projections=True, active_only=False
+        )
+        mahomes = next(p for p in players if p["player_id"] == sample_projection.player_id)
+        assert mahomes["projection"]["pass_td"] == 45
+
     @pytest.mark.asyncio
     async def test_dependent_stat_recalculation_qb(self, service, test_db, sample_players):
         """Test recalculation of QB dependent stats."""
@@ -125,7 +154,7 @@ class TestOverrideService:
             pass_yards=4800,
             pass_td=38,
             interceptions=10,
-            comp_pct=400 / 600,  # 0.667
+            comp_pct=400 / 600 * 100,  # 66.7
             yards_per_att=4800 / 600,  # 8.0
             pass_td_rate=38 / 600,  # 0.063
             int_rate=10 / 600,  # 0.017
@@ -157,7 +186,7 @@ class TestOverrideService:
         )
 
         # Get the current value of pass_attempts, don't assume it's still 600
-        expected_comp_pct = 420 / updated_proj.pass_attempts
+        expected_comp_pct = 420 / updated_proj.pass_attempts * 100
         assert round(updated_proj.comp_pct, 3) == round(expected_comp_pct, 3)
 
         # Reset for next test
@@ -211,7 +240,7 @@ class TestOverrideService:
             receptions=88,
             rec_yards=750,
             rec_td=5,
-            catch_pct=0.8,
+            catch_pct=80.0,
             yards_per_target=6.82,
             rec_td_rate=0.045,
             # Other stats
@@ -290,7 +319,7 @@ class TestOverrideService:
             .first()
         )
 
-        expected_catch_pct = 95 / 110  # 0.864
+        expected_catch_pct = 95 / 110 * 100  # 86.4
         assert round(updated_proj.catch_pct, 3) == round(expected_catch_pct, 3)
 
     @pytest.fixture(scope="function")
@@ -309,7 +338,7 @@ class TestOverrideService:
             receptions=98,
             rec_yards=1200,
             rec_td=10,
-            catch_pct=0.7,
+            catch_pct=70.0,
             yards_per_target=8.57,
             rec_td_rate=0.071,
             has_overrides=False,
@@ -337,7 +366,7 @@ class TestOverrideService:
             receptions=98,
             rec_yards=1200,
             rec_td=10,
-            catch_pct=98 / 140,  # 0.7
+            catch_pct=98 / 140 * 100,  # 70.0
             yards_per_target=1200 / 140,  # 8.57
             rec_td_rate=10 / 140,  # 0.071
             has_overrides=False,
@@ -368,7 +397,7 @@ class TestOverrideService:
         )
 
         # Use the actual values from the projection
-        expected_catch_pct = updated_proj.receptions / updated_proj.targets
+        expected_catch_pct = updated_proj.receptions / updated_proj.targets * 100
         expected_ypt = updated_proj.rec_yards / updated_proj.targets
 
         assert round(updated_proj.catch_pct, 3) == round(expected_catch_pct, 3)
@@ -528,7 +557,7 @@ class TestOverrideService:
             pass_yards=4800,
             pass_td=38,
             interceptions=10,
-            comp_pct=0.667,
+            comp_pct=66.7,
             yards_per_att=8.0,
             pass_td_rate=0.063,
             int_rate=0.017,
@@ -640,7 +669,7 @@ class TestOverrideService:
             pass_yards=4800,
             pass_td=38,
             interceptions=10,
-            comp_pct=0.667,  # 400/600
+            comp_pct=66.7,  # 400/600
             yards_per_att=8.0,  # 4800/600
             pass_td_rate=0.063,  # 38/600
             int_rate=0.017,  # 10/600
@@ -711,7 +740,7 @@ class TestOverrideService:
         )  # Allow small rounding differences
 
         # The ratio stats should remain the same
-        assert round(updated_proj.comp_pct, 3) == 0.667
+        assert round(updated_proj.comp_pct, 1) == 66.7
         assert round(updated_proj.yards_per_att, 3) == 8.0
         assert round(updated_proj.pass_td_rate, 3) == 0.063
         assert round(updated_proj.int_rate, 3) == 0.017
@@ -747,7 +776,7 @@ class TestOverrideService:
             .first()
         )
 
-        # Based on the OverrideService._recalculate_receiver_stats method:
+        # Based on the OverrideService._recalculate_dependent_stats method:
         # 1. When targets change, receptions get scaled by the original catch rate
         # 2. Rec yards get scaled based on original yards per reception
         # 3. The ratio stats (catch_pct, yards_per_target) remain the same
@@ -788,7 +817,7 @@ class TestOverrideService:
         )
 
         # When we override receptions directly, the catch_pct should be recalculated
-        expected_catch_pct_2 = 120 / 160  # 0.75
+        expected_catch_pct_2 = 120 / 160 * 100  # 75.0
         assert round(proj_after_second.catch_pct, 3) == round(expected_catch_pct_2, 3)
 
         # The yards_per_target should remain at the original value
@@ -319,6 +319,85 @@ class TestPositionImportAccuracy:
         expected_points = 52.8
         assert abs(stat_dict["half_ppr"] - expected_points) < 0.1
 
+    @pytest.mark.asyncio
+    @patch("backend.services.adapters.nfl_data_py_adapter.NFLDataPyAdapter.get_weekly_stats")
+    @patch("backend.services.adapters.nfl_data_py_adapter.NFLDataPyAdapter.get_schedules")
+    async def test_weekly_reimport(
+        self,
+        mock_get_schedules,
+        mock_get_weekly_stats,
+        service,
+        sample_players,
+        mock_qb_weekly_data,
+        mock_schedules_data,
+    ):
+        """Re-importing skips existing weeks unless replace is set."""
+        mock_get_schedules.return_value = mock_schedules_data
+        mock_get_weekly_stats.return_value = mock_qb_weekly_data.iloc[:2]
+        assert (await service.import_weekly_stats(2023))["weekly_stats_added"] == 2
+
+        # Only the new week is inserted; a duplicated week keeps its first row
+        weekly = pd.concat([mock_qb_weekly_data, mock_qb_weekly_data.iloc[[2]]])
+        weekly.iloc[-1, weekly.columns.get_loc("passing_yards")] = 999
+        mock_get_weekly_stats.return_value = weekly
+        assert (await service.import_weekly_stats(2023))["weekly_stats_added"] == 1
+
+        corrected = mock_qb_weekly_data.copy()
+        corrected.loc[0, "passing_yards"] = 255
+        mock_get_weekly_stats.return_value = corrected
+        result = await service.import_weekly_stats(2023, replace=True)
+        assert result["weekly_stats_added"] == 3
+
+        game_stats = {
+            g.week: g
+            for g in service.db.query(GameStats).filter(GameStats.player_id == "qb1").all()
+        }
+        assert len(game_stats) == 3
+        assert game_stats[1].stats["pass_yards"] == 255
+        assert game_stats[1].pass_yards == 255
+        assert game_stats[3].stats["pass_yards"] == 310
+        assert (game_stats[2].opponent, game_stats[2].result, game_stats[2].team_score) == (
+            "CIN",
+            "W",
+            31,
+        )
+
+    @pytest.mark.asyncio
+    @patch("backend.services.adapters.nfl_data_py_adapter.NFLDataPyAdapter.get_weekly_stats")
+    @patch("backend.services.adapters.nfl_data_py_adapter.NFLDataPyAdapter.get_schedules")
+    async def test_incremental_import(
+        self,
+        mock_get_schedules,
+        mock_get_weekly_stats,
+        service,
+        sample_players,
+        mock_qb_weekly_data,
+        mock_rb_weekly_data,
+        mock_schedules_data,
+    ):
+        """Only weeks after the watermark are imported and only their players re-totaled."""
+        mock_get_schedules.return_value = mock_schedules_data
+        season = pd.concat([mock_qb_weekly_data, mock_rb_weekly_data.iloc[:2]])
+        mock_get_weekly_stats.return_value = season[season["week"] <= 2]
+        await service.import_weekly_stats(2023)
+        await service.calculate_season_totals(2023)
+        assert service.get_watermark("weekly_stats", 2023) == 2
+
+        mock_get_weekly_stats.return_value = season
+        results = await service.import_season(2023, incremental=True)
+
+        assert results["weekly_stats"]["weeks"] == [3]
+        assert results["weekly_stats"]["weekly_stats_added"] == 1
+        assert results["season_totals"]["players_processed"] == 1
+        assert service.get_watermark("weekly_stats", 2023) == 3
+        assert service.season_stats.get_season_stats("qb1", 2023)["games"] == 3
+        assert service.season_stats.get_season_stats("rb1", 2023)["games"] == 2
+
+        # Nothing new: no rows and no totals work
+        results = await service.import_season(2023, incremental=True)
+        assert results["weekly_stats"]["weeks"] == []
+        assert results["season_totals"]["players_processed"] == 0
+
     @pytest.mark.asyncio
     async def test_fantasy_point_calculation_accuracy(self, service):
         """Test fantasy point calculation accuracy for different positions."""
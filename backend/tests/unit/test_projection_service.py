@@ -3,7 +3,7 @@ import uuid
 import numpy as np
 from backend.services.projection_service import ProjectionService
 from backend.services.projection_variance_service import ProjectionVarianceService
-from backend.database.models import TeamStat, Projection, Player, BaseStat
+from backend.database.models import TeamStat, Projection, Player, BaseStat, GameStats
 
 
 class TestProjectionService:
@@ -574,3 +574,267 @@ class TestProjectionService:
         )  # = 404
 
         assert proj.half_ppr == pytest.approx(expected_points, rel=0.01)
+
+    @pytest.mark.asyncio
+    async def test_build_season_projections_matches_per_player(
+        self, service, sample_players, team_stats_2024, sample_base_stats
+    ):
+        """Test that the bulk season build produces the same numbers as the per-player path."""
+        result = await service.build_season_projections(season=2024)
+
+        assert result["success"] is True
+        # Only the KC players have team stats for 2024
+        assert result["count"] == 2
+        assert len(result["errors"]) == 2
+
+        await self._assert_bulk_matches_per_player(service, sample_players, result)
+
+    @pytest.mark.asyncio
+    async def test_build_season_projections_ignores_weekly_rows(
+        self, service, test_db, sample_players, team_stats_2024, sample_base_stats
+    ):
+        """Test that weekly BaseStat rows feed neither the bulk nor the per-player path."""
+        mahomes_id = sample_players["ids"]["Patrick Mahomes"]
+        before = await service.create_base_projection(player_id=mahomes_id, season=2024)
+        expected = (before.pass_attempts, before.pass_yards)
+        test_db.delete(before)
+        test_db.commit()
+
+        for stat_type, value in [("pass_attempts", 45), ("pass_yards", 410), ("pass_td", 5)]:
+            test_db.add(
+                BaseStat(
+                    stat_id=str(uuid.uuid4()),
+                    player_id=mahomes_id,
+                    season=2023,
+                    week=1,
+                    stat_type=stat_type,
+                    value=value,
+                )
+            )
+        test_db.commit()
+
+        result = await service.build_season_projections(season=2024)
+        assert result["count"] == 2
+
+        bulk = service.db.get(Projection, result["projection_ids"][mahomes_id])
+        assert (bulk.pass_attempts, bulk.pass_yards) == pytest.approx(expected)
+        await self._assert_bulk_matches_per_player(service, sample_players, result)
+
+    async def _assert_bulk_matches_per_player(self, service, sample_players, result):
+        """Compare bulk-built projections with create_base_projection for the KC players."""
+        compared_fields = [
+            "games",
+            "half_ppr",
+            "pass_attempts",
+            "completions",
+            "pass_yards",
+            "pass_td",
+            "interceptions",
+            "rush_attempts",
+            "rush_yards",
+            "rush_td",
+            "targets",
+            "receptions",
+            "rec_yards",
+            "rec_td",
+            "yards_per_att",
+            "comp_pct",
+            "pass_td_rate",
+            "yards_per_carry",
+            "rush_td_rate",
+            "catch_pct",
+            "yards_per_target",
+            "rec_td_rate",
+            "rush_share",
+            "target_share",
+        ]
+
+        for name in ["Patrick Mahomes", "Travis Kelce"]:
+            player_id = sample_players["ids"][name]
+            bulk = service.db.get(Projection, result["projection_ids"][player_id])
+            single = await service.create_base_projection(player_id=player_id, season=2024)
+
+            assert bulk is not None and single is not None
+            for field in compared_fields:
+                expected = getattr(single, field)
+                actual = getattr(bulk, field)
+                if expected is None:
+                    assert actual is None, f"{name} {field}"
+                else:
+                    assert actual == pytest.approx(expected), f"{name} {field}"
+
+    @pytest.mark.asyncio
+    async def test_build_season_projections_estimates_and_skips_existing(
+        self, service, sample_players, team_stats_2024
+    ):
+        """Test team-context estimates for players without history and idempotent rebuilds."""
+        kelce_id = sample_players["ids"]["Travis Kelce"]
+
+        first = await service.build_season_projections(season=2024)
+        assert first["count"] == 2
+
+        bulk = service.db.get(Projection, first["projection_ids"][kelce_id])
+        single = await service.create_base_projection(player_id=kelce_id, season=2024)
+        assert bulk.targets == pytest.approx(single.targets)
+        assert bulk.half_ppr == pytest.approx(single.half_ppr)
+
+        # Rerunning skips players that already have a projection
+        second = await service.build_season_projections(season=2024)
+        assert second["count"] == 0
+        assert second["skipped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_apply_regression_matches_per_player(
+        self, service, sample_players, team_stats_2024, sample_base_stats
+    ):
+        """Test that the set-based regression matches apply_statistical_regression."""
+        mahomes_id = sample_players["ids"]["Patrick Mahomes"]
+        kelce_id = sample_players["ids"]["Travis Kelce"]
+
+        # Two identical projections per player, one per scenario
+        projections = {}
+        for scenario_id in ["bulk", "single"]:
+            for player_id in [mahomes_id, kelce_id]:
+                proj = await service.create_base_projection(
+                    player_id=player_id, season=2024, scenario_id=scenario_id
+                )
+                # Move the projection away from the historical totals
+                if proj.pass_attempts:
+                    proj.pass_attempts = 650
+                    proj.completions = 440
+                    proj.pass_td = 35
+                else:
+                    proj.targets = 140
+                    proj.receptions = 100
+                    proj.rec_td = 9
+                projections[(scenario_id, player_id)] = proj.projection_id
+        service.db.commit()
+
+        result = await service.batch_apply_regression(
+            team="KC", season=2024, scenario_id="bulk", active_only=False
+        )
+        assert result["success"] is True
+        assert result["count"] == 2
+
+        for player_id in [mahomes_id, kelce_id]:
+            single = await service.apply_statistical_regression(
+                player_id=player_id, season=2024, scenario_id="single"
+            )
+            assert single is not None
+
+            bulk = service.db.get(Projection, projections[("bulk", player_id)])
+            for field in [
+                "pass_attempts",
+                "completions",
+                "pass_td",
+                "targets",
+                "receptions",
+                "rec_td",
+                "comp_pct",
+                "yards_per_att",
+                "catch_pct",
+                "yards_per_target",
+                "half_ppr",
+            ]:
+                expected = getattr(single, field)
+                actual = getattr(bulk, field)
+                if expected is None:
+                    assert actual is None, field
+                else:
+                    assert actual == pytest.approx(expected), field
+
+        # Regression pulls the inflated values back towards history
+        mahomes = service.db.get(Projection, projections[("bulk", mahomes_id)])
+        assert mahomes.pass_attempts == pytest.approx(0.65 * 650 + 0.35 * 580)
+
+    @pytest.mark.asyncio
+    async def test_variance_batch_matches_per_projection(
+        self, variance_service, test_db, sample_players
+    ):
+        mahomes_id = sample_players["ids"]["Patrick Mahomes"]
+        kelce_id = sample_players["ids"]["Travis Kelce"]
+
+        # Ten 2023 games: current stat keys for Mahomes, older keys for Kelce
+        for week in range(1, 11):
+            for player_id, stats in [
+                (
+                    mahomes_id,
+                    {
+                        "pass_attempts": 30 + week,
+                        "completions": 20 + week,
+                        "pass_yards": 200 + 15 * week,
+                        "pass_td": week % 4,
+                        "interceptions": week % 2,
+                    },
+                ),
+                (kelce_id, {"tgt": 6 + week % 3, "rec": 5 + week % 2, "rec_yds": 40 + 8 * week}),
+            ]:
+                test_db.add(
+                    GameStats(
+                        player_id=player_id,
+                        season=2023,
+                        week=week,
+                        opponent="LV",
+                        game_location="home",
+                        result="W",
+                        team_score=24,
+                        opponent_score=17,
+                        stats=stats,
+                    )
+                )
+
+        projections = {
+            mahomes_id: Projection(
+                player_id=mahomes_id,
+                season=2024,
+                games=16,
+                half_ppr=350.0,
+                pass_attempts=580,
+                completions=390,
+                pass_yards=4500,
+                pass_td=32,
+                interceptions=11,
+                rush_attempts=60,
+                rush_yards=350,
+                rush_td=3,
+            ),
+            kelce_id: Projection(
+                player_id=kelce_id,
+                season=2024,
+                games=17,
+                half_ppr=170.0,
+                targets=120,
+                receptions=90,
+                rec_yards=1000,
+                rec_td=6,
+            ),
+        }
+        test_db.add_all(projections.values())
+        test_db.commit()
+
+        batch = await variance_service.calculate_variance_batch(2024, confidence=0.80)
+        assert batch["count"] == 2
+        assert set(batch["stats"]) >= {"pass_yards", "rec_yards"}
+
+        for i, player_id in enumerate(batch["players"]["player_id"]):
+            single = await variance_service.calculate_variance(
+                projections[player_id].projection_id
+            )
+            for stat in ["pass_yards", "interceptions", "receptions", "rec_yards", "half_ppr"]:
+                column = batch["half_ppr"] if stat == "half_ppr" else batch["stats"][stat]
+                if stat not in single:
+                    assert column["std_dev"][i] is None
+                    continue
+                interval = single[stat]["intervals"]["0.80"]
+                assert column["std_dev"][i] == pytest.approx(single[stat]["std_dev"], abs=0.05)
+                assert column["lower"][i] == pytest.approx(interval["lower"], abs=0.1)
+                assert column["upper"][i] == pytest.approx(interval["upper"], abs=0.1)
+
+        # History replaces the default coefficient once a player has enough games
+        coefficients = await variance_service.historical_coefficients(
+            {mahomes_id: "QB", kelce_id: "TE"}, 2024
+        )
+        defaults = variance_service.variance_coefficients
+        assert coefficients[mahomes_id]["pass_yards"] != defaults["QB"]["pass_yards"]
+        assert coefficients[kelce_id]["rec_yards"] != defaults["TE"]["rec_yards"]
+        assert coefficients[kelce_id]["rec_td"] == defaults["TE"]["rec_td"]
@@ -0,0 +1,127 @@
+import pytest
+import uuid
+import numpy as np
+import pandas as pd
+
+from backend.database.models import Projection
+from backend.services.projection_simulation_service import ProjectionSimulationService
+
+
+class TestProjectionSimulationService:
+    @pytest.fixture(scope="function")
+    def service(self, test_db):
+        return ProjectionSimulationService(test_db)
+
+    @pytest.fixture(scope="function")
+    def projections(self, test_db, sample_players):
+        ids = sample_players["ids"]
+        rows = [
+            Projection(
+                projection_id=str(uuid.uuid4()),
+                player_id=ids["Patrick Mahomes"],
+                season=2024,
+                games=17,
+                half_ppr=356.0,
+                pass_attempts=580,
+                completions=390,
+                pass_yards=4500,
+                pass_td=32,
+                interceptions=11,
+                rush_attempts=60,
+                rush_yards=350,
+                rush_td=3,
+            ),
+            Projection(
+                projection_id=str(uuid.uuid4()),
+                player_id=ids["Christian McCaffrey"],
+                season=2024,
+                games=14,
+                half_ppr=291.0,
+                rush_attempts=250,
+                rush_yards=1200,
+                rush_td=12,
+                targets=80,
+                receptions=64,
+                rec_yards=520,
+                rec_td=4,
+            ),
+            Projection(
+                projection_id=str(uuid.uuid4()),
+                player_id=ids["Travis Kelce"],
+                season=2024,
+                games=17,
+                half_ppr=160.0,
+                targets=120,
+                receptions=90,
+                rec_yards=1000,
+                rec_td=6,
+            ),
+        ]
+        test_db.add_all(rows)
+        test_db.commit()
+        return rows
+
+    @pytest.mark.asyncio
+    async def test_simulation_matches_projection(self, service, projections):
+        result = await service.simulate_season(2024, draws=4000, seed=7, keep_stats=True)
+
+        summary = result.summary.set_index("player_id")
+        assert result.points.shape == (3, 4000)
+        for projection in projections:
+            row = summary.loc[projection.player_id]
+            # Lognormal draws keep the projected mean
+            assert row["mean"] == pytest.approx(row["projected"], rel=0.03)
+            assert row["p10"] < row["p50"] < row["p90"]
+            assert 0 < row["boom_prob"] < 1 and 0 < row["bust_prob"] < 1
+
+        # Stats are never negative and stay correlated within a player
+        rows = summary.index.get_loc(projections[0].player_id)
+        attempts = result.stats["pass_attempts"][rows]
+        yards = result.stats["pass_yards"][rows]
+        assert attempts.min() >= 0
+        assert np.corrcoef(attempts, yards)[0, 1] > 0.8
+        tight_end = summary.index.get_loc(projections[2].player_id)
+        assert np.isnan(result.stats["pass_yards"][tight_end]).all()
+
+    @pytest.mark.asyncio
+    async def test_seed_reproduces_draws(self, service, projections):
+        first = await service.simulate_season(2024, draws=500, seed=11)
+        second = await service.simulate_season(2024, draws=500, seed=11)
+        other = await service.simulate_season(2024, draws=500, seed=12)
+
+        np.testing.assert_array_equal(first.points, second.points)
+        assert not np.array_equal(first.points, other.points)
+
+        # Filtering a position leaves that position's draws unchanged
+        tight_ends = await service.simulate_season(2024, draws=500, seed=11, position="TE")
+        te_row = first.summary.index[first.summary["position"] == "TE"][0]
+        np.testing.assert_array_equal(tight_ends.points[0], first.points[te_row])
+
+    def test_coefficient_overrides(self, service):
+        frame = pd.DataFrame(
+            [
+                {
+                    "projection_id": "p1",
+                    "player_id": "te1",
+                    "position": "TE",
+                    "games": 17,
+                    "targets": 120,
+                    "receptions": 90,
+                    "rec_yards": 1000,
+                    "rec_td": 6,
+                }
+            ]
+        )
+        stats = service.variance.variance_coefficients["TE"]
+        fixed = service.simulate_frame(
+            frame, draws=1000, seed=3, coefficients={"te1": {stat: 0.0 for stat in stats}}
+        )
+
+        # Without variance every draw is the projection: no booms or busts
+        row = fixed.summary.iloc[0]
+        assert row["projected"] == pytest.approx(181.0)
+        assert row["std_dev"] == pytest.approx(0.0, abs=1e-9)
+        assert row["boom_prob"] == 0.0 and row["bust_prob"] == 0.0
+
+        wide = service.simulate_frame(frame, draws=1000, seed=3)
+        assert wide.summary.iloc[0]["std_dev"] > 0
@@ -0,0 +1,285 @@
+import pytest
+import uuid
+
+from backend.services.batch_service import BatchService
+from backend.services.data_validation import DataValidationService
+from backend.services.projection_service import ProjectionService
+from backend.services.scenario_service import ScenarioService
+from backend.services.season_stats_service import SeasonStatsService
+from backend.services.team_stat_service import TeamStatService
+from backend.services.scenario_delta_service import parse_virtual_projection_id
+from backend.database.models import Projection, ProjectionDelta, StatOverride
+
+
+class TestScenarioDeltaService:
+    @pytest.fixture(scope="function")
+    def service(self, test_db):
+        """Create ScenarioService instance for testing."""
+        return ScenarioService(test_db)
+
+    @pytest.fixture(scope="function")
+    def base_scenario(self, test_db, service, sample_players):
+        """A root scenario owning 2024 projections for the KC players."""
+
+        @pytest.mark.asyncio
+        async def _create():
+            scenario = await service.create_scenario(name="Base", is_baseline=True)
+            ids = sample_players["ids"]
+            test_db.add_all([
+                Projection(
+                    projection_id=str(uuid.uuid4()), player_id=ids["Patrick Mahomes"],
+                    scenario_id=scenario.scenario_id, season=2024, games=17, half_ppr=350.0,
+                    pass_attempts=600, completions=400, pass_yards=4800, pass_td=38,
+                    interceptions=10, rush_attempts=60, rush_yards=350, rush_td=3,
+                ),
+                Projection(
+                    projection_id=str(uuid.uuid4()), player_id=ids["Travis Kelce"],
+                    scenario_id=scenario.scenario_id, season=2024, games=16, half_ppr=245.0,
+                    targets=140, receptions=98, rec_yards=1200, rec_td=10,
+                ),
+            ])
+            test_db.commit()
+            return scenario
+
+        return _create()
+
+    @pytest.mark.asyncio
+    async def test_clone_copies_nothing(self, service, test_db, base_scenario):
+        """Cloning is O(1): no projection rows, and reads resolve through the base."""
+        base = await base_scenario
+        rows_before = test_db.query(Projection).count()
+
+        clone = await service.clone_scenario(base.scenario_id, "Clone")
+
+        assert test_db.query(Projection).count() == rows_before
+        assert test_db.query(ProjectionDelta).count() == 0
+
+        projections = await service.get_scenario_projections(clone.scenario_id)
+        assert len(projections) == 2
+        assert all(parse_virtual_projection_id(p.projection_id) for p in projections)
+        assert all(p.scenario_id == clone.scenario_id for p in projections)
+
+        qb = next(p for p in projections if p.player.position == "QB")
+        assert qb.pass_td == 38
+
+    @pytest.mark.asyncio
+    async def test_update_stores_only_changed_fields(self, service, test_db, base_scenario):
+        """Writing an inherited projection records a delta; the base is untouched."""
+        base = await base_scenario
+        clone = await service.clone_scenario(base.scenario_id, "Clone")
+        kelce = next(
+            p for p in await service.get_scenario_projections(clone.scenario_id)
+            if p.player.name == "Travis Kelce"
+        )
+
+        updated = await service.projection_service.update_projection(
+            kelce.projection_id, {"td_rate": 1.2}
+        )
+        assert updated.rec_td == pytest.approx(12.0)
+
+        delta = test_db.query(ProjectionDelta).one()
+        assert delta.scenario_id == clone.scenario_id
+        assert set(delta.changes) == {"rec_td", "rec_td_rate", "half_ppr"}
+
+        base_kelce = next(
+            p for p in await service.get_scenario_projections(base.scenario_id)
+            if p.player.name == "Travis Kelce"
+        )
+        assert base_kelce.rec_td == 10
+
+        # A second-level clone sees the first clone's change
+        grandchild = await service.clone_scenario(clone.scenario_id, "Grandchild")
+        resolved = await service.get_player_scenario_projection(
+            grandchild.scenario_id, kelce.player_id
+        )
+        assert resolved.rec_td == pytest.approx(12.0)
+
+    @pytest.mark.asyncio
+    async def test_team_adjustment_writes_deltas(
+        self, service, test_db, base_scenario, team_stats_2024
+    ):
+        """Adjusting a clone's team stores deltas instead of cloning rows."""
+        base = await base_scenario
+        clone = await service.clone_scenario(base.scenario_id, "Pass heavy")
+        rows_before = test_db.query(Projection).count()
+
+        updated = await TeamStatService(test_db).apply_team_adjustments(
+            team="KC", season=2024, adjustments={"pass_volume": 1.1}, scenario_id=clone.scenario_id
+        )
+
+        assert len(updated) == 2
+        assert test_db.query(Projection).count() == rows_before
+        assert test_db.query(ProjectionDelta).filter(
+            ProjectionDelta.scenario_id == clone.scenario_id
+        ).count() == 2
+
+        qb = await service.get_player_scenario_projection(
+            clone.scenario_id, next(p.player_id for p in updated if p.player.position == "QB")
+        )
+        assert qb.pass_attempts == pytest.approx(660.0)
+        base_qb = await service.get_player_scenario_projection(base.scenario_id, qb.player_id)
+        assert base_qb.pass_attempts == 600
+
+    @pytest.mark.asyncio
+    async def test_team_adjustment_on_root_seeds_deltas(
+        self, service, test_db, sample_players, team_stats_2024
+    ):
+        """Adjusting a root scenario stores deltas over the base projections."""
+        ids = sample_players["ids"]
+        test_db.add_all([
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Patrick Mahomes"], season=2024,
+                games=17, half_ppr=350.0, pass_attempts=600, completions=400, pass_yards=4800,
+                pass_td=38, interceptions=10,
+            ),
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Travis Kelce"], season=2024,
+                games=16, half_ppr=245.0, targets=140, receptions=98, rec_yards=1200, rec_td=10,
+            ),
+        ])
+        test_db.commit()
+        root = await service.create_scenario(name="Root")
+        rows_before = test_db.query(Projection).count()
+
+        updated = await TeamStatService(test_db).apply_team_adjustments(
+            team="KC", season=2024, adjustments={"pass_volume": 1.1}, scenario_id=root.scenario_id
+        )
+
+        assert len(updated) == 2
+        assert test_db.query(Projection).count() == rows_before
+        assert test_db.query(ProjectionDelta).filter(
+            ProjectionDelta.scenario_id == root.scenario_id
+        ).count() == 2
+
+        qb = await service.get_player_scenario_projection(root.scenario_id, ids["Patrick Mahomes"])
+        assert qb.pass_attempts == pytest.approx(660.0)
+        base_qb = test_db.query(Projection).filter(
+            Projection.player_id == ids["Patrick Mahomes"], Projection.scenario_id.is_(None)
+        ).one()
+        assert base_qb.pass_attempts == 600
+
+    @pytest.mark.asyncio
+    async def test_clone_export_validate_and_regress(
+        self, service, test_db, base_scenario, sample_players
+    ):
+        """Scenario reads outside ScenarioService see a clone's inherited projections."""
+        base = await base_scenario
+        clone = await service.clone_scenario(base.scenario_id, "Clone")
+        ids = sample_players["ids"]
+        kc_ids = {ids["Patrick Mahomes"], ids["Travis Kelce"]}
+
+        _, content = await BatchService(test_db).export_projections(
+            "csv", {"scenario_id": clone.scenario_id}
+        )
+        exported = content.decode("utf-8")
+        assert "Patrick Mahomes" in exported
+        assert "Travis Kelce" in exported
+
+        results = await DataValidationService(test_db).batch_validate_projections(
+            2024, scenario_id=clone.scenario_id
+        )
+        assert set(results) == kc_ids
+
+        season_stats = SeasonStatsService(test_db)
+        season_stats.save_season_totals(ids["Patrick Mahomes"], 2023, {
+            "games": 17, "pass_attempts": 580, "completions": 401, "pass_yards": 4183,
+            "pass_td": 27, "interceptions": 14,
+        })
+        season_stats.save_season_totals(ids["Travis Kelce"], 2023, {
+            "games": 15, "targets": 121, "receptions": 93, "rec_yards": 984, "rec_td": 5,
+        })
+        test_db.commit()
+        rows_before = test_db.query(Projection).count()
+
+        result = await ProjectionService(test_db).batch_apply_regression(
+            team="KC", season=2024, scenario_id=clone.scenario_id, active_only=False
+        )
+
+        assert result["count"] == 2
+        assert test_db.query(Projection).count() == rows_before
+        assert test_db.query(ProjectionDelta).filter(
+            ProjectionDelta.scenario_id == clone.scenario_id
+        ).count() == 2
+
+        qb = await service.get_player_scenario_projection(clone.scenario_id, ids["Patrick Mahomes"])
+        assert qb.pass_td != 38
+        base_qb = await service.get_player_scenario_projection(
+            base.scenario_id, ids["Patrick Mahomes"]
+        )
+        assert base_qb.pass_td == 38
+
+    @pytest.mark.asyncio
+    async def test_build_season_projections_skips_inherited(
+        self, service, test_db, base_scenario, team_stats_2024
+    ):
+        """Building a clone's projections does not duplicate inherited players."""
+        base = await base_scenario
+        clone = await service.clone_scenario(base.scenario_id, "Clone")
+        rows_before = test_db.query(Projection).count()
+
+        result = await ProjectionService(test_db).build_season_projections(
+            season=2024, scenario_id=clone.scenario_id
+        )
+
+        # The KC players are inherited; the SF players have no team stats
+        assert result["count"] == 0
+        assert result["skipped"] == 2
+        assert test_db.query(Projection).count() == rows_before
+
+    @pytest.mark.asyncio
+    async def test_override_materializes_inherited_projection(
+        self, service, test_db, base_scenario
+    ):
+        """An override on an inherited projection gives the clone its own row."""
+        base = await base_scenario
+        clone = await service.clone_scenario(base.scenario_id, "Clone")
+        qb = next(
+            p for p in await service.get_scenario_projections(clone.scenario_id, position="QB")
+        )
+
+        override = await service.override_service.create_override(
+            player_id=qb.player_id, projection_id=qb.projection_id,
+            stat_name="pass_td", manual_value=45,
+        )
+
+        assert override is not None
+        own = test_db.get(Projection, override.projection_id)
+        assert own.scenario_id == clone.scenario_id
+        assert own.pass_td == 45
+
+        resolved = await service.get_player_scenario_projection(clone.scenario_id, qb.player_id)
+        assert resolved.projection_id == own.projection_id
+        base_qb = await service.get_player_scenario_projection(base.scenario_id, qb.player_id)
+        assert base_qb.pass_td == 38
+
+    @pytest.mark.asyncio
+    async def test_delete_base_keeps_clone_values(self, service, test_db, base_scenario):
+        """Deleting a base scenario rebases its clones without changing their values."""
+        base = await base_scenario
+        clone = await service.clone_scenario(base.scenario_id, "Clone")
+        kelce = next(
+            p for p in await service.get_scenario_projections(clone.scenario_id)
+            if p.player.name == "Travis Kelce"
+        )
+        await service.projection_service.update_projection(kelce.projection_id, {"td_rate": 1.2})
+        base_qb = next(
+            p for p in await service.get_scenario_projections(base.scenario_id)
+            if p.player.position == "QB"
+        )
+        await service.override_service.create_override(
+            player_id=base_qb.player_id, projection_id=base_qb.projection_id,
+            stat_name="pass_td", manual_value=40,
+        )
+
+        assert await service.delete_scenario(base.scenario_id) is True
+
+        test_db.refresh(clone)
+        assert clone.base_scenario_id is None
+        projections = await service.get_scenario_projections(clone.scenario_id)
+        by_name = {p.player.name: p for p in projections}
+        assert by_name["Travis Kelce"].rec_td == pytest.approx(12.0)
+        assert by_name["Patrick Mahomes"].pass_td == 40
+        assert test_db.query(StatOverride).filter(
+            StatOverride.projection_id == by_name["Patrick Mahomes"].projection_id
+        ).count() == 1
+        assert test_db.query(ProjectionDelta).count() == 0
@@ -0,0 +1,143 @@
+import pytest
+import uuid
+import pandas as pd
+from datetime import datetime
+
+from backend.services.scoring_service import ScoringRules, ScoringService
+from backend.services.projection_variance_service import FANTASY_POINT_WEIGHTS
+from backend.services.cache_service import get_cache
+from backend.database.models import DraftBoard, Projection
+
+
+class TestScoringService:
+    @pytest.fixture(scope="function")
+    def service(self, test_db):
+        """Create ScoringService instance with an empty cache."""
+        get_cache().clear()
+        return ScoringService(test_db)
+
+    @pytest.fixture(scope="function")
+    def projections(self, test_db, sample_players):
+        """Base 2024 projections for the sample players."""
+        ids = sample_players["ids"]
+        rows = [
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Patrick Mahomes"], season=2024,
+                games=17, half_ppr=0.0, pass_attempts=600, completions=400, pass_yards=4800,
+                pass_td=38, interceptions=10, rush_attempts=60, rush_yards=350, rush_td=3,
+                net_pass_yards=4625, fumbles=2,
+            ),
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Travis Kelce"], season=2024,
+                games=16, half_ppr=0.0, targets=140, receptions=98, rec_yards=1200, rec_td=10,
+            ),
+            Projection(
+                projection_id=str(uuid.uuid4()), player_id=ids["Christian McCaffrey"], season=2024,
+                games=16, half_ppr=0.0, rush_attempts=280, rush_yards=1400, rush_td=14,
+                targets=110, receptions=88, rec_yards=750, rec_td=5,
+            ),
+        ]
+        for projection in rows:
+            projection.half_ppr = projection.calculate_fantasy_points()
+            test_db.add(projection)
+        test_db.commit()
+        return rows
+
+    def test_presets_match_calculate_fantasy_points(self, projections):
+        """The built-in formats score frames as the per-object method scores projections."""
+        frame = pd.DataFrame([{c.name: getattr(p, c.name) for c in Projection.__table__.columns}
+                              for p in projections])
+
+        # Mahomes scores net passing yards and loses points for fumbles
+        known = {
+            "standard": [366.0, 180.0, 329.0],
+            "half": [366.0, 229.0, 373.0],
+            "ppr": [366.0, 278.0, 417.0],
+        }
+        for scoring_type, values in known.items():
+            points = ScoringRules.preset(scoring_type).score_frame(frame)
+            expected = [p.calculate_fantasy_points(scoring_type) for p in projections]
+            assert points.tolist() == pytest.approx(expected)
+            assert expected == pytest.approx(values)
+
+    def test_variance_weights_follow_half_ppr(self):
+        """Fantasy point variance weights come from the half-PPR preset."""
+        assert FANTASY_POINT_WEIGHTS == pytest.approx({
+            "pass_yards": 0.04, "pass_td": 4.0, "interceptions": -2.0, "rush_yards": 0.1,
+            "rush_td": 6.0, "receptions": 0.5, "rec_yards": 0.1, "rec_td": 6.0,
+        })
+
+    def test_rules_from_settings(self):
+        """Settings override the preset and add per-position points."""
+        rules = ScoringRules.from_settings(
+            {"scoring": {"preset": "ppr", "points": {"pass_td": 6},
+                         "position_points": {"TE": {"receptions": 0.5}}}}
+        )
+        frame = pd.DataFrame([
+            {"position": "TE", "receptions": 10.0, "pass_td": 0.0},
+            {"position": "WR", "receptions": 10.0, "pass_td": 1.0},
+        ])
+
+        assert rules.score_frame(frame).tolist() == pytest.approx([15.0, 16.0])
+        assert rules.rule_hash != ScoringRules.preset("ppr").rule_hash
+        assert ScoringRules.from_settings(None).rule_hash == ScoringRules.preset("half").rule_hash
+
+    def test_unknown_stat_rejected(self):
+        with pytest.raises(ValueError):
+            ScoringRules(points={"tackles": 1.0})
+        with pytest.raises(ValueError):
+            ScoringRules.from_dict({"preset": "six-point"})
+
+    @pytest.mark.asyncio
+    async def test_score_projections_cached_until_projections_change(
+        self, service, test_db, projections
+    ):
+        """Scores are served from cache and recomputed after a projection write."""
+        rules = {"half": ScoringRules.preset("half"), "ppr": ScoringRules.preset("ppr")}
+
+        first = await service.score_projections(rules, season=2024)
+        assert len(first) == 3
+        by_id = first.set_index("projection_id")
+        for projection in projections:
+            assert by_id.loc[projection.projection_id, "half"] == pytest.approx(projection.half_ppr)
+            assert by_id.loc[projection.projection_id, "ppr"] == pytest.approx(projection.ppr)
+
+        key = service._cache_key(2024, None, rules["ppr"])
+        assert service.cache.get(key) is not None
+
+        # Cached columns are reused as-is
+        second = await service.score_projections(rules, season=2024)
+        pd.testing.assert_frame_equal(first, second)
+
+        # Any projection write changes the fingerprint
+        kelce = projections[1]
+        kelce.receptions = 120
+        kelce.half_ppr = kelce.calculate_fantasy_points()
+        kelce.updated_at = datetime.utcnow()
+        test_db.commit()
+
+        third = await service.score_projections(rules, season=2024)
+        row = third.set_index("projection_id").loc[kelce.projection_id]
+        assert row["ppr"] == pytest.approx(kelce.ppr)
+
+        assert service.invalidate() == 2
+        assert service.cache.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_score_draft_board(self, service, test_db, projections):
+        """Draft board settings drive the ranking."""
+        board = DraftBoard(
+            draft_board_id=str(uuid.uuid4()), name="TE premium", season=2024,
+            settings={"scoring": {"preset": "ppr", "position_points": {"TE": {"receptions": 1.0}}}},
+        )
+        test_db.add(board)
+        test_db.commit()
+
+        result = await service.score_draft_board(board.draft_board_id, formats=["standard"])
+
+        assert list(result.columns[-2:]) == ["points", "standard"]
+        assert result["points"].is_monotonic_decreasing
+        kelce = result.set_index("name").loc["Travis Kelce"]
+        assert kelce["points"] == pytest.approx(projections[1].ppr + 98)
+
+        assert await service.score_draft_board("missing") is None
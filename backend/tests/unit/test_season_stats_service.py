@@ -0,0 +1,147 @@
+import pytest
+
+from backend.database.models import BaseStat, PlayerSeasonStats
+from backend.services.season_stats_service import SeasonStatsService
+
+
+class TestSeasonStatsService:
+    @pytest.fixture(scope="function")
+    def service(self, test_db):
+        return SeasonStatsService(test_db)
+
+    def add_legacy(self, db, player_id, season, stats, week=None):
+        for stat_type, value in stats.items():
+            db.add(
+                BaseStat(
+                    player_id=player_id, season=season, week=week, stat_type=stat_type, value=value
+                )
+            )
+        db.commit()
+
+    def test_save_writes_wide_row_and_mirror(self, service, test_db, sample_players):
+        mahomes = sample_players["ids"]["Patrick Mahomes"]
+        service.save_season_totals(
+            mahomes, 2023, {"pass_yards": 4183, "pass_td": 27, "games": 16, "fumbles": 2}
+        )
+        test_db.commit()
+
+        row = test_db.query(PlayerSeasonStats).filter_by(player_id=mahomes, season=2023).one()
+        assert row.pass_yards == 4183.0
+        assert row.games == 16.0
+        assert row.extra == {"fumbles": 2.0}
+        assert row.to_stat_dict() == {
+            "games": 16.0, "pass_yards": 4183.0, "pass_td": 27.0, "fumbles": 2.0
+        }
+
+        # Legacy readers still see the totals
+        mirrored = {
+            s.stat_type: s.value
+            for s in test_db.query(BaseStat).filter_by(player_id=mahomes, season=2023)
+        }
+        assert mirrored == {"pass_yards": 4183.0, "pass_td": 27.0, "games": 16.0, "fumbles": 2.0}
+
+        # Updating one stat keeps the others
+        service.save_season_totals(mahomes, 2023, {"pass_td": 28})
+        test_db.commit()
+        assert service.get_season_stats(mahomes, 2023)["pass_yards"] == 4183.0
+        assert service.get_season_stats(mahomes, 2023)["pass_td"] == 28.0
+        assert test_db.query(PlayerSeasonStats).count() == 1
+        assert test_db.query(BaseStat).filter_by(stat_type="pass_td").count() == 1
+
+    def test_reads_fall_back_to_base_stats(self, service, test_db, sample_players):
+        ids = sample_players["ids"]
+        kelce, mccaffrey = ids["Travis Kelce"], ids["Christian McCaffrey"]
+        self.add_legacy(test_db, kelce, 2023, {"targets": 121, "rec_yards": 984})
+        self.add_legacy(test_db, kelce, 2023, {"targets": 9}, week=1)  # weekly, ignored
+        service.save_season_totals(mccaffrey, 2023, {"rush_yards": 1459})
+        test_db.commit()
+
+        assert service.get_season_stats(kelce, 2023) == {"targets": 121.0, "rec_yards": 984.0}
+        assert service.get_season_stats(kelce, 2022) == {}
+
+        stats = service.get_season_stats_map(2023)
+        assert stats[kelce]["rec_yards"] == 984.0
+        assert stats[mccaffrey] == {"rush_yards": 1459.0}
+
+        frame = service.season_stats_frame(2023, position="TE")
+        assert list(frame.index) == [kelce]
+        assert frame.loc[kelce, "targets"] == 121.0
+
+        frame = service.season_stats_frame(2023)
+        assert set(frame.index) == {kelce, mccaffrey}
+
+        # Saving a legacy-only player seeds the row from BaseStat
+        service.save_season_totals(kelce, 2023, {"rec_td": 5})
+        test_db.commit()
+        row = test_db.query(PlayerSeasonStats).filter_by(player_id=kelce).one()
+        assert (row.targets, row.rec_yards, row.rec_td) == (121.0, 984.0, 5.0)
+
+    def test_latest_season_stats(self, service, test_db, sample_players):
+        ids = sample_players["ids"]
+        purdy, mahomes = ids["Brock Purdy"], ids["Patrick Mahomes"]
+        service.save_season_totals(purdy, 2022, {"pass_yards": 1374})
+        service.save_season_totals(purdy, 2023, {"pass_yards": 4280})
+        test_db.commit()
+        # A newer legacy season wins over older wide rows
+        self.add_legacy(test_db, purdy, 2024, {"pass_yards": 3864})
+        self.add_legacy(test_db, mahomes, 2023, {"pass_yards": 4183})
+
+        latest = service.get_latest_season_stats([purdy, mahomes, "missing"])
+        assert latest[purdy] == (2024, {"pass_yards": 3864.0})
+        assert latest[mahomes] == (2023, {"pass_yards": 4183.0})
+        assert "missing" not in latest
+
+    def test_sync_from_base_stats(self, service, test_db, sample_players):
+        ids = sample_players["ids"]
+        mahomes, kelce = ids["Patrick Mahomes"], ids["Travis Kelce"]
+        self.add_legacy(test_db, mahomes, 2023, {"pass_yards": 4183, "games": 16})
+        self.add_legacy(test_db, kelce, 2023, {"targets": 121, "catch_rate": 76.9})
+        self.add_legacy(test_db, kelce, 2022, {"targets": 152})
+
+        assert service.sync_from_base_stats(season=2023) == 2
+        test_db.commit()
+        rows = {r.player_id: r for r in test_db.query(PlayerSeasonStats).all()}
+        assert rows[mahomes].pass_yards == 4183.0
+        assert rows[kelce].catch_rate == 76.9
+
+        # Re-running overwrites with BaseStat values instead of duplicating
+        test_db.query(BaseStat).filter_by(stat_type="pass_yards").update({"value": 4200})
+        assert service.sync_from_base_stats() == 3
+        test_db.commit()
+        assert test_db.query(PlayerSeasonStats).count() == 3
+        assert service.get_season_stats(mahomes, 2023)["pass_yards"] == 4200.0
+
+    def test_bulk_save_season_totals(self, service, test_db, sample_players):
+        ids = sample_players["ids"]
+        mahomes, kelce, purdy = ids["Patrick Mahomes"], ids["Travis Kelce"], ids["Brock Purdy"]
+        service.save_season_totals(mahomes, 2023, {"pass_yards": 4000, "fumbles": 2})
+        test_db.commit()
+        self.add_legacy(test_db, kelce, 2023, {"targets": 121})
+
+        created = service.bulk_save_season_totals(
+            2023,
+            {
+                mahomes: {"pass_yards": 4183, "pass_td": 27},
+                kelce: {"rec_yards": 984},
+                purdy: {"pass_yards": 4280, "sacks": 28},
+            },
+        )
+        test_db.commit()
+
+        assert created == 1
+        assert test_db.query(PlayerSeasonStats).count() == 3
+        assert service.get_season_stats(mahomes, 2023) == {
+            "pass_yards": 4183.0, "pass_td": 27.0, "fumbles": 2.0
+        }
+        # New rows are seeded from legacy totals and extras are kept
+        assert service.get_season_stats(kelce, 2023) == {"targets": 121.0, "rec_yards": 984.0}
+        assert service.get_season_stats(purdy, 2023)["sacks"] == 28.0
+
+        mirrored = {
+            (s.player_id, s.stat_type): s.value
+            for s in test_db.query(BaseStat).filter_by(season=2023, week=None)
+        }
+        assert mirrored[(mahomes, "pass_yards")] == 4183.0
+        assert mirrored[(kelce, "rec_yards")] == 984.0
+        assert mirrored[(purdy, "sacks")] == 28.0
+        assert test_db.query(BaseStat).filter_by(player_id=mahomes, stat_type="pass_yards").count() == 1
@@ -0,0 +1,93 @@
+import pytest
+import time
+
+from backend.services.cache_service import CacheService
+from backend.services.shared_cache import SQLiteCacheStore
+
+
+class TestSharedCache:
+    @pytest.fixture(scope="function")
+    def workers(self, tmp_path):
+        """Two caches sharing one store file, as two uvicorn workers would."""
+        path = str(tmp_path / "cache.db")
+        return (
+            CacheService(l2=SQLiteCacheStore(path), sync_interval=0),
+            CacheService(l2=SQLiteCacheStore(path), sync_interval=0),
+        )
+
+    def test_entries_shared_between_workers(self, workers):
+        first, second = workers
+        first.set("player_listing:a", {"players": [1, 2]}, ttl_seconds=60, tags=["players"])
+
+        assert second.get("player_listing:a") == {"players": [1, 2]}
+        assert second.get_stats()["l2_hits"] == 1
+        assert "players" in second.tag_index
+
+        # Unpicklable values stay local
+        first.set("local", lambda: None)
+        assert first.get("local") is not None
+        assert second.get("local") is None
+
+    def test_invalidation_reaches_other_workers(self, workers):
+        first, second = workers
+        for key, tag in [("a", "player:1"), ("b", "player:2"), ("listing:c", "players")]:
+            first.set(key, key.upper(), tags=[tag])
+            assert second.get(key) == key.upper()
+
+        first.invalidate_tags(["player:1"])
+        assert second.get("a") is None
+        assert second.get("b") == "B"
+
+        second.delete("b")
+        assert first.get("b") is None
+
+        first.clear_pattern("listing")
+        assert second.get("listing:c") is None
+
+        second.set("d", "D")
+        assert first.get("d") == "D"
+        second.clear()
+        assert first.get("d") is None
+        assert first.get_stats()["total_entries"] == 0
+
+    def test_expired_shared_entries_are_misses(self, workers):
+        first, second = workers
+        first.set("short", "value", ttl_seconds=0)
+        time.sleep(0.01)
+
+        assert second.get("short") is None
+        assert first.l2.prune() == 1
+
+    def test_pruned_log_clears_local_tier(self, workers):
+        first, second = workers
+        first.set("a", "A")
+        assert second.get("a") == "A"
+
+        first.invalidate_tags(["unrelated"])
+        first.l2._connection().execute("DELETE FROM cache_invalidations")
+
+        # The worker cannot tell what it missed, so it drops everything local
+        assert "a" in second.cache
+        assert second.get("other") is None
+        assert "a" not in second.cache
+        assert second.get("a") == "A"
+
+    def test_shared_tier_polled_once_per_interval(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        first = CacheService(l2=SQLiteCacheStore(path), sync_interval=0)
+        second = CacheService(l2=SQLiteCacheStore(path), sync_interval=60)
+        polls = []
+        poll = second.l2.poll
+        second.l2.poll = lambda: polls.append(1) or poll()
+
+        first.set("a", "A", tags=["player:1"])
+        assert second.get("a") == "A"
+        first.invalidate_tags(["player:1"])
+
+        # Hits within the interval are served locally without polling
+        assert second.get("a") == "A"
+        assert len(polls) == 1
+
+        second.last_sync -= 60
+        assert second.get("a") is None
+        assert len(polls) == 2
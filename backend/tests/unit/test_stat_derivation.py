@@ -0,0 +1,140 @@
+import pytest
+import uuid
+import pandas as pd
+
+from backend.services.stat_derivation import (
+    STAT_GRAPH,
+    DerivedStat,
+    StatDerivationGraph,
+    scale_volume_dependents,
+)
+from backend.database.models import Projection
+
+
+class TestStatDerivationGraph:
+    @pytest.fixture(scope="function")
+    def qb_values(self):
+        """Projection values for a QB with consistent derived fields."""
+        return {
+            "pass_attempts": 600.0,
+            "completions": 400.0,
+            "pass_yards": 4800.0,
+            "pass_td": 38.0,
+            "interceptions": 10.0,
+            "sacks": 25.0,
+            "sack_yards": 175.0,
+            "rush_attempts": 60.0,
+            "rush_yards": 350.0,
+            "rush_td": 3.0,
+            "comp_pct": 400 / 600 * 100,
+            "yards_per_att": 8.0,
+        }
+
+    def test_affected_is_limited_to_downstream_fields(self):
+        """Changing completions only touches comp_pct and nothing else."""
+        assert STAT_GRAPH.affected(["completions"]) == ("comp_pct",)
+
+        affected = STAT_GRAPH.affected(["pass_yards"])
+        assert set(affected) == {"yards_per_att", "net_pass_yards", "net_yards_per_att", "half_ppr"}
+        assert "catch_pct" not in affected
+
+    def test_affected_is_topologically_ordered(self):
+        """Derived inputs are evaluated before the fields that read them."""
+        affected = STAT_GRAPH.affected(["sacks"])
+        assert affected.index("sack_yards") < affected.index("net_pass_yards")
+        assert affected.index("net_pass_yards") < affected.index("net_yards_per_att")
+        assert affected.index("net_pass_yards") < affected.index("half_ppr")
+
+    def test_recompute_dict(self, qb_values):
+        """Only the fields downstream of the dirty inputs are written."""
+        qb_values["pass_attempts"] = 650.0
+        qb_values["completions"] = 420.0
+
+        updated = STAT_GRAPH.recompute(qb_values, {"pass_attempts", "completions"})
+
+        assert qb_values["comp_pct"] == pytest.approx(420 / 650 * 100)
+        assert qb_values["yards_per_att"] == pytest.approx(4800 / 650)
+        assert qb_values["sack_rate"] == pytest.approx(25 / 675)
+        assert "yards_per_carry" not in qb_values
+        assert "half_ppr" not in updated  # Volume alone does not score points
+
+    def test_recompute_leaves_undefined_values(self):
+        """A zero denominator or missing input keeps the existing value."""
+        values = {"targets": 0.0, "receptions": 0.0, "catch_pct": 65.0, "rec_yards": None}
+
+        STAT_GRAPH.recompute(values, {"targets"})
+
+        assert values["catch_pct"] == 65.0
+        assert "yards_per_target" not in values
+
+    def test_recompute_projection_matches_fantasy_points(self, qb_values):
+        """The half_ppr node mirrors Projection.calculate_fantasy_points."""
+        projection = Projection(
+            projection_id=str(uuid.uuid4()), player_id="p", season=2024, games=17,
+            half_ppr=0.0, fumbles=2.0, net_rush_yards=None, **qb_values
+        )
+
+        updated = STAT_GRAPH.recompute(projection, {"pass_yards", "sacks", "fumbles"})
+
+        assert "net_pass_yards" in updated
+        assert projection.net_pass_yards == pytest.approx(4800 - 175)
+        assert projection.net_rush_yards == pytest.approx(350 - 10)
+        assert projection.half_ppr == pytest.approx(projection.calculate_fantasy_points())
+
+    def test_missing_fumbles_count_as_none(self):
+        """net_rush_yards treats missing fumbles as 0, like the per-field code did."""
+        values = {"rush_attempts": 200.0, "rush_yards": 900.0, "fumbles": None}
+
+        STAT_GRAPH.recompute(values, {"rush_yards"})
+        frame = STAT_GRAPH.recompute_frame(
+            pd.DataFrame([{"rush_attempts": 200.0, "rush_yards": 900.0}]), ["rush_yards"]
+        )
+
+        assert values["net_rush_yards"] == pytest.approx(900.0)
+        assert values["net_yards_per_carry"] == pytest.approx(4.5)
+        assert frame.loc[0, "net_rush_yards"] == pytest.approx(900.0)
+
+    def test_recompute_frame_matches_single(self, qb_values):
+        """The batch path produces the same values as the single-projection path."""
+        receiver = {"targets": 140.0, "receptions": 98.0, "rec_yards": 1200.0, "rec_td": 10.0}
+        frame = pd.DataFrame([qb_values, receiver])
+
+        result = STAT_GRAPH.recompute_frame(frame, ["pass_attempts", "pass_yards", "targets"])
+
+        single_qb = dict(qb_values)
+        STAT_GRAPH.recompute(single_qb, ["pass_attempts", "pass_yards", "targets"])
+        single_receiver = dict(receiver)
+        STAT_GRAPH.recompute(single_receiver, ["pass_attempts", "pass_yards", "targets"])
+
+        for column, value in single_qb.items():
+            assert result.loc[0, column] == pytest.approx(value)
+        for column, value in single_receiver.items():
+            assert result.loc[1, column] == pytest.approx(value)
+        assert result.loc[1, "catch_pct"] == pytest.approx(70.0)
+        assert pd.isna(result.loc[1, "comp_pct"])
+
+    def test_scale_volume_dependents(self):
+        """Counting stats follow their volume stat, from stored rates or the previous volume."""
+        projection = Projection(
+            projection_id=str(uuid.uuid4()), player_id="p", season=2024, games=17, half_ppr=0.0,
+            rush_attempts=300.0, rush_yards=1500.0, rush_td=10.0, yards_per_carry=5.0,
+            targets=100.0, receptions=80.0, rec_yards=800.0, rec_td=5.0,
+        )
+
+        assert scale_volume_dependents(projection, "rush_attempts") == ["rush_yards"]
+        assert projection.rush_yards == pytest.approx(1500.0)
+        assert projection.rush_td == 10.0  # No stored rush_td_rate
+
+        projection.targets = 120.0
+        scaled = scale_volume_dependents(projection, "targets", previous_volume=100.0)
+        assert scaled == ["receptions", "rec_yards", "rec_td"]
+        assert projection.receptions == pytest.approx(96.0)
+        assert projection.rec_yards == pytest.approx(960.0)
+
+    def test_cycle_detection(self):
+        """A cyclic declaration is rejected up front."""
+        with pytest.raises(ValueError):
+            StatDerivationGraph([
+                DerivedStat("a", ("b",), lambda b: b),
+                DerivedStat("b", ("a",), lambda a: a),
+            ])
@@ -0,0 +1,106 @@
+import pytest
+import numpy as np
+
+from backend.database.models import GameStats, StatVariance
+from backend.services.nfl_data_import_service import NFLDataImportService
+from backend.services.stat_variance_service import StatVarianceService
+
+
+def add_games(db, player_id, season, weeks, stats_for_week):
+    for week in weeks:
+        db.add(
+            GameStats(
+                player_id=player_id,
+                season=season,
+                week=week,
+                opponent="LV",
+                game_location="home",
+                result="W",
+                team_score=24,
+                opponent_score=17,
+                stats=stats_for_week(week),
+            )
+        )
+    db.commit()
+
+
+class TestStatVarianceService:
+    @pytest.fixture(scope="function")
+    def service(self, test_db):
+        return StatVarianceService(test_db)
+
+    def test_moments_combine_seasons(self, service, test_db, sample_players):
+        mahomes_id = sample_players["ids"]["Patrick Mahomes"]
+        add_games(test_db, mahomes_id, 2022, range(1, 6), lambda w: {"pass_yards": 200 + 10 * w})
+        # Older imports stored passing yards under "pass_yds"
+        add_games(test_db, mahomes_id, 2023, range(1, 6), lambda w: {"pass_yds": 300 + 5 * w})
+
+        assert service.refresh_season(2022) == 1
+        assert service.refresh_season(2023) == 1
+        test_db.commit()
+
+        yards = np.array([200 + 10 * w for w in range(1, 6)] + [300 + 5 * w for w in range(1, 6)])
+        row = service.moments([mahomes_id], [2022, 2023]).loc[mahomes_id]
+        assert row["pass_yards_n"] == 10
+        assert row["pass_yards_mean"] == pytest.approx(yards.mean())
+        assert row["pass_yards_sq"] - row["pass_yards_mean"] ** 2 == pytest.approx(yards.var())
+        assert row["rush_yards_n"] == 0
+
+    def test_stale_seasons_read_from_game_logs(self, service, test_db, sample_players):
+        kelce_id = sample_players["ids"]["Travis Kelce"]
+        add_games(test_db, kelce_id, 2023, range(1, 9), lambda w: {"rec_yards": 50 + w})
+
+        # Game logs without stored moments are stale; seasons without games are not
+        assert service.stale_seasons([2022, 2023]) == [2023]
+        row = service.moments([kelce_id], [2022, 2023]).loc[kelce_id]
+        assert row["rec_yards_n"] == 8
+
+        # Reads leave the caller's session untouched
+        assert test_db.query(StatVariance).count() == 0
+        assert not test_db.new and not test_db.dirty
+
+        service.refresh_season(2023)
+        test_db.commit()
+        assert service.stale_seasons([2023]) == []
+
+        # A replace re-import with the same weeks changes the version
+        test_db.query(GameStats).filter(GameStats.week == 8).delete()
+        add_games(test_db, kelce_id, 2023, [8], lambda w: {"rec_yards": 120})
+        assert service.stale_seasons([2023]) == [2023]
+        row = service.moments([kelce_id], [2023]).loc[kelce_id]
+        assert row["rec_yards_mean"] == pytest.approx((sum(50 + w for w in range(1, 8)) + 120) / 8)
+
+    def test_partial_refresh_leaves_season_stale(self, service, test_db, sample_players):
+        ids = sample_players["ids"]
+        for name in ("Travis Kelce", "Christian McCaffrey"):
+            add_games(test_db, ids[name], 2023, range(1, 5), lambda w: {"rec_yards": 40 + w})
+
+        service.refresh_season(2023, [ids["Travis Kelce"]])
+        test_db.commit()
+        assert {row.version for row in test_db.query(StatVariance)} == {None}
+        assert service.stale_seasons([2023]) == [2023]
+
+        service.refresh_season(2023)
+        test_db.commit()
+        assert service.stale_seasons([2023]) == []
+        assert test_db.query(StatVariance).count() == 2
+
+    @pytest.mark.asyncio
+    async def test_season_totals_refresh_moments(self, test_db, sample_players):
+        purdy_id = sample_players["ids"]["Brock Purdy"]
+        add_games(
+            test_db,
+            purdy_id,
+            2023,
+            range(1, 4),
+            lambda w: {"pass_attempts": 30, "pass_yards": 250 + w, "pass_td": 2},
+        )
+
+        results = await NFLDataImportService(test_db).calculate_season_totals(2023)
+
+        assert results["variance_rows"] == 3
+        stats = {
+            row.stat: row.games
+            for row in test_db.query(StatVariance).filter(StatVariance.player_id == purdy_id)
+        }
+        assert stats == {"pass_attempts": 3, "pass_yards": 3, "pass_td": 3}